@@ -0,0 +1,123 @@
+"""저장 압축 벤치마크
+
+녹화한 매크로처럼 비슷한 마우스/키보드 동작이 이어지는 트리를 코덱과 압축 수준별로 저장하고 불러와서
+크기, 압축률, 저장/불러오기 시간을 비교합니다. 저장소별 기본 압축 수준을 정할 때 사용합니다.
+
+사용 예시:
+    python benchmarks/bench_compression.py
+    python benchmarks/bench_compression.py --nodes 50000 --backend sqlite
+"""
+import argparse
+import codecs
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from core.impl.tree import MTTree  # noqa: E402
+from core.impl.tree_stream import read_tree_json, write_tree_json  # noqa: E402
+from core.interfaces.base_item_data import MTDevice, MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType  # noqa: E402
+from model.store.tree_compression import CODECS, MTCompressingWriter, open_decompressed  # noqa: E402
+
+# (코덱, 압축 수준) 후보. None은 압축하지 않음
+CANDIDATES = [(None, None), ("zlib", 1), ("zlib", 6), ("zlib", 9), ("lzma", 0), ("lzma", 6)]
+
+
+def build_macro_tree(nodes: int, seed: int = 1) -> MTTree:
+    """녹화 구간(그룹)마다 좌표만 조금씩 다른 클릭/드래그/입력 동작이 이어지는 트리"""
+    rng = random.Random(seed)
+    tree = MTTree("bench", "Recorded Macro")
+    group_count = max(1, nodes // 500)
+    groups = [f"rec{n}" for n in range(group_count)]
+    for group_id in groups:
+        tree.add_item(MTItemDTO(group_id, MTItemDomainDTO(name=f"Recording {group_id}", node_type=MTNodeType.GROUP),
+                                MTItemUIStateDTO()))
+    x, y = 400, 300
+    for n in range(nodes - group_count):
+        x = max(0, x + rng.randint(-3, 3))
+        y = max(0, y + rng.randint(-3, 3))
+        if n % 20 == 19:
+            domain = MTItemDomainDTO(name="Type text", parent_id=groups[n % group_count], node_type=MTNodeType.INSTRUCTION,
+                                     device=MTDevice.KEYBOARD.value, action="type", action_data={"text": "hello", "interval": 0.05})
+        else:
+            action = "click" if n % 5 == 0 else "move"
+            domain = MTItemDomainDTO(name=f"Mouse {action}", parent_id=groups[n % group_count], node_type=MTNodeType.INSTRUCTION,
+                                     device=MTDevice.MOUSE.value, action=action,
+                                     action_data={"x": x, "y": y, "button": "left", "delay": 0.016})
+        tree.add_item(MTItemDTO(f"a{n:07d}", domain, MTItemUIStateDTO()))
+    return tree
+
+
+def encode(tree: MTTree, codec_name: str | None, level: int | None) -> bytes:
+    buffer = io.BytesIO()
+    if codec_name is None:
+        write_tree_json(tree, codecs.getwriter("utf-8")(buffer))
+    else:
+        with MTCompressingWriter(buffer, CODECS[codec_name], level) as writer:
+            write_tree_json(tree, codecs.getwriter("utf-8")(writer))
+    return buffer.getvalue()
+
+
+def bench_codecs(tree: MTTree) -> None:
+    print(f"{'codec':<10}{'size':>12}{'ratio':>8}{'save ms':>10}{'load ms':>10}")
+    raw_size = None
+    for codec_name, level in CANDIDATES:
+        started = time.perf_counter()
+        data = encode(tree, codec_name, level)
+        save_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        read_tree_json(open_decompressed(io.BytesIO(data)))
+        load_ms = (time.perf_counter() - started) * 1000
+        raw_size = raw_size or len(data)
+        label = "none" if codec_name is None else f"{codec_name}-{level}"
+        print(f"{label:<10}{len(data):>12,}{raw_size / len(data):>7.1f}x{save_ms:>10.0f}{load_ms:>10.0f}")
+
+
+def bench_backend(tree: MTTree, backend: str) -> None:
+    """실제 저장소로 저장/불러오기 (디스크 쓰기와 fsync 포함)"""
+    from model.store.db.impl.sqlite_tree_repo import SQLiteTreeRepository
+    from model.store.file.impl.file_tree_repo import MTFileTreeRepository
+
+    print(f"\n{backend} backend")
+    print(f"{'codec':<10}{'save ms':>10}{'load ms':>10}")
+    for codec_name, level in CANDIDATES:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            compression = codec_name or "none"
+            if backend == "file":
+                repo = MTFileTreeRepository(temp_dir, compression=compression, compression_level=level)
+            else:
+                repo = SQLiteTreeRepository(str(Path(temp_dir) / "trees.db"), compression=compression,
+                                            compression_level=level)
+            started = time.perf_counter()
+            repo.save(tree)
+            save_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            repo.load(tree.id)
+            load_ms = (time.perf_counter() - started) * 1000
+            if backend == "sqlite":
+                repo.close()
+        label = "none" if codec_name is None else f"{codec_name}-{level}"
+        print(f"{label:<10}{save_ms:>10.0f}{load_ms:>10.0f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--backend", choices=["file", "sqlite", "all", "none"], default="all")
+    args = parser.parse_args()
+
+    tree = build_macro_tree(args.nodes)
+    print(f"tree: {args.nodes} nodes")
+    bench_codecs(tree)
+    for backend in (["file", "sqlite"] if args.backend == "all" else [] if args.backend == "none" else [args.backend]):
+        bench_backend(tree, backend)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""검색 인덱스 벤치마크
+
+큰 트리에서 한 글자씩 입력할 때 키 입력마다 검색에 걸리는 시간을 측정합니다.
+목표: 100k 노드에서 키 입력당 16 ms 이하 (한 프레임)
+Undo처럼 트리가 통째로 바뀐 뒤 색인을 맞추는 시간(refresh)과 그 다음 첫 키 입력 시간도 측정합니다.
+검색창과 같은 경로(MTTreeViewModelHeadless.search, expand=True: 찾은 아이템의 조상 펼치기 포함)로
+입력했다가 지우는 시간도 측정합니다.
+
+사용 예시:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --nodes 200000 --query "click login"
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from core.impl.tree import MTTree  # noqa: E402
+from core.interfaces.base_item_data import MTDevice, MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType  # noqa: E402
+from model.events.impl.tree_event_mgr import MTTreeEventManager  # noqa: E402
+from model.state.impl.tree_state_mgr import MTTreeStateManager  # noqa: E402
+from viewmodel.impl.tree_search import GRAM_SIZE, MTTreeSearchIndex  # noqa: E402
+from viewmodel.impl.tree_viewmodel_base import MTTreeViewModelHeadless  # noqa: E402
+
+KEYSTROKE_BUDGET_MS = 16.0
+WORDS = ["click", "login", "button", "type", "password", "wait", "scroll", "drag", "window", "menu", "save", "open"]
+
+
+def build_tree(nodes: int, seed: int = 1) -> MTTree:
+    """그룹 100개 아래에 명령 노드를 고르게 나눈 트리"""
+    rng = random.Random(seed)
+    tree = MTTree("bench", "Bench")
+    groups = [f"g{n}" for n in range(100)]
+    for group_id in groups:
+        tree.add_item(MTItemDTO(group_id, MTItemDomainDTO(name=f"Group {group_id}", node_type=MTNodeType.GROUP), MTItemUIStateDTO()))
+    for n in range(nodes - len(groups)):
+        name = " ".join(rng.sample(WORDS, 3)) + f" {n}"
+        domain = MTItemDomainDTO(name=name, parent_id=groups[n % len(groups)], node_type=MTNodeType.INSTRUCTION,
+                                 device=rng.choice(list(MTDevice)))
+        tree.add_item(MTItemDTO(f"n{n}", domain, MTItemUIStateDTO()))
+    return tree
+
+
+def bench_viewmodel_search(tree: MTTree, query: str) -> float:
+    """검색창처럼 한 글자씩 입력했다가 지우며 뷰모델 검색 시간을 재고, 가장 느린 키 입력 시간(ms)을 반환합니다."""
+    vm = MTTreeViewModelHeadless(tree, MTTreeStateManager(tree), MTTreeEventManager(), None, None)
+    vm.visible_rows.rebuild()
+    started = time.perf_counter()
+    vm._search_index.rebuild()
+    print(f"view model search (expand=True), index {(time.perf_counter() - started) * 1000:.0f} ms")
+    prefixes = [query[:end] for end in range(1, len(query) + 1)]
+    worst = 0.0
+    for text in prefixes + prefixes[-2::-1]:
+        started = time.perf_counter()
+        matches = vm.search(text)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        worst = max(worst, elapsed_ms)
+        print(f"  {text!r:16} {len(matches):7d} matches  {elapsed_ms:6.2f} ms  rows {len(vm.visible_rows)}")
+    return worst
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--query", default="login butt")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tree = build_tree(args.nodes)
+    print(f"build tree: {args.nodes} nodes in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    index = MTTreeSearchIndex(tree)
+    started = time.perf_counter()
+    index.rebuild()
+    print(f"build index: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    worst = 0.0
+    for end in range(1, len(args.query) + 1):
+        query = args.query[:end]
+        started = time.perf_counter()
+        matches = index.search(query)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        worst = max(worst, elapsed_ms)
+        print(f"  {query!r:16} {len(matches):7d} matches  {elapsed_ms:6.2f} ms")
+
+    # Undo: 이름 하나를 바꾼 뒤 스냅샷으로 되돌림 (색인은 바뀐 아이템만 다시 색인)
+    snapshot = tree.to_dict()
+    dto = tree.get_item("n0").to_dto()
+    dto.domain_data.name = "renamed"
+    tree.modify_item("n0", dto)
+    tree.dict_to_state(snapshot)
+    started = time.perf_counter()
+    index.refresh()
+    print(f"refresh after undo: {(time.perf_counter() - started) * 1000:.0f} ms")
+    started = time.perf_counter()
+    index.search(args.query[:GRAM_SIZE])
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    worst = max(worst, elapsed_ms)
+    print(f"  first keystroke after undo {elapsed_ms:6.2f} ms")
+
+    worst = max(worst, bench_viewmodel_search(tree, args.query))
+
+    status = "OK" if worst <= KEYSTROKE_BUDGET_MS else "OVER BUDGET"
+    print(f"worst keystroke: {worst:.2f} ms (budget {KEYSTROKE_BUDGET_MS} ms, {status})")
+    return 0 if worst <= KEYSTROKE_BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""시작 시간 벤치마크
+
+`python -X importtime`으로 주요 모듈의 임포트 비용을 측정하고,
+선택적으로 실제 창을 띄워 첫 창 표시 시간(time-to-first-window)을 측정합니다.
+
+사용 예시:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --top 15 viewmodel.impl.tree_viewmodel_base
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py --first-window
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+
+DEFAULT_MODULES = [
+    "core.impl.tree",
+    "model.events.impl.tree_event_mgr",
+    "viewmodel.impl.tree_viewmodel_base",
+    "model.store.registry",
+    "view.impl.tree_main",
+]
+
+# 임포트 목표 시간(ms). 헤드리스 모듈은 Qt/DB 드라이버 없이 이 안에 로드되어야 합니다.
+IMPORT_BUDGET_MS = {
+    "core.impl.tree": 100,
+    "model.events.impl.tree_event_mgr": 100,
+    "viewmodel.impl.tree_viewmodel_base": 150,
+    "model.store.registry": 100,
+}
+
+HEAVY_MODULES = ("PyQt6", "psycopg2", "sqlalchemy", "dotenv")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_imports(module: str) -> dict:
+    """하위 프로세스에서 -X importtime으로 모듈을 임포트하고 결과를 집계합니다."""
+    code = f"import {module}, sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(SRC_DIR), str(ROOT_DIR)]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC_DIR, env=env, capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    target = next((row for row in reversed(rows) if row[0] == module), None)
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode != 0 and proc.stderr.strip() else "",
+        "cumulative_ms": target[2] / 1000 if target else 0.0,
+        "heavy_loaded": [m for m in proc.stdout.strip().split(",") if m],
+        "rows": rows,
+    }
+
+
+def measure_first_window() -> str:
+    """앱을 시작 프로브 모드로 실행해 첫 창 표시 시간 출력을 반환합니다."""
+    env = dict(os.environ, MACRO_TREE_STARTUP_PROBE="1")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, str(ROOT_DIR / "main.py")], cwd=ROOT_DIR, env=env, capture_output=True, text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("time-to-first-window"):
+            return line
+    return f"time-to-first-window: 측정 실패 (exit {proc.returncode}) {proc.stderr.strip()[-200:]}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="측정할 모듈")
+    parser.add_argument("--top", type=int, default=10, help="모듈별로 출력할 가장 무거운 임포트 개수")
+    parser.add_argument("--first-window", action="store_true", help="첫 창 표시 시간도 측정")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in args.modules:
+        result = measure_imports(module)
+        if not result["ok"]:
+            print(f"{module}: 임포트 실패 - {result['error']}")
+            continue
+        budget = IMPORT_BUDGET_MS.get(module)
+        status = ""
+        if budget is not None:
+            within = result["cumulative_ms"] <= budget
+            over_budget |= not within
+            status = f" (budget {budget} ms, {'OK' if within else 'OVER BUDGET'})"
+        heavy = ", ".join(result["heavy_loaded"]) or "-"
+        print(f"{module}: {result['cumulative_ms']:.1f} ms{status}, heavy modules: {heavy}")
+        heaviest = sorted(result["rows"], key=lambda row: row[1], reverse=True)[:args.top]
+        for name, self_us, cumulative_us, _ in heaviest:
+            print(f"    {self_us / 1000:8.2f} ms self {cumulative_us / 1000:8.2f} ms cumulative  {name}")
+
+    if args.first_window:
+        print(measure_first_window())
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
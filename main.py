@@ -2,6 +2,10 @@
 
 애플리케이션의 진입점을 제공합니다.
 """
+import time
+
+_STARTED_AT = time.perf_counter() # 첫 창 표시 시간 측정 기준
+
 import sys
 import os
 
@@ -12,13 +16,8 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR) # sys.path[0]에 추가하여 가장 먼저 검색되도록 함
 # --- src 폴더 추가 완료 ---
 
-from dotenv import load_dotenv
-from view.impl.tree_main import main
-
-# 환경변수 로드
-load_dotenv()
-
-# MACRO_TREE_DEBUG 환경 변수 설정 (예시)
+# 환경변수(.env) 로드와 디버그/저장소 모듈 임포트는 tree_main.main()에서 필요할 때 수행합니다.
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    from view.impl.tree_main import main
+    main(started_at=_STARTED_AT)
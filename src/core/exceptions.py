@@ -18,4 +18,8 @@ class InvalidMTItemDomainDTOError(MTTreeError):
     """트리 아이템 데이터가 유효하지 않을 때 발생하는 예외입니다."""
     pass
 
+class MTSearchUnavailableError(MTTreeError):
+    """저장소가 검색을 지원하지 않을 때 발생하는 예외입니다."""
+    pass
+
 # 필요에 따라 예외 클래스를 추가로 정의할 수 있습니다. 
\ No newline at end of file
@@ -0,0 +1,310 @@
+import dataclasses
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, Set
+
+from core.impl.item import MTItem
+from core.impl.tree import MTTree
+from core.interfaces.base_item import IMTItem
+from core.interfaces.base_item_data import MTItemDTO, MTNodeType
+from core.interfaces.base_item_keys import DomainKeys as DK
+from core.interfaces.base_tree import IMTTreeChildrenSource
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager, MTTreeEvent
+
+"""
+저장소에서 필요한 부분만 불러오는 지연 로딩 트리입니다.
+처음에는 루트의 자식만 불러오고, 그룹의 자식은 get_children()으로 처음 조회할 때(뷰에서 펼치거나 순회가 닿을 때) 가져옵니다.
+자식을 불러온 그룹은 LRU로 관리하며, cache_size를 넘으면 가장 오래 쓰지 않은 그룹의 하위 아이템을 메모리에서 내려놓습니다.
+hint()로 알려 둔 그룹과 (저장소가 UI 상태를 주는 경우) 펼친 채 저장된 그룹은 다음 조회 때 같은 질의로 함께 가져옵니다. (prefetch)
+Undo/TREE_CRUD 스냅샷(snapshot())은 불러온 아이템과 자식을 아직 불러오지 않은 그룹 목록(UNLOADED_KEY)만 담습니다.
+편집한 그룹은 내려놓지 않으므로, 되돌릴 때 불러오지 않은 그룹의 자식은 저장소에서 다시 가져오면 됩니다.
+자식은 그룹만 가질 수 있다고 봅니다. (뷰도 그룹에만 끌어다 놓기를 허용)
+"""
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_PREFETCH_LIMIT = 32
+UNLOADED_KEY = "unloaded_ids"  # 스냅샷에서 자식을 불러오지 않은 그룹 ID 목록
+
+
+def _is_group(node_type: Any) -> bool:
+    group_value: str = MTNodeType.GROUP.value
+    return bool(getattr(node_type, "value", node_type) == group_value)
+
+
+class MTLazyTree(MTTree):
+    """
+    IMTTreeChildrenSource에서 자식을 필요할 때 가져오는 MTTree.
+    items/get_item은 불러온 아이템만 보여 줍니다. to_dict()(저장, 복제)는 먼저 전체를 불러오고, snapshot()은 불러온 부분만 담습니다.
+    편집한 그룹과 그 조상은 캐시에서 내려놓지 않습니다.
+    """
+
+    def __init__(self, tree_id: str, name: str, source: IMTTreeChildrenSource,
+                 event_manager: IMTTreeEventManager | None = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE, prefetch_limit: int = DEFAULT_PREFETCH_LIMIT):
+        """
+        Args:
+            tree_id (str): 트리 ID
+            name (str): 트리 이름
+            source (IMTTreeChildrenSource): 자식 아이템을 조회할 저장소
+            event_manager (IMTTreeEventManager | None): 이벤트 매니저(선택)
+            cache_size (int): 자식을 메모리에 유지할 그룹 수 (루트 포함)
+            prefetch_limit (int): 한 번의 조회에 함께 가져올 hint 그룹 수
+        """
+        super().__init__(tree_id, name, event_manager)
+        self._source = source
+        self._cache_size = max(1, cache_size)
+        self._prefetch_limit = max(0, prefetch_limit)
+        self._unloaded: Set[str] = {self._root_id}  # 자식을 아직 가져오지 않은 그룹
+        self._loaded: "OrderedDict[str, None]" = OrderedDict()  # 자식을 가져온 그룹 (오래 안 쓴 것 먼저)
+        self._hints: "OrderedDict[str, None]" = OrderedDict()
+        self._pinned: Set[str] = set()  # 편집해서 내려놓으면 안 되는 그룹
+        self._eviction_holds = 0
+        self._complete = False  # 전체를 불러왔거나 저장소와 무관한 상태가 됨
+        self.fetch_count = 0  # 저장소 조회 횟수
+        self.ensure_children(None)
+
+    # --- 지연 로딩 ---
+    @property
+    def loaded_group_count(self) -> int:
+        """자식을 메모리에 불러 둔 그룹 수"""
+        return len(self._loaded)
+
+    def is_loaded(self, item_id: str | None) -> bool:
+        """그룹의 자식을 이미 불러왔는지 여부 (그룹이 아니거나 없는 아이템이면 True)"""
+        return self._container(item_id) not in self._unloaded
+
+    def ensure_children(self, parent_id: str | None) -> bool:
+        """
+        그룹의 자식을 아직 불러오지 않았으면 가져옵니다. 이미 있으면 LRU 순서만 갱신합니다.
+        Returns:
+            bool: 저장소를 조회했는지 여부
+        """
+        container_id = self._container(parent_id)
+        if container_id in self._unloaded:
+            self._fetch([container_id])
+            return True
+        if container_id is not None and container_id in self._loaded:
+            self._loaded.move_to_end(container_id)
+        return False
+
+    def hint(self, parent_ids: Iterable[str]) -> None:
+        """곧 펼칠 것 같은 그룹을 알려 둡니다. 다음 조회 때 prefetch_limit개까지 함께 가져옵니다."""
+        for parent_id in parent_ids:
+            if parent_id in self._unloaded:
+                self._hints[parent_id] = None
+                self._hints.move_to_end(parent_id)
+
+    def prefetch(self, parent_ids: Iterable[str | None]) -> int:
+        """여러 그룹의 자식을 한 번의 조회로 가져옵니다. 가져온 그룹 수를 반환합니다."""
+        containers = [container_id for container_id in map(self._container, parent_ids) if container_id in self._unloaded]
+        return self._fetch(containers) if containers else 0
+
+    def load_all(self) -> None:
+        """남은 그룹을 모두 불러옵니다. 이후로는 캐시에서 내려놓지 않습니다."""
+        self._complete = True
+        while self._unloaded:
+            self._fetch(list(self._unloaded))
+
+    # --- 조회 (필요하면 불러옴) ---
+    def get_children(self, parent_id: str | None) -> List[IMTItem]:
+        self.ensure_children(parent_id)
+        children: List[IMTItem] = super().get_children(parent_id)
+        return children
+
+    def get_children_dtos(self, parent_id: str | None) -> List[MTItemDTO]:
+        self.ensure_children(parent_id)
+        dtos: List[MTItemDTO] = super().get_children_dtos(parent_id)
+        return dtos
+
+    def traverse(self, visitor: Callable[[IMTItem], None], node_id: str | None = None) -> None:
+        # RF : 순회 큐에 들어간 아이템이 도중에 캐시에서 빠지지 않도록 끝날 때까지 내려놓지 않음
+        with self._hold_eviction():
+            super().traverse(visitor, node_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        self.load_all()
+        data: Dict[str, Any] = super().to_dict()
+        return data
+
+    def snapshot(self) -> Dict[str, Any]:
+        # RF : 편집마다 전체를 불러오지 않도록 불러온 부분만 담고 나머지는 그룹 ID로 표시
+        data: Dict[str, Any] = super().to_dict()
+        if not self._complete:
+            data[UNLOADED_KEY] = list(self._unloaded)
+        return data
+
+    def dict_to_state(self, data: Dict[str, Any]) -> None:
+        super().dict_to_state(data)
+        unloaded = data.get(UNLOADED_KEY) if isinstance(data, dict) else None
+        if unloaded is None:
+            self._mark_complete()
+            return
+        # 불러온 부분만 담은 스냅샷: 표시된 그룹은 다음 조회 때 저장소에서 다시 가져옴
+        self._complete = False
+        self._unloaded = {group_id for group_id in unloaded if group_id in self._items}
+        self._loaded = OrderedDict((item_id, None) for item_id, item in self._items.items()
+                                   if item_id not in self._unloaded
+                                   and (item_id == self._root_id or _is_group(item.get_property(DK.NODE_TYPE))))
+        self._hints.clear()
+        self._pinned &= self._items.keys()
+
+    # --- 편집 (대상 그룹을 먼저 불러오고 고정) ---
+    def add_item(self, item_dto: MTItemDTO, index: int = -1) -> str | None:
+        self._prepare_edit(item_dto.domain_data.parent_id)
+        new_id: str | None = super().add_item(item_dto, index)
+        return new_id
+
+    def add_subtree(self, item_dtos: List[MTItemDTO], index: int = -1) -> str | None:
+        if item_dtos:
+            self._prepare_edit(item_dtos[0].domain_data.parent_id)
+        top_id: str | None = super().add_subtree(item_dtos, index)
+        return top_id
+
+    def remove_item(self, item_id: str) -> bool:
+        self._prepare_edit(self._parent_of(item_id))
+        removed: bool = super().remove_item(item_id)
+        return removed
+
+    def remove_items(self, item_ids: List[str]) -> List[str]:
+        for item_id in item_ids:
+            self._prepare_edit(self._parent_of(item_id))
+        removed_ids: List[str] = super().remove_items(item_ids)
+        return removed_ids
+
+    def move_item(self, item_id: str, new_parent_id: str | None = None, new_index: int = -1) -> bool:
+        self._prepare_edit(self._parent_of(item_id))
+        self._prepare_edit(new_parent_id)
+        moved: bool = super().move_item(item_id, new_parent_id, new_index)
+        return moved
+
+    def move_items(self, item_ids: List[str], new_parent_id: str | None = None, new_index: int = -1) -> List[str]:
+        for item_id in item_ids:
+            self._prepare_edit(self._parent_of(item_id))
+        self._prepare_edit(new_parent_id)
+        moved_ids: List[str] = super().move_items(item_ids, new_parent_id, new_index)
+        return moved_ids
+
+    def modify_item(self, item_id: str, item_dto: MTItemDTO) -> bool:
+        self._prepare_edit(self._parent_of(item_id))
+        modified: bool = super().modify_item(item_id, item_dto)
+        return modified
+
+    def duplicate_items(self, item_ids: List[str]) -> List[str]:
+        # RF : 복제본에 하위 아이템이 빠지지 않도록 원본 하위 트리를 모두 불러옴
+        with self._hold_eviction():
+            for item_id in item_ids:
+                self._prepare_edit(self._parent_of(item_id))
+                self._load_subtree(item_id)
+            copies: List[str] = super().duplicate_items(item_ids)
+            return copies
+
+    def reset_tree(self) -> None:
+        super().reset_tree()
+        self._mark_complete()
+
+    # --- 내부 도우미 ---
+    def _container(self, item_id: str | None) -> str | None:
+        return item_id if item_id is not None else self._root_id
+
+    def _parent_of(self, item_id: str) -> str | None:
+        item = self._items.get(item_id)
+        return item.get_property(DK.PARENT_ID) if item is not None else None
+
+    def _prepare_edit(self, parent_id: str | None) -> None:
+        """편집할 그룹의 자식을 불러오고, 그룹과 조상을 캐시에서 내려놓지 않도록 고정합니다."""
+        if self._complete:
+            return
+        self.ensure_children(parent_id)
+        current_id = self._container(parent_id)
+        while current_id is not None and current_id not in self._pinned:
+            self._pinned.add(current_id)
+            item = self._items.get(current_id)
+            current_id = item.get_property(DK.PARENT_ID) if item is not None else None
+        self._pinned.add(self._root_id)
+
+    def _load_subtree(self, item_id: str) -> None:
+        level = [item_id]
+        while level:
+            self.prefetch(level)
+            level = [child_id for parent_id in level if parent_id in self._items
+                     for child_id in self._items[parent_id].get_property(DK.CHILDREN, [])]
+
+    def _fetch(self, container_ids: List[str]) -> int:
+        """그룹들의 자식을 (hint 그룹과 함께) 한 번에 가져와 트리에 넣습니다."""
+        batch = list(dict.fromkeys(container_ids))
+        for hinted_id in list(self._hints):
+            if len(batch) >= len(container_ids) + self._prefetch_limit:
+                break
+            del self._hints[hinted_id]
+            if hinted_id in self._unloaded and hinted_id not in batch:
+                batch.append(hinted_id)
+        root_id = self._root_id
+        fetched = self._source.fetch_children([None if container_id == root_id else container_id for container_id in batch])
+        self.fetch_count += 1
+        for container_id in batch:
+            self._unloaded.discard(container_id)
+            self._hints.pop(container_id, None)
+            container = self._items.get(container_id)
+            if container is None:
+                continue
+            parent_id = None if container_id == root_id else container_id
+            children_ids = []
+            for dto in fetched.get(parent_id, []):
+                if dto.item_id in self._items:
+                    continue  # 이미 다른 곳으로 옮겨 온 아이템
+                domain_data = dataclasses.replace(dto.domain_data, parent_id=parent_id, children_ids=[])
+                self._items[dto.item_id] = MTItem(item_id=dto.item_id, domain_data=domain_data, ui_state_data=dto.ui_state_data)
+                if _is_group(domain_data.node_type):
+                    self._unloaded.add(dto.item_id)
+                    if dto.ui_state_data.is_expanded:
+                        self._hints[dto.item_id] = None  # 펼친 채 저장된 그룹은 곧 보이므로 다음 조회 때 함께 가져옴 (UI 상태를 주는 저장소만)
+                children_ids.append(dto.item_id)
+            # 불러오기 전에 이 그룹에 추가된 아이템은 뒤에 유지
+            children_ids.extend(child_id for child_id in container.get_property(DK.CHILDREN, []) if child_id not in children_ids)
+            container.set_property(DK.CHILDREN, children_ids)
+            self._loaded[container_id] = None
+            self._loaded.move_to_end(container_id)
+        self._evict(protected=set(batch))
+        return len(batch)
+
+    def _evict(self, protected: AbstractSet[str] = frozenset()) -> None:
+        """불러온 그룹이 cache_size를 넘으면 오래 쓰지 않은 그룹부터 하위 아이템을 내려놓습니다."""
+        if self._complete or self._eviction_holds:
+            return
+        for group_id in list(self._loaded):
+            if len(self._loaded) <= self._cache_size:
+                break
+            if group_id not in self._loaded or group_id in protected or group_id in self._pinned or group_id == self._root_id:
+                continue
+            self._unload(group_id)
+
+    def _unload(self, group_id: str) -> None:
+        group = self._items[group_id]
+        stack = list(group.get_property(DK.CHILDREN, []))
+        while stack:
+            item = self._items.pop(stack.pop(), None)
+            if item is None:
+                continue
+            self._loaded.pop(item.id, None)
+            self._unloaded.discard(item.id)
+            self._hints.pop(item.id, None)
+            stack.extend(item.get_property(DK.CHILDREN, []))
+        group.set_property(DK.CHILDREN, [])
+        self._loaded.pop(group_id, None)
+        self._unloaded.add(group_id)
+        self._notify(MTTreeEvent.SUBTREE_UNLOADED, {"item_id": group_id})
+
+    @contextmanager
+    def _hold_eviction(self) -> Iterator[None]:
+        self._eviction_holds += 1
+        try:
+            yield
+        finally:
+            self._eviction_holds -= 1
+            self._evict()
+
+    def _mark_complete(self) -> None:
+        """트리 전체가 메모리에 있는 상태로 바뀜 (undo/redo 복원, 리셋)"""
+        self._complete = True
+        self._unloaded.clear()
+        self._hints.clear()
@@ -1,8 +1,10 @@
-from typing import Any, Callable, Dict, List, Set, cast # Optional removed
+from typing import Any, Callable, Dict, Iterator, List, Set, cast # Optional removed
+from contextlib import contextmanager
 import json
 import copy
 import uuid
 import dataclasses
+from time import perf_counter_ns
 
 from core.interfaces.base_item import IMTItem
 from core.interfaces.base_tree import IMTTree
@@ -127,6 +129,8 @@ class _MTTreeModifiable:
         
         if actual_parent_id is not None and actual_parent_id not in self._tree._items:
             raise exc.MTItemNotFoundError(f"add_item: 부모 아이템 ID '{actual_parent_id}'를 찾을 수 없습니다.")
+        if not self._tree._validate(MTTreeEvent.ITEM_ADDED, {"item_id": item_id, "parent_id": actual_parent_id, "index": index, "item_dto": item_dto}):
+            return None
 
         self._tree._items[item_id] = new_item
         
@@ -144,10 +148,49 @@ class _MTTreeModifiable:
             parent_item.set_property("children_ids", children_ids)
         
         self._tree._notify(MTTreeEvent.ITEM_ADDED, {"item_id": item_id, "parent_id": actual_parent_id})
-        new_stage = self._tree.to_dict()
-        self._tree._notify(MTTreeEvent.TREE_CRUD, {"tree_data": new_stage})
+        self._tree._notify_tree_crud()
         return item_id
 
+    def add_subtree(self, item_dtos: List[MTItemDTO], index: int = -1) -> str | None:
+        """
+        하위 트리(첫 DTO가 하위 트리의 루트, 나머지는 그 자손)를 한 번에 추가합니다.
+        자손 DTO의 children_ids는 그대로 사용하며, ITEM_ADDED는 하위 트리 루트에 대해서만 한 번 알립니다.
+        Args:
+            item_dtos (List[MTItemDTO]): 하위 트리 아이템 DTO 목록 (루트 먼저)
+            index (int): 부모의 자식 목록에 삽입할 위치, -1이면 맨 뒤
+        Returns:
+            str | None: 하위 트리 루트 ID 또는 실패 시 None
+        Raises:
+            MTItemNotFoundError: 부모 아이템이 존재하지 않을 때
+            MTItemAlreadyExistsError: 이미 있는 아이템 ID가 포함되어 있을 때
+        """
+        if not item_dtos:
+            return None
+        root_dto = item_dtos[0]
+        parent_id = root_dto.domain_data.parent_id
+        actual_parent_id = parent_id if parent_id is not None else self._tree._root_id
+        if actual_parent_id is None or actual_parent_id not in self._tree._items:
+            raise exc.MTItemNotFoundError(f"add_subtree: 부모 아이템 ID '{actual_parent_id}'를 찾을 수 없습니다.")
+        for item_dto in item_dtos:
+            if item_dto.item_id in self._tree._items:
+                raise exc.MTItemAlreadyExistsError(f"add_subtree: 이미 존재하는 아이템 ID: {item_dto.item_id}")
+        if not self._tree._validate(MTTreeEvent.ITEM_ADDED, {"item_id": root_dto.item_id, "parent_id": actual_parent_id, "index": index, "item_dto": root_dto}):
+            return None
+
+        for item_dto in item_dtos:
+            self._tree._items[item_dto.item_id] = MTItem(item_id=item_dto.item_id, domain_data=item_dto.domain_data, ui_state_data=item_dto.ui_state_data)
+
+        children_ids = self._tree._items[actual_parent_id].get_property("children_ids", [])
+        if index == -1 or index >= len(children_ids):
+            children_ids.append(root_dto.item_id)
+        else:
+            children_ids.insert(index, root_dto.item_id)
+
+        top_id: str = root_dto.item_id
+        self._tree._notify(MTTreeEvent.ITEM_ADDED, {"item_id": top_id, "parent_id": actual_parent_id})
+        self._tree._notify_tree_crud()
+        return top_id
+
     def remove_item(self, item_id: str) -> bool:
         """
         트리에서 아이템을 삭제합니다. 자식도 재귀적으로 삭제됩니다.
@@ -159,6 +202,17 @@ class _MTTreeModifiable:
             MTTreeError: 루트 아이템 삭제 시
             MTItemNotFoundError: 아이템이 존재하지 않을 때
         """
+        return self._remove_item(item_id, validate=True)
+
+    def _remove_item(self, item_id: str, validate: bool) -> bool:
+        """
+        아이템과 하위 아이템을 삭제합니다. 검증은 최상위 삭제에서 한 번만 수행합니다.
+        Args:
+            item_id (str): 삭제할 아이템 ID
+            validate (bool): 삭제 전 검증 단계 실행 여부
+        Returns:
+            bool: 성공 여부
+        """
         if item_id == self._tree._root_id:
             raise exc.MTTreeError("더미 루트 아이템은 삭제할 수 없습니다.")
         if item_id not in self._tree._items:
@@ -166,9 +220,13 @@ class _MTTreeModifiable:
         
         item_to_remove = self._tree._items[item_id]
         parent_id = item_to_remove.get_property("parent_id")
+        if validate and not self._tree._validate(MTTreeEvent.ITEM_REMOVED, {"item_id": item_id, "parent_id": parent_id}):
+            return False
 
-        if parent_id is not None and parent_id in self._tree._items:
-            parent = self._tree._items[parent_id]
+        # RF : 최상위 아이템은 parent_id가 None이지만 더미 루트의 children_ids에 들어 있음
+        container_id = parent_id if parent_id is not None else self._tree._root_id
+        if container_id is not None and container_id in self._tree._items:
+            parent = self._tree._items[container_id]
             parent_children_ids = parent.get_property("children_ids", [])
             if item_id in parent_children_ids:
                 parent_children_ids.remove(item_id)
@@ -180,12 +238,11 @@ class _MTTreeModifiable:
         
         for child_id in children_to_remove_recursively:
             if child_id in self._tree._items:
-                self.remove_item(child_id)
+                self._remove_item(child_id, validate=False)
                 
         self._tree._notify(MTTreeEvent.ITEM_REMOVED, {"item_id": item_id, "parent_id": parent_id})
 
-        new_stage = self._tree.to_dict() # MTTree 인스턴스에서 전체 데이터를 가져옴
-        self._tree._notify(MTTreeEvent.TREE_CRUD, {"tree_data": new_stage}) 
+        self._tree._notify_tree_crud()
         return True
 
     def get_children_for_modification(self, parent_id: str | None) -> List[IMTItem]:
@@ -231,24 +288,35 @@ class _MTTreeModifiable:
             raise exc.MTTreeError(f"순환 참조 발생: {item_id}는 {actual_new_parent_id}의 조상입니다.")
         item = self._tree._items[item_id]
         old_parent_id = item.get_property("parent_id")
-        if old_parent_id == actual_new_parent_id and new_index != -1:
+        if not self._tree._validate(MTTreeEvent.ITEM_MOVED, {"item_id": item_id, "new_parent_id": actual_new_parent_id, "old_parent_id": old_parent_id, "new_index": new_index}):
+            return False
+        old_container_id = old_parent_id if old_parent_id is not None else self._tree._root_id
+        if actual_new_parent_id is not None and old_container_id == actual_new_parent_id and new_index != -1:
+            # RF : 같은 부모 안에서 순서만 바꾸는 경우에도 ITEM_MOVED를 알려야 뷰/인덱스가 따라옴
             parent = self._tree._items[actual_new_parent_id]
             children_ids = parent.get_property("children_ids", [])
-            if item_id in children_ids:
-                children_ids.remove(item_id)
-                if new_index == -1 or new_index >= len(children_ids):
-                    children_ids.append(item_id)
-                else:
-                    children_ids.insert(new_index, item_id)
-                parent.set_property("children_ids", children_ids)
+            if item_id not in children_ids:
+                return True
+            old_index = children_ids.index(item_id)
+            children_ids.remove(item_id)
+            if new_index >= len(children_ids):
+                children_ids.append(item_id)
+            else:
+                children_ids.insert(new_index, item_id)
+            position = children_ids.index(item_id)
+            if position == old_index:
+                return True
+            self._tree._notify(MTTreeEvent.ITEM_MOVED, {"item_id": item_id, "new_parent_id": actual_new_parent_id, "old_parent_id": old_parent_id, "new_index": position})
+            self._tree._notify_tree_crud()
             return True
-        if old_parent_id is not None and old_parent_id in self._tree._items:
-            old_parent = self._tree._items[old_parent_id]
+        if old_container_id is not None and old_container_id in self._tree._items:
+            old_parent = self._tree._items[old_container_id]
             old_children = old_parent.get_property("children_ids", [])
             if item_id in old_children:
                 old_children.remove(item_id)
                 old_parent.set_property("children_ids", old_children)
         item.set_property("parent_id", actual_new_parent_id)
+        position = -1
         if actual_new_parent_id is not None:
             new_parent = self._tree._items[actual_new_parent_id]
             children_ids = new_parent.get_property("children_ids", [])
@@ -258,9 +326,9 @@ class _MTTreeModifiable:
                 else:
                     children_ids.insert(new_index, item_id)
                 new_parent.set_property("children_ids", children_ids)
-        self._tree._notify(MTTreeEvent.ITEM_MOVED, {"item_id": item_id, "new_parent_id": actual_new_parent_id, "old_parent_id": old_parent_id})
-        new_stage = self._tree.to_dict()
-        self._tree._notify(MTTreeEvent.TREE_CRUD, {"tree_data": new_stage})
+            position = children_ids.index(item_id)
+        self._tree._notify(MTTreeEvent.ITEM_MOVED, {"item_id": item_id, "new_parent_id": actual_new_parent_id, "old_parent_id": old_parent_id, "new_index": position})
+        self._tree._notify_tree_crud()
         return True
 
     def modify_item(self, item_id: str, item_dto: MTItemDTO) -> bool:
@@ -276,6 +344,8 @@ class _MTTreeModifiable:
         """
         if item_id not in self._tree._items:
             raise exc.MTItemNotFoundError(f"존재하지 않는 아이템 ID: {item_id}")
+        if not self._tree._validate(MTTreeEvent.ITEM_MODIFIED, {"item_id": item_id, "item_dto": item_dto}):
+            return False
 
         item = self._tree._items[item_id]
         
@@ -284,20 +354,145 @@ class _MTTreeModifiable:
         
         self._tree._notify(MTTreeEvent.ITEM_MODIFIED, {"item_id": item_id, "changes": item_dto.to_dict()})
         
-        new_stage = self._tree.to_dict()
-        self._tree._notify(MTTreeEvent.TREE_CRUD, {"tree_data": new_stage})
+        self._tree._notify_tree_crud()
         return True
 
     def reset_tree(self) -> None:
         """
         트리의 모든 아이템을 삭제하고 초기화합니다.
         """
+        if not self._tree._validate(MTTreeEvent.TREE_RESET, {}):
+            return
         self._tree._items = {}
         self._tree._root_id = None
         self._tree._notify(MTTreeEvent.TREE_RESET, {})
 
-        new_stage = self._tree.to_dict() # MTTree 인스턴스에서 전체 데이터를 가져옴
-        self._tree._notify(MTTreeEvent.TREE_CRUD, {"tree_data": new_stage}) 
+        self._tree._notify_tree_crud()
+
+    def remove_items(self, item_ids: List[str]) -> List[str]:
+        """
+        여러 아이템을 한 번에 삭제합니다. 선택된 조상이 있는 아이템은 조상과 함께 삭제됩니다.
+        TREE_CRUD는 마지막에 한 번만 알립니다.
+        Args:
+            item_ids (List[str]): 삭제할 아이템 ID 목록
+        Returns:
+            List[str]: 실제로 삭제한 최상위 아이템 ID 목록 (트리 순서)
+        """
+        removed: List[str] = []
+        with self._tree.batch():
+            for item_id in self._selection_roots(item_ids):
+                if self._remove_item(item_id, validate=True):
+                    removed.append(item_id)
+        return removed
+
+    def move_items(self, item_ids: List[str], new_parent_id: str | None = None, new_index: int = -1) -> List[str]:
+        """
+        여러 아이템을 새 부모의 new_index 위치로 한 번에 옮깁니다. 트리에서의 상대 순서는 유지됩니다.
+        Args:
+            item_ids (List[str]): 이동할 아이템 ID 목록
+            new_parent_id (str | None): 새 부모 ID 또는 None(루트)
+            new_index (int): 이동 전 기준 새 부모의 자식 목록 위치, -1이면 맨 뒤
+        Returns:
+            List[str]: 이동한 아이템 ID 목록 (트리 순서)
+        Raises:
+            MTTreeError: 아이템을 자기 자신이나 하위 아이템 아래로 옮기려 할 때
+            MTItemNotFoundError: 새 부모가 존재하지 않을 때
+        """
+        actual_new_parent_id = new_parent_id if new_parent_id is not None else self._tree._root_id
+        if actual_new_parent_id is None or actual_new_parent_id not in self._tree._items:
+            raise exc.MTItemNotFoundError(f"존재하지 않는 새 부모 아이템 ID: {actual_new_parent_id}")
+        roots = self._selection_roots(item_ids)
+        for item_id in roots:
+            if item_id == actual_new_parent_id or self._tree._is_descendant(item_id, actual_new_parent_id):
+                raise exc.MTTreeError(f"순환 참조 발생: {item_id}는 {actual_new_parent_id}의 조상입니다.")
+
+        # RF : 인덱스 대신 '이동하지 않는 첫 형제'를 기준으로 잡아야 앞쪽 아이템이 빠져도 위치가 어긋나지 않음
+        children_ids = self._tree._items[actual_new_parent_id].get_property("children_ids", [])
+        moving = set(roots)
+        anchor_id = None
+        if new_index != -1:
+            anchor_id = next((child_id for child_id in children_ids[new_index:] if child_id not in moving), None)
+
+        moved: List[str] = []
+        with self._tree.batch():
+            for item_id in roots:
+                index = -1
+                if anchor_id is not None:
+                    index = children_ids.index(anchor_id)
+                    if item_id in children_ids and children_ids.index(item_id) < index:
+                        index -= 1
+                if self.move_item(item_id, new_parent_id, index):
+                    moved.append(item_id)
+        return moved
+
+    def duplicate_items(self, item_ids: List[str]) -> List[str]:
+        """
+        여러 아이템(하위 아이템 포함)을 새 ID로 복제해 각 원본 바로 뒤에 넣습니다.
+        Args:
+            item_ids (List[str]): 복제할 아이템 ID 목록
+        Returns:
+            List[str]: 새로 만든 최상위 복제본 ID 목록 (원본의 트리 순서)
+        """
+        copies: List[str] = []
+        with self._tree.batch():
+            for item_id in self._selection_roots(item_ids):
+                item = self._tree._items[item_id]
+                container_id = item.get_property("parent_id")
+                container_id = container_id if container_id is not None else self._tree._root_id
+                siblings = self._tree._items[container_id].get_property("children_ids", [])
+                index = siblings.index(item_id) + 1 if item_id in siblings else -1
+                new_id = self.add_subtree(self._copy_subtree_dtos(item_id), index)
+                if new_id is not None:
+                    copies.append(new_id)
+        return copies
+
+    def _copy_subtree_dtos(self, item_id: str) -> List[MTItemDTO]:
+        """아이템과 하위 아이템을 새 ID로 복사한 DTO 목록 (루트 먼저, 전위 순서)"""
+        id_map: Dict[str, str] = {}
+        source_dtos: List[MTItemDTO] = []
+        stack = [item_id]
+        while stack:
+            current = self._tree._items[stack.pop()]
+            source_dtos.append(current.to_dto())
+            id_map[current.id] = str(uuid.uuid4())
+            stack.extend(reversed(current.get_property("children_ids", [])))
+        copies: List[MTItemDTO] = []
+        for dto in source_dtos:
+            domain_data = dataclasses.replace(
+                dto.domain_data,
+                parent_id=id_map.get(dto.domain_data.parent_id, dto.domain_data.parent_id),
+                children_ids=[id_map[child_id] for child_id in dto.domain_data.children_ids if child_id in id_map],
+            )
+            ui_state_data = dataclasses.replace(dto.ui_state_data, is_selected=False)
+            copies.append(MTItemDTO(item_id=id_map[dto.item_id], domain_data=domain_data, ui_state_data=ui_state_data))
+        return copies
+
+    def _selection_roots(self, item_ids: List[str]) -> List[str]:
+        """
+        선택 목록에서 존재하지 않는 아이템, 더미 루트, 선택된 조상이 있는 아이템을 빼고 트리 순서(전위)로 정렬합니다.
+        """
+        selected = {item_id for item_id in item_ids if item_id in self._tree._items and item_id != self._tree._root_id}
+        roots = set()
+        for item_id in selected:
+            parent_id = self._tree._items[item_id].get_property("parent_id")
+            while parent_id is not None and parent_id not in selected:
+                parent = self._tree._items.get(parent_id)
+                parent_id = parent.get_property("parent_id") if parent is not None else None
+            if parent_id is None:
+                roots.add(item_id)
+        if not roots:
+            return []
+        ordered: List[str] = []
+        stack = list(reversed(self._tree._items[self._tree._root_id].get_property("children_ids", []))) if self._tree._root_id else []
+        while stack and len(ordered) < len(roots):
+            current_id = stack.pop()
+            if current_id in roots:
+                ordered.append(current_id)
+                continue
+            current = self._tree._items.get(current_id)
+            if current is not None:
+                stack.extend(reversed(current.get_property("children_ids", [])))
+        return ordered
 
     def get_item_dto(self, item_id: str) -> MTItemDTO | None:
         """
@@ -356,7 +551,7 @@ class _MTTreeTraversable:
             if current_item is not None:
                 visitor(current_item)
                 for child_dto in self._tree.get_children_dtos(current_id):
-                    queue.append(child_dto.id)
+                    queue.append(child_dto.item_id)
 
 # 직렬화 관련 포괄적 네이밍으로 변경
 # IMTTreeDictSerializable, IMTTreeJSONSerializable 두 인터페이스를 모두 만족
@@ -534,6 +729,8 @@ class MTTree:
         )
         self._items[MTTree.DUMMY_ROOT_ID] = dummy_root_item
         self._root_id: str | None = MTTree.DUMMY_ROOT_ID
+        self._batch_depth = 0  # begin_batch 중첩 깊이
+        self._crud_pending = False  # 일괄 변경 중 미뤄 둔 TREE_CRUD 여부
         
         self._common = _MTTreeCommon(self)
         self._readable = _MTTreeReadable(self)
@@ -609,6 +806,79 @@ class MTTree:
         """
         return self._modifiable.add_item(item_dto=item_dto, index=index)
     
+    def remove_items(self, item_ids: List[str]) -> List[str]:
+        """
+        여러 아이템을 한 번에 삭제합니다. (TREE_CRUD 한 번)
+        Args:
+            item_ids (List[str]): 삭제할 아이템 ID 목록
+        Returns:
+            List[str]: 삭제한 최상위 아이템 ID 목록
+        """
+        return self._modifiable.remove_items(item_ids)
+
+    def move_items(self, item_ids: List[str], new_parent_id: str | None = None, new_index: int = -1) -> List[str]:
+        """
+        여러 아이템을 상대 순서를 유지한 채 새 부모의 new_index 위치로 옮깁니다. (TREE_CRUD 한 번)
+        Args:
+            item_ids (List[str]): 이동할 아이템 ID 목록
+            new_parent_id (str | None): 새 부모 ID 또는 None(루트)
+            new_index (int): 새 부모의 자식 목록 위치, -1이면 맨 뒤
+        Returns:
+            List[str]: 이동한 아이템 ID 목록
+        """
+        return self._modifiable.move_items(item_ids, new_parent_id, new_index)
+
+    def duplicate_items(self, item_ids: List[str]) -> List[str]:
+        """
+        여러 아이템을 하위 아이템과 함께 복제해 각 원본 바로 뒤에 넣습니다. (TREE_CRUD 한 번)
+        Args:
+            item_ids (List[str]): 복제할 아이템 ID 목록
+        Returns:
+            List[str]: 복제본 ID 목록
+        """
+        return self._modifiable.duplicate_items(item_ids)
+
+    def add_subtree(self, item_dtos: List[MTItemDTO], index: int = -1) -> str | None:
+        """
+        하위 트리(루트 DTO 먼저, 이어서 자손 DTO)를 한 번에 추가합니다.
+        Args:
+            item_dtos (List[MTItemDTO]): 하위 트리 아이템 DTO 목록
+            index (int): 부모의 자식 목록에 삽입할 위치, -1이면 맨 뒤
+        Returns:
+            str | None: 하위 트리 루트 ID 또는 실패 시 None
+        """
+        return self._modifiable.add_subtree(item_dtos, index)
+
+    def begin_batch(self) -> None:
+        """
+        일괄 변경을 시작합니다. end_batch까지 TREE_CRUD 스냅샷을 미루고 마지막에 한 번만 알립니다.
+        중첩해서 호출할 수 있습니다.
+        """
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """일괄 변경을 끝냅니다. 가장 바깥 호출에서 미뤄 둔 TREE_CRUD를 알립니다."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._crud_pending:
+            self._crud_pending = False
+            self._notify_tree_crud()
+
+    @contextmanager
+    def batch(self) -> Iterator["MTTree"]:
+        """begin_batch/end_batch를 감싸는 컨텍스트 관리자"""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    @property
+    def in_batch(self) -> bool:
+        """일괄 변경 중인지 여부"""
+        return self._batch_depth > 0
+    
     
     def remove_item(self, item_id: str) -> bool:
         """
@@ -693,6 +963,15 @@ class MTTree:
             Dict[str, Any]: 트리 상태 딕셔너리
         """
         return self._serializable.to_dict()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Undo 기록과 TREE_CRUD에 쓸 트리 상태를 반환합니다. dict_to_state()로 되돌릴 수 있습니다.
+        기본은 to_dict()와 같고, 일부만 메모리에 두는 트리는 메모리에 있는 부분만 담을 수 있습니다.
+        Returns:
+            Dict[str, Any]: 트리 상태 딕셔너리
+        """
+        return self.to_dict()
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], event_manager: IMTTreeEventManager | None = None) -> IMTTree:
@@ -738,6 +1017,37 @@ class MTTree:
         if self._event_manager:
             self._event_manager.notify(event_type, data)
 
+    def _validate(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> bool:
+        """
+        변경을 적용하기 전에 이벤트 매니저의 검증 단계를 실행합니다.
+        Args:
+            event_type (MTTreeEvent): 적용하려는 변경의 이벤트 타입
+            data (Dict[str, Any]): 변경 내용
+        Returns:
+            bool: 변경을 진행해도 되면 True, 거부되면 False
+        """
+        validate = getattr(self._event_manager, "validate", None) if self._event_manager else None
+        return validate is None or validate(event_type, data) is not False
+
+    def _notify_tree_crud(self) -> None:
+        """
+        변경 후 전체 트리 스냅샷을 TREE_CRUD 이벤트로 알립니다. 일괄 변경 중이면 end_batch까지 미룹니다.
+        이벤트 매니저가 없으면 스냅샷을 만들지 않고, 계측이 켜져 있으면 스냅샷 생성 시간을 기록합니다.
+        """
+        if not self._event_manager:
+            return
+        if self._batch_depth:
+            self._crud_pending = True
+            return
+        metrics = getattr(self._event_manager, "metrics", None)
+        if metrics is None:
+            new_stage = self.snapshot()
+        else:
+            started = perf_counter_ns()
+            new_stage = self.snapshot()
+            metrics.record_payload(MTTreeEvent.TREE_CRUD, perf_counter_ns() - started)
+        self._event_manager.notify(MTTreeEvent.TREE_CRUD, {"tree_data": new_stage})
+
     def get_children_dtos(self, parent_id: str | None) -> List[MTItemDTO]:
         """
         주어진 부모 ID의 자식 아이템 DTO 목록을 반환합니다.
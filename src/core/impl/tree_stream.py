@@ -0,0 +1,301 @@
+import codecs
+import json
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Tuple
+
+from core.impl.tree import MTTree, _MTTreeSerializable
+from core.interfaces.base_item_keys import DomainKeys as DK
+from core.interfaces.base_tree import IMTTree
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager
+
+"""
+트리 JSON 스트리밍 읽기/쓰기입니다.
+쓰기는 아이템을 하나씩 직렬화해 파일에 바로 쓰고, 읽기는 파일을 조각(chunk) 단위로 읽으면서 아이템을 하나씩 파싱해 MTItem으로 만듭니다.
+트리 전체 딕셔너리나 전체 JSON 문자열을 만들지 않으므로, 메모리 사용량은 파일 크기가 아니라 조각 크기와 가장 큰 아이템 하나의 크기로 정해집니다.
+형식은 MTTree.to_dict()를 json.dumps 한 것과 같습니다. (서로 읽고 쓸 수 있음)
+"""
+
+CHUNK_SIZE = 64 * 1024
+ITEMS_KEY = "items"
+_WRITE_BUFFER_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+
+def write_tree_json(tree: IMTTree, fp: IO[str], buffer_size: int = _WRITE_BUFFER_SIZE) -> int:
+    """
+    트리를 JSON으로 fp에 씁니다. 아이템은 하나씩 직렬화해서 buffer_size만큼 모아 씁니다.
+    Args:
+        tree (IMTTree): 저장할 트리
+        fp (IO[str]): 문자열을 쓰는 파일 객체 (바이너리 파일은 codecs.getwriter("utf-8")로 감쌈)
+        buffer_size (int): 한 번에 쓸 문자열 크기
+    Returns:
+        int: 쓴 아이템 수
+    """
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    pending = [f'{{"id":{dumps(tree.id)},"name":{dumps(tree.name)},"root_id":{dumps(tree.root_id)},"{ITEMS_KEY}":{{']
+    pending_size = len(pending[0])
+    count = 0
+    for item_id, item in tree.items.items():
+        piece = f'{"," if count else ""}{dumps(item_id)}:{dumps(item.to_dto().to_dict())}'
+        pending.append(piece)
+        pending_size += len(piece)
+        count += 1
+        if pending_size >= buffer_size:
+            fp.write("".join(pending))
+            pending.clear()
+            pending_size = 0
+    pending.append("}}")
+    fp.write("".join(pending))
+    return count
+
+
+class _JsonTokenStream:
+    """파일을 조각 단위로 읽으면서 JSON 구조 문자와 값을 하나씩 꺼냅니다."""
+
+    def __init__(self, fp: IO[Any], chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._raw_decode = json.JSONDecoder().raw_decode
+
+    def _fill(self) -> bool:
+        """다음 조각을 읽어 버퍼 뒤에 붙입니다. 이미 처리한 앞부분은 버립니다."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+        if isinstance(chunk, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8")()
+            # 여러 바이트 문자가 조각 경계에서 잘리면 다음 조각과 합쳐서 디코딩
+            chunk = self._decoder.decode(chunk, final=self._eof)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """공백을 건너뛰고 다음 문자를 반환합니다. 끝이면 빈 문자열"""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill() and self._eof:
+                return ""
+
+    def expect(self, *chars: str) -> str:
+        char = self.peek()
+        if char == "" or char not in chars:
+            raise json.JSONDecodeError(f"{' 또는 '.join(chars)}이(가) 필요합니다", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나를 파싱합니다. 값이 조각 경계에 걸리면 더 읽어서 다시 시도합니다."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            if end >= len(self._buffer) and not self._eof:
+                self._fill()  # 숫자가 조각 끝에서 잘렸을 수 있음
+                continue
+            self._pos = end
+            return value
+
+    def finish(self) -> None:
+        """남은 내용이 공백뿐인지 확인하며 끝까지 읽습니다."""
+        if self.peek() != "":
+            raise json.JSONDecodeError("JSON 뒤에 남은 데이터가 있습니다", self._buffer, self._pos)
+
+
+def iter_tree_json(fp: IO[Any], chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    트리 JSON을 최상위 키 단위로 읽어 반환합니다. items는 아이템 하나씩 ("items", (아이템 ID, 아이템 딕셔너리))로 반환합니다.
+    Args:
+        fp (IO[Any]): 텍스트 또는 바이너리(UTF-8) 파일 객체
+        chunk_size (int): 한 번에 읽을 크기
+    Raises:
+        json.JSONDecodeError: JSON 형식이 잘못되었을 때
+    """
+    stream = _JsonTokenStream(fp, chunk_size)
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+    else:
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("키는 문자열이어야 합니다", "", 0)
+            stream.expect(":")
+            if key == ITEMS_KEY:
+                stream.expect("{")
+                if stream.peek() == "}":
+                    stream.expect("}")
+                else:
+                    while True:
+                        item_id = stream.value()
+                        stream.expect(":")
+                        yield ITEMS_KEY, (item_id, stream.value())
+                        if stream.expect(",", "}") == "}":
+                            break
+            else:
+                yield key, stream.value()
+            if stream.expect(",", "}") == "}":
+                break
+    stream.finish()
+
+
+def read_tree_json(fp: IO[Any], event_manager: IMTTreeEventManager | None = None, chunk_size: int = CHUNK_SIZE) -> IMTTree:
+    """
+    트리 JSON을 읽으면서 아이템마다 바로 MTItem을 만들어 트리를 구성합니다. MTTree.json_to_tree와 같은 결과입니다.
+    Args:
+        fp (IO[Any]): 텍스트 또는 바이너리(UTF-8) 파일 객체
+        event_manager (IMTTreeEventManager | None): 새 트리의 이벤트 매니저
+        chunk_size (int): 한 번에 읽을 크기
+    """
+    header: Dict[str, Any] = {}
+    tree: MTTree | None = None
+    for key, value in iter_tree_json(fp, chunk_size):
+        if key == ITEMS_KEY:
+            if tree is None:
+                tree = _new_tree(header, event_manager)
+            item_id, item_data = value
+            tree._items[item_id] = _MTTreeSerializable.dict_to_item(item_id, item_data)
+        else:
+            header[key] = value
+    if tree is None:
+        tree = _new_tree(header, event_manager)
+    _apply_header(tree, header)
+    return tree
+
+
+class MTTreeStream(NamedTuple):
+    """저장소가 여는 트리 JSON 스트림 (iter_tree_json 형식의 토큰, 알고 있으면 더미 루트를 뺀 아이템 수)"""
+    tokens: Iterator[Tuple[str, Any]]
+    item_count: int | None = None
+
+
+class MTTreeStreamBuilder:
+    """
+    iter_tree_json 토큰을 받아 트리를 구성하면서, 하위 아이템이 모두 들어온 최상위 그룹을 순서대로 알려 줍니다.
+    아이템은 저장된 순서(추가한 순서)로 오므로 그룹이 연속해서 오지 않아도 되고, 부모보다 자식이 먼저 와도 됩니다.
+    """
+
+    def __init__(self, event_manager: IMTTreeEventManager | None = None):
+        self._event_manager = event_manager
+        self._header: Dict[str, Any] = {}
+        self._tree: MTTree | None = None
+        self._order: List[str] | None = None  # 최상위 아이템 ID (더미 루트의 children_ids)
+        self._next = 0  # 아직 알리지 않은 첫 최상위 그룹 위치
+        self._owner: Dict[str, str] = {}  # 참조된 아이템 -> 속한 최상위 그룹
+        self._missing: Dict[str, int] = {}  # 최상위 그룹 -> 참조했지만 아직 읽지 않은 아이템 수
+
+    @property
+    def item_count(self) -> int:
+        """읽은 아이템 수 (더미 루트 제외. root_id가 items 뒤에 오면 그 전까지는 더미 루트도 셈)"""
+        if self._tree is None:
+            return 0
+        items = self._tree._items
+        return len(items) - (1 if self._header.get("root_id") in items else 0)
+
+    @property
+    def tree(self) -> MTTree:
+        if self._tree is None:
+            self._tree = _new_tree(self._header, self._event_manager)
+        return self._tree
+
+    def feed(self, key: str, value: Any) -> List[str]:
+        """
+        토큰 하나를 반영합니다.
+        Returns:
+            List[str]: 이번에 완성된 최상위 그룹 ID (저장된 순서, 앞 그룹이 완성되어야 뒤 그룹도 알림)
+        """
+        if key != ITEMS_KEY:
+            self._header[key] = value
+            if key == "root_id" and self._order is None and self._tree is not None and value in self._tree._items:
+                self._start_groups(value)  # items 뒤에 온 root_id
+                return self._take_ready()
+            return []
+        tree = self.tree
+        item_id, item_data = value
+        tree._items[item_id] = _MTTreeSerializable.dict_to_item(item_id, item_data)
+        if item_id == self._header.get("root_id"):
+            self._start_groups(item_id)
+        else:
+            top_id = self._owner.get(item_id)
+            if top_id is not None:
+                self._missing[top_id] -= 1
+                self._attach(item_id, top_id)
+        return self._take_ready()
+
+    def finish(self) -> List[str]:
+        """
+        스트림이 끝났을 때 호출합니다. items 뒤에 온 헤더를 반영하고, 남은 최상위 그룹을 (빠진 하위 아이템이 있어도) 반환합니다.
+        """
+        tree = self.tree
+        _apply_header(tree, self._header)
+        if self._order is None and tree.root_id in tree._items:
+            self._start_groups(tree.root_id)
+        remaining = self._order[self._next:] if self._order is not None else []
+        self._next += len(remaining)
+        return remaining
+
+    def _start_groups(self, root_id: str) -> None:
+        root = self.tree._items[root_id]
+        self._order = list(root.get_property(DK.CHILDREN, []))
+        for top_id in self._order:
+            if top_id in self._owner:
+                continue
+            self._owner[top_id] = top_id
+            self._missing[top_id] = 0
+            if top_id in self.tree._items:
+                self._attach(top_id, top_id)
+            else:
+                self._missing[top_id] = 1
+
+    def _attach(self, item_id: str, top_id: str) -> None:
+        """읽은 아이템의 하위 아이템을 그룹에 등록합니다. 먼저 읽어 둔 하위 아이템은 바로 따라 내려갑니다."""
+        items = self.tree._items
+        stack = [item_id]
+        while stack:
+            item = items[stack.pop()]
+            for child_id in item.get_property(DK.CHILDREN, []):
+                if child_id in self._owner:
+                    continue
+                self._owner[child_id] = top_id
+                if child_id in items:
+                    stack.append(child_id)
+                else:
+                    self._missing[top_id] += 1
+
+    def _take_ready(self) -> List[str]:
+        order = self._order
+        if order is None:
+            return []
+        start = self._next
+        while self._next < len(order) and self._missing.get(order[self._next]) == 0:
+            self._next += 1
+        return order[start:self._next]
+
+
+def _new_tree(header: Dict[str, Any], event_manager: IMTTreeEventManager | None) -> MTTree:
+    tree = MTTree(header.get("id", ""), header.get("name", ""), event_manager)
+    tree._items.clear()
+    return tree
+
+
+def _apply_header(tree: MTTree, header: Dict[str, Any]) -> None:
+    """items 뒤에 온 키도 반영합니다. (MTTree.from_dict와 같은 기본값)"""
+    tree._id = header.get("id", "")
+    tree._name = header.get("name", tree._name)
+    tree._root_id = header.get("root_id")
@@ -121,6 +121,7 @@ class IMTActionPerformer(Protocol, Generic[TActionData]):
 class MTItemDomainDTO:
     name: str = ""
     parent_id: str | None = None
+    children_ids: list[str] = dataclasses.field(default_factory=list)
     node_type: MTNodeType | None = None
     device: MTDevice | None = None
     action: IMTAction | None = None
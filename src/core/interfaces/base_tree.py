@@ -49,6 +49,30 @@ class IMTTreeModifiable(Protocol):
         """트리를 초기 상태로 리셋합니다."""
         ...
 
+    def add_subtree(self, item_dtos: List[MTItemDTO], index: int = -1) -> str | None:
+        """하위 트리(루트 DTO 먼저)를 한 번에 추가합니다."""
+        ...
+
+    def remove_items(self, item_ids: List[str]) -> List[str]:
+        """여러 아이템을 한 번에 삭제합니다."""
+        ...
+
+    def move_items(self, item_ids: List[str], new_parent_id: str | None = None, new_index: int = -1) -> List[str]:
+        """여러 아이템을 상대 순서를 유지한 채 새 부모로 옮깁니다."""
+        ...
+
+    def duplicate_items(self, item_ids: List[str]) -> List[str]:
+        """여러 아이템을 하위 아이템과 함께 복제합니다."""
+        ...
+
+    def begin_batch(self) -> None:
+        """일괄 변경을 시작합니다. (TREE_CRUD를 end_batch까지 미룸)"""
+        ...
+
+    def end_batch(self) -> None:
+        """일괄 변경을 끝냅니다."""
+        ...
+
 # 트리 순회 인터페이스
 class IMTTreeTraversable(Protocol):
     """트리 순회 인터페이스"""
@@ -89,6 +113,12 @@ class IMTTreeClonable(Protocol):
         """트리의 복제본을 생성합니다."""
         ...
 
+class IMTTreeChildrenSource(Protocol):
+    """지연 로딩 트리(MTLazyTree)에 자식 아이템을 공급하는 저장소 인터페이스"""
+    def fetch_children(self, parent_ids: List[str | None]) -> Dict[str | None, List[MTItemDTO]]:
+        """여러 부모의 자식 DTO 목록을 순서대로 한 번에 조회합니다. None은 루트입니다."""
+        ...
+
 # 통합 트리 인터페이스
 class IMTTree(
     IMTTreeReadable,
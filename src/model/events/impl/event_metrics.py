@@ -0,0 +1,150 @@
+import json
+import threading
+from typing import Any, Callable, Dict
+
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+
+
+class MTLatencyHistogram:
+    """마이크로초 단위 로그(2의 거듭제곱) 버킷 지연 시간 히스토그램"""
+    __slots__ = ("count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        # RF : 버킷 i는 [2^(i-1), 2^i) 마이크로초 구간 (0번은 1us 미만)
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, elapsed_ns: int) -> None:
+        """측정값 하나를 기록합니다."""
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        bucket = (elapsed_ns // 1000).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile_us(self, ratio: float) -> float:
+        """버킷 상한 기준 근사 백분위수(마이크로초)를 반환합니다."""
+        if self.count == 0:
+            return 0.0
+        threshold = self.count * ratio
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= threshold:
+                return float(1 << bucket)
+        return self.max_ns / 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """히스토그램을 JSON 직렬화 가능한 딕셔너리로 반환합니다."""
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1_000_000,
+            "mean_us": (self.total_ns / self.count / 1000) if self.count else 0.0,
+            "max_us": self.max_ns / 1000,
+            "p50_us": self.percentile_us(0.5),
+            "p99_us": self.percentile_us(0.99),
+            "buckets_us": {f"<{1 << b}": n for b, n in sorted(self.buckets.items())},
+        }
+
+
+def _callback_name(callback: Callable[..., Any]) -> str:
+    """콜백을 사람이 읽을 수 있는 이름으로 변환합니다."""
+    name = getattr(callback, "__qualname__", None)
+    if name is None:
+        return repr(callback)
+    module = getattr(callback, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class MTEventMetrics:
+    """이벤트 디스패치 계측 수집기 (이벤트별 횟수, 페이로드 생성 시간, 콜백별 실행 시간)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._event_counts: Dict[str, int] = {}
+        self._dispatch: Dict[str, MTLatencyHistogram] = {}
+        self._payload: Dict[str, MTLatencyHistogram] = {}
+        self._callbacks: Dict[str, Dict[str, MTLatencyHistogram]] = {}
+        self._operations: Dict[str, MTLatencyHistogram] = {}
+
+    @staticmethod
+    def _event_key(event_type: MTTreeEvent | str) -> str:
+        return event_type.value if isinstance(event_type, MTTreeEvent) else str(event_type)
+
+    @staticmethod
+    def _histogram(table: Dict[str, MTLatencyHistogram], key: str) -> MTLatencyHistogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = MTLatencyHistogram()
+        return histogram
+
+    def record_dispatch(self, event_type: MTTreeEvent | str, elapsed_ns: int) -> None:
+        """notify 한 번의 전체 디스패치 시간을 기록합니다."""
+        key = self._event_key(event_type)
+        with self._lock:
+            self._event_counts[key] = self._event_counts.get(key, 0) + 1
+            self._histogram(self._dispatch, key).add(elapsed_ns)
+
+    def record_callback(self, event_type: MTTreeEvent | str, callback: Callable[..., Any], elapsed_ns: int) -> None:
+        """콜백 하나의 실행 시간을 기록합니다."""
+        key = self._event_key(event_type)
+        with self._lock:
+            table = self._callbacks.setdefault(key, {})
+            self._histogram(table, _callback_name(callback)).add(elapsed_ns)
+
+    def record_payload(self, event_type: MTTreeEvent | str, elapsed_ns: int) -> None:
+        """이벤트 페이로드(예: 전체 트리 스냅샷) 생성 시간을 기록합니다."""
+        key = self._event_key(event_type)
+        with self._lock:
+            self._histogram(self._payload, key).add(elapsed_ns)
+
+    def record_operation(self, name: str, elapsed_ns: int) -> None:
+        """이벤트 외 작업(예: 히스토리 undo/redo) 실행 시간을 기록합니다."""
+        with self._lock:
+            self._histogram(self._operations, name).add(elapsed_ns)
+
+    def reset(self) -> None:
+        """수집된 모든 측정값을 지웁니다."""
+        with self._lock:
+            self._event_counts.clear()
+            self._dispatch.clear()
+            self._payload.clear()
+            self._callbacks.clear()
+            self._operations.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지의 측정값을 JSON 직렬화 가능한 딕셔너리로 반환합니다."""
+        with self._lock:
+            return {
+                "event_counts": dict(self._event_counts),
+                "dispatch": {k: h.to_dict() for k, h in self._dispatch.items()},
+                "payload": {k: h.to_dict() for k, h in self._payload.items()},
+                "callbacks": {
+                    event: {name: h.to_dict() for name, h in table.items()}
+                    for event, table in self._callbacks.items()
+                },
+                "operations": {k: h.to_dict() for k, h in self._operations.items()},
+            }
+
+    def slowest_callbacks(self, limit: int = 10) -> list[tuple[str, str, float]]:
+        """평균 실행 시간이 긴 콜백 순으로 (이벤트, 콜백, 평균 us) 목록을 반환합니다."""
+        with self._lock:
+            rows = [
+                (event, name, h.total_ns / h.count / 1000)
+                for event, table in self._callbacks.items()
+                for name, h in table.items()
+                if h.count
+            ]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:limit]
+
+    def dump_json(self, file_path: str | None = None) -> str:
+        """측정값을 JSON 문자열로 반환하고, 경로가 주어지면 파일로도 저장합니다."""
+        text = json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+        if file_path:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
@@ -0,0 +1,122 @@
+from enum import IntEnum
+from typing import Any, Dict, List, Tuple
+
+from core.interfaces.base_tree import IMTTree
+from core.interfaces.base_item_data import MTItemDTO
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+
+"""
+이 모듈은 트리 이벤트를 전체 스냅샷 대신 작은 변경분(delta)으로 표현하고,
+다른 트리(복제본)에 적용하는 기능을 제공합니다.
+"""
+
+
+class MTDeltaOp(IntEnum):
+    """트리 변경분 연산 코드"""
+    ADD = 1
+    REMOVE = 2
+    MODIFY = 3
+    MOVE = 4
+    RESET = 5
+    SNAPSHOT = 6
+    ADD_SUBTREE = 7
+
+
+# RF : (연산 코드, 인자 튜플). 전송 크기를 줄이기 위해 딕셔너리 대신 튜플 사용
+MTTreeDelta = Tuple[int, Tuple[Any, ...]]
+
+
+def _index_in_parent(tree: IMTTree, item_id: str, parent_id: str | None) -> int:
+    """부모의 자식 목록에서 아이템의 위치를 반환합니다. 찾지 못하면 -1"""
+    parent = tree.get_item(parent_id) if parent_id is not None else None
+    if parent is None:
+        return -1
+    children_ids = parent.get_property("children_ids", [])
+    return children_ids.index(item_id) if item_id in children_ids else -1
+
+
+def _subtree_dicts(tree: IMTTree, item_id: str) -> List[Dict[str, Any]]:
+    """하위 트리 아이템 DTO 딕셔너리 목록 (루트 먼저, 전위 순서)"""
+    result = []
+    stack = [item_id]
+    while stack:
+        item = tree.get_item(stack.pop())
+        if item is None:
+            continue
+        result.append(item.to_dto().to_dict())
+        stack.extend(reversed(item.get_property("children_ids", [])))
+    return result
+
+
+def encode_event(tree: IMTTree, event_type: MTTreeEvent, data: Dict[str, Any]) -> MTTreeDelta | None:
+    """
+    트리 이벤트를 변경분으로 변환합니다. 이벤트 직후(트리가 변경된 상태)에 호출해야 합니다.
+    Args:
+        tree (IMTTree): 이벤트가 발생한 트리
+        event_type (MTTreeEvent): 이벤트 타입
+        data (Dict[str, Any]): 이벤트 데이터
+    Returns:
+        MTTreeDelta | None: 변경분 또는 변경분이 없는 이벤트(TREE_CRUD 등)면 None
+    """
+    if event_type == MTTreeEvent.ITEM_ADDED:
+        item_id = data["item_id"]
+        item = tree.get_item(item_id)
+        if item is None:
+            return None
+        index = _index_in_parent(tree, item_id, data.get("parent_id"))
+        if item.get_property("children_ids", []):
+            # RF : add_subtree는 루트에 대해서만 ITEM_ADDED를 알리므로 자손까지 함께 담음
+            return (MTDeltaOp.ADD_SUBTREE, (item_id, index, _subtree_dicts(tree, item_id)))
+        return (MTDeltaOp.ADD, (item_id, index, item.to_dto().to_dict()))
+    if event_type == MTTreeEvent.ITEM_REMOVED:
+        return (MTDeltaOp.REMOVE, (data["item_id"],))
+    if event_type == MTTreeEvent.ITEM_MODIFIED:
+        return (MTDeltaOp.MODIFY, (data["item_id"], data["changes"]))
+    if event_type == MTTreeEvent.ITEM_MOVED:
+        item_id = data["item_id"]
+        new_parent_id = data.get("new_parent_id")
+        index = _index_in_parent(tree, item_id, new_parent_id)
+        return (MTDeltaOp.MOVE, (item_id, new_parent_id, index))
+    if event_type == MTTreeEvent.TREE_RESET:
+        return (MTDeltaOp.RESET, ())
+    return None
+
+
+def snapshot_delta(tree_data: Dict[str, Any]) -> MTTreeDelta:
+    """전체 트리 상태를 담은 변경분을 만듭니다. (undo/redo, 재동기화용)"""
+    return (MTDeltaOp.SNAPSHOT, (tree_data,))
+
+
+def apply_delta(tree: IMTTree, delta: MTTreeDelta) -> None:
+    """
+    변경분을 트리에 적용합니다. 이미 반영된 추가/삭제는 무시합니다.
+    Args:
+        tree (IMTTree): 적용 대상 트리
+        delta (MTTreeDelta): 적용할 변경분
+    """
+    op, args = delta
+    if op == MTDeltaOp.ADD:
+        item_id, index, item_dict = args
+        if tree.get_item(item_id) is None:
+            tree.add_item(MTItemDTO.from_dict(item_dict), index=index)
+    elif op == MTDeltaOp.ADD_SUBTREE:
+        item_id, index, item_dicts = args
+        if tree.get_item(item_id) is None:
+            tree.add_subtree([MTItemDTO.from_dict(item_dict) for item_dict in item_dicts], index=index)
+    elif op == MTDeltaOp.REMOVE:
+        item_id, = args
+        if tree.get_item(item_id) is not None:
+            tree.remove_item(item_id)
+    elif op == MTDeltaOp.MODIFY:
+        item_id, changes = args
+        tree.modify_item(item_id, MTItemDTO.from_dict(changes))
+    elif op == MTDeltaOp.MOVE:
+        item_id, new_parent_id, index = args
+        tree.move_item(item_id, new_parent_id, new_index=index)
+    elif op == MTDeltaOp.RESET:
+        tree.reset_tree()
+    elif op == MTDeltaOp.SNAPSHOT:
+        tree_data, = args
+        tree.dict_to_state(tree_data)
+    else:
+        raise ValueError(f"알 수 없는 변경분 연산: {op}")
@@ -0,0 +1,220 @@
+import pickle
+import struct
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List
+
+from core.interfaces.base_tree import IMTTree
+from core.impl.tree import MTTree
+from core.impl.lazy_tree import UNLOADED_KEY
+import core.exceptions as exc
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+from model.events.impl.tree_event_mgr import EventManagerBase
+from model.events.impl.tree_delta import MTDeltaOp, MTTreeDelta, encode_event, snapshot_delta, apply_delta
+
+"""
+이 모듈은 편집기 프로세스의 트리 변경을 다른 프로세스(매크로 실행기 등)로 전달하는 이벤트 버스를 제공합니다.
+
+프레임 형식: 헤더(매직, 버전, 종류, 시퀀스 번호, 변경분 개수) + pickle된 변경분 목록.
+pickle을 사용하므로 같은 사용자가 띄운 신뢰할 수 있는 로컬 프로세스 사이에서만 사용해야 합니다.
+"""
+
+_FRAME_MAGIC = b"MTEV"
+_FRAME_VERSION = 1
+_FRAME_HEADER = struct.Struct("!4sBBQI")
+
+_KIND_DELTAS = 0
+_KIND_RESYNC_REQUEST = 1
+
+
+class MTTreeSyncError(exc.MTTreeError):
+    """이벤트 버스 프레임이 손상되었거나 호환되지 않을 때 발생하는 예외입니다."""
+    pass
+
+
+def encode_frame(kind: int, seq: int, deltas: List[MTTreeDelta]) -> bytes:
+    """변경분 목록을 전송용 바이트 프레임으로 인코딩합니다."""
+    body = pickle.dumps(deltas, protocol=pickle.HIGHEST_PROTOCOL) if deltas else b""
+    return _FRAME_HEADER.pack(_FRAME_MAGIC, _FRAME_VERSION, kind, seq, len(deltas)) + body
+
+
+def decode_frame(frame: bytes) -> tuple[int, int, List[MTTreeDelta]]:
+    """바이트 프레임을 (종류, 시퀀스 번호, 변경분 목록)으로 디코딩합니다."""
+    if len(frame) < _FRAME_HEADER.size:
+        raise MTTreeSyncError("프레임 헤더가 너무 짧습니다.")
+    magic, version, kind, seq, count = _FRAME_HEADER.unpack_from(frame)
+    if magic != _FRAME_MAGIC or version != _FRAME_VERSION:
+        raise MTTreeSyncError(f"지원하지 않는 프레임입니다: magic={magic!r}, version={version}")
+    deltas: List[MTTreeDelta] = pickle.loads(frame[_FRAME_HEADER.size:]) if count else []
+    if len(deltas) != count:
+        raise MTTreeSyncError(f"변경분 개수 불일치: 헤더 {count}, 본문 {len(deltas)}")
+    return kind, seq, deltas
+
+
+class MTTreeEventForwarder(EventManagerBase):
+    """
+    로컬 구독자에게 이벤트를 알리면서, 변경분을 모아 연결(파이프/소켓) 너머로 전달하는 이벤트 매니저입니다.
+    변경분은 TREE_CRUD(변경 하나가 끝난 시점)마다 한 프레임으로 묶어 전송합니다.
+    """
+
+    def __init__(self, connection: Connection, tree: IMTTree | None = None, max_batch: int = 256):
+        """
+        Args:
+            connection (Connection): multiprocessing 파이프/리스너 연결 (양방향)
+            tree (IMTTree | None): 변경분을 인코딩할 원본 트리. 나중에 bind_tree로 지정 가능
+            max_batch (int): 한 프레임에 담을 최대 변경분 개수
+        """
+        super().__init__()
+        self._connection = connection
+        self._tree = tree
+        self._max_batch = max_batch
+        self._pending: List[MTTreeDelta] = []
+        self._seq = 0
+
+    @property
+    def seq(self) -> int:
+        """마지막으로 전송한 프레임의 시퀀스 번호"""
+        return self._seq
+
+    def bind_tree(self, tree: IMTTree) -> None:
+        """변경분을 인코딩할 원본 트리를 지정합니다."""
+        self._tree = tree
+
+    def watch_state_manager(self, state_manager: EventManagerBase) -> None:
+        """undo/redo로 트리 전체가 바뀌는 경우 스냅샷을 전송하도록 상태 관리자를 구독합니다."""
+        state_manager.subscribe(MTTreeEvent.TREE_UNDO, self._on_history_changed)
+        state_manager.subscribe(MTTreeEvent.TREE_REDO, self._on_history_changed)
+
+    def _on_history_changed(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        # 지연 로딩 트리의 스냅샷은 불러온 부분뿐이므로 상대에게는 전체를 만들어 보냄
+        self.send_snapshot(None if UNLOADED_KEY in data else data)
+
+    def notify(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        if event_type == MTTreeEvent.TREE_CRUD:
+            self.flush()
+        elif self._tree is not None:
+            # RF : 로컬 구독자가 트리를 다시 바꾸기 전에, 이벤트 시점의 상태로 인코딩
+            delta = encode_event(self._tree, event_type, data)
+            if delta is not None:
+                self._pending.append(delta)
+                if len(self._pending) >= self._max_batch:
+                    self.flush()
+        super().notify(event_type, data)
+
+    def send_snapshot(self, tree_data: Dict[str, Any] | None = None) -> None:
+        """
+        대기 중인 변경분을 버리고 전체 트리 상태를 전송합니다. (초기 동기화, undo/redo, 재동기화 요청)
+        Args:
+            tree_data (Dict[str, Any] | None): 전송할 트리 상태. None이면 바인딩된 트리에서 생성
+        """
+        if tree_data is None:
+            if self._tree is None:
+                return
+            tree_data = self._tree.to_dict()
+        self._pending = [snapshot_delta(tree_data)]
+        self._send_pending()
+
+    def flush(self) -> int:
+        """
+        대기 중인 변경분을 한 프레임으로 전송합니다. 재동기화 요청이 와 있으면 스냅샷을 먼저 보냅니다.
+        Returns:
+            int: 전송한 변경분 개수
+        """
+        if self._resync_requested():
+            self.send_snapshot()
+            return 1
+        return self._send_pending()
+
+    def _send_pending(self) -> int:
+        if not self._pending:
+            return 0
+        deltas, self._pending = self._pending, []
+        self._seq += 1
+        self._connection.send_bytes(encode_frame(_KIND_DELTAS, self._seq, deltas))
+        return len(deltas)
+
+    def _resync_requested(self) -> bool:
+        requested = False
+        while self._connection.poll():
+            kind, _, _ = decode_frame(self._connection.recv_bytes())
+            if kind == _KIND_RESYNC_REQUEST:
+                requested = True
+        return requested
+
+    def close(self) -> None:
+        """남은 변경분을 전송하고 연결을 닫습니다."""
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+
+class MTTreeReplica:
+    """
+    이벤트 버스로 받은 변경분을 적용해 원본 트리와 같은 상태를 유지하는 복제본입니다.
+    시퀀스 번호가 끊기면 재동기화를 요청하고, 스냅샷을 받을 때까지 변경분을 무시합니다.
+    """
+
+    def __init__(self, connection: Connection, tree: IMTTree | None = None):
+        """
+        Args:
+            connection (Connection): MTTreeEventForwarder와 연결된 반대쪽 연결
+            tree (IMTTree | None): 변경분을 적용할 트리. None이면 빈 MTTree 생성
+        """
+        self._connection = connection
+        self._tree = tree if tree is not None else MTTree("", "")
+        self._last_seq = 0
+        self._needs_resync = False
+
+    @property
+    def tree(self) -> IMTTree:
+        """복제된 트리"""
+        return self._tree
+
+    @property
+    def last_seq(self) -> int:
+        """마지막으로 적용한 프레임의 시퀀스 번호"""
+        return self._last_seq
+
+    @property
+    def needs_resync(self) -> bool:
+        """재동기화 스냅샷을 기다리는 중인지 여부"""
+        return self._needs_resync
+
+    def poll(self, timeout: float = 0.0) -> int:
+        """
+        도착한 프레임을 모두 적용합니다.
+        Args:
+            timeout (float): 첫 프레임을 기다릴 최대 시간(초)
+        Returns:
+            int: 적용한 변경분 개수
+        """
+        applied = 0
+        if not self._connection.poll(timeout):
+            return 0
+        while True:
+            applied += self._handle_frame(self._connection.recv_bytes())
+            if not self._connection.poll():
+                return applied
+
+    def _handle_frame(self, frame: bytes) -> int:
+        kind, seq, deltas = decode_frame(frame)
+        if kind != _KIND_DELTAS:
+            return 0
+        is_snapshot = bool(deltas) and deltas[0][0] == MTDeltaOp.SNAPSHOT
+        if not is_snapshot:
+            if self._needs_resync:
+                return 0
+            if seq != self._last_seq + 1:
+                self.request_resync()
+                return 0
+        for delta in deltas:
+            apply_delta(self._tree, delta)
+        self._last_seq = seq
+        self._needs_resync = False
+        return len(deltas)
+
+    def request_resync(self) -> None:
+        """원본에 전체 스냅샷을 요청합니다."""
+        if not self._needs_resync:
+            self._needs_resync = True
+            self._connection.send_bytes(encode_frame(_KIND_RESYNC_REQUEST, self._last_seq, []))
@@ -1,35 +1,191 @@
-from typing import Any, Dict, List, Set
+import inspect
+import weakref
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Tuple
 
-from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager, TreeEventCallback, MTTreeEvent
+from model.events.interfaces.base_tree_event_mgr import (
+    IMTTreeEventManager, TreeEventCallback, TreeEventValidator, MTTreeEvent, MTEventPriority, MTEventResult,
+)
+from model.events.impl.event_metrics import MTEventMetrics
 
-class EventManagerBase(IMTTreeEventManager):
-    def __init__(self):
-        self._subscribers: Dict[MTTreeEvent, List[TreeEventCallback]] = {event: [] for event in MTTreeEvent}
+# RF : 구독자 참조 해석 함수. 약한 참조면 대상이 소멸했을 때 None을 반환
+_CallbackRef = Callable[[], TreeEventCallback | None]
 
-    def subscribe(self, event_type: MTTreeEvent, callback: TreeEventCallback) -> None:
-        self._subscribers[event_type].append(callback)
 
-    def unsubscribe(self, event_type: MTTreeEvent, callback: TreeEventCallback) -> None:
-        self._subscribers[event_type] = [cb for cb in self._subscribers[event_type] if cb != callback]
+class MTSubscriberList:
+    """이벤트 하나의 구독자 목록 (우선순위 순서 유지, O(1) 추가/제거, 약한 참조 자동 정리)
 
-    def notify(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
-        for callback in self._subscribers[event_type]:
-            callback(event_type, data)
+    바운드 메서드는 기본적으로 WeakMethod로 보관하여 닫힌 뷰/뷰모델이 누수되지 않도록 합니다.
+    실행 순서는 우선순위 내림차순, 같은 우선순위는 구독 순서이며 변경 시에만 다시 정렬합니다.
+    """
+    __slots__ = ("_entries", "_order", "__weakref__")
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, Tuple[_CallbackRef, int]] = {}
+        self._order: List[_CallbackRef] | None = None
+
+    @staticmethod
+    def _key(callback: TreeEventCallback) -> Hashable:
+        """콜백의 식별 키를 반환합니다. 바운드 메서드는 (객체, 함수) 쌍으로 식별합니다."""
+        if inspect.ismethod(callback):
+            return (id(callback.__self__), id(callback.__func__))
+        return id(callback)
+
+    def add(self, callback: TreeEventCallback, weak: bool | None = None, priority: int = MTEventPriority.NORMAL) -> None:
+        """콜백을 추가합니다. weak가 None이면 바운드 메서드만 약한 참조로 보관합니다."""
+        key = self._key(callback)
+        if key in self._entries:
+            return
+        if weak is None:
+            weak = inspect.ismethod(callback)
+        self._order = None
+        if not weak:
+            self._entries[key] = (lambda: callback, int(priority))
+            return
+
+        owner_ref = weakref.ref(self)
+
+        def _prune(dead_ref: Any, key: Hashable = key) -> None:
+            owner = owner_ref()
+            if owner is None:
+                return
+            entry = owner._entries.get(key)
+            if entry is not None and entry[0] is dead_ref:
+                del owner._entries[key]
+                owner._order = None
+
+        ref: _CallbackRef
+        if inspect.ismethod(callback):
+            ref = weakref.WeakMethod(callback, _prune)
+        else:
+            ref = weakref.ref(callback, _prune)
+        self._entries[key] = (ref, int(priority))
+
+    def discard(self, callback: TreeEventCallback) -> None:
+        """콜백을 제거합니다. 등록되지 않은 콜백이면 무시합니다."""
+        if self._entries.pop(self._key(callback), None) is not None:
+            self._order = None
+
+    def snapshot(self) -> List[TreeEventCallback]:
+        """현재 살아 있는 콜백 목록을 실행 순서대로 복사해 반환합니다. (알림 중 구독 변경에 안전)"""
+        order = self._order
+        if order is None:
+            # RF : sorted는 안정 정렬이므로 같은 우선순위는 삽입(구독) 순서 유지
+            entries = sorted(self._entries.values(), key=lambda entry: -entry[1])
+            order = self._order = [ref for ref, _ in entries]
+        callbacks = []
+        for ref in order:
+            callback = ref()
+            if callback is not None:
+                callbacks.append(callback)
+        return callbacks
+
+    def __contains__(self, callback: object) -> bool:
+        if not callable(callback):
+            return False
+        entry = self._entries.get(self._key(callback))
+        return entry is not None and entry[0]() is not None
+
+    def __iter__(self) -> Iterator[TreeEventCallback]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return sum(1 for ref, _ in self._entries.values() if ref() is not None)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+
+class EventManagerBase(IMTTreeEventManager):
+    # RF : 계측이 꺼져 있으면 None. notify는 이 값 하나만 확인하고 빠른 경로로 진행
+    _metrics: MTEventMetrics | None = None
 
-class EventManagerSet(EventManagerBase):
     def __init__(self):
-        self._subscribers: Dict[MTTreeEvent, Set[TreeEventCallback]] = {event: set() for event in MTTreeEvent}
+        self._subscribers: Dict[MTTreeEvent, MTSubscriberList] = {event: MTSubscriberList() for event in MTTreeEvent}
+        self._validators: Dict[MTTreeEvent, MTSubscriberList] = {}
+
+    @property
+    def metrics(self) -> MTEventMetrics | None:
+        """활성화된 계측 수집기를 반환합니다. 비활성 상태면 None"""
+        return self._metrics
+
+    def enable_metrics(self, metrics: MTEventMetrics | None = None) -> MTEventMetrics:
+        """디스패치 계측을 켭니다. 수집기를 공유하려면 기존 인스턴스를 넘깁니다."""
+        self._metrics = metrics if metrics is not None else MTEventMetrics()
+        return self._metrics
 
-    def subscribe(self, event_type: MTTreeEvent, callback: TreeEventCallback) -> None:
-        self._subscribers[event_type].add(callback)
+    def disable_metrics(self) -> None:
+        """디스패치 계측을 끕니다."""
+        self._metrics = None
+
+    def subscribe(self, event_type: MTTreeEvent, callback: TreeEventCallback, weak: bool | None = None,
+                  priority: int = MTEventPriority.NORMAL) -> None:
+        """이벤트를 구독합니다. 같은 콜백의 중복 구독은 한 번만 등록됩니다."""
+        self._subscribers[event_type].add(callback, weak, priority)
 
     def unsubscribe(self, event_type: MTTreeEvent, callback: TreeEventCallback) -> None:
         self._subscribers[event_type].discard(callback)
 
     def notify(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
-        for callback in self._subscribers[event_type]:
-            callback(event_type, data)
+        """우선순위 순서로 구독자에게 알립니다. 구독자가 CONSUMED를 반환하면 전파를 멈춥니다."""
+        subscribers = self._subscribers[event_type]
+        metrics = self._metrics
+        if metrics is not None:
+            self._notify_measured(metrics, event_type, data, subscribers.snapshot())
+            return
+        if not subscribers:
+            return
+        for callback in subscribers.snapshot():
+            if callback(event_type, data) is MTEventResult.CONSUMED:
+                break
+
+    def _notify_measured(self, metrics: MTEventMetrics, event_type: MTTreeEvent, data: Dict[str, Any],
+                         callbacks: List[TreeEventCallback]) -> None:
+        """콜백별 실행 시간을 기록하며 알립니다."""
+        started = perf_counter_ns()
+        try:
+            for callback in callbacks:
+                callback_started = perf_counter_ns()
+                try:
+                    result = callback(event_type, data)
+                finally:
+                    metrics.record_callback(event_type, callback, perf_counter_ns() - callback_started)
+                if result is MTEventResult.CONSUMED:
+                    break
+        finally:
+            metrics.record_dispatch(event_type, perf_counter_ns() - started)
+
+    def add_validator(self, event_type: MTTreeEvent, validator: TreeEventValidator, weak: bool | None = None,
+                      priority: int = MTEventPriority.NORMAL) -> None:
+        """변경 전 검증 콜백을 등록합니다. 검증 콜백이 False를 반환하면 변경이 거부됩니다."""
+        validators = self._validators.get(event_type)
+        if validators is None:
+            validators = self._validators[event_type] = MTSubscriberList()
+        validators.add(validator, weak, priority)
+
+    def remove_validator(self, event_type: MTTreeEvent, validator: TreeEventValidator) -> None:
+        validators = self._validators.get(event_type)
+        if validators is not None:
+            validators.discard(validator)
+
+    def validate(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> bool:
+        """
+        변경을 적용하기 전에 검증 콜백을 실행합니다. (스냅샷 생성 전이므로 비용이 작아야 함)
+        Returns:
+            bool: 모든 검증 콜백이 허용하면 True, 하나라도 False를 반환하면 False
+        """
+        validators = self._validators.get(event_type)
+        if not validators:
+            return True
+        for validator in validators.snapshot():
+            if validator(event_type, data) is False:
+                return False
+        return True
+
+class EventManagerSet(EventManagerBase):
+    """(호환용) 중복 없는 구독자 관리자. 현재는 EventManagerBase가 중복 없이 순서를 보장하므로 동일하게 동작"""
+    pass
 
 class MTTreeEventManager(EventManagerBase):
     """트리 이벤트 관리자 구현체"""
-    pass 
\ No newline at end of file
+    pass
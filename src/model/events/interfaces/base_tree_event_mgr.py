@@ -1,5 +1,5 @@
 from typing import Any, Callable, Dict, Protocol
-from enum import Enum
+from enum import Enum, IntEnum
 
 # 트리 이벤트 유형을 직접 정의
 class MTTreeEvent(Enum):
@@ -12,6 +12,7 @@ class MTTreeEvent(Enum):
     TREE_CRUD = "tree_crud"
     TREE_UNDO = "tree_undo"
     TREE_REDO = "tree_redo"
+    SUBTREE_UNLOADED = "subtree_unloaded"  # 지연 로딩 트리가 캐시에서 하위 아이템을 내려놓음 (저장된 내용은 그대로)
 
 class MTTreeUIEvent(Enum):
     """트리 UI 이벤트 유형"""
@@ -19,8 +20,21 @@ class MTTreeUIEvent(Enum):
     ITEM_EXPANDED = "item_expanded"
     ITEM_COLLAPSED = "item_collapsed"
 
-# 콜백 타입 정의 (타입 힌트)
-TreeEventCallback = Callable[[MTTreeEvent, Dict[str, Any]], None]
+class MTEventPriority(IntEnum):
+    """구독자 실행 우선순위 (값이 클수록 먼저 실행, 같은 우선순위는 구독 순서)"""
+    HIGHEST = 200   # 인덱스 유지 등 트리 일관성 관련
+    HIGH = 100      # 캐시 무효화 등
+    NORMAL = 0      # 기본값
+    LOW = -100      # UI 갱신 등 다른 구독자 이후에 트리를 읽는 작업
+
+class MTEventResult(Enum):
+    """구독자 콜백 반환값"""
+    CONSUMED = "consumed"   # 이후 구독자에게 이벤트를 전달하지 않음
+
+# 콜백 타입 정의 (타입 힌트). 반환값이 MTEventResult.CONSUMED면 전파 중단
+TreeEventCallback = Callable[[MTTreeEvent, Dict[str, Any]], MTEventResult | None]
+# 변경 전 검증 콜백. False를 반환하면 변경을 거부
+TreeEventValidator = Callable[[MTTreeEvent, Dict[str, Any]], bool]
 
 class IMTTreeEventHandler(Protocol):
     """트리 이벤트 처리 인터페이스"""
@@ -42,4 +56,8 @@ class IMTTreeEventManager(Protocol):
         
     def notify(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
         """이벤트를 구독자들에게 알립니다."""
+        ...
+
+    def validate(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> bool:
+        """변경을 적용하기 전에 검증합니다. False면 변경을 거부합니다."""
         ... 
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Any, Callable, Dict, List, Set, Optional
 from copy import deepcopy
+from time import perf_counter_ns
 
 from core.interfaces.base_tree import IMTTree
 from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
@@ -22,7 +23,8 @@ class History:
     def set_initial_state(self, tree: IMTTree) -> None:
         self._undo_stack = []
         self._redo_stack = []
-        self._stage = tree.to_dict()
+        snapshot = getattr(tree, "snapshot", None)
+        self._stage = snapshot() if snapshot is not None else tree.to_dict()
         return None
 
     def can_undo(self) -> bool:
@@ -75,17 +77,27 @@ class MTTreeStateManager(EventManagerBase, IMTTreeStateManager):
     def can_redo(self) -> bool:
         return self._history.can_redo()
 
+    def _run_history(self, name: str, operation: Callable[..., Dict[str, Any] | None], *args: Any) -> Dict[str, Any] | None:
+        """히스토리 작업을 실행합니다. 계측이 켜져 있으면 실행 시간을 기록합니다."""
+        metrics = self._metrics
+        if metrics is None:
+            return operation(*args)
+        started = perf_counter_ns()
+        result = operation(*args)
+        metrics.record_operation(f"history.{name}", perf_counter_ns() - started)
+        return result
+
     def new_undo(self, new_stage: Dict[str, Any]) -> Dict[str, Any] | None:
-        result = self._history.new_undo(new_stage)
+        result = self._run_history("new_undo", self._history.new_undo, new_stage)
         self.notify(MTTreeEvent.TREE_CRUD, self._history._stage)
         return result
 
     def undo(self) -> Dict[str, Any] | None:
-        result = self._history.undo()
+        result = self._run_history("undo", self._history.undo)
         self.notify(MTTreeEvent.TREE_UNDO, self._history._stage)
         return result
 
     def redo(self) -> Dict[str, Any] | None:
-        result = self._history.redo()
+        result = self._run_history("redo", self._history.redo)
         self.notify(MTTreeEvent.TREE_REDO, self._history._stage)
-        return result 
\ No newline at end of file
+        return result
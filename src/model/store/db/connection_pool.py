@@ -0,0 +1,257 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Deque, Dict, Iterator, List
+
+import core.exceptions as exc
+from model.events.impl.event_metrics import MTLatencyHistogram
+
+"""
+DB-API 연결 풀입니다. (PostgreSQL 저장소가 작업마다 연결/인증/백엔드 fork 하지 않도록 연결을 재사용)
+드라이버와 무관하게 connect 함수만 받으므로 가짜 DB-API 드라이버로 시험할 수 있습니다.
+- 최대 max_size개까지 열고, 모두 사용 중이면 acquire_timeout까지 기다립니다.
+- max_lifetime보다 오래된 연결은 반납/대여할 때 닫습니다. (서버/프록시의 연결 수명 제한, 메모리 증가 대비)
+- health_check_after초 이상 쉬었던 연결은 빌려주기 전에 ping으로 확인하고, 실패하면 버리고 다른 연결을 줍니다.
+- 반납할 때 rollback()으로 열린 트랜잭션을 정리하고, 닫혔거나 정리에 실패한 연결은 버립니다.
+"""
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_LIFETIME = 30 * 60.0
+DEFAULT_HEALTH_CHECK_AFTER = 30.0
+DEFAULT_ACQUIRE_TIMEOUT = 10.0
+
+
+class MTPoolTimeoutError(exc.MTTreeError):
+    """acquire_timeout 안에 빌릴 수 있는 연결이 없을 때 발생합니다."""
+
+
+class MTPoolClosedError(exc.MTTreeError):
+    """닫힌 풀에서 연결을 빌리려고 할 때 발생합니다."""
+
+
+def default_ping(conn: Any) -> None:
+    """SELECT 1로 연결이 살아 있는지 확인합니다. 실패하면 드라이버 예외가 그대로 올라갑니다."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    finally:
+        cursor.close()
+    conn.rollback()  # SELECT로 열린 트랜잭션을 닫음 (psycopg2는 첫 문장에서 트랜잭션 시작)
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "created_at", "released_at", "checked_out_ns")
+
+    def __init__(self, conn: Any, now: float):
+        self.conn = conn
+        self.created_at = now
+        self.released_at = now
+        self.checked_out_ns = 0
+
+
+class MTPoolMetrics:
+    """풀 계측 (대기 시간/사용 시간 히스토그램과 연결 생성·폐기 횟수)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.wait = MTLatencyHistogram()
+        self.use = MTLatencyHistogram()
+        self.counters: Dict[str, int] = dict.fromkeys(
+            ("created", "closed", "expired", "health_check_failed", "discarded", "timeouts"), 0)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def record_wait(self, elapsed_ns: int) -> None:
+        with self._lock:
+            self.wait.add(elapsed_ns)
+
+    def record_use(self, elapsed_ns: int) -> None:
+        with self._lock:
+            self.use.add(elapsed_ns)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.wait = MTLatencyHistogram()
+            self.use = MTLatencyHistogram()
+            self.counters = dict.fromkeys(self.counters, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"wait": self.wait.to_dict(), "use": self.use.to_dict(), **self.counters}
+
+
+class MTConnectionPool:
+    """스레드 안전한 크기 제한 DB-API 연결 풀"""
+
+    def __init__(self, connect: Callable[[], Any], max_size: int = DEFAULT_POOL_SIZE,
+                 max_lifetime: float | None = DEFAULT_MAX_LIFETIME,
+                 health_check_after: float | None = DEFAULT_HEALTH_CHECK_AFTER,
+                 acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+                 ping: Callable[[Any], None] = default_ping, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            connect: 새 연결을 여는 함수
+            max_size: 동시에 열어 둘 최대 연결 수
+            max_lifetime: 연결 최대 수명(초). None이면 제한 없음
+            health_check_after: 이 시간(초) 이상 쉬었던 연결은 빌려주기 전에 ping. 0이면 항상, None이면 확인 안 함
+            acquire_timeout: 연결을 기다릴 최대 시간(초)
+            ping: 연결 확인 함수 (실패하면 예외)
+            clock: 수명/유휴 시간 계산용 시계 (초)
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size는 1 이상이어야 합니다: {max_size}")
+        self._connect = connect
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self.acquire_timeout = acquire_timeout
+        self._ping = ping
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._idle: Deque[_PooledConnection] = deque()
+        self._size = 0  # 열려 있는 연결 수 (빌려준 연결 포함)
+        self._closed = False
+        self.metrics = MTPoolMetrics()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 연결 수와 누적 계측을 JSON 직렬화 가능한 딕셔너리로 반환합니다."""
+        with self._cond:
+            size, idle = self._size, len(self._idle)
+        return {"size": size, "idle": idle, "in_use": size - idle, "max_size": self.max_size,
+                **self.metrics.snapshot()}
+
+    def _expired(self, entry: _PooledConnection, now: float) -> bool:
+        return self.max_lifetime is not None and now - entry.created_at >= self.max_lifetime
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[Any]:
+        """
+        연결을 빌려 주고 블록이 끝나면 반납합니다. 커밋은 호출하는 쪽에서 하며, 커밋하지 않은 변경은 반납할 때 롤백됩니다.
+        Raises:
+            MTPoolTimeoutError: timeout(None이면 acquire_timeout) 안에 연결을 빌리지 못했을 때
+        """
+        entry = self._acquire(self.acquire_timeout if timeout is None else timeout)
+        try:
+            yield entry.conn
+        finally:
+            self._release(entry)
+
+    def _acquire(self, timeout: float) -> _PooledConnection:
+        started = perf_counter_ns()
+        deadline = self._clock() + timeout
+        while True:
+            entry = self._take_or_reserve(deadline)
+            if entry is None:
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                self.metrics.count("created")
+                entry = _PooledConnection(conn, self._clock())
+            elif self.health_check_after is not None and \
+                    self._clock() - entry.released_at >= self.health_check_after and not self._healthy(entry):
+                continue
+            self.metrics.record_wait(perf_counter_ns() - started)
+            entry.checked_out_ns = perf_counter_ns()
+            return entry
+
+    def _take_or_reserve(self, deadline: float) -> _PooledConnection | None:
+        """쉬고 있는 연결을 꺼내거나, 새로 열 자리를 예약하고 None을 반환합니다. 둘 다 안 되면 기다립니다."""
+        expired: List[_PooledConnection] = []
+        try:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise MTPoolClosedError("닫힌 연결 풀입니다")
+                    now = self._clock()
+                    while self._idle:
+                        entry = self._idle.pop()  # RF : 최근에 쓴 연결부터 (오래 쉰 연결은 수명이 다해 자연히 정리됨)
+                        if not self._expired(entry, now):
+                            return entry
+                        self._size -= 1
+                        expired.append(entry)
+                    if self._size < self.max_size:
+                        self._size += 1
+                        return None
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self.metrics.count("timeouts")
+                        raise MTPoolTimeoutError(f"{self.max_size}개 연결이 모두 사용 중입니다")
+                    self._cond.wait(remaining)
+        finally:
+            for entry in expired:
+                self.metrics.count("expired")
+                self._close_quietly(entry)
+
+    def _healthy(self, entry: _PooledConnection) -> bool:
+        try:
+            self._ping(entry.conn)
+            return True
+        except Exception:
+            self.metrics.count("health_check_failed")
+            self._discard(entry)
+            return False
+
+    def _release(self, entry: _PooledConnection) -> None:
+        self.metrics.record_use(perf_counter_ns() - entry.checked_out_ns)
+        conn = entry.conn
+        if getattr(conn, "closed", False):
+            self._discard(entry)
+            return
+        try:
+            conn.rollback()  # 다음 사용자가 이전 트랜잭션을 이어받지 않도록 정리
+        except Exception:
+            self._discard(entry)
+            return
+        now = self._clock()
+        with self._cond:
+            if not self._closed and not self._expired(entry, now):
+                entry.released_at = now
+                self._idle.append(entry)
+                self._cond.notify()
+                return
+        if not self._closed:
+            self.metrics.count("expired")
+        self._discard(entry, count=False)
+
+    def _discard(self, entry: _PooledConnection, count: bool = True) -> None:
+        """연결을 닫고 자리를 비웁니다."""
+        if count:
+            self.metrics.count("discarded")
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+        self._close_quietly(entry)
+
+    def _close_quietly(self, entry: _PooledConnection) -> None:
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+        self.metrics.count("closed")
+
+    def close(self) -> None:
+        """쉬고 있는 연결을 모두 닫습니다. 빌려준 연결은 반납될 때 닫힙니다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_quietly(entry)
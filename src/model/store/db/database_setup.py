@@ -1,9 +1,12 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+import threading
 from contextlib import contextmanager
+from typing import Any
 
-from .models import Base # src.model.store.db.models에서 Base를 가져옵니다.
+"""
+SQLAlchemy 엔진/세션 설정 모듈입니다.
+엔진은 처음 사용할 때 생성합니다. (임포트만으로 DB 드라이버를 로드하거나 연결 설정을 만들지 않음)
+"""
 
 # 기존 postgres_repo.py의 연결 정보와 유사하게 설정
 DB_HOST = os.environ.get("DB_HOST", "localhost")
@@ -14,18 +17,50 @@ DB_PASSWORD = os.environ.get("DB_PASSWORD") # 환경 변수에서 비밀번호
 
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-# echo=True로 설정하면 실행되는 SQL 쿼리를 로깅합니다. (개발 시 유용)
-engine = create_engine(DATABASE_URL, echo=False) 
+_engine = None
+_session_factory = None
+_lock = threading.Lock()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_engine():
+    """SQLAlchemy 엔진을 반환합니다. 처음 호출될 때 생성합니다."""
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                from sqlalchemy import create_engine
+                # echo=True로 설정하면 실행되는 SQL 쿼리를 로깅합니다. (개발 시 유용)
+                _engine = create_engine(DATABASE_URL, echo=False)
+    return _engine
+
+
+def get_session_factory():
+    """엔진에 바인딩된 sessionmaker를 반환합니다. 처음 호출될 때 생성합니다."""
+    global _session_factory
+    if _session_factory is None:
+        with _lock:
+            if _session_factory is None:
+                from sqlalchemy.orm import sessionmaker
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return _session_factory
+
+
+def __getattr__(name: str) -> Any:
+    """기존 모듈 속성(engine, SessionLocal) 접근을 지연 생성으로 연결합니다."""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def init_db():
     """데이터베이스 테이블을 생성합니다.
     애플리케이션 시작 시 또는 필요할 때 한 번 호출되어야 합니다.
     MTItem 모델에 정의된 테이블 (mt_items)을 생성합니다.
     """
+    from .models import Base # src.model.store.db.models에서 Base를 가져옵니다.
     # Base.metadata.drop_all(bind=engine) # 기존 테이블 삭제 (테스트 시)
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 @contextmanager
 def get_db_session():
@@ -36,7 +71,8 @@ def get_db_session():
         # db 세션 사용
         pass
     """
-    session = scoped_session(SessionLocal)
+    from sqlalchemy.orm import scoped_session
+    session = scoped_session(get_session_factory())
     try:
         yield session
     except Exception:
@@ -2,7 +2,8 @@ import json
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import psycopg2
 from psycopg2 import sql
@@ -10,11 +11,16 @@ from psycopg2.extras import Json
 
 from core.interfaces.base_tree import IMTTree, IMTTreeSerializable
 from core.impl.tree import MTTree
+from model.store.db.connection_pool import (DEFAULT_ACQUIRE_TIMEOUT, DEFAULT_MAX_LIFETIME, DEFAULT_POOL_SIZE,
+                                            MTConnectionPool, MTPoolClosedError, MTPoolTimeoutError)
 from model.store.repo.interfaces.base_tree_repo import IMTStore
 import core.exceptions as exc
 
 logger = logging.getLogger(__name__)
 
+# JSONB 열의 TOAST 압축 방식 (PostgreSQL 14 이상)
+TOAST_COMPRESSIONS = ("pglz", "lz4")
+
 class PostgreSQLConnectionError(Exception):
     """PostgreSQL 연결 오류"""
     pass
@@ -34,7 +40,11 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
                  port: str = "5432", 
                  dbname: str = "macro_tree", 
                  user: str = "postgres", 
-                 password: Optional[str] = None):
+                 password: Optional[str] = None,
+                 toast_compression: Optional[str] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 max_lifetime: Optional[float] = DEFAULT_MAX_LIFETIME,
+                 acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT):
         """PostgreSQLTreeRepository 초기화
         
         Args:
@@ -43,7 +53,14 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
             dbname: 데이터베이스 이름 (기본값: macro_tree)
             user: 데이터베이스 사용자 (기본값: postgres)
             password: 비밀번호 (선택적, 환경변수 DB_PASSWORD 사용 가능)
+            toast_compression: 트리/스냅샷 JSONB 열의 압축 방식 ("pglz", "lz4", None이면 서버 설정 유지)
+            pool_size: 연결 풀 최대 크기 (여러 스레드가 동시에 쓸 수 있는 연결 수)
+            max_lifetime: 연결 최대 수명(초). None이면 제한 없음
+            acquire_timeout: 풀의 연결이 모두 사용 중일 때 기다릴 최대 시간(초)
         """
+        if toast_compression is not None and toast_compression not in TOAST_COMPRESSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {toast_compression} (사용 가능: {', '.join(TOAST_COMPRESSIONS)})")
+        self.toast_compression = toast_compression
         self.host = host
         self.port = port
         self.dbname = dbname
@@ -51,12 +68,43 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
         
         # 비밀번호 처리 (환경변수 우선)
         self.password = password or os.environ.get("DB_PASSWORD")
+
+        # RF : 작업마다 연결(TCP/인증/백엔드 fork)하지 않도록 연결을 풀에서 재사용
+        self._pool = MTConnectionPool(self._get_connection, max_size=pool_size, max_lifetime=max_lifetime,
+                                      acquire_timeout=acquire_timeout)
         
         # 초기 연결 테스트 및 테이블 생성
         self._ensure_tables_exist()
 
+    @property
+    def pool(self) -> MTConnectionPool:
+        return self._pool
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """연결 풀 상태와 대기/사용 시간 계측을 반환합니다."""
+        stats: Dict[str, Any] = self._pool.stats()
+        return stats
+
+    def close(self) -> None:
+        """풀의 연결을 모두 닫습니다."""
+        self._pool.close()
+
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """풀에서 연결을 빌려 줍니다. 커밋하지 않은 변경은 반납할 때 롤백됩니다.
+
+        Raises:
+            PostgreSQLConnectionError: 연결에 실패했거나 풀에서 연결을 빌리지 못한 경우
+        """
+        try:
+            with self._pool.connection() as conn:
+                yield conn
+        except (MTPoolTimeoutError, MTPoolClosedError) as e:
+            logger.error(f"데이터베이스 연결 대기 실패: {e}")
+            raise PostgreSQLConnectionError(f"데이터베이스 연결 대기 실패: {e}")
+
     def _get_connection(self) -> psycopg2.extensions.connection:
-        """데이터베이스 연결을 반환합니다.
+        """새 데이터베이스 연결을 엽니다. (연결 풀이 사용, 직접 쓰지 말고 _connection() 사용)
         
         Returns:
             데이터베이스 연결 객체
@@ -79,39 +127,56 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
 
     def _ensure_tables_exist(self) -> None:
         """필요한 테이블이 존재하는지 확인하고, 없으면 생성합니다."""
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._connection() as conn:
+                self._create_tables(conn)
+        except PostgreSQLConnectionError as e:
+            logger.error(f"테이블 생성 실패: {e}")
 
-            # 트리 상태 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tree_states (
-                    id SERIAL PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    state JSONB NOT NULL,
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+    def _create_tables(self, conn: psycopg2.extensions.connection) -> None:
+        """필요한 테이블을 만듭니다."""
+        cursor = conn.cursor()
 
-            # 트리 스냅샷 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tree_snapshots (
-                    id SERIAL PRIMARY KEY,
-                    tree_state_id INT REFERENCES tree_states(id) ON DELETE CASCADE,
-                    name TEXT NOT NULL,
-                    snapshot JSONB NOT NULL,
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+        # 트리 상태 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tree_states (
+                id SERIAL PRIMARY KEY,
+                name TEXT NOT NULL,
+                state JSONB NOT NULL,
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # 트리 스냅샷 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tree_snapshots (
+                id SERIAL PRIMARY KEY,
+                tree_state_id INT REFERENCES tree_states(id) ON DELETE CASCADE,
+                name TEXT NOT NULL,
+                snapshot JSONB NOT NULL,
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        conn.commit()
+        if self.toast_compression is not None:
+            self._set_toast_compression(conn)
 
+    def _set_toast_compression(self, conn: psycopg2.extensions.connection) -> None:
+        """JSONB 열의 TOAST 압축 방식을 바꿉니다. 이후 저장하는 행부터 적용되며, 서버가 지원하지 않으면 경고만 남깁니다."""
+        # RF : 큰 JSONB 값은 서버가 TOAST로 이미 압축하므로 클라이언트에서 압축하지 않음 (BYTEA로 바꾸면 JSONB 조회를 쓸 수 없음)
+        cursor = conn.cursor()
+        try:
+            for table, column in (("tree_states", "state"), ("tree_snapshots", "snapshot")):
+                cursor.execute(
+                    sql.SQL("ALTER TABLE {} ALTER COLUMN {} SET COMPRESSION {}").format(
+                        sql.Identifier(table), sql.Identifier(column), sql.SQL(self.toast_compression))
+                )
             conn.commit()
-        except PostgreSQLConnectionError as e:
-            logger.error(f"테이블 생성 실패: {e}")
-        finally:
-            if conn:
-                conn.close()
+        except psycopg2.Error as e:
+            conn.rollback()
+            logger.warning(f"JSONB 압축 방식 변경 실패 (PostgreSQL 14 이상 필요): {e}")
 
     def save(self, tree: IMTTree, tree_id: str | None = None) -> str:
         """트리를 데이터베이스에 저장합니다.
@@ -132,58 +197,52 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
         # 트리를 JSON으로 직렬화
         tree_data = tree.to_dict()
         
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # 기존 트리가 있는지 확인
-            if tree_id and tree_id.isdigit():
-                cursor.execute(
-                    "SELECT id FROM tree_states WHERE id = %s",
-                    (int(tree_id),)
-                )
-                result = cursor.fetchone()
-            else:
-                result = None
-            
-            if result is not None:
-                tree_id = result[0]
-                cursor.execute(
-                    """
-                    UPDATE tree_states 
-                    SET state = %s, name = %s, updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = %s
-                    """,
-                    (Json(tree_data), name, tree_id)
-                )
-            else:
-                # 새 트리 삽입
-                cursor.execute(
-                    """
-                    INSERT INTO tree_states (name, state) 
-                    VALUES (%s, %s) 
-                    RETURNING id
-                    """,
-                    (name, Json(tree_data))
-                )
-                insert_result = cursor.fetchone()
-                if insert_result is not None:
-                    tree_id = insert_result[0]
+            with self._connection() as conn:
+                cursor = conn.cursor()
+            
+                # 기존 트리가 있는지 확인
+                if tree_id and tree_id.isdigit():
+                    cursor.execute(
+                        "SELECT id FROM tree_states WHERE id = %s",
+                        (int(tree_id),)
+                    )
+                    result = cursor.fetchone()
+                else:
+                    result = None
+            
+                if result is not None:
+                    tree_id = result[0]
+                    cursor.execute(
+                        """
+                        UPDATE tree_states 
+                        SET state = %s, name = %s, updated_at = CURRENT_TIMESTAMP 
+                        WHERE id = %s
+                        """,
+                        (Json(tree_data), name, tree_id)
+                    )
                 else:
-                    raise Exception("Failed to insert new tree and retrieve its ID.")
+                    # 새 트리 삽입
+                    cursor.execute(
+                        """
+                        INSERT INTO tree_states (name, state) 
+                        VALUES (%s, %s) 
+                        RETURNING id
+                        """,
+                        (name, Json(tree_data))
+                    )
+                    insert_result = cursor.fetchone()
+                    if insert_result is not None:
+                        tree_id = insert_result[0]
+                    else:
+                        raise Exception("Failed to insert new tree and retrieve its ID.")
                 
-            conn.commit()
-            return str(tree_id)
+                conn.commit()
+                return str(tree_id)
             
         except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
             logger.error(f"트리 저장 실패: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
 
     def load(self, tree_id: str) -> IMTTree | None:
         """트리를 데이터베이스에서 불러옵니다.
@@ -194,38 +253,34 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
         Returns:
             IMTTree 객체 또는 None (실패 시)
         """
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            if tree_id.isdigit():
-                # ID로 불러오기
-                cursor.execute(
-                    "SELECT state FROM tree_states WHERE id = %s",
-                    (int(tree_id),)
-                )
-            else:
-                # 이름으로 불러오기
-                cursor.execute(
-                    "SELECT state FROM tree_states WHERE name = %s",
-                    (tree_id,)
-                )
+            with self._connection() as conn:
+                cursor = conn.cursor()
+            
+                if tree_id.isdigit():
+                    # ID로 불러오기
+                    cursor.execute(
+                        "SELECT state FROM tree_states WHERE id = %s",
+                        (int(tree_id),)
+                    )
+                else:
+                    # 이름으로 불러오기
+                    cursor.execute(
+                        "SELECT state FROM tree_states WHERE name = %s",
+                        (tree_id,)
+                    )
                 
-            result = cursor.fetchone()
-            if result is not None:
-                tree_data = result[0]
-                return MTTree.from_dict(tree_data)
-            else:
-                logger.warning(f"트리를 찾을 수 없음: {tree_id}")
-                return None
+                result = cursor.fetchone()
+                if result is not None:
+                    tree_data = result[0]
+                    return MTTree.from_dict(tree_data)
+                else:
+                    logger.warning(f"트리를 찾을 수 없음: {tree_id}")
+                    return None
             
         except psycopg2.Error as e:
             logger.error(f"트리 불러오기 실패: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
 
     def delete(self, tree_id: str) -> bool:
         """저장된 트리를 삭제합니다.
@@ -236,36 +291,30 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
         Returns:
             성공 여부
         """
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            if tree_id.isdigit():
-                # ID로 삭제
-                cursor.execute(
-                    "DELETE FROM tree_states WHERE id = %s",
-                    (int(tree_id),)
-                )
-            else:
-                # 이름으로 삭제
-                cursor.execute(
-                    "DELETE FROM tree_states WHERE name = %s",
-                    (tree_id,)
-                )
+            with self._connection() as conn:
+                cursor = conn.cursor()
+            
+                if tree_id.isdigit():
+                    # ID로 삭제
+                    cursor.execute(
+                        "DELETE FROM tree_states WHERE id = %s",
+                        (int(tree_id),)
+                    )
+                else:
+                    # 이름으로 삭제
+                    cursor.execute(
+                        "DELETE FROM tree_states WHERE name = %s",
+                        (tree_id,)
+                    )
                 
-            deleted = cursor.rowcount > 0
-            conn.commit()
-            return deleted
+                deleted: bool = cursor.rowcount > 0
+                conn.commit()
+                return deleted
             
         except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
             logger.error(f"트리 삭제 실패: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
                 
     def list_trees(self) -> Dict[str, str]:
         """사용 가능한 모든 트리 목록을 반환합니다.
@@ -273,23 +322,19 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
         Returns:
             트리 ID를 키, 트리 이름을 값으로 하는 딕셔너리
         """
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute(
-                "SELECT id, name FROM tree_states ORDER BY updated_at DESC"
-            )
+                cursor.execute(
+                    "SELECT id, name FROM tree_states ORDER BY updated_at DESC"
+                )
             
-            return {str(row[0]): row[1] for row in cursor.fetchall()}
+                return {str(row[0]): row[1] for row in cursor.fetchall()}
             
         except psycopg2.Error as e:
             logger.error(f"트리 목록 불러오기 실패: {e}")
             return {}
-        finally:
-            if conn:
-                conn.close()
 
     def to_json(self) -> str:
         """트리를 JSON 문자열로 변환합니다.
@@ -337,50 +382,44 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
         if name is None:
             name = f"snapshot_{int(time.time())}"
             
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._connection() as conn:
+                cursor = conn.cursor()
             
-            # 트리 데이터 가져오기
-            cursor.execute(
-                "SELECT state FROM tree_states WHERE id = %s",
-                (int(tree_id),)
-            )
+                # 트리 데이터 가져오기
+                cursor.execute(
+                    "SELECT state FROM tree_states WHERE id = %s",
+                    (int(tree_id),)
+                )
             
-            result = cursor.fetchone()
-            if result is not None:
-                tree_state = result[0]
-            else:
-                raise TreeNotFoundError(f"트리를 찾을 수 없음: {tree_id}")
+                result = cursor.fetchone()
+                if result is not None:
+                    tree_state = result[0]
+                else:
+                    raise TreeNotFoundError(f"트리를 찾을 수 없음: {tree_id}")
                 
-            # 스냅샷 저장
-            cursor.execute(
-                """
-                INSERT INTO tree_snapshots (tree_state_id, name, snapshot) 
-                VALUES (%s, %s, %s)
-                RETURNING id
-                """,
-                (int(tree_id), name, Json(tree_state))
-            )
+                # 스냅샷 저장
+                cursor.execute(
+                    """
+                    INSERT INTO tree_snapshots (tree_state_id, name, snapshot) 
+                    VALUES (%s, %s, %s)
+                    RETURNING id
+                    """,
+                    (int(tree_id), name, Json(tree_state))
+                )
             
-            snapshot_result = cursor.fetchone()
-            if snapshot_result is not None:
-                snapshot_id = snapshot_result[0]
-            else:
-                raise Exception("Failed to create snapshot and retrieve its ID.")
+                snapshot_result = cursor.fetchone()
+                if snapshot_result is not None:
+                    snapshot_id = snapshot_result[0]
+                else:
+                    raise Exception("Failed to create snapshot and retrieve its ID.")
             
-            conn.commit()
-            return str(snapshot_id)
+                conn.commit()
+                return str(snapshot_id)
             
         except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
             logger.error(f"스냅샷 생성 실패: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
 
     def restore_snapshot(self, snapshot_id: str) -> str:
         """스냅샷을 복원합니다.
@@ -391,58 +430,52 @@ class PostgreSQLTreeRepository(IMTStore, IMTTreeSerializable):
         Returns:
             복원된 트리의 ID
         """
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # 스냅샷 데이터 가져오기
-            cursor.execute(
-                """
-                SELECT s.tree_state_id, s.snapshot, t.name
-                FROM tree_snapshots s
-                JOIN tree_states t ON s.tree_state_id = t.id
-                WHERE s.id = %s
-                """,
-                (int(snapshot_id),)
-            )
+            with self._connection() as conn:
+                cursor = conn.cursor()
             
-            result = cursor.fetchone()
-            if result is not None:
-                tree_id, snapshot_data, tree_name = result
-            else:
-                raise TreeNotFoundError(f"스냅샷을 찾을 수 없음: {snapshot_id}")
+                # 스냅샷 데이터 가져오기
+                cursor.execute(
+                    """
+                    SELECT s.tree_state_id, s.snapshot, t.name
+                    FROM tree_snapshots s
+                    JOIN tree_states t ON s.tree_state_id = t.id
+                    WHERE s.id = %s
+                    """,
+                    (int(snapshot_id),)
+                )
+            
+                result = cursor.fetchone()
+                if result is not None:
+                    tree_id, snapshot_data, tree_name = result
+                else:
+                    raise TreeNotFoundError(f"스냅샷을 찾을 수 없음: {snapshot_id}")
                 
-            # 복원된 트리 이름 생성
-            restored_name = f"{tree_name}_restored_{int(time.time())}"
-            
-            # 복원된 트리 저장
-            cursor.execute(
-                """
-                INSERT INTO tree_states (name, state) 
-                VALUES (%s, %s) 
-                RETURNING id
-                """,
-                (restored_name, Json(snapshot_data))
-            )
+                # 복원된 트리 이름 생성
+                restored_name = f"{tree_name}_restored_{int(time.time())}"
+            
+                # 복원된 트리 저장
+                cursor.execute(
+                    """
+                    INSERT INTO tree_states (name, state) 
+                    VALUES (%s, %s) 
+                    RETURNING id
+                    """,
+                    (restored_name, Json(snapshot_data))
+                )
             
-            new_tree_result = cursor.fetchone()
-            if new_tree_result is not None:
-                new_tree_id = new_tree_result[0]
-            else:
-                raise Exception("Failed to restore tree and retrieve its ID.")
+                new_tree_result = cursor.fetchone()
+                if new_tree_result is not None:
+                    new_tree_id = new_tree_result[0]
+                else:
+                    raise Exception("Failed to restore tree and retrieve its ID.")
             
-            conn.commit()
-            return str(new_tree_id)
+                conn.commit()
+                return str(new_tree_id)
             
         except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
             logger.error(f"스냅샷 복원 실패: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
 
     # IMTTreeSerializable 인터페이스의 restore_state 메서드 구현
     def restore_state(self, data: Dict[str, Any]) -> None:
@@ -6,6 +6,9 @@ from sqlalchemy import func, and_, or_
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 
+from core.impl.lazy_tree import DEFAULT_CACHE_SIZE, DEFAULT_PREFETCH_LIMIT, MTLazyTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager
 from model.store.db.models import MTItem, DUMMY_ROOT_ID
 from model.store.db.database_setup import get_db_session
 from model.store.repo.interfaces.base_tree_repo import IMTStore
@@ -13,6 +16,9 @@ import core.exceptions as exc # 사용자 정의 예외 사용 (경로 확인 
 
 logger = logging.getLogger(__name__)
 
+# IN 목록 하나에 넣을 부모 ID 수 (SQLite 바인드 변수 제한 999 이하)
+_FETCH_CHUNK_SIZE = 500
+
 class SQLAlchemyTreeRepo(IMTStore):
     """SQLAlchemy ORM 기반 트리 저장소 구현체"""
 
@@ -61,7 +67,7 @@ class SQLAlchemyTreeRepo(IMTStore):
         target_parent_id = parent_id if parent_id is not None else DUMMY_ROOT_ID
         with get_db_session() as db:
             try:
-                children = (
+                children: List[MTItem] = (
                     db.query(MTItem)
                     .filter(MTItem.parent_id == target_parent_id)
                     .order_by(MTItem.item_order)
@@ -72,11 +78,46 @@ class SQLAlchemyTreeRepo(IMTStore):
                 logger.error(f"Error getting children for parent '{target_parent_id}': {e}")
                 return []
 
+    def fetch_children(self, parent_ids: List[Optional[str]]) -> Dict[Optional[str], List[MTItemDTO]]:
+        """
+        여러 부모의 자식을 item_order 순으로 한 번에 조회합니다. (MTLazyTree의 자식 공급원, None은 더미 루트)
+        필요한 열만 읽고 ORM 객체는 만들지 않습니다.
+        mt_items에는 UI 상태 열이 없으므로 UI 상태는 기본값(접힘)이며, 펼친 그룹을 미리 가져오는 prefetch는 일어나지 않습니다.
+        """
+        result: Dict[Optional[str], List[MTItemDTO]] = {parent_id: [] for parent_id in parent_ids}
+        db_ids = {parent_id if parent_id is not None else DUMMY_ROOT_ID: parent_id for parent_id in parent_ids}
+        keys = list(db_ids)
+        with get_db_session() as db:
+            try:
+                for start in range(0, len(keys), _FETCH_CHUNK_SIZE):
+                    rows = (
+                        db.query(MTItem.id, MTItem.name, MTItem.data, MTItem.parent_id)
+                        .filter(MTItem.parent_id.in_(keys[start:start + _FETCH_CHUNK_SIZE]))
+                        .order_by(MTItem.parent_id, MTItem.item_order)
+                        .all()
+                    )
+                    for item_id, name, data, parent_id in rows:
+                        domain_data = MTItemDomainDTO.from_dict(data or {})
+                        domain_data.name = name
+                        result[db_ids[parent_id]].append(MTItemDTO(item_id, domain_data, MTItemUIStateDTO()))
+            except SQLAlchemyError as e:
+                logger.error(f"Error fetching children for {len(keys)} parents: {e}")
+                # RF : 빈 목록을 돌려주면 지연 로딩 트리가 자식이 없는 그룹으로 기억하므로 예외로 알림
+                raise exc.MTTreeError(f"Failed to fetch children: {e}")
+        return result
+
+    def load_lazy(self, tree_id: str = "sqlalchemy", name: str = "", event_manager: Optional[IMTTreeEventManager] = None,
+                  cache_size: int = DEFAULT_CACHE_SIZE, prefetch_limit: int = DEFAULT_PREFETCH_LIMIT) -> MTLazyTree:
+        """
+        더미 루트의 자식만 읽은 지연 로딩 트리를 반환합니다. 그룹의 자식은 펼치거나 순회할 때 fetch_children()으로 가져옵니다.
+        """
+        return MTLazyTree(tree_id, name, self, event_manager, cache_size=cache_size, prefetch_limit=prefetch_limit)
+
     def get_all_items_in_tree(self) -> List[MTItem]:
         """더미 루트를 제외한 모든 아이템을 반환합니다."""
         with get_db_session() as db:
             try:
-                items = (
+                items: List[MTItem] = (
                     db.query(MTItem)
                     .filter(MTItem.id != DUMMY_ROOT_ID) # 더미 루트 제외
                     .order_by(MTItem.parent_id, MTItem.item_order) # 부모, 순서대로 정렬 (옵션)
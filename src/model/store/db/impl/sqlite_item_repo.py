@@ -0,0 +1,400 @@
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTItemDTO
+from core.interfaces.base_tree import IMTTree
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager, MTTreeEvent
+from model.store.db.sqlite_connection import DEFAULT_BUSY_TIMEOUT, DEFAULT_MAX_READERS, MTSQLiteConnectionManager
+from model.store.repo.interfaces.base_tree_repo import IMTStore
+
+"""
+아이템 한 개를 행 한 개로 저장하는 SQLite 트리 저장소입니다.
+tree_items(tree_id, id, parent_id, order_key, name, payload) 행의 순서는 (parent_id, order_key)로 정해지고,
+payload에는 이름/부모/자식 목록을 뺀 나머지 도메인 데이터와 UI 상태를 JSON으로 둡니다.
+attach_tracker()로 연결된 트리는 트리 이벤트로 바뀐 아이템만 모아 두었다가, save()에서 그 행만 executemany로 씁니다.
+"""
+
+_TRACKED_EVENTS = (
+    MTTreeEvent.ITEM_ADDED,
+    MTTreeEvent.ITEM_REMOVED,
+    MTTreeEvent.ITEM_MODIFIED,
+    MTTreeEvent.ITEM_MOVED,
+    MTTreeEvent.TREE_RESET,
+)
+
+# 행 데이터에서 빼는 도메인 필드 (열로 저장하거나 행 순서로 다시 만듦)
+_STRUCTURE_FIELDS = ("name", "parent_id", "children_ids")
+
+_UPSERT_SQL = """
+INSERT INTO tree_items (tree_id, id, parent_id, order_key, name, payload) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (tree_id, id) DO UPDATE SET
+    parent_id = excluded.parent_id, order_key = excluded.order_key, name = excluded.name, payload = excluded.payload
+"""
+
+# RF : 부모 링크를 따라 하위 아이템을 DB 안에서 모음 (depth는 위에서부터 읽기 위한 정렬 키)
+_SUBTREE_SQL = """
+WITH RECURSIVE subtree (id, depth) AS (
+    SELECT id, 0 FROM tree_items WHERE tree_id = :tree_id AND id = :item_id
+    UNION ALL
+    SELECT child.id, subtree.depth + 1 FROM tree_items AS child
+    JOIN subtree ON child.tree_id = :tree_id AND child.parent_id = subtree.id
+)
+"""
+
+
+class MTDirtyItemTracker:
+    """
+    트리 이벤트로 마지막 저장 이후 바뀐 아이템을 모으는 기록기.
+    - dirty: 내용을 다시 써야 하는 아이템 (추가된 하위 트리 포함)
+    - reordered: 자식 목록이 바뀐 부모 (자식들의 parent_id/order_key만 다시 씀, 루트는 None)
+    - removed: 삭제된 하위 트리의 루트
+    undo/redo나 TREE_RESET처럼 아이템 단위로 표현할 수 없는 변경이 생기면 needs_full_save가 켜집니다.
+    """
+
+    def __init__(self, tree: IMTTree):
+        self._tree = tree
+        self._lock = threading.Lock()
+        self._dirty: Set[str] = set()
+        self._reordered: Set[str | None] = set()
+        self._removed: Set[str] = set()
+        self._needs_full_save = False
+        self._event_manager: IMTTreeEventManager | None = None
+        self._state_manager: Any = None
+
+    @property
+    def tree(self) -> IMTTree:
+        return self._tree
+
+    @property
+    def needs_full_save(self) -> bool:
+        return self._needs_full_save
+
+    @property
+    def pending_count(self) -> int:
+        """다음 저장에서 다시 쓸 아이템/부모/삭제 수의 합"""
+        return len(self._dirty) + len(self._reordered) + len(self._removed)
+
+    def attach(self, event_manager: IMTTreeEventManager, state_manager: Any = None) -> None:
+        """트리 이벤트(와 상태 관리자의 undo/redo)를 구독합니다."""
+        self.detach()
+        self._event_manager = event_manager
+        for event_type in _TRACKED_EVENTS:
+            event_manager.subscribe(event_type, self._on_tree_event)
+        if state_manager is not None and hasattr(state_manager, "subscribe"):
+            self._state_manager = state_manager
+            state_manager.subscribe(MTTreeEvent.TREE_UNDO, self._on_history_changed)
+            state_manager.subscribe(MTTreeEvent.TREE_REDO, self._on_history_changed)
+
+    def detach(self) -> None:
+        if self._event_manager is not None:
+            for event_type in _TRACKED_EVENTS:
+                self._event_manager.unsubscribe(event_type, self._on_tree_event)
+            self._event_manager = None
+        if self._state_manager is not None:
+            self._state_manager.unsubscribe(MTTreeEvent.TREE_UNDO, self._on_history_changed)
+            self._state_manager.unsubscribe(MTTreeEvent.TREE_REDO, self._on_history_changed)
+            self._state_manager = None
+
+    def take(self) -> Tuple[Set[str], Set[str | None], Set[str]]:
+        """모아 둔 (dirty, reordered, removed)를 꺼내고 비웁니다."""
+        with self._lock:
+            pending = self._dirty, self._reordered, self._removed
+            self._dirty, self._reordered, self._removed = set(), set(), set()
+        return pending
+
+    def clear(self) -> None:
+        """트리 전체를 저장한 뒤 호출합니다."""
+        self.take()
+        self._needs_full_save = False
+
+    def mark_full_save(self) -> None:
+        """증분 저장에 실패해 DB와 트리가 어긋났을 수 있을 때 호출합니다."""
+        self._needs_full_save = True
+
+    def _parent_key(self, parent_id: str | None) -> str | None:
+        return None if parent_id is None or parent_id == self._tree.root_id else parent_id
+
+    def _on_tree_event(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        if self._needs_full_save:
+            return  # 어차피 다음 저장에서 전체를 다시 씀
+        if event_type == MTTreeEvent.TREE_RESET:
+            self._needs_full_save = True
+            return
+        item_id: str | None = data.get("item_id")
+        if item_id is None:
+            return
+        with self._lock:
+            if event_type == MTTreeEvent.ITEM_MODIFIED:
+                self._dirty.add(item_id)
+            elif event_type == MTTreeEvent.ITEM_ADDED:
+                # RF : add_subtree는 하위 트리 루트에 대해서만 알리므로 자손도 함께 표시
+                self._dirty.update(_iter_subtree_ids(self._tree, item_id))
+                self._reordered.add(self._parent_key(data.get("parent_id")))
+            elif event_type == MTTreeEvent.ITEM_REMOVED:
+                self._removed.add(item_id)
+                self._reordered.add(self._parent_key(data.get("parent_id")))
+            elif event_type == MTTreeEvent.ITEM_MOVED:
+                self._reordered.add(self._parent_key(data.get("old_parent_id")))
+                self._reordered.add(self._parent_key(data.get("new_parent_id")))
+
+    def _on_history_changed(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        # RF : undo/redo는 트리 이벤트 없이 상태를 통째로 바꾸므로 바뀐 아이템을 알 수 없음
+        self._needs_full_save = True
+
+
+def _iter_subtree_ids(tree: IMTTree, item_id: str) -> Iterator[str]:
+    items = tree.items
+    stack = [item_id]
+    while stack:
+        current_id = stack.pop()
+        item = items.get(current_id)
+        if item is None:
+            continue
+        yield current_id
+        stack.extend(item.get_property("children_ids", []))
+
+
+def _encode_payload(dto: MTItemDTO) -> str:
+    domain_data = dto.domain_data.to_dict()
+    for field in _STRUCTURE_FIELDS:
+        domain_data.pop(field, None)
+    return json.dumps({"domain_data": domain_data, "ui_state_data": dto.ui_state_data.to_dict()},
+                      ensure_ascii=False, separators=(",", ":"))
+
+
+def _decode_item(item_id: str, parent_id: str | None, name: str, payload: str,
+                 children_ids: List[str]) -> Dict[str, Any]:
+    """행을 MTItemDTO.to_dict() 형식의 딕셔너리로 되돌립니다."""
+    data = json.loads(payload)
+    domain_data = data.get("domain_data", {})
+    domain_data.update(name=name, parent_id=parent_id, children_ids=children_ids)
+    return {"item_id": item_id, "domain_data": domain_data, "ui_state_data": data.get("ui_state_data", {})}
+
+
+class SQLiteItemTreeRepository(IMTStore):
+    """아이템 단위 행으로 저장하는 SQLite 트리 저장소 구현체 (변경된 행만 저장)"""
+
+    def __init__(self, db_path: str = "tree_items.db", max_readers: int = DEFAULT_MAX_READERS,
+                 busy_timeout: float = DEFAULT_BUSY_TIMEOUT):
+        """
+        여러 스레드에서 함께 쓸 수 있습니다. (쓰기는 한 번에 하나, 읽기는 쓰기를 막지 않음)
+        Args:
+            db_path: 데이터베이스 파일 경로
+            max_readers: 동시에 열어 둘 읽기 연결 수
+            busy_timeout: 다른 연결이 잠금을 쥐고 있을 때 기다릴 최대 시간(초)
+        """
+        self.db_path = db_path
+        self._connections = MTSQLiteConnectionManager(db_path, max_readers=max_readers, busy_timeout=busy_timeout)
+        self._trackers: Dict[str, MTDirtyItemTracker] = {}
+        self._init_tables()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """쓰기 연결 (점검/테스트용, 스레드 안전하지 않음)"""
+        writer: sqlite3.Connection = self._connections.writer
+        return writer
+
+    def close(self) -> None:
+        self._connections.close()
+
+    def _init_tables(self) -> None:
+        with self._connections.write() as conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS trees (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL
+            )
+            """)
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS tree_items (
+                tree_id TEXT NOT NULL,
+                id TEXT NOT NULL,
+                parent_id TEXT,
+                order_key INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (tree_id, id)
+            ) WITHOUT ROWID
+            """)
+            conn.execute("""
+            CREATE INDEX IF NOT EXISTS tree_items_children ON tree_items (tree_id, parent_id, order_key)
+            """)
+
+    def save(self, tree: IMTTree, tree_id: str | None = None) -> str:
+        """
+        트리를 저장합니다.
+        attach_tracker()로 연결된 트리는 마지막 저장 이후 바뀐 행만 쓰고, 그 밖에는 트리의 행을 모두 다시 씁니다.
+        """
+        tree_id = tree_id or tree.id
+        tracker = self._trackers.get(tree_id)
+        if tracker is not None and tracker.tree is tree and not tracker.needs_full_save:
+            try:
+                self._save_changes(tree, tree_id, *tracker.take())
+            except Exception:
+                tracker.mark_full_save()
+                raise
+            return tree_id
+        if tracker is not None and tracker.tree is not tree:
+            self.detach_tracker(tree_id)
+        self._save_full(tree, tree_id)
+        if tracker is not None and tracker.tree is tree:
+            tracker.clear()
+        return tree_id
+
+    def _save_full(self, tree: IMTTree, tree_id: str) -> None:
+        rows = self._iter_rows(tree, tree_id, tree.root_id)
+        with self._connections.write() as conn:
+            self._upsert_tree(conn, tree, tree_id)
+            conn.execute("DELETE FROM tree_items WHERE tree_id = ?", (tree_id,))
+            conn.executemany(_UPSERT_SQL, rows)
+
+    def _iter_rows(self, tree: IMTTree, tree_id: str, parent_id: str | None) -> Iterator[Tuple]:
+        """parent_id 아래 모든 아이템의 행 (위에서부터)"""
+        items = tree.items
+        stack = [parent_id]
+        while stack:
+            current_id = stack.pop()
+            parent = items.get(current_id)
+            if parent is None:
+                continue
+            children_ids = parent.get_property("children_ids", [])
+            db_parent_id = None if current_id == tree.root_id else current_id
+            for order_key, child_id in enumerate(children_ids):
+                child = items.get(child_id)
+                if child is not None:
+                    yield self._item_row(tree_id, child.to_dto(), db_parent_id, order_key)
+            stack.extend(children_ids)
+
+    @staticmethod
+    def _item_row(tree_id: str, dto: MTItemDTO, parent_id: str | None, order_key: int) -> Tuple:
+        return tree_id, dto.item_id, parent_id, order_key, dto.domain_data.name or "", _encode_payload(dto)
+
+    @staticmethod
+    def _upsert_tree(conn: sqlite3.Connection, tree: IMTTree, tree_id: str) -> None:
+        conn.execute("INSERT INTO trees (id, name) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET name = excluded.name",
+                          (tree_id, tree.name or tree_id))
+
+    def _save_changes(self, tree: IMTTree, tree_id: str, dirty: Set[str], reordered: Set[str | None],
+                      removed: Set[str]) -> None:
+        """바뀐 아이템만 한 트랜잭션으로 씁니다. 비용은 트리 크기가 아니라 변경 크기(와 바뀐 부모의 자식 수)에 비례합니다."""
+        items = tree.items
+        positions: Dict[str | None, Dict[str, int]] = {}
+
+        def position(item_id: str) -> Tuple[str | None, int]:
+            parent_key = items[item_id].get_property("parent_id")
+            parent_key = None if parent_key == tree.root_id else parent_key
+            if parent_key not in positions:
+                parent = items.get(tree.root_id if parent_key is None else parent_key)
+                children_ids = parent.get_property("children_ids", []) if parent is not None else []
+                positions[parent_key] = {child_id: order for order, child_id in enumerate(children_ids)}
+            return parent_key, positions[parent_key].get(item_id, 0)
+
+        upserts = [self._item_row(tree_id, items[item_id].to_dto(), *position(item_id))
+                   for item_id in dirty if item_id in items]
+        moves = []
+        for parent_key in reordered:
+            parent = items.get(tree.root_id if parent_key is None else parent_key)
+            if parent is None:
+                continue  # 부모도 삭제됨
+            for order_key, child_id in enumerate(parent.get_property("children_ids", [])):
+                if child_id not in dirty:
+                    moves.append((parent_key, order_key, tree_id, child_id))
+        with self._connections.write() as conn:
+            self._upsert_tree(conn, tree, tree_id)
+            conn.executemany(_UPSERT_SQL, upserts)
+            conn.executemany("UPDATE tree_items SET parent_id = ?, order_key = ? WHERE tree_id = ? AND id = ?", moves)
+            # RF : 행 이동을 먼저 반영한 뒤 삭제 대상을 찾아야 삭제 전에 밖으로 옮긴 아이템이 지워지지 않음.
+            #      같은 ID로 다시 추가된 아이템은 트리에 있으므로 남김
+            stale = [(tree_id, item_id) for root_id in removed
+                     for item_id in self._subtree_ids(conn, tree_id, root_id) if item_id not in items]
+            conn.executemany("DELETE FROM tree_items WHERE tree_id = ? AND id = ?", stale)
+
+    @staticmethod
+    def _subtree_ids(conn: sqlite3.Connection, tree_id: str, item_id: str) -> List[str]:
+        cur = conn.execute(_SUBTREE_SQL + "SELECT id FROM subtree", {"tree_id": tree_id, "item_id": item_id})
+        return [row[0] for row in cur.fetchall()]
+
+    def attach_tracker(self, tree: IMTTree, event_manager: IMTTreeEventManager,
+                       state_manager: Any = None, tree_id: str | None = None) -> MTDirtyItemTracker:
+        """
+        트리의 이후 변경을 기록하도록 연결합니다. 이후 save()는 바뀐 행만 씁니다.
+        트리는 저장된 내용과 같은 상태여야 합니다. (저장이나 불러오기 직후) 저장된 적 없는 트리는 먼저 전체를 저장합니다.
+        Args:
+            tree: 기록할 트리
+            event_manager: 트리 이벤트를 알리는 이벤트 매니저
+            state_manager: undo/redo를 알리는 상태 관리자(선택)
+            tree_id: 트리 ID (None이면 tree.id)
+        """
+        tree_id = tree_id or tree.id
+        tracker = self._trackers.get(tree_id)
+        if tracker is None or tracker.tree is not tree:
+            self.detach_tracker(tree_id)
+            with self._connections.read() as conn:
+                stored = conn.execute("SELECT 1 FROM trees WHERE id = ?", (tree_id,)).fetchone() is not None
+            if not stored:
+                self._save_full(tree, tree_id)
+            tracker = MTDirtyItemTracker(tree)
+            self._trackers[tree_id] = tracker
+        tracker.attach(event_manager, state_manager)
+        return tracker
+
+    def detach_tracker(self, tree_id: str) -> None:
+        """변경 기록을 멈춥니다. 다음 save()는 전체를 다시 씁니다."""
+        tracker = self._trackers.pop(tree_id, None)
+        if tracker is not None:
+            tracker.detach()
+
+    def load(self, tree_id: str) -> MTTree | None:
+        with self._connections.read() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")  # 두 조회가 같은 스냅샷을 보도록 함
+            row = conn.execute("SELECT name FROM trees WHERE id = ?", (tree_id,)).fetchone()
+            if row is None:
+                return None
+            cur = conn.execute(
+                "SELECT id, parent_id, name, payload FROM tree_items WHERE tree_id = ? ORDER BY parent_id, order_key",
+                (tree_id,))
+            data = MTTree(tree_id, row[0]).to_dict()
+            root = data["items"][MTTree.DUMMY_ROOT_ID]
+            data["items"].update(self._decode_rows(cur, root["domain_data"]["children_ids"]))
+        return MTTree.from_dict(data)
+
+    @staticmethod
+    def _decode_rows(rows: Iterable[Tuple], root_children: List[str]) -> Dict[str, Dict[str, Any]]:
+        """(id, parent_id, name, payload) 행을 아이템 딕셔너리로 만들고 자식 목록을 행 순서대로 채웁니다."""
+        items: Dict[str, Dict[str, Any]] = {}
+        children: Dict[str | None, List[str]] = {None: root_children}
+        for item_id, parent_id, name, payload in rows:
+            items[item_id] = _decode_item(item_id, parent_id, name, payload, children.setdefault(item_id, []))
+            children.setdefault(parent_id, []).append(item_id)
+        return items
+
+    def load_subtree(self, tree_id: str, item_id: str) -> List[MTItemDTO]:
+        """
+        아이템과 그 하위 아이템만 읽습니다. (재귀 CTE, 트리 전체를 읽지 않음)
+        Returns:
+            List[MTItemDTO]: 하위 트리 루트가 먼저 오고 위에서부터 정렬된 DTO 목록 (add_subtree에 바로 사용 가능).
+                아이템이 없으면 빈 목록
+        """
+        with self._connections.read() as conn:
+            cur = conn.execute(
+                _SUBTREE_SQL + "SELECT item.id, item.parent_id, item.name, item.payload FROM subtree "
+                               "JOIN tree_items AS item ON item.tree_id = :tree_id AND item.id = subtree.id "
+                               "ORDER BY subtree.depth, item.parent_id, item.order_key",
+                {"tree_id": tree_id, "item_id": item_id})
+            items = self._decode_rows(cur, [])
+        return [MTItemDTO.from_dict(item) for item in items.values()]
+
+    def delete(self, tree_id: str) -> bool:
+        self.detach_tracker(tree_id)
+        with self._connections.write() as conn:
+            cur: sqlite3.Cursor = conn.execute("DELETE FROM trees WHERE id = ?", (tree_id,))
+            conn.execute("DELETE FROM tree_items WHERE tree_id = ?", (tree_id,))
+        return cur.rowcount > 0
+
+    def list_trees(self) -> Dict[str, str]:
+        with self._connections.read() as conn:
+            return dict(conn.execute("SELECT id, name FROM trees").fetchall())
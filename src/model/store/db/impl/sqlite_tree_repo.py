@@ -1,59 +1,244 @@
+import codecs
 import sqlite3
 import json
 import os
-from typing import Dict, Optional
+import tempfile
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
 from core.impl.tree import MTTree
+import core.exceptions as exc
+from core.impl.tree_stream import MTTreeStream, iter_tree_json, read_tree_json, write_tree_json
+from model.store.db.sqlite_connection import DEFAULT_BUSY_TIMEOUT, DEFAULT_MAX_READERS, MTSQLiteConnectionManager
+from model.store.db.sqlite_search import (build_search_rows, create_search_index, delete_tree_index, replace_tree_index,
+                                          search_index)
+from model.store.repo.interfaces.base_search import DEFAULT_SEARCH_LIMIT, MTSearchHit
 from model.store.repo.interfaces.base_tree_repo import IMTStore
+from model.store.tree_compression import (MTCompressingWriter, compress_bytes, decompress_bytes, get_codec,
+                                          open_decompressed, resolve_level)
+
+# 이보다 큰 트리 JSON은 메모리 대신 임시 파일에 모았다가 BLOB에 나눠 씀
+_SPOOL_MAX_SIZE = 4 * 1024 * 1024
+_BLOB_CHUNK_SIZE = 64 * 1024
+# RF : 저장하는 동안 쓰기 트랜잭션을 잡고 있으므로 가장 빠른 zlib 수준 사용 (zlib 6보다 2배 빠르고 압축률은 약 18배)
+_DEFAULT_LEVELS = {"zlib": 1}
+# BLOB을 나눠 읽고 쓸 수 있는지 (Python 3.11 이상)
+_HAS_BLOBOPEN = hasattr(sqlite3.Connection, "blobopen")
+
+
+class _Blob(Protocol):
+    """sqlite3.Blob 중 여기서 쓰는 부분"""
+
+    def read(self, length: int = -1, /) -> bytes: ...
+
+    def write(self, data: bytes, /) -> None: ...
+
+    def __enter__(self) -> "_Blob": ...
+
+    def __exit__(self, *args: Any) -> None: ...
+
+
+def _open_blob(conn: sqlite3.Connection, rowid: int, readonly: bool = False) -> _Blob:
+    """tree_data 행의 data BLOB을 엽니다. (mypy 대상인 Python 3.10 타입 정보에는 blobopen이 없음)"""
+    blobopen: Callable[..., _Blob] = getattr(conn, "blobopen")
+    return blobopen("tree_data", "data", rowid, readonly=readonly)
+
+
+class _BlobReader:
+    """sqlite3.Blob을 read(size)만 쓰는 파일 객체처럼 감쌉니다. (TEXT 열도 바이트로 읽힘)"""
+
+    def __init__(self, blob: _Blob) -> None:
+        self._blob = blob
+
+    def read(self, size: int = -1) -> bytes:
+        return self._blob.read(size)
+
 
 class SQLiteTreeRepository(IMTStore):
     """SQLite 기반 트리 저장소 구현체"""
-    def __init__(self, db_path: str = "tree.db"):
+    def __init__(self, db_path: str = "tree.db", compression: str = "zlib", compression_level: int | None = None,
+                 max_readers: int = DEFAULT_MAX_READERS, busy_timeout: float = DEFAULT_BUSY_TIMEOUT):
+        """
+        여러 스레드에서 함께 쓸 수 있습니다. (쓰기는 한 번에 하나, 읽기는 쓰기를 막지 않음)
+        Args:
+            db_path: 데이터베이스 파일 경로
+            compression: 트리 데이터 압축 방식 ("none", "zlib", "lzma"). 압축하지 않고 저장된 예전 행도 읽음
+            compression_level: 압축 수준 (None이면 이 저장소의 기본값)
+            max_readers: 동시에 열어 둘 읽기 연결 수
+            busy_timeout: 다른 연결이 잠금을 쥐고 있을 때 기다릴 최대 시간(초)
+        """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self._codec = get_codec(compression)
+        self.compression = compression
+        if compression_level is None:
+            compression_level = _DEFAULT_LEVELS.get(compression)
+        self.compression_level = resolve_level(self._codec, compression_level)
+        self._connections = MTSQLiteConnectionManager(db_path, max_readers=max_readers, busy_timeout=busy_timeout)
         self._init_table()
+        self.search_enabled = self._init_search_index()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """쓰기 연결 (점검/테스트용, 스레드 안전하지 않음)"""
+        writer: sqlite3.Connection = self._connections.writer
+        return writer
+
+    def close(self) -> None:
+        self._connections.close()
 
     def _init_table(self):
-        cur = self.conn.cursor()
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS tree_data (
-            id TEXT PRIMARY KEY,
-            data TEXT NOT NULL
-        )
-        """)
-        self.conn.commit()
+        with self._connections.write() as conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS tree_data (
+                id TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            )
+            """)
+
+    def _init_search_index(self) -> bool:
+        """검색 색인을 만들고, 색인보다 먼저 저장된 트리가 있으면 한 번 색인합니다. FTS5가 없으면 False"""
+        try:
+            with self._connections.write() as conn:
+                created = create_search_index(conn)
+        except sqlite3.OperationalError:
+            return False  # FTS5 없이 빌드된 SQLite
+        if created:
+            self.rebuild_search_index()
+        return True
+
+    def rebuild_search_index(self) -> int:
+        """저장된 트리를 모두 불러와 검색 색인을 다시 만듭니다. 색인한 트리 수를 반환합니다."""
+        count = 0
+        for tree_id in self.list_trees():
+            tree = self.load(tree_id)
+            if tree is None:
+                continue
+            rows = build_search_rows(tree)
+            with self._connections.write() as conn:
+                replace_tree_index(conn, tree_id, rows)
+            count += 1
+        return count
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[MTSearchHit]:
+        """
+        아이템 이름/노드 타입/동작 설명으로 저장된 트리를 검색합니다. (트리를 불러오지 않음)
+        Returns:
+            List[MTSearchHit]: 관련도 순 (tree_id, item_id, snippet) 목록
+        Raises:
+            MTSearchUnavailableError: SQLite가 FTS5 없이 빌드되었을 때
+        """
+        if not self.search_enabled:
+            raise exc.MTSearchUnavailableError("이 SQLite는 FTS5를 지원하지 않아 검색할 수 없습니다")
+        with self._connections.read() as conn:
+            hits: List[MTSearchHit] = search_index(conn, query, limit)
+        return hits
 
     def save(self, tree: MTTree, tree_id: str | None = None) -> str:
         if tree_id is None:
             tree_id = tree.id
-        data = json.dumps(tree.to_dict(), ensure_ascii=False)
-        cur = self.conn.cursor()
-        cur.execute("REPLACE INTO tree_data (id, data) VALUES (?, ?)", (tree_id, data))
-        self.conn.commit()
+        search_rows = build_search_rows(tree) if self.search_enabled else None
+        if not _HAS_BLOBOPEN:
+            data = json.dumps(tree.to_dict(), ensure_ascii=False)
+            if self._codec is not None:
+                data = compress_bytes(data.encode('utf-8'), self._codec, self.compression_level)
+            with self._connections.write() as conn:
+                conn.execute("REPLACE INTO tree_data (id, data) VALUES (?, ?)", (tree_id, data))
+                if search_rows is not None:
+                    replace_tree_index(conn, tree_id, search_rows)
+            return tree_id
+        # RF : JSON을 아이템 단위로 임시 버퍼에 쓴 뒤, 크기만큼 zeroblob을 잡고 BLOB에 나눠 씀.
+        #      직렬화/압축은 쓰기 잠금 밖에서 하므로 잠금은 BLOB 복사 동안만 잡음
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool:
+            if self._codec is None:
+                write_tree_json(tree, codecs.getwriter('utf-8')(spool))
+            else:
+                with MTCompressingWriter(spool, self._codec, self.compression_level) as writer:
+                    write_tree_json(tree, codecs.getwriter('utf-8')(writer))
+            size = spool.tell()
+            spool.seek(0)
+            with self._connections.write() as conn:
+                cur = conn.execute("REPLACE INTO tree_data (id, data) VALUES (?, zeroblob(?))", (tree_id, size))
+                with _open_blob(conn, cur.lastrowid) as blob:
+                    while chunk := spool.read(_BLOB_CHUNK_SIZE):
+                        blob.write(chunk)
+                if search_rows is not None:
+                    replace_tree_index(conn, tree_id, search_rows)
         return tree_id
 
     def load(self, tree_id: str) -> MTTree | None:
-        cur = self.conn.cursor()
-        cur.execute("SELECT data FROM tree_data WHERE id = ?", (tree_id,))
-        row = cur.fetchone()
-        if row:
-            tree_data = json.loads(row[0])
-            return MTTree.from_dict(tree_data)
-        return None
+        if not _HAS_BLOBOPEN:
+            with self._connections.read() as conn:
+                row = conn.execute("SELECT data FROM tree_data WHERE id = ?", (tree_id,)).fetchone()
+            if row:
+                tree_data = json.loads(self._decode_row(row[0]))
+                return MTTree.from_dict(tree_data)
+            return None
+        with self._connections.read() as conn:
+            rowid = self._rowid(conn, tree_id)
+            if rowid is None:
+                return None
+            with _open_blob(conn, rowid, readonly=True) as blob:
+                return read_tree_json(open_decompressed(_BlobReader(blob)))
+
+    def open_tree_stream(self, tree_id: str) -> Optional[MTTreeStream]:
+        """
+        트리 BLOB을 읽는 대로 토큰으로 넘기는 스트림을 엽니다. (백그라운드 불러오기용, 읽는 동안 읽기 연결 하나를 씀)
+        BLOB을 나눠 읽을 수 없으면(Python 3.11 미만) None을 반환하므로 load()를 쓰면 됩니다.
+        """
+        if not _HAS_BLOBOPEN:
+            return None
+        return MTTreeStream(self._iter_blob(tree_id))
+
+    def _iter_blob(self, tree_id: str) -> Iterator[Tuple[str, Any]]:
+        with self._connections.read() as conn:
+            rowid = self._rowid(conn, tree_id)
+            if rowid is None:
+                return
+            with _open_blob(conn, rowid, readonly=True) as blob:
+                yield from iter_tree_json(open_decompressed(_BlobReader(blob)))
+
+    @staticmethod
+    def _decode_row(data: str | bytes) -> str | bytes:
+        """TEXT(예전 행)는 그대로, BLOB은 압축을 풀어 반환합니다."""
+        return decompress_bytes(data) if isinstance(data, bytes) else data
+
+    @staticmethod
+    def _rowid(conn: sqlite3.Connection, tree_id: str) -> int | None:
+        row = conn.execute("SELECT rowid FROM tree_data WHERE id = ?", (tree_id,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _read_name(conn: sqlite3.Connection, rowid: int, tree_id: str) -> str:
+        """BLOB 앞부분에서 트리 이름만 읽습니다. (이름은 items보다 앞에 저장됨)"""
+        with _open_blob(conn, rowid, readonly=True) as blob:
+            for key, value in iter_tree_json(open_decompressed(_BlobReader(blob)), chunk_size=4096):
+                if key == "name":
+                    name: str = value
+                    return name
+        return tree_id
 
     def delete(self, tree_id: str) -> bool:
-        cur = self.conn.cursor()
-        cur.execute("DELETE FROM tree_data WHERE id = ?", (tree_id,))
-        self.conn.commit()
+        with self._connections.write() as conn:
+            cur: sqlite3.Cursor = conn.execute("DELETE FROM tree_data WHERE id = ?", (tree_id,))
+            if self.search_enabled:
+                delete_tree_index(conn, tree_id)
         return cur.rowcount > 0
 
     def list_trees(self) -> Dict[str, str]:
-        cur = self.conn.cursor()
-        cur.execute("SELECT id, data FROM tree_data")
+        if _HAS_BLOBOPEN:
+            result = {}
+            with self._connections.read() as conn:
+                for rowid, tree_id in conn.execute("SELECT rowid, id FROM tree_data").fetchall():
+                    try:
+                        result[tree_id] = self._read_name(conn, rowid, tree_id)
+                    except Exception:
+                        result[tree_id] = tree_id
+            return result
+        with self._connections.read() as conn:
+            rows = conn.execute("SELECT id, data FROM tree_data").fetchall()
         result = {}
-        for row in cur.fetchall():
+        for row in rows:
             tree_id, data = row
             try:
-                tree_data = json.loads(data)
+                tree_data = json.loads(self._decode_row(data))
                 tree_name = tree_data.get("name", tree_id)
             except Exception:
                 tree_name = tree_id
@@ -0,0 +1,149 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+"""
+SQLite 연결 관리자입니다. 여러 스레드(자동 저장 스레드, 실행기, 목록 화면 등)가 저장소 하나를 함께 쓸 수 있게 합니다.
+- 쓰기: 연결 1개를 잠금으로 보호합니다. (SQLite는 어차피 쓰기를 한 번에 하나만 허용)
+- 읽기: 최대 max_readers개의 읽기 연결을 풀로 돌려 씁니다. WAL 모드라서 읽기와 쓰기가 서로 막지 않습니다.
+모든 연결에 synchronous=NORMAL, busy_timeout, 준비된 문장 캐시(cached_statements)를 설정합니다.
+"""
+
+DEFAULT_BUSY_TIMEOUT = 5.0
+DEFAULT_MAX_READERS = 4
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+
+def _is_memory_path(db_path: str) -> bool:
+    return db_path == ":memory:" or db_path.startswith("file::memory:") or "mode=memory" in db_path
+
+
+class MTSQLiteConnectionManager:
+    """
+    쓰기 연결 1개와 읽기 연결 풀을 관리합니다.
+    같은 스레드에서 write() 안에서 read()를 부르면 아직 커밋하지 않은 내용이 보이도록 쓰기 연결을 그대로 줍니다.
+    메모리 DB는 연결마다 다른 DB가 되므로 읽기도 쓰기 연결(잠금)로 처리합니다.
+    """
+
+    def __init__(self, db_path: str, max_readers: int = DEFAULT_MAX_READERS, busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+                 statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE, wal: bool = True):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로 (":memory:" 가능)
+            max_readers: 동시에 열어 둘 읽기 연결 수 (0이면 읽기도 쓰기 연결로 처리)
+            busy_timeout: 다른 연결(다른 프로세스 포함)이 잠금을 쥐고 있을 때 기다릴 최대 시간(초)
+            statement_cache_size: 연결마다 보관할 준비된 문장 수
+            wal: WAL 모드 사용 여부
+        """
+        if max_readers < 0:
+            raise ValueError(f"max_readers는 0 이상이어야 합니다: {max_readers}")
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.statement_cache_size = statement_cache_size
+        self.max_readers = 0 if _is_memory_path(db_path) else max_readers
+        self._uri = db_path.startswith("file:")
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._idle_readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(max(self.max_readers, 1))
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._closed = False
+        self._writer = self._connect()
+        if wal and not _is_memory_path(db_path):
+            self._writer.execute("PRAGMA journal_mode=WAL")
+
+    def _connect(self) -> sqlite3.Connection:
+        # RF : 연결은 잠금/풀로 한 번에 한 스레드만 쓰도록 보장하므로 check_same_thread 검사를 끔
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False,
+                               cached_statements=self.statement_cache_size, uri=self._uri)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @property
+    def writer(self) -> sqlite3.Connection:
+        """쓰기 연결. 잠금 없이 직접 쓰면 스레드 안전하지 않으므로 점검/테스트 용도로만 사용합니다."""
+        return self._writer
+
+    @property
+    def reader_count(self) -> int:
+        """지금까지 연 읽기 연결 수 (max_readers 이하)"""
+        return len(self._readers)
+
+    def _in_write(self) -> bool:
+        return getattr(self._local, "write_depth", 0) > 0
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """
+        쓰기 잠금을 잡고 트랜잭션 안에서 쓰기 연결을 줍니다. 정상 종료하면 커밋, 예외면 롤백합니다.
+        중첩해서 호출하면 가장 바깥 호출에서 한 번만 커밋합니다.
+        """
+        self._check_open()
+        with self._write_lock:
+            depth = getattr(self._local, "write_depth", 0)
+            self._local.write_depth = depth + 1
+            try:
+                if depth:
+                    yield self._writer
+                else:
+                    with self._writer:
+                        yield self._writer
+            finally:
+                self._local.write_depth = depth
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """읽기 연결을 풀에서 빌려 줍니다. 풀이 모두 사용 중이면 하나가 반납될 때까지 기다립니다."""
+        self._check_open()
+        if self.max_readers == 0 or self._in_write():
+            with self._write_lock:
+                in_write = self._in_write()
+                try:
+                    yield self._writer
+                finally:
+                    if not in_write and self._writer.in_transaction:
+                        self._writer.rollback()  # 읽으려고 연 트랜잭션
+            return
+        with self._reader_slots:
+            conn = self._acquire_reader()
+            try:
+                yield conn
+            finally:
+                self._release_reader(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+            with self._readers_lock:
+                self._readers.append(conn)
+            return conn
+
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()  # 읽기 스냅샷을 놓아야 WAL 체크포인트가 진행됨
+        if self._closed:
+            conn.close()
+            return
+        self._idle_readers.put(conn)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise sqlite3.ProgrammingError("닫힌 연결 관리자입니다")
+
+    def close(self) -> None:
+        """모든 연결을 닫습니다. 사용 중인 읽기 연결은 반납될 때 닫힙니다."""
+        if self._closed:
+            return
+        self._closed = True
+        while True:
+            try:
+                self._idle_readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self._writer.close()
@@ -0,0 +1,115 @@
+import sqlite3
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from core.interfaces.base_tree import IMTTree
+from model.store.repo.interfaces.base_search import DEFAULT_SEARCH_LIMIT, MTSearchHit
+
+"""
+저장된 트리 아이템의 SQLite FTS5 전문 검색 색인입니다.
+아이템 이름, 노드 타입, 동작 설명(장치/동작 이름과 action_data의 문자열 값)을 색인하고,
+검색 결과는 (tree_id, item_id, snippet)만 돌려주므로 트리를 역직렬화하지 않습니다.
+- tree_search_items: FTS 행 번호 -> (tree_id, item_id). tree_id 인덱스로 트리 단위 삭제를 빠르게 함
+- tree_search: FTS5 가상 테이블 (rowid = tree_search_items.id)
+"""
+
+_SNIPPET_TOKENS = 8
+
+
+def create_search_index(conn: sqlite3.Connection) -> bool:
+    """
+    색인 테이블을 만듭니다. 쓰기 트랜잭션 안에서 호출해야 합니다.
+    Returns:
+        bool: 이번에 새로 만들었으면 True (기존 트리를 색인해야 함)
+    Raises:
+        sqlite3.OperationalError: SQLite가 FTS5 없이 빌드되었을 때
+    """
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'tree_search'").fetchone() is not None
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS tree_search_items (
+        id INTEGER PRIMARY KEY,
+        tree_id TEXT NOT NULL,
+        item_id TEXT NOT NULL
+    )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS tree_search_items_tree ON tree_search_items (tree_id)")
+    # RF : 한글 이름은 공백 단위로 나뉘므로 앞부분 일치("클릭*")를 빠르게 하려고 접두 색인 사용
+    conn.execute("""
+    CREATE VIRTUAL TABLE IF NOT EXISTS tree_search USING fts5(
+        name, node_type, action, tokenize = 'unicode61 remove_diacritics 2', prefix = '1 2 3'
+    )
+    """)
+    return not exists
+
+
+def _text(value: Any) -> str:
+    value = getattr(value, "value", value)  # Enum
+    return "" if value is None else str(value)
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for nested in value.values():
+            yield from _iter_strings(nested)
+    elif isinstance(value, (list, tuple)):
+        for nested in value:
+            yield from _iter_strings(nested)
+
+
+def describe_action(device: Any, action: Any, action_data: Any) -> str:
+    """검색용 동작 설명 (예: "keyboard type hello")"""
+    words = [_text(device), _text(action), *_iter_strings(action_data)]
+    return " ".join(word for word in words if word)
+
+
+def build_search_rows(tree: IMTTree) -> List[Tuple[str, str, str, str]]:
+    """트리의 아이템마다 (item_id, name, node_type, action) 색인 행을 만듭니다. (더미 루트 제외)"""
+    rows = []
+    for item_id, item in tree.items.items():
+        if item_id == tree.root_id:
+            continue
+        rows.append((item_id, _text(item.get_property("name")), _text(item.get_property("node_type")),
+                     describe_action(item.get_property("device"), item.get_property("action"),
+                                     item.get_property("action_data"))))
+    return rows
+
+
+def delete_tree_index(conn: sqlite3.Connection, tree_id: str) -> None:
+    """트리의 색인 행을 지웁니다. 쓰기 트랜잭션 안에서 호출해야 합니다."""
+    conn.execute("DELETE FROM tree_search WHERE rowid IN (SELECT id FROM tree_search_items WHERE tree_id = ?)",
+                 (tree_id,))
+    conn.execute("DELETE FROM tree_search_items WHERE tree_id = ?", (tree_id,))
+
+
+def replace_tree_index(conn: sqlite3.Connection, tree_id: str, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+    """트리의 색인 행을 rows로 바꿉니다. 쓰기 트랜잭션 안에서 호출해야 합니다."""
+    delete_tree_index(conn, tree_id)
+    # RF : 쓰기 트랜잭션 안이므로 행 번호를 미리 정해 두 테이블 모두 executemany로 넣음
+    first_id: int = conn.execute("SELECT coalesce(max(id), 0) + 1 FROM tree_search_items").fetchone()[0]
+    numbered = [(first_id + n, *row) for n, row in enumerate(rows)]
+    conn.executemany("INSERT INTO tree_search_items (id, tree_id, item_id) VALUES (?, ?, ?)",
+                     [(rowid, tree_id, item_id) for rowid, item_id, *_ in numbered])
+    conn.executemany("INSERT INTO tree_search (rowid, name, node_type, action) VALUES (?, ?, ?, ?)",
+                     [(rowid, name, node_type, action) for rowid, _, name, node_type, action in numbered])
+
+
+def to_match_query(query: str) -> str:
+    """
+    사용자 입력을 FTS5 MATCH 식으로 바꿉니다. 단어마다 따옴표로 감싸 앞부분 일치로 찾고, 모든 단어가 있어야 합니다.
+    (따옴표, AND/OR, 괄호 같은 FTS5 문법 문자가 들어 있어도 오류가 나지 않음)
+    """
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in query.split())
+
+
+def search_index(conn: sqlite3.Connection, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[MTSearchHit]:
+    """관련도 순으로 최대 limit건을 찾습니다. 빈 검색어면 빈 목록"""
+    match = to_match_query(query)
+    if not match or limit <= 0:
+        return []
+    cur = conn.execute(
+        "SELECT item.tree_id, item.item_id, snippet(tree_search, -1, '[', ']', '…', ?) "
+        "FROM tree_search JOIN tree_search_items AS item ON item.id = tree_search.rowid "
+        "WHERE tree_search MATCH ? ORDER BY rank LIMIT ?",
+        (_SNIPPET_TOKENS, match, limit))
+    return [MTSearchHit(*row) for row in cur.fetchall()]
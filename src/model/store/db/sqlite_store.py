@@ -1,33 +1,40 @@
 import sqlite3
 import json
+from model.store.db.sqlite_connection import MTSQLiteConnectionManager
 from model.store.repo.base_store import ITreeStore
 
 class SQLiteTreeStore(ITreeStore):
     def __init__(self, db_path="tree.db"):
-        self.conn = sqlite3.connect(db_path)
+        self._connections = MTSQLiteConnectionManager(db_path)
         self._init_table()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """쓰기 연결 (점검/테스트용, 스레드 안전하지 않음)"""
+        writer: sqlite3.Connection = self._connections.writer
+        return writer
+
+    def close(self) -> None:
+        self._connections.close()
+
     def _init_table(self):
-        cur = self.conn.cursor()
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS tree_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            data TEXT NOT NULL
-        )
-        """)
-        self.conn.commit()
+        with self._connections.write() as conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS tree_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data TEXT NOT NULL
+            )
+            """)
 
     def save(self, tree):
         data = json.dumps(tree.to_dict(), ensure_ascii=False)
-        cur = self.conn.cursor()
-        cur.execute("DELETE FROM tree_data")  # 항상 1개만 저장
-        cur.execute("INSERT INTO tree_data (data) VALUES (?)", (data,))
-        self.conn.commit()
+        with self._connections.write() as conn:
+            conn.execute("DELETE FROM tree_data")  # 항상 1개만 저장
+            conn.execute("INSERT INTO tree_data (data) VALUES (?)", (data,))
 
     def load(self):
-        cur = self.conn.cursor()
-        cur.execute("SELECT data FROM tree_data ORDER BY id DESC LIMIT 1")
-        row = cur.fetchone()
+        with self._connections.read() as conn:
+            row = conn.execute("SELECT data FROM tree_data ORDER BY id DESC LIMIT 1").fetchone()
         if row:
             return json.loads(row[0])
-        return None 
\ No newline at end of file
+        return None
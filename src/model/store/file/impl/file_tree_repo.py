@@ -1,89 +1,415 @@
+import codecs
 import json
 import os
-from typing import Dict, Any # Optional removed
+import struct
+import threading
+from typing import Dict, Any, Iterator, Tuple # Optional removed
 import uuid
 from core.interfaces.base_tree import IMTTree
 from core.impl.tree import MTTree
+from core.impl.tree_stream import ITEMS_KEY, MTTreeStream, iter_tree_json, read_tree_json, write_tree_json
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager
+from model.store.file.impl.tree_binary import BINARY_FILE_EXT, BINARY_MAGIC, MTBinaryFormatError, MTBinaryTreeReader, encode_tree, is_binary_tree
+from model.store.file.impl.tree_journal import (JOURNAL_FILE_EXT, MTHashingReader, MTTreeJournal, file_hash, replay_journal,
+                                                scan_journal, write_atomic)
 from model.store.repo.interfaces.base_tree_repo import IMTStore
+from model.store.tree_compression import (COMPRESSION_NONE, MTCompressingWriter, MTCompressionError, get_codec,
+                                          open_decompressed, resolve_level)
+
+TREE_FILE_EXT = ".json"
+# 저장 형식 -> 파일 확장자. 불러오기는 형식 설정과 관계없이 둘 다 읽음
+FILE_FORMATS = {"json": TREE_FILE_EXT, "binary": BINARY_FILE_EXT}
+MANIFEST_FILE = "_manifest.json"
+MANIFEST_VERSION = 1
+
 
 class MTFileTreeRepository(IMTStore):
     """파일 기반 트리 저장소 구현체"""
-    
-    def __init__(self, storage_dir: str = "./trees"):
+
+    def __init__(self, storage_dir: str = "./trees", compact_ratio: float = 0.5, compact_min_bytes: int = 64 * 1024,
+                 file_format: str = "json", compression: str = COMPRESSION_NONE, compression_level: int | None = None):
         """저장소 초기화
-        
+
         Args:
             storage_dir: 트리 파일 저장 경로
+            compact_ratio: 저널이 기본 파일 크기의 이 비율을 넘으면 저장할 때 기본 파일을 다시 씀
+            compact_min_bytes: 저널이 이 크기보다 작으면 비율과 관계없이 압축하지 않음
+            file_format: 기본 파일 저장 형식 ("json" 또는 "binary")
+            compression: JSON 기본 파일 압축 방식 ("none", "zlib", "lzma"). 불러오기는 설정과 관계없이 헤더 바이트로 판단
+            compression_level: 압축 수준 (None이면 코덱 기본값)
         """
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_format} (사용 가능: {', '.join(FILE_FORMATS)})")
+        self._codec = get_codec(compression)
+        if self._codec is not None and file_format == "binary":
+            raise ValueError("바이너리 형식은 mmap으로 바로 읽으므로 압축할 수 없습니다")
+        self.compression = compression
+        self.compression_level = resolve_level(self._codec, compression_level)
         self.storage_dir = storage_dir
+        self.file_format = file_format
         os.makedirs(storage_dir, exist_ok=True)
-    
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self._journals: Dict[str, MTTreeJournal] = {}
+        # RF : 목록 조회 때 트리를 통째로 읽지 않도록 트리별 요약을 매니페스트 파일에 보관
+        self._manifest_lock = threading.RLock()
+        self._manifest: Dict[str, Dict[str, Any]] | None = None
+
     def _get_file_path(self, tree_id: str) -> str:
         """트리 ID로부터 파일 경로를 생성합니다."""
-        return os.path.join(self.storage_dir, f"{tree_id}")
-    
+        return os.path.join(self.storage_dir, f"{tree_id}{FILE_FORMATS[self.file_format]}")
+
+    def _candidate_paths(self, tree_id: str) -> list[str]:
+        """현재 형식, 다른 형식, 확장자 없는 예전 파일 순서의 경로 후보"""
+        paths = [self._get_file_path(tree_id)]
+        paths += [os.path.join(self.storage_dir, f"{tree_id}{ext}") for fmt, ext in FILE_FORMATS.items() if fmt != self.file_format]
+        paths.append(os.path.join(self.storage_dir, tree_id))
+        return paths
+
+    def _find_file_path(self, tree_id: str) -> str | None:
+        """저장된 트리 파일 경로를 찾습니다. (다른 형식, 확장자 없이 저장된 예전 파일 포함)"""
+        for file_path in self._candidate_paths(tree_id):
+            if os.path.isfile(file_path):
+                return file_path
+        return None
+
+    def _get_journal_path(self, tree_id: str) -> str:
+        return os.path.join(self.storage_dir, f"{tree_id}{JOURNAL_FILE_EXT}")
+
     def save(self, tree: IMTTree, tree_id: str | None = None) -> str:
-        """트리를 파일로 저장합니다."""
+        """
+        트리를 파일로 저장합니다.
+        attach_journal()로 연결된 트리는 마지막 저장 이후의 변경분만 저널에 덧붙이고,
+        저널이 커졌거나 변경분으로 기록할 수 없는 변경이 있었으면 기본 파일을 새로 씁니다.
+        """
         if tree_id is None:
-            if hasattr(tree, 'id') and tree.id: 
+            if hasattr(tree, 'id') and tree.id:
                 tree_id = tree.id
             else:
                 tree_id = str(uuid.uuid4())
-        
-        tree_dict = tree.to_dict()
-        json_str = json.dumps(tree_dict, ensure_ascii=False, indent=2)
-        with open(self._get_file_path(tree_id), 'w', encoding='utf-8') as file:
-            file.write(json_str)
+
+        journal = self._journals.get(tree_id)
+        if journal is not None and journal.tree is tree and not self._should_compact(tree_id, journal):
+            journal.commit()
+            self._update_summary(tree_id, tree)
+            return tree_id
+        self._compact(tree, tree_id)
         return tree_id
-    
+
+    def _should_compact(self, tree_id: str, journal: MTTreeJournal) -> bool:
+        if journal.needs_compaction:
+            return True
+        with self._manifest_lock:
+            base_entry = self._load_manifest().get(tree_id)
+        if base_entry is None:
+            return True
+        return bool(journal.size > max(self.compact_min_bytes, base_entry["size"] * self.compact_ratio))
+
+    def _compact(self, tree: IMTTree, tree_id: str) -> None:
+        """기본 파일을 통째로 원자적으로 다시 쓰고 저널을 비웁니다."""
+        file_path = self._get_file_path(tree_id)
+        if self.file_format == "binary":
+            sha256 = write_atomic(file_path, encode_tree(tree.to_dict()))
+        else:
+            # RF : 트리 전체 딕셔너리/문자열을 만들지 않고 아이템 단위로 바로 씀
+            sha256 = write_atomic(file_path, lambda file: self._write_json(tree, file))
+
+        journal = self._journals.get(tree_id)
+        if journal is not None and journal.tree is tree:
+            journal.reset(sha256)
+        else:
+            self.detach_journal(tree_id)
+            journal_path = self._get_journal_path(tree_id)
+            if os.path.exists(journal_path):
+                os.remove(journal_path)  # 다른 기본 파일의 저널
+
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            for old_path in self._candidate_paths(tree_id)[1:]:
+                if os.path.isfile(old_path):
+                    os.remove(old_path)  # 다른 형식이나 확장자 없는 예전 파일은 새 파일로 대체
+            manifest[tree_id] = self._make_entry(tree_id, file_path, tree.name,
+                                                 self._count_items(tree.items, tree.root_id), sha256)
+            self._write_manifest()
+
+    def _write_json(self, tree: IMTTree, file: Any) -> None:
+        if self._codec is None:
+            write_tree_json(tree, codecs.getwriter('utf-8')(file))
+            return
+        with MTCompressingWriter(file, self._codec, self.compression_level) as writer:
+            write_tree_json(tree, codecs.getwriter('utf-8')(writer))
+
+    def attach_journal(self, tree: IMTTree, event_manager: IMTTreeEventManager,
+                       state_manager: Any = None, tree_id: str | None = None) -> MTTreeJournal:
+        """
+        트리의 이후 변경을 저널에 기록하도록 연결합니다. 이후 save()는 변경분만 덧붙입니다.
+        트리는 저장된 내용(기본 파일 + 저널)과 같은 상태여야 합니다. (저장이나 불러오기 직후)
+        Args:
+            tree: 기록할 트리
+            event_manager: 트리 이벤트를 알리는 이벤트 매니저
+            state_manager: undo/redo를 알리는 상태 관리자(선택)
+            tree_id: 트리 ID (None이면 tree.id)
+        """
+        tree_id = tree_id or tree.id
+        journal = self._journals.get(tree_id)
+        if journal is not None and journal.tree is tree:
+            journal.attach(event_manager, state_manager)
+            return journal
+        self.detach_journal(tree_id)
+        file_path = self._find_file_path(tree_id)
+        if file_path != self._get_file_path(tree_id):
+            self._compact(tree, tree_id)  # 기본 파일이 없거나 예전 형식
+            file_path = self._get_file_path(tree_id)
+        base_sha256 = file_hash(file_path)
+        journal = MTTreeJournal(self._get_journal_path(tree_id), tree, base_sha256)
+        journal.attach(event_manager, state_manager)
+        self._journals[tree_id] = journal
+        return journal
+
+    def detach_journal(self, tree_id: str) -> None:
+        """저널 기록을 멈춥니다. 커밋하지 않은 변경분은 버립니다."""
+        journal = self._journals.pop(tree_id, None)
+        if journal is not None:
+            journal.detach()
+
+    def _update_summary(self, tree_id: str, tree: IMTTree) -> None:
+        """저널만 덧붙였을 때 매니페스트의 이름/아이템 수를 맞춥니다."""
+        with self._manifest_lock:
+            entry = self._load_manifest().get(tree_id)
+            if entry is None:
+                return
+            item_count = self._count_items(tree.items, tree.root_id)
+            name = tree.name or tree_id
+            journal_size = self._journal_size(tree_id)
+            if (entry["item_count"], entry["name"], entry.get("journal_size")) != (item_count, name, journal_size):
+                entry["item_count"], entry["name"], entry["journal_size"] = item_count, name, journal_size
+                self._write_manifest()
+
     def load(self, tree_id: str) -> IMTTree | None:
         """파일로부터 트리를 로드합니다."""
-        file_path = self._get_file_path(tree_id)
-        
-        if not os.path.exists(file_path):
+        file_path = self._find_file_path(tree_id)
+
+        if file_path is None:
             return None
-        
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                json_str = file.read()
+            with open(file_path, 'rb') as file:
+                if is_binary_tree(file.read(len(BINARY_MAGIC))):
+                    with MTBinaryTreeReader(file_path) as reader:
+                        tree = MTTree.from_dict(reader.to_dict())
+                    base_sha256 = file_hash(file_path)
+                else:
+                    file.seek(0)
+                    hashing_file = MTHashingReader(file)  # 해시는 압축된 파일 바이트 기준
+                    tree = read_tree_json(open_decompressed(hashing_file))
+                    base_sha256 = hashing_file.hexdigest()
 
-            tree_data_dict = json.loads(json_str)
-            return MTTree.from_dict(tree_data_dict)
+            replay_journal(tree, self._get_journal_path(tree_id), base_sha256)
+            return tree
         except Exception as e:
             print(f"트리 로드 실패: {e}")
             return None
-    
+
+    def open_tree_stream(self, tree_id: str) -> MTTreeStream | None:
+        """
+        JSON으로 저장된 트리를 읽는 대로 토큰으로 넘기는 스트림을 엽니다. (백그라운드 불러오기용)
+        바이너리로 저장되었거나 아직 기본 파일에 합치지 않은 저널 기록이 있으면 None을 반환하므로 load()를 쓰면 됩니다.
+        """
+        file_path = self._find_file_path(tree_id)
+        if file_path is None:
+            return None
+        with open(file_path, 'rb') as file:
+            if is_binary_tree(file.read(len(BINARY_MAGIC))):
+                return None
+        journal_path = self._get_journal_path(tree_id)
+        if os.path.exists(journal_path) and scan_journal(journal_path, file_hash(file_path))[0]:
+            return None
+        stat = os.stat(file_path)
+        with self._manifest_lock:
+            entry = self._load_manifest().get(tree_id)
+        item_count = None
+        if (entry is not None and entry["file"] == os.path.basename(file_path)
+                and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns):
+            item_count = entry["item_count"]
+        return MTTreeStream(self._iter_file(file_path), item_count)
+
+    @staticmethod
+    def _iter_file(file_path: str) -> Iterator[Tuple[str, Any]]:
+        with open(file_path, 'rb') as file:
+            yield from iter_tree_json(open_decompressed(file))
+
+    def open_tree(self, tree_id: str) -> MTBinaryTreeReader | None:
+        """
+        바이너리로 저장된 트리를 mmap으로 엽니다. 노드는 꺼낼 때만 풀립니다. (MTBinaryTreeReader.items)
+        JSON으로 저장되었거나 아직 기본 파일에 합치지 않은 저널 기록이 있으면 None을 반환하므로 load()를 쓰면 됩니다.
+        다 쓴 뒤에는 close()(또는 with 문)로 닫아야 합니다.
+        """
+        file_path = self._find_file_path(tree_id)
+        if file_path is None or not file_path.endswith(BINARY_FILE_EXT):
+            return None
+        reader = MTBinaryTreeReader(file_path)
+        if scan_journal(self._get_journal_path(tree_id), file_hash(file_path))[0]:
+            reader.close()
+            return None
+        return reader
+
     def delete(self, tree_id: str) -> bool:
         """트리 파일을 삭제합니다."""
-        file_path = self._get_file_path(tree_id)
-        
-        if not os.path.exists(file_path):
+        file_path = self._find_file_path(tree_id)
+
+        if file_path is None:
             return False
-        
+
+        self.detach_journal(tree_id)
         try:
             os.remove(file_path)
-            return True
+            journal_path = self._get_journal_path(tree_id)
+            if os.path.exists(journal_path):
+                os.remove(journal_path)
         except Exception as e:
             print(f"트리 삭제 실패: {e}")
             return False
-    
+
+        with self._manifest_lock:
+            if self._load_manifest().pop(tree_id, None) is not None:
+                self._write_manifest()
+        return True
+
     def list_trees(self) -> Dict[str, str]:
         """저장된 모든 트리 목록을 반환합니다."""
-        result = {}
-        
-        for filename in os.listdir(self.storage_dir):
-            if filename.endswith(".json"):
-                tree_id = filename[:-5]  # .json 확장자 제거
-                
-                try:
-                    tree_obj = self.load(tree_id)
-                    if tree_obj and hasattr(tree_obj, 'name') and tree_obj.name:
-                        result[tree_id] = tree_obj.name
-                    elif tree_obj:
-                        result[tree_id] = tree_id
+        return {tree_id: entry["name"] for tree_id, entry in self.list_tree_info().items()}
+
+    def list_tree_info(self) -> Dict[str, Dict[str, Any]]:
+        """
+        저장된 트리별 요약(name, file, size, mtime_ns, item_count, sha256, journal_size)을 반환합니다.
+        매니페스트와 크기/수정 시각(또는 저널 크기)이 다른 파일만 다시 읽고, 읽을 수 없는 파일은 목록에서 뺍니다.
+        """
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            changed = False
+            chosen: Dict[str, os.DirEntry] = {}
+            with os.scandir(self.storage_dir) as entries:
+                for dir_entry in entries:
+                    tree_id = self._tree_id_of(dir_entry)
+                    if tree_id is None:
+                        continue
+                    other = chosen.get(tree_id)
+                    if other is None or self._file_rank(dir_entry.name) < self._file_rank(other.name):
+                        chosen[tree_id] = dir_entry  # 같은 ID면 load()가 읽을 파일이 우선
+            for tree_id, dir_entry in list(chosen.items()):
+                stat = dir_entry.stat()
+                entry = manifest.get(tree_id)
+                if (entry is not None and entry["file"] == dir_entry.name
+                        and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
+                        and entry.get("journal_size") == self._journal_size(tree_id)):
+                    continue
+                scanned = self._scan_file(tree_id, dir_entry.path)
+                if scanned is None:
+                    chosen.pop(tree_id)  # 아래에서 매니페스트 항목도 지움
+                    continue
+                manifest[tree_id] = scanned
+                changed = True
+            for tree_id in [tree_id for tree_id in manifest if tree_id not in chosen]:
+                del manifest[tree_id]  # 다른 곳에서 지워진 파일
+                changed = True
+            if changed:
+                self._write_manifest()
+            return {tree_id: dict(entry) for tree_id, entry in manifest.items()}
+
+    # --- 매니페스트 ---
+    def _manifest_path(self) -> str:
+        return os.path.join(self.storage_dir, MANIFEST_FILE)
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """매니페스트를 한 번만 읽어 메모리에 둡니다. 없거나 깨졌으면 빈 매니페스트로 시작합니다."""
+        if self._manifest is None:
+            try:
+                with open(self._manifest_path(), 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                trees = data.get("trees", {}) if data.get("version") == MANIFEST_VERSION else {}
+            except (OSError, ValueError, AttributeError):
+                trees = {}
+            self._manifest = trees
+        return self._manifest
+
+    def _write_manifest(self) -> None:
+        """임시 파일에 쓴 뒤 교체해서, 읽는 쪽이 반쯤 쓰인 매니페스트를 보지 않도록 합니다."""
+        data = {"version": MANIFEST_VERSION, "trees": self._manifest or {}}
+        write_atomic(self._manifest_path(), json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _tree_id_of(dir_entry: "os.DirEntry[str]") -> str | None:
+        name = dir_entry.name
+        if name == MANIFEST_FILE or name.startswith(".") or name.endswith(".tmp") or not dir_entry.is_file():
+            return None
+        stem, ext = os.path.splitext(name)
+        if ext in FILE_FORMATS.values():
+            return stem
+        return None if ext else name  # 확장자 없이 저장된 예전 파일
+
+    def _file_rank(self, file_name: str) -> int:
+        """_candidate_paths와 같은 우선순위 (현재 형식 0, 다른 형식 1, 확장자 없음 2)"""
+        ext = os.path.splitext(file_name)[1]
+        if ext == FILE_FORMATS[self.file_format]:
+            return 0
+        return 1 if ext else 2
+
+    @staticmethod
+    def _count_items(items: Any, root_id: str | None) -> int:
+        """더미 루트를 뺀 아이템 수"""
+        return len(items) - (1 if root_id in items else 0)
+
+    def _journal_size(self, tree_id: str) -> int:
+        """저널 파일 크기 (없으면 0)"""
+        try:
+            return os.stat(self._get_journal_path(tree_id)).st_size
+        except OSError:
+            return 0
+
+    def _make_entry(self, tree_id: str, file_path: str, name: str | None, item_count: int, sha256: str) -> Dict[str, Any]:
+        stat = os.stat(file_path)
+        return {
+            "name": name or tree_id,
+            "file": os.path.basename(file_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "item_count": item_count,
+            "sha256": sha256,
+            "journal_size": self._journal_size(tree_id),
+        }
+
+    def _scan_file(self, tree_id: str, file_path: str) -> Dict[str, Any] | None:
+        """
+        바뀐 파일 하나를 읽어 매니페스트 항목을 만듭니다. (저널 기록이 없으면 트리 객체는 만들지 않음)
+        내용이 깨진 파일은 "Failed to load" 항목으로, 읽을 수 없는 파일은 None으로 돌려줍니다.
+        """
+        try:
+            try:
+                with open(file_path, 'rb') as file:
+                    if is_binary_tree(file.read(len(BINARY_MAGIC))):
+                        # 바이너리 파일은 헤더와 ID 색인만 읽음
+                        with MTBinaryTreeReader(file_path) as reader:
+                            name, item_count = reader.name, self._count_items(reader.items, reader.root_id)
+                        sha256 = file_hash(file_path)
                     else:
-                        result[tree_id] = f"Failed to load {tree_id}"
-                except Exception:
-                    result[tree_id] = f"Error processing {tree_id}"
-        
-        return result
\ No newline at end of file
+                        file.seek(0)
+                        hashing_file = MTHashingReader(file)
+                        header: Dict[str, Any] = {}
+                        item_count = 0
+                        # RF : 아이템은 세기만 하고 버림 (파일 크기와 관계없이 아이템 하나 크기의 메모리만 사용)
+                        for key, value in iter_tree_json(open_decompressed(hashing_file)):
+                            if key == ITEMS_KEY:
+                                item_count += 0 if value[0] == header.get("root_id") else 1
+                            else:
+                                header[key] = value
+                        name, sha256 = header.get("name"), hashing_file.hexdigest()
+                if scan_journal(self._get_journal_path(tree_id), sha256)[0]:
+                    # RF : 삭제 기록에는 하위 아이템 수가 없으므로 저널이 남아 있을 때만 트리를 만들어 다시 적용해서 셈
+                    tree = self.load(tree_id)
+                    if tree is not None:
+                        name, item_count = tree.name, self._count_items(tree.items, tree.root_id)
+                return self._make_entry(tree_id, file_path, name, item_count, sha256)
+            except (ValueError, KeyError, struct.error, MTBinaryFormatError, MTCompressionError):
+                return self._make_entry(tree_id, file_path, f"Failed to load {tree_id}", 0, file_hash(file_path))
+        except OSError:
+            return None
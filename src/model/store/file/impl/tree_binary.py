@@ -0,0 +1,459 @@
+import mmap
+import struct
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List
+
+import core.exceptions as exc
+from core.interfaces.base_item_data import MTDevice, MTItemDTO, MTNodeType
+
+"""
+MTTree 바이너리 파일 형식(.mtb)입니다.
+JSON과 같은 트리 딕셔너리(MTTree.to_dict())를 담지만, 파일을 mmap으로 열어 필요한 노드만 그때그때 풀어 씁니다.
+
+구성 (리틀 엔디언, 오프셋은 파일 처음 기준):
+    헤더       : 매직, 버전, 노드 수, 문자열 수, 트리 ID/이름/루트 ID 문자열 번호, 각 영역 오프셋
+    문자열 표  : 오프셋 배열(u32 * (개수 + 1)) + UTF-8 바이트 (중복 문자열은 한 번만 저장)
+    노드 레코드: 노드마다 고정 길이 (_NODE 참고), 저장 순서 = items 딕셔너리 순서
+    자식 배열  : 노드별 자식 노드 번호(u32)를 이어 붙인 배열
+    ID 색인    : ID 문자열 순으로 정렬한 노드 번호 배열 (이진 탐색)
+    데이터 블록: action, action_data 등 고정 필드에 담지 못한 값 (타입 태그를 붙인 값)
+"""
+
+BINARY_FILE_EXT = ".mtb"
+BINARY_MAGIC = b"MTTB"
+BINARY_VERSION = 1
+
+# 매직, 버전, 플래그, 노드 수, 문자열 수, 트리 ID, 트리 이름, 루트 ID, 문자열/노드/자식/색인/데이터 오프셋
+_HEADER = struct.Struct("<4sHHIIIIIQQQQQ")
+# ID, 이름, 부모 번호, 노드 타입, 장치, UI 플래그, 예약, 아이콘, 자식 시작, 자식 수, 데이터 오프셋, 데이터 길이
+_NODE = struct.Struct("<IIiBBBBIIIII")
+_U32 = struct.Struct("<I")
+
+_NO_STRING = 0xFFFFFFFF
+_NO_PARENT = -1
+_EXTRA_PARENT = -2  # 파일에 없는 부모 ID (데이터 블록에 원래 값 저장)
+_EXTRA_CODE = 0xFF  # 코드표에 없는 노드 타입/장치 값 (데이터 블록에 원래 값 저장)
+
+_FLAG_SELECTED = 0x01
+_FLAG_EXPANDED = 0x02
+_FLAG_VISIBLE = 0x04
+_FLAG_EXTRA_CHILDREN = 0x08  # 파일에 없는 자식 ID가 있음 (데이터 블록에 원래 목록 저장)
+
+_NODE_TYPE_CODES = {None: 0, **{node_type.value: code for code, node_type in enumerate(MTNodeType, 1)}}
+_DEVICE_CODES = {None: 0, **{device.value: code for code, device in enumerate(MTDevice, 1)}}
+_NODE_TYPE_VALUES = {code: value for value, code in _NODE_TYPE_CODES.items()}
+_DEVICE_VALUES = {code: value for value, code in _DEVICE_CODES.items()}
+
+_DOMAIN_FIELDS = ("name", "parent_id", "children_ids", "node_type", "device")
+_UI_FIELDS = ("is_selected", "is_expanded", "visible", "icon")
+
+# 데이터 블록 값 태그
+_T_NONE, _T_FALSE, _T_TRUE, _T_INT, _T_FLOAT, _T_STR, _T_LIST, _T_DICT, _T_BIGINT = range(9)
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+
+
+class MTBinaryFormatError(exc.MTTreeError):
+    """바이너리 트리 파일이 아니거나 지원하지 않는 버전일 때 발생합니다."""
+
+
+def _plain(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self._index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def add(self, text: str | None) -> int:
+        if text is None:
+            return _NO_STRING
+        index = self._index.get(text)
+        if index is None:
+            index = self._index[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+    def to_bytes(self) -> bytes:
+        encoded = [text.encode('utf-8') for text in self.strings]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+def _encode_value(value: Any, strings: _StringTable, out: bytearray) -> None:
+    value = _plain(value)
+    if value is None:
+        out.append(_T_NONE)
+    elif value is True or value is False:
+        out.append(_T_TRUE if value else _T_FALSE)
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            out.append(_T_INT)
+            out += _INT64.pack(value)
+        else:
+            out.append(_T_BIGINT)
+            out += _U32.pack(strings.add(str(value)))
+    elif isinstance(value, float):
+        out.append(_T_FLOAT)
+        out += _FLOAT64.pack(value)
+    elif isinstance(value, str):
+        out.append(_T_STR)
+        out += _U32.pack(strings.add(value))
+    elif isinstance(value, (list, tuple)):
+        out.append(_T_LIST)
+        out += _U32.pack(len(value))
+        for element in value:
+            _encode_value(element, strings, out)
+    elif isinstance(value, dict):
+        out.append(_T_DICT)
+        out += _U32.pack(len(value))
+        for key, element in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"바이너리 트리 형식의 딕셔너리 키는 문자열이어야 합니다: {key!r}")
+            out += _U32.pack(strings.add(key))
+            _encode_value(element, strings, out)
+    else:
+        raise TypeError(f"바이너리 트리 형식으로 저장할 수 없는 값입니다: {type(value).__name__}")
+
+
+def encode_tree(tree_data: Dict[str, Any]) -> bytes:
+    """
+    트리 딕셔너리(MTTree.to_dict() 형식)를 바이너리 파일 내용으로 변환합니다.
+    Raises:
+        TypeError: JSON으로도 저장할 수 없는 값(임의 객체 등)이 있을 때
+    """
+    items: Dict[str, Dict[str, Any]] = tree_data.get("items") or {}
+    strings = _StringTable()
+    positions = {item_id: index for index, item_id in enumerate(items)}
+    tree_id_str = strings.add(tree_data.get("id"))
+    tree_name_str = strings.add(tree_data.get("name"))
+    root_id_str = strings.add(tree_data.get("root_id"))
+
+    nodes = bytearray()
+    children = bytearray()
+    data_block = bytearray()
+    child_count_total = 0
+    for item_id, item_data in items.items():
+        domain = dict(item_data.get("domain_data") or {})
+        ui_state = dict(item_data.get("ui_state_data") or {})
+        extra_domain = {key: value for key, value in domain.items() if key not in _DOMAIN_FIELDS and value is not None}
+
+        parent_id = domain.get("parent_id")
+        if parent_id is None:
+            parent_index = _NO_PARENT
+        elif parent_id in positions:
+            parent_index = positions[parent_id]
+        else:
+            parent_index, extra_domain["parent_id"] = _EXTRA_PARENT, parent_id
+
+        node_type = _plain(domain.get("node_type"))
+        node_type_code = _NODE_TYPE_CODES.get(node_type, _EXTRA_CODE) if isinstance(node_type, (str, type(None))) else _EXTRA_CODE
+        if node_type_code == _EXTRA_CODE:
+            extra_domain["node_type"] = node_type
+        device = _plain(domain.get("device"))
+        device_code = _DEVICE_CODES.get(device, _EXTRA_CODE) if isinstance(device, (str, type(None))) else _EXTRA_CODE
+        if device_code == _EXTRA_CODE:
+            extra_domain["device"] = device
+
+        flags = (_FLAG_SELECTED if ui_state.get("is_selected") else 0) \
+            | (_FLAG_EXPANDED if ui_state.get("is_expanded") else 0) \
+            | (_FLAG_VISIBLE if ui_state.get("visible", True) else 0)
+        children_ids = list(domain.get("children_ids") or [])
+        child_start = child_count_total
+        if all(child_id in positions for child_id in children_ids):
+            for child_id in children_ids:
+                children += _U32.pack(positions[child_id])
+            child_count = len(children_ids)
+        else:
+            flags |= _FLAG_EXTRA_CHILDREN
+            extra_domain["children_ids"] = children_ids
+            child_count = 0
+        child_count_total += child_count
+
+        extra_ui = {key: value for key, value in ui_state.items() if key not in _UI_FIELDS}
+        data_offset = data_length = 0
+        if extra_domain or extra_ui:
+            data_offset = len(data_block)
+            _encode_value({"domain": extra_domain, "ui": extra_ui}, strings, data_block)
+            data_length = len(data_block) - data_offset
+
+        nodes += _NODE.pack(
+            strings.add(item_id), strings.add(domain.get("name", "")), parent_index,
+            node_type_code, device_code, flags, 0, strings.add(ui_state.get("icon", "")),
+            child_start, child_count, data_offset, data_length,
+        )
+
+    sorted_index = b"".join(_U32.pack(positions[item_id]) for item_id in sorted(items))
+    string_bytes = strings.to_bytes()
+    strings_off = _HEADER.size
+    nodes_off = strings_off + len(string_bytes)
+    children_off = nodes_off + len(nodes)
+    sorted_off = children_off + len(children)
+    data_off = sorted_off + len(sorted_index)
+    header = _HEADER.pack(
+        BINARY_MAGIC, BINARY_VERSION, 0, len(items), len(strings.strings),
+        tree_id_str, tree_name_str, root_id_str,
+        strings_off, nodes_off, children_off, sorted_off, data_off,
+    )
+    return b"".join((header, string_bytes, bytes(nodes), bytes(children), sorted_index, bytes(data_block)))
+
+
+def decode_tree(content: bytes) -> Dict[str, Any]:
+    """바이너리 파일 내용을 트리 딕셔너리로 변환합니다. (모든 노드를 풀어 씀)"""
+    return MTBinaryTreeReader.from_bytes(content).to_dict()
+
+
+def is_binary_tree(content: bytes) -> bool:
+    return content[:len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+class MTBinaryTreeReader:
+    """
+    바이너리 트리 파일 읽기. 여는 데는 헤더만 읽고, 노드는 요청할 때 풀어서 캐시합니다.
+    파일로 열었으면 다 쓴 뒤 close()(또는 with 문)로 mmap을 닫아야 합니다.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as file:
+            try:
+                buffer: Any = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # 빈 파일
+                raise MTBinaryFormatError(f"바이너리 트리 파일이 비어 있습니다: {path}") from None
+        self._open(buffer)
+
+    @classmethod
+    def from_bytes(cls, content: bytes) -> 'MTBinaryTreeReader':
+        reader = cls.__new__(cls)
+        reader._open(content)
+        return reader
+
+    def _open(self, buffer: Any) -> None:
+        self._buffer = buffer
+        if len(buffer) < _HEADER.size:
+            self.close()
+            raise MTBinaryFormatError("바이너리 트리 헤더가 잘렸습니다")
+        (magic, version, _flags, node_count, string_count, tree_id_str, tree_name_str, root_id_str,
+         self._strings_off, self._nodes_off, self._children_off, self._sorted_off, self._data_off) = _HEADER.unpack_from(buffer, 0)
+        self._node_count: int = node_count
+        if magic != BINARY_MAGIC:
+            self.close()
+            raise MTBinaryFormatError("바이너리 트리 파일이 아닙니다")
+        if version != BINARY_VERSION:
+            self.close()
+            raise MTBinaryFormatError(f"지원하지 않는 바이너리 트리 버전입니다: {version}")
+        self._blob_off = self._strings_off + (string_count + 1) * _U32.size
+        self._string_cache: Dict[int, str] = {}
+        self.id = self._string(tree_id_str)
+        self.name = self._string(tree_name_str)
+        self.root_id = self._string(root_id_str)
+        self._items = MTLazyItemMap(self)
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> 'MTBinaryTreeReader':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._node_count
+
+    @property
+    def items(self) -> 'MTLazyItemMap':
+        """ID -> 아이템 DTO 딕셔너리. 처음 꺼낼 때 풀어서 캐시합니다."""
+        return self._items
+
+    def index_of(self, item_id: str) -> int | None:
+        """ID 색인을 이진 탐색해 노드 번호를 찾습니다."""
+        low, high = 0, self._node_count
+        while low < high:
+            middle = (low + high) // 2
+            index: int = _U32.unpack_from(self._buffer, self._sorted_off + middle * _U32.size)[0]
+            found = self._required_string(_NODE.unpack_from(self._buffer, self._nodes_off + index * _NODE.size)[0])
+            if found == item_id:
+                return index
+            if found < item_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def item_id_at(self, index: int) -> str:
+        return self._required_string(self._node(index)[0])
+
+    def children_ids(self, item_id: str) -> List[str]:
+        """아이템 전체를 풀지 않고 자식 ID 목록만 읽습니다."""
+        index = self.index_of(item_id)
+        if index is None:
+            return []
+        node = self._node(index)
+        if node[5] & _FLAG_EXTRA_CHILDREN:
+            return list(self._extras(node)[0]["children_ids"])
+        return [self.item_id_at(child) for child in self._child_indexes(node)]
+
+    def item_dict(self, index: int) -> Dict[str, Any]:
+        """노드 하나를 MTItemDTO.to_dict() 형식으로 풉니다."""
+        (id_str, name_str, parent_index, node_type_code, device_code, flags, _reserved, icon_str,
+         child_start, child_count, data_offset, data_length) = node = self._node(index)
+        extra_domain, extra_ui = self._extras(node)
+        if parent_index >= 0:
+            parent_id = self.item_id_at(parent_index)
+        elif parent_index == _EXTRA_PARENT:
+            parent_id = extra_domain["parent_id"]
+        else:
+            parent_id = None
+        if flags & _FLAG_EXTRA_CHILDREN:
+            children_ids = list(extra_domain["children_ids"])
+        else:
+            children_ids = [self.item_id_at(child) for child in self._child_indexes(node)]
+        domain = {
+            "name": self._string(name_str),
+            "parent_id": parent_id,
+            "children_ids": children_ids,
+            "node_type": extra_domain["node_type"] if node_type_code == _EXTRA_CODE else _NODE_TYPE_VALUES[node_type_code],
+            "device": extra_domain["device"] if device_code == _EXTRA_CODE else _DEVICE_VALUES[device_code],
+            "action": None,
+            "action_data": None,
+        }
+        domain.update((key, value) for key, value in extra_domain.items() if key not in _DOMAIN_FIELDS)
+        ui_state = {
+            "is_selected": bool(flags & _FLAG_SELECTED),
+            "is_expanded": bool(flags & _FLAG_EXPANDED),
+            "visible": bool(flags & _FLAG_VISIBLE),
+            "icon": self._string(icon_str),
+        }
+        ui_state.update(extra_ui)
+        return {"item_id": self._string(id_str), "domain_data": domain, "ui_state_data": ui_state}
+
+    def header_dict(self) -> Dict[str, Any]:
+        """아이템 없이 ID, 이름, 루트 ID만 담은 트리 딕셔너리"""
+        return {"id": self.id, "name": self.name, "root_id": self.root_id, "items": {}}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """모든 노드를 풀어 MTTree.to_dict()와 같은 딕셔너리를 만듭니다."""
+        data = self.header_dict()
+        data["items"] = dict(self._items.items())
+        return data
+
+    def iter_subtree_dtos(self, item_id: str) -> Iterator[MTItemDTO]:
+        """하위 트리를 전위 순서로 풀어 DTO로 반환합니다. 방문한 노드만 풉니다."""
+        stack = [item_id]
+        while stack:
+            current_id = stack.pop()
+            if current_id not in self._items:
+                continue
+            item_data = self._items[current_id]
+            yield MTItemDTO.from_dict(item_data)
+            stack.extend(reversed(item_data["domain_data"]["children_ids"]))
+
+    # --- 내부 도우미 ---
+    def _node(self, index: int) -> tuple:
+        if not 0 <= index < self._node_count:
+            raise IndexError(index)
+        return _NODE.unpack_from(self._buffer, self._nodes_off + index * _NODE.size)
+
+    def _child_indexes(self, node: tuple) -> tuple:
+        child_start, child_count = node[8], node[9]
+        return struct.unpack_from(f"<{child_count}I", self._buffer, self._children_off + child_start * _U32.size)
+
+    def _extras(self, node: tuple) -> tuple:
+        data_offset, data_length = node[10], node[11]
+        if not data_length:
+            return {}, {}
+        extras, _ = self._decode_value(self._data_off + data_offset)
+        return extras["domain"], extras["ui"]
+
+    def _string(self, index: int) -> str | None:
+        if index == _NO_STRING:
+            return None
+        text = self._string_cache.get(index)
+        if text is None:
+            start, end = struct.unpack_from("<II", self._buffer, self._strings_off + index * _U32.size)
+            text = self._string_cache[index] = bytes(self._buffer[self._blob_off + start:self._blob_off + end]).decode('utf-8')
+        return text
+
+    def _required_string(self, index: int) -> str:
+        """ID, 문자열 값처럼 빠질 수 없는 문자열"""
+        text = self._string(index)
+        if text is None:
+            raise MTBinaryFormatError("필수 문자열이 비어 있습니다")
+        return text
+
+    def _decode_value(self, offset: int) -> tuple:
+        buffer = self._buffer
+        tag = buffer[offset]
+        offset += 1
+        if tag == _T_NONE:
+            return None, offset
+        if tag == _T_FALSE or tag == _T_TRUE:
+            return tag == _T_TRUE, offset
+        if tag == _T_INT:
+            return _INT64.unpack_from(buffer, offset)[0], offset + _INT64.size
+        if tag == _T_FLOAT:
+            return _FLOAT64.unpack_from(buffer, offset)[0], offset + _FLOAT64.size
+        if tag in (_T_STR, _T_BIGINT):
+            text = self._required_string(_U32.unpack_from(buffer, offset)[0])
+            return (text if tag == _T_STR else int(text)), offset + _U32.size
+        count, = _U32.unpack_from(buffer, offset)
+        offset += _U32.size
+        if tag == _T_LIST:
+            values = []
+            for _ in range(count):
+                value, offset = self._decode_value(offset)
+                values.append(value)
+            return values, offset
+        if tag == _T_DICT:
+            mapping = {}
+            for _ in range(count):
+                key = self._string(_U32.unpack_from(buffer, offset)[0])
+                mapping[key], offset = self._decode_value(offset + _U32.size)
+            return mapping, offset
+        raise MTBinaryFormatError(f"알 수 없는 값 태그: {tag}")
+
+
+class MTLazyItemMap(Mapping):
+    """바이너리 트리 파일의 아이템을 ID로 꺼낼 때마다 풀어서 캐시하는 읽기 전용 매핑"""
+
+    def __init__(self, reader: MTBinaryTreeReader):
+        self._reader = reader
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def materialized(self) -> int:
+        """지금까지 풀어 둔 아이템 수"""
+        return len(self._cache)
+
+    def __getitem__(self, item_id: str) -> Dict[str, Any]:
+        item_data = self._cache.get(item_id)
+        if item_data is None:
+            index = self._reader.index_of(item_id)
+            if index is None:
+                raise KeyError(item_id)
+            item_data = self._cache[item_id] = self._reader.item_dict(index)
+        return item_data
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._cache or (isinstance(item_id, str) and self._reader.index_of(item_id) is not None)
+
+    def __iter__(self) -> Iterator[str]:
+        # 저장 순서(items 딕셔너리 순서)대로 ID만 읽음
+        return (self._reader.item_id_at(index) for index in range(len(self._reader)))
+
+    def __len__(self) -> int:
+        return len(self._reader)
+
+    def items(self) -> Iterator[tuple]:  # type: ignore[override]
+        """저장 순서대로 (ID, 아이템 딕셔너리). 전체를 순회하면서 색인 탐색 없이 바로 풉니다."""
+        reader, cache = self._reader, self._cache
+        for index in range(len(reader)):
+            item_id = reader.item_id_at(index)
+            item_data = cache.get(item_id)
+            if item_data is None:
+                item_data = cache[item_id] = reader.item_dict(index)
+            yield item_id, item_data
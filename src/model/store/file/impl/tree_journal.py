@@ -0,0 +1,274 @@
+import hashlib
+import json
+import os
+import threading
+from typing import IO, Any, Callable, Dict, List, Protocol, Tuple
+
+from core.interfaces.base_tree import IMTTree
+from model.events.impl.tree_delta import MTTreeDelta, apply_delta, encode_event
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager, MTTreeEvent
+
+"""
+파일 저장소의 트리별 변경 저널입니다.
+기본 파일(<id>.json) 이후의 변경분을 <id>.journal에 한 줄씩(JSON Lines) 덧붙이고, 저장할 때 fsync 합니다.
+첫 줄(헤더)에는 기본 파일의 sha256을 적어서, 압축(기본 파일 다시 쓰기)으로 기본 파일이 바뀌면 예전 저널을 무시합니다.
+마지막 줄이 쓰다 만 상태(비정상 종료)면 그 줄부터 버립니다.
+"""
+
+JOURNAL_FILE_EXT = ".journal"
+JOURNAL_VERSION = 1
+
+_JOURNALED_EVENTS = (
+    MTTreeEvent.ITEM_ADDED,
+    MTTreeEvent.ITEM_REMOVED,
+    MTTreeEvent.ITEM_MODIFIED,
+    MTTreeEvent.ITEM_MOVED,
+    MTTreeEvent.TREE_RESET,
+)
+
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    """파일 전체를 메모리에 올리지 않고 sha256을 계산합니다."""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class MTHashingReader:
+    """읽은 바이트의 sha256을 함께 계산하는 파일 래퍼 (스트리밍 파싱하면서 기본 파일 해시를 구할 때 사용)"""
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+        self._hasher = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._hasher.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        """끝까지 읽은 뒤 호출해야 파일 전체의 해시가 됩니다."""
+        while self.read(_HASH_CHUNK_SIZE):
+            pass
+        return self._hasher.hexdigest()
+
+
+class MTBinaryWriter(Protocol):
+    """write_atomic이 내용을 쓰는 함수에 넘기는 쓰기 전용 파일 객체"""
+
+    def write(self, data: bytes) -> int: ...
+
+
+class _HashingWriter:
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+        self.hasher = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.hasher.update(data)
+        return self._file.write(data)
+
+
+def write_atomic(path: str, content: bytes | Callable[[MTBinaryWriter], Any]) -> str:
+    """
+    임시 파일에 쓰고 fsync 한 뒤 이름을 바꿉니다. 중간에 죽어도 path는 이전 내용이나 새 내용 중 하나입니다.
+    Args:
+        path (str): 쓸 파일 경로
+        content: 파일 내용, 또는 쓰기 전용 파일 객체(write만 제공)를 받아 내용을 조금씩 쓰는 함수
+    Returns:
+        str: 쓴 내용의 sha256
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            writer = _HashingWriter(file)
+            if isinstance(content, (bytes, bytearray)):
+                writer.write(content)
+            else:
+                content(writer)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_dir(os.path.dirname(path) or ".")
+    return writer.hasher.hexdigest()
+
+
+def _fsync_dir(dir_path: str) -> None:
+    """이름 바꾸기를 디스크에 반영합니다. 디렉터리를 열 수 없는 플랫폼(Windows)에서는 건너뜁니다."""
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _header_line(base_sha256: str) -> bytes:
+    return json.dumps({"version": JOURNAL_VERSION, "base_sha256": base_sha256}).encode('utf-8') + b"\n"
+
+
+def scan_journal(path: str, base_sha256: str) -> Tuple[List[MTTreeDelta], int]:
+    """
+    저널에서 기본 파일(base_sha256) 이후의 변경분을 읽습니다.
+    Returns:
+        Tuple[List[MTTreeDelta], int]: (변경분 목록, 온전한 부분의 바이트 길이). 다른 기본 파일의 저널이면 ([], 0)
+    """
+    try:
+        with open(path, 'rb') as file:
+            content = file.read()
+    except FileNotFoundError:
+        return [], 0
+    deltas: List[MTTreeDelta] = []
+    good_size = 0
+    for line in content.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break  # 쓰다 만 마지막 줄
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break
+        if good_size == 0:
+            if not isinstance(record, dict) or record.get("base_sha256") != base_sha256 \
+                    or record.get("version") != JOURNAL_VERSION:
+                return [], 0
+        else:
+            op, args = record
+            deltas.append((op, tuple(args)))
+        good_size += len(line)
+    return deltas, good_size
+
+
+def replay_journal(tree: IMTTree, path: str, base_sha256: str) -> int:
+    """기본 파일에서 만든 트리에 저널의 변경분을 순서대로 적용하고, 적용한 개수를 반환합니다."""
+    deltas, _ = scan_journal(path, base_sha256)
+    for delta in deltas:
+        apply_delta(tree, delta)
+    return len(deltas)
+
+
+class MTTreeJournal:
+    """
+    트리 이벤트를 변경분으로 모았다가 commit()에서 저널 파일에 덧붙이는 기록기.
+    undo/redo나 TREE_RESET처럼 변경분으로 표현할 수 없는 변경이 생기면 needs_compaction이 켜지고,
+    저장소는 다음 저장에서 기본 파일을 통째로 다시 씁니다.
+    """
+
+    def __init__(self, path: str, tree: IMTTree, base_sha256: str):
+        self._path = path
+        self._tree = tree
+        self._lock = threading.Lock()
+        self._pending: List[bytes] = []
+        self._needs_compaction = False
+        self._event_manager: IMTTreeEventManager | None = None
+        self._state_manager: Any = None
+        deltas, good_size = scan_journal(path, base_sha256)
+        if good_size:
+            with open(path, 'r+b') as file:
+                file.truncate(good_size)  # 쓰다 만 줄 뒤에 덧붙이지 않도록 잘라냄
+            self._records, self._size = len(deltas), good_size
+        else:
+            self.reset(base_sha256)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def tree(self) -> IMTTree:
+        return self._tree
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._needs_compaction
+
+    @property
+    def size(self) -> int:
+        """커밋된 저널 크기와 아직 쓰지 않은 변경분 크기의 합 (바이트)"""
+        return self._size + sum(len(line) for line in self._pending)
+
+    @property
+    def record_count(self) -> int:
+        return self._records + len(self._pending)
+
+    def attach(self, event_manager: IMTTreeEventManager, state_manager: Any = None) -> None:
+        """트리 이벤트(와 상태 관리자의 undo/redo)를 구독합니다."""
+        self.detach()
+        self._event_manager = event_manager
+        for event_type in _JOURNALED_EVENTS:
+            event_manager.subscribe(event_type, self._on_tree_event)
+        if state_manager is not None and hasattr(state_manager, "subscribe"):
+            self._state_manager = state_manager
+            state_manager.subscribe(MTTreeEvent.TREE_UNDO, self._on_history_changed)
+            state_manager.subscribe(MTTreeEvent.TREE_REDO, self._on_history_changed)
+
+    def detach(self) -> None:
+        if self._event_manager is not None:
+            for event_type in _JOURNALED_EVENTS:
+                self._event_manager.unsubscribe(event_type, self._on_tree_event)
+            self._event_manager = None
+        if self._state_manager is not None:
+            self._state_manager.unsubscribe(MTTreeEvent.TREE_UNDO, self._on_history_changed)
+            self._state_manager.unsubscribe(MTTreeEvent.TREE_REDO, self._on_history_changed)
+            self._state_manager = None
+
+    def commit(self) -> int:
+        """모아 둔 변경분을 저널 끝에 쓰고 fsync 합니다. 쓴 변경분 개수를 반환합니다."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        data = b"".join(pending)
+        with open(self._path, 'ab') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        self._size += len(data)
+        self._records += len(pending)
+        return len(pending)
+
+    def reset(self, base_sha256: str) -> None:
+        """기본 파일을 새로 쓴 뒤 호출합니다. 저널을 헤더만 남기고 비웁니다."""
+        header = _header_line(base_sha256)
+        write_atomic(self._path, header)
+        with self._lock:
+            self._pending.clear()
+            self._needs_compaction = False
+        self._records, self._size = 0, len(header)
+
+    def _on_tree_event(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        if self._needs_compaction:
+            return  # 어차피 다음 저장에서 기본 파일을 다시 씀
+        if event_type == MTTreeEvent.TREE_RESET:
+            self._needs_compaction = True
+            return
+        try:
+            delta = encode_event(self._tree, event_type, data)
+            if delta is None:
+                return
+            line = json.dumps(delta, ensure_ascii=False, separators=(",", ":")).encode('utf-8') + b"\n"
+        except (TypeError, ValueError, KeyError):
+            self._needs_compaction = True
+            return
+        with self._lock:
+            self._pending.append(line)
+
+    def _on_history_changed(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        # RF : undo/redo는 트리 이벤트 없이 상태를 통째로 바꾸므로 변경분으로 기록할 수 없음
+        self._needs_compaction = True
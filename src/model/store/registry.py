@@ -0,0 +1,58 @@
+import importlib
+from typing import Any, Dict
+
+from model.store.repo.interfaces.base_tree_repo import IMTStore
+
+"""
+저장소 백엔드 레지스트리입니다.
+백엔드는 "모듈:클래스" 경로로만 등록해 두고, 실제로 사용할 때 임포트합니다.
+(파일 저장소만 쓰는 경우 psycopg2, SQLAlchemy 등을 로드하지 않음)
+"""
+
+_BACKENDS: Dict[str, str] = {
+    "file": "model.store.file.impl.file_tree_repo:MTFileTreeRepository",
+    "sqlite": "model.store.db.impl.sqlite_tree_repo:SQLiteTreeRepository",
+    "sqlite_items": "model.store.db.impl.sqlite_item_repo:SQLiteItemTreeRepository",
+    "postgres": "model.store.db.impl.postgres_repo:PostgreSQLTreeRepository",
+    "sqlalchemy": "model.store.db.impl.sqlalchemy_tree_repo:SQLAlchemyTreeRepo",
+}
+
+DEFAULT_BACKEND = "file"
+
+
+def register_backend(name: str, target: str) -> None:
+    """
+    저장소 백엔드를 등록합니다.
+    Args:
+        name (str): 백엔드 이름
+        target (str): "패키지.모듈:클래스" 형식의 경로
+    """
+    if ":" not in target:
+        raise ValueError(f"백엔드 경로는 '모듈:클래스' 형식이어야 합니다: {target}")
+    _BACKENDS[name] = target
+
+
+def available_backends() -> list[str]:
+    """등록된 백엔드 이름 목록을 반환합니다. (임포트하지 않음)"""
+    return sorted(_BACKENDS)
+
+
+def get_backend_class(name: str) -> type:
+    """
+    백엔드 클래스를 임포트해 반환합니다.
+    Raises:
+        KeyError: 등록되지 않은 백엔드일 때
+        ImportError: 백엔드의 의존 패키지가 설치되지 않았을 때
+    """
+    try:
+        target = _BACKENDS[name]
+    except KeyError:
+        raise KeyError(f"등록되지 않은 저장소 백엔드입니다: {name} (사용 가능: {', '.join(available_backends())})") from None
+    module_name, class_name = target.split(":", 1)
+    backend: type = getattr(importlib.import_module(module_name), class_name)
+    return backend
+
+
+def create_repository(name: str = DEFAULT_BACKEND, **kwargs: Any) -> IMTStore:
+    """이름으로 백엔드를 임포트하고 저장소 인스턴스를 생성합니다."""
+    return get_backend_class(name)(**kwargs)
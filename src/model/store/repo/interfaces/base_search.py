@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+"""
+저장된 트리 검색 결과 타입입니다. 검색을 지원하는 저장소(search(query, limit))와 StoreManager가 함께 씁니다.
+"""
+
+DEFAULT_SEARCH_LIMIT = 20
+
+
+class MTSearchHit(NamedTuple):
+    """검색 결과 한 건"""
+    tree_id: str
+    item_id: str
+    snippet: str
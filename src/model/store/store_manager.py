@@ -1,21 +1,55 @@
-from typing import Dict, Any # Optional removed
+from typing import Dict, Any, Callable, List # Optional removed
+from concurrent.futures import Executor
 from model.store.repo.interfaces.base_tree_repo import IMTStore
+from model.store.repo.interfaces.base_search import DEFAULT_SEARCH_LIMIT, MTSearchHit
+from model.store.tree_loader import Dispatch, MTTreeLoadTask, load_tree_async
+from core.interfaces.base_item_data import MTItemDTO
 from core.interfaces.base_tree import IMTTree
+import core.exceptions as exc
 
 class StoreManager:
-    def __init__(self, repository: IMTStore):
+    def __init__(self, repository: IMTStore, executor: Executor | None = None):
         self._repository = repository
+        self._executor = executor  # 백그라운드 불러오기 실행기 (None이면 공유 스레드 풀)
 
     def save(self, tree: IMTTree, tree_id: str | None = None) -> str:
-        return self._repository.save(tree, tree_id)
+        saved_id: str = self._repository.save(tree, tree_id)
+        return saved_id
 
     def load(self, tree_id: str) -> IMTTree | None:
         return self._repository.load(tree_id)
 
+    def load_tree_async(
+        self,
+        tree_id: str,
+        on_start: Callable[[Dict[str, Any], int], None] | None = None,
+        on_chunk: Callable[[List[MTItemDTO]], None] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+        on_done: Callable[[MTTreeLoadTask], None] | None = None,
+        dispatch: Dispatch | None = None,
+        task: MTTreeLoadTask | None = None,
+    ) -> MTTreeLoadTask:
+        """작업 스레드에서 트리를 불러와 최상위 그룹 단위로 콜백에 넘깁니다. (model.store.tree_loader 참고)"""
+        return load_tree_async(self._repository, tree_id, on_start, on_chunk, on_progress, on_done,
+                               dispatch=dispatch, executor=self._executor, task=task)
+
     def delete(self, tree_id: str) -> bool:
         result = self._repository.delete(tree_id)
         return bool(result)
 
     def list_trees(self) -> Dict[str, str]:
         result = self._repository.list_trees()
-        return dict(result) 
\ No newline at end of file
+        return dict(result)
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[MTSearchHit]:
+        """
+        저장된 트리에서 아이템 이름/노드 타입/동작 설명을 검색해 (tree_id, item_id, snippet)을 관련도 순으로 반환합니다.
+        트리를 불러오지 않고 저장소의 검색 색인만 읽습니다.
+        Raises:
+            MTSearchUnavailableError: 저장소가 검색을 지원하지 않을 때
+        """
+        search = getattr(self._repository, "search", None)
+        if search is None:
+            raise exc.MTSearchUnavailableError(f"{type(self._repository).__name__} 저장소는 검색을 지원하지 않습니다")
+        hits: List[MTSearchHit] = search(query, limit)
+        return hits 
\ No newline at end of file
@@ -0,0 +1,234 @@
+import io
+import lzma
+import zlib
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Dict, Protocol
+
+import core.exceptions as exc
+
+"""
+저장소 공용 압축 코덱입니다. (표준 라이브러리 zlib, lzma)
+압축한 데이터는 코덱을 나타내는 헤더 바이트 1개로 시작합니다. 헤더가 없으면(JSON은 '{'로 시작) 압축하지 않은 데이터로 읽습니다.
+쓰기와 읽기 모두 조각 단위로 처리하므로 원본과 압축본을 한꺼번에 메모리에 두지 않습니다.
+"""
+
+COMPRESSION_NONE = "none"
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+class MTCompressionError(exc.MTTreeError):
+    """알 수 없는 코덱이거나 압축 데이터가 깨졌을 때 발생합니다."""
+
+
+class MTCompressor(Protocol):
+    """압축기 (zlib.compressobj, lzma.LZMACompressor)"""
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class MTDecompressor(Protocol):
+    """조각 단위 해제기. max_length까지만 풀고, 남은 입력은 다음 호출에서 이어서 풉니다."""
+
+    @property
+    def needs_input(self) -> bool: ...
+
+    @property
+    def eof(self) -> bool: ...
+
+    def decompress(self, data: bytes, max_length: int) -> bytes: ...
+
+
+@dataclass(frozen=True)
+class MTCompressionCodec:
+    """압축 코덱 (헤더 바이트, 기본 압축 수준, 압축기/해제기 생성 함수)"""
+    name: str
+    header: bytes
+    default_level: int
+    min_level: int
+    max_level: int
+    compressor: Callable[[int], MTCompressor]
+    decompressor: Callable[[], MTDecompressor]
+
+
+class _ZlibDecompressor:
+    def __init__(self) -> None:
+        self._obj = zlib.decompressobj()
+        self._tail = b""
+
+    @property
+    def needs_input(self) -> bool:
+        return not self._tail
+
+    @property
+    def eof(self) -> bool:
+        return self._obj.eof
+
+    def decompress(self, data: bytes, max_length: int) -> bytes:
+        output = self._obj.decompress(self._tail + data, max_length)
+        self._tail = self._obj.unconsumed_tail
+        return output
+
+
+class _LzmaDecompressor:
+    def __init__(self) -> None:
+        self._obj = lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+
+    @property
+    def needs_input(self) -> bool:
+        return self._obj.needs_input
+
+    @property
+    def eof(self) -> bool:
+        return self._obj.eof
+
+    def decompress(self, data: bytes, max_length: int) -> bytes:
+        return self._obj.decompress(data, max_length)
+
+
+# RF : 헤더 바이트는 JSON 첫 글자('{', 공백, BOM)나 바이너리 매직('M')과 겹치지 않는 값만 사용
+# RF : lzma 기본 수준은 0 (매크로 트리에서 6과 압축률 차이는 몇 %인데 압축 시간은 20배, benchmarks/bench_compression.py)
+CODECS: Dict[str, MTCompressionCodec] = {
+    "zlib": MTCompressionCodec("zlib", b"\x01", 6, 0, 9, lambda level: zlib.compressobj(level), _ZlibDecompressor),
+    "lzma": MTCompressionCodec("lzma", b"\x02", 0, 0, 9,
+                               lambda level: lzma.LZMACompressor(format=lzma.FORMAT_XZ, preset=level),
+                               _LzmaDecompressor),
+}
+_CODECS_BY_HEADER = {codec.header: codec for codec in CODECS.values()}
+
+
+def get_codec(name: str) -> MTCompressionCodec | None:
+    """
+    이름으로 코덱을 찾습니다. "none"이면 None을 반환합니다.
+    Raises:
+        ValueError: 등록되지 않은 코덱일 때
+    """
+    if name == COMPRESSION_NONE:
+        return None
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {name} (사용 가능: {', '.join(available_codecs())})") from None
+
+
+def available_codecs() -> list[str]:
+    return [COMPRESSION_NONE, *CODECS]
+
+
+def resolve_level(codec: MTCompressionCodec | None, level: int | None) -> int:
+    """압축 수준을 코덱 범위로 확인합니다. None이면 코덱 기본값"""
+    if codec is None:
+        return 0
+    if level is None:
+        return codec.default_level
+    if not codec.min_level <= level <= codec.max_level:
+        raise ValueError(f"{codec.name} 압축 수준은 {codec.min_level}~{codec.max_level} 사이여야 합니다: {level}")
+    return level
+
+
+class MTCompressingWriter:
+    """
+    쓰는 바이트를 압축해 fp에 쓰는 파일 객체. 처음에 코덱 헤더를 쓰고, close()에서 남은 압축 데이터를 씁니다.
+    fp 자체는 닫지 않습니다.
+    """
+
+    def __init__(self, fp: IO[bytes], codec: MTCompressionCodec, level: int | None = None):
+        self._fp = fp
+        self._compressor = codec.compressor(resolve_level(codec, level))
+        self._closed = False
+        fp.write(codec.header)
+
+    def write(self, data: bytes) -> int:
+        compressed = self._compressor.compress(data)
+        if compressed:
+            self._fp.write(compressed)
+        return len(data)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._fp.write(self._compressor.flush())
+
+    def __enter__(self) -> "MTCompressingWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+
+
+class MTDecompressingReader:
+    """압축된 fp를 읽으면서 풀어 주는 read(size) 파일 객체. 한 번에 size보다 많이 풀지 않습니다."""
+
+    def __init__(self, fp: IO[bytes], codec: MTCompressionCodec):
+        self._fp = fp
+        self._decompressor = codec.decompressor()
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(_READ_CHUNK_SIZE), b""))
+        decompressor = self._decompressor
+        while size and not decompressor.eof:
+            data = b""
+            if decompressor.needs_input:
+                data = self._fp.read(_READ_CHUNK_SIZE)
+                if not data:
+                    raise MTCompressionError("압축 데이터가 중간에 끝났습니다")
+            try:
+                output = decompressor.decompress(data, size)
+            except (zlib.error, lzma.LZMAError) as e:
+                raise MTCompressionError(f"압축 데이터가 손상되었습니다: {e}") from e
+            if output:
+                return output
+        return b""
+
+
+class _PrefixedReader:
+    """헤더 확인을 위해 미리 읽은 바이트를 앞에 다시 붙여 주는 read(size) 파일 객체"""
+
+    def __init__(self, prefix: bytes, fp: IO[bytes]):
+        self._prefix = prefix
+        self._fp = fp
+
+    def read(self, size: int = -1) -> bytes:
+        prefix = self._prefix
+        if not prefix:
+            return self._fp.read(size)
+        self._prefix = b""
+        if size is None or size < 0:
+            return prefix + self._fp.read()
+        return prefix + self._fp.read(size - len(prefix)) if size > len(prefix) else prefix
+
+
+def codec_of(head: bytes) -> MTCompressionCodec | None:
+    """데이터 첫 바이트로 코덱을 찾습니다. 압축하지 않은 데이터면 None"""
+    return _CODECS_BY_HEADER.get(head[:1])
+
+
+def open_decompressed(fp: IO[bytes]) -> Any:
+    """
+    첫 바이트로 압축 여부를 판단해 풀린 내용을 읽는 파일 객체를 반환합니다. (압축하지 않은 데이터는 그대로 읽음)
+    fp는 read(size)만 있으면 되며, seek 할 수 없어도 됩니다.
+    """
+    head = fp.read(1)
+    codec = codec_of(head)
+    if codec is None:
+        return _PrefixedReader(head, fp)
+    return MTDecompressingReader(fp, codec)
+
+
+def compress_bytes(data: bytes, codec: MTCompressionCodec | None, level: int | None = None) -> bytes:
+    """한 번에 압축합니다. codec이 None이면 그대로 반환합니다."""
+    if codec is None:
+        return data
+    compressor = codec.compressor(resolve_level(codec, level))
+    return codec.header + compressor.compress(data) + compressor.flush()
+
+
+def decompress_bytes(data: bytes) -> bytes:
+    """compress_bytes의 역. 헤더가 없으면 그대로 반환합니다."""
+    codec = codec_of(data)
+    if codec is None:
+        return data
+    return MTDecompressingReader(io.BytesIO(data[1:]), codec).read()
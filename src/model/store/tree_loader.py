@@ -0,0 +1,273 @@
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List
+
+from core.impl.tree_stream import ITEMS_KEY, MTTreeStream, MTTreeStreamBuilder
+from core.interfaces.base_item_data import MTItemDTO
+from core.interfaces.base_item_keys import DomainKeys as DK
+from core.interfaces.base_tree import IMTTree
+from model.store.repo.interfaces.base_tree_repo import IMTStore
+
+"""
+트리 백그라운드 불러오기입니다.
+저장소가 스트림(open_tree_stream)을 제공하면 작업 스레드에서 아이템을 읽는 대로 MTTree를 구성하고,
+하위 아이템이 모두 들어온 최상위 그룹부터 콜백으로 넘깁니다. 스트림이 없으면 load()로 읽은 뒤 그룹 단위로 넘깁니다.
+- 콜백은 작업 스레드에서 호출되므로 UI에 반영하려면 dispatch로 UI 스레드에 넘겨야 합니다.
+- 다음 그룹은 UI가 앞 그룹을 반영한 뒤에 넘깁니다. (UI 큐가 밀리지 않도록, 그동안 작업 스레드는 다음 그룹을 읽음)
+- 읽는 동안에도 진행률을 알리고 취소를 확인합니다.
+"""
+
+# dispatch(fn, *args): fn(*args)를 UI 스레드에서 실행하도록 넘기는 함수
+Dispatch = Callable[..., None]
+
+PROGRESS_INTERVAL = 2048  # 그룹이 완성되지 않아도 이만큼 읽을 때마다 진행률을 알림
+_HANDOFF_POLL = 0.05  # UI가 앞 그룹을 반영하기를 기다리며 취소를 확인하는 간격(초)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _default_executor() -> ThreadPoolExecutor:
+    """불러오기 작업에 공유하는 스레드 풀을 처음 사용할 때 만듭니다."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mt-store")
+        return _executor
+
+
+def _direct_dispatch(fn: Callable[..., Any], *args: Any) -> None:
+    fn(*args)
+
+
+class MTTreeLoadCancelled(Exception):
+    """불러오기가 취소되었음을 나타냅니다."""
+
+
+class MTTreeLoadTask:
+    """백그라운드 불러오기 작업 핸들 (진행률, 취소, 결과)"""
+
+    def __init__(self, tree_id: str):
+        self.tree_id = tree_id
+        self.loaded = 0  # 읽은 아이템 수 (더미 루트 제외)
+        self.total = 0  # 전체 아이템 수. 스트림으로 읽는 중 모르면 0 (끝나면 loaded와 같음)
+        self._cancel_event = threading.Event()
+        self._future: Future | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """불러오기를 취소합니다. 작업 스레드는 다음 그룹을 넘기기 전에 멈춥니다."""
+        self._cancel_event.set()
+
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def result(self, timeout: float | None = None) -> IMTTree | None:
+        """
+        작업이 끝날 때까지 기다려 불러온 트리를 반환합니다.
+        Returns:
+            IMTTree | None: 불러온 트리. 취소되었거나 트리가 없으면 None
+        Raises:
+            Exception: 작업 중 발생한 오류
+        """
+        if self._future is None:
+            return None
+        try:
+            return self._future.result(timeout)
+        except MTTreeLoadCancelled:
+            return None
+
+    def error(self) -> BaseException | None:
+        """작업 중 발생한 오류 (취소는 오류가 아님)"""
+        if self._future is None or not self._future.done():
+            return None
+        error = self._future.exception()
+        return None if isinstance(error, MTTreeLoadCancelled) else error
+
+
+def iter_top_level_groups(tree: IMTTree) -> Iterator[List[MTItemDTO]]:
+    """트리를 최상위 아이템 단위의 하위 트리 DTO 목록으로 나눠 차례로 반환합니다. (각 목록은 루트 먼저, 전위 순서)"""
+    root = tree.get_item(tree.root_id) if tree.root_id is not None else None
+    if root is None:
+        return
+    for top_id in list(root.get_property(DK.CHILDREN, [])):
+        yield subtree_dtos(tree, top_id)
+
+
+def subtree_dtos(tree: IMTTree, top_id: str) -> List[MTItemDTO]:
+    """아이템과 하위 아이템의 DTO 목록 (루트 먼저, 전위 순서). 없는 아이템은 건너뜀"""
+    chunk: List[MTItemDTO] = []
+    stack = [top_id]
+    while stack:
+        item = tree.get_item(stack.pop())
+        if item is None:
+            continue
+        chunk.append(item.to_dto())
+        stack.extend(reversed(item.get_property(DK.CHILDREN, [])))
+    return chunk
+
+
+def load_tree_async(
+    repository: IMTStore,
+    tree_id: str,
+    on_start: Callable[[Dict[str, Any], int], None] | None = None,
+    on_chunk: Callable[[List[MTItemDTO]], None] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    on_done: Callable[[MTTreeLoadTask], None] | None = None,
+    dispatch: Dispatch | None = None,
+    executor: Executor | None = None,
+    task: MTTreeLoadTask | None = None,
+) -> MTTreeLoadTask:
+    """
+    저장소에서 트리를 백그라운드로 불러옵니다.
+    Args:
+        repository (IMTStore): 저장소
+        tree_id (str): 불러올 트리 ID
+        on_start: (빈 트리 딕셔너리, 전체 아이템 수) - 첫 그룹을 넘기기 직전에 한 번 호출. 전체 수를 모르면 0
+        on_chunk: 최상위 그룹 하나의 DTO 목록 (루트 먼저, 전위 순서)
+        on_progress: (읽은 아이템 수, 전체 아이템 수). 전체 수를 모르면 0
+        on_done: 성공/실패/취소와 관계없이 마지막에 한 번 호출
+        dispatch (Dispatch | None): 콜백을 실행할 스레드로 넘기는 함수. None이면 작업 스레드에서 바로 호출
+        executor (Executor | None): 작업을 실행할 실행기. None이면 공유 스레드 풀
+        task (MTTreeLoadTask | None): 콜백에서 미리 참조할 작업 핸들. None이면 새로 만듦
+    Returns:
+        MTTreeLoadTask: 작업 핸들
+    """
+    task = task if task is not None else MTTreeLoadTask(tree_id)
+    post = dispatch if dispatch is not None else _direct_dispatch
+
+    # RF : on_done 안에서 task.result()/error()를 쓸 수 있도록 future를 먼저 연결하고 작업이 끝나면 알림
+    future: Future = Future()
+    task._future = future
+
+    def complete() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            tree = _run(task, repository, post, on_start, on_chunk, on_progress)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(tree)
+        if on_done is not None:
+            post(on_done, task)
+
+    (executor if executor is not None else _default_executor()).submit(complete)
+    return task
+
+
+class _Handoff:
+    """작업 스레드 -> UI 스레드 전달. 앞에 넘긴 호출이 실행된 뒤에만 다음 호출을 넘깁니다."""
+
+    def __init__(self, task: MTTreeLoadTask, post: Dispatch):
+        self._task = task
+        self._post = post
+        self._idle = threading.Event()
+        self._idle.set()
+
+    @property
+    def idle(self) -> bool:
+        return self._idle.is_set()
+
+    def send(self, fn: Callable[..., Any], *args: Any) -> None:
+        """앞 호출이 끝나기를 기다린 뒤 fn(*args)를 넘깁니다. 기다리는 동안 취소되면 MTTreeLoadCancelled"""
+        while not self._idle.wait(_HANDOFF_POLL):
+            if self._task.cancelled:
+                raise MTTreeLoadCancelled(self._task.tree_id)
+        if self._task.cancelled:
+            raise MTTreeLoadCancelled(self._task.tree_id)
+        self._idle.clear()
+        self._post(self._run, fn, args)
+
+    def _run(self, fn: Callable[..., Any], args: tuple) -> None:
+        try:
+            fn(*args)
+        finally:
+            self._idle.set()
+
+
+def _run(
+    task: MTTreeLoadTask,
+    repository: IMTStore,
+    post: Dispatch,
+    on_start: Callable[[Dict[str, Any], int], None] | None,
+    on_chunk: Callable[[List[MTItemDTO]], None] | None,
+    on_progress: Callable[[int, int], None] | None,
+) -> IMTTree | None:
+    """작업 스레드 본문: 읽기(스트림이면 읽는 대로) -> 빈 트리 알림 -> 그룹 단위 전달"""
+    if task.cancelled:
+        raise MTTreeLoadCancelled(task.tree_id)
+    handoff = _Handoff(task, post)
+    started = False
+
+    def deliver(tree: IMTTree, top_ids: List[str]) -> None:
+        nonlocal started
+        if not started:
+            started = True
+            if on_start is not None:
+                handoff.send(on_start, _empty_tree_dict(tree), task.total)
+        for top_id in top_ids:
+            chunk = subtree_dtos(tree, top_id)
+            handoff.send(_apply_chunk, on_chunk, on_progress, chunk, task.loaded, task.total)
+
+    open_stream = getattr(repository, "open_tree_stream", None)
+    stream: MTTreeStream | None = open_stream(task.tree_id) if open_stream is not None else None
+    if stream is None:
+        # 스트림이 없는 저장소(또는 저널 재생이 필요한 파일)는 다 읽은 뒤 그룹 단위로 넘김
+        tree = repository.load(task.tree_id)
+        if tree is None:
+            return None
+        task.total = max(len(tree.items) - 1, 0)
+        deliver(tree, [])
+        for chunk in iter_top_level_groups(tree):
+            task.loaded += len(chunk)
+            handoff.send(_apply_chunk, on_chunk, on_progress, chunk, task.loaded, task.total)
+        return tree
+
+    builder = MTTreeStreamBuilder()
+    task.total = stream.item_count or 0
+    found = False
+    try:
+        for key, value in stream.tokens:
+            if task.cancelled:
+                raise MTTreeLoadCancelled(task.tree_id)
+            found = True
+            ready = builder.feed(key, value)
+            task.loaded = builder.item_count
+            if ready:
+                deliver(builder.tree, ready)
+            elif (key == ITEMS_KEY and on_progress is not None and task.loaded and task.loaded % PROGRESS_INTERVAL == 0
+                  and handoff.idle):
+                handoff.send(on_progress, task.loaded, task.total)  # 큰 그룹을 읽는 동안에도 진행률 표시
+    finally:
+        close = getattr(stream.tokens, "close", None)
+        if close is not None:
+            close()  # 취소/오류로 멈춰도 파일/연결을 바로 닫음
+    if not found:
+        return None
+    known_total = task.total
+    remaining = builder.finish()
+    task.total = task.loaded = builder.item_count
+    deliver(builder.tree, remaining)
+    if on_progress is not None and not remaining and known_total != task.total:
+        handoff.send(on_progress, task.loaded, task.total)  # 전체 수를 몰랐으면 마지막에 알림
+    return builder.tree
+
+
+def _apply_chunk(on_chunk: Callable[[List[MTItemDTO]], None] | None, on_progress: Callable[[int, int], None] | None,
+                 chunk: List[MTItemDTO], loaded: int, total: int) -> None:
+    if on_chunk is not None:
+        on_chunk(chunk)
+    if on_progress is not None:
+        on_progress(loaded, total)
+
+
+def _empty_tree_dict(tree: IMTTree) -> Dict[str, Any]:
+    """최상위 아이템을 모두 뺀 트리 딕셔너리 (ID, 이름, 더미 루트만)"""
+    root = tree.get_item(tree.root_id)
+    root_data = root.to_dto().to_dict()
+    root_data["domain_data"]["children_ids"] = []
+    return {"id": tree.id, "name": tree.name, "root_id": tree.root_id, "items": {tree.root_id: root_data}}
@@ -0,0 +1,105 @@
+import os
+import sys
+import logging
+from typing import Dict, Tuple
+
+from PyQt6.QtGui import QIcon
+
+from core.interfaces.base_item_data import MTNodeType
+
+logger = logging.getLogger(__name__)
+
+"""
+트리 렌더링용 아이콘 레지스트리입니다.
+경로 확인(stat)과 이미지 로드는 키마다 한 번만 하고, 같은 QIcon 인스턴스를 프로세스 전체에서 공유합니다.
+파일이 없으면 빈 QIcon을 대신 캐시해 매번 다시 찾지 않습니다.
+"""
+
+ICON_DIR = "src/images/icons"
+
+
+def resource_path(relative_path: str) -> str:
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    base_path = getattr(sys, "_MEIPASS", None)
+    if base_path is None:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+IconKey = Tuple[MTNodeType | None, str | None]
+
+
+class MTIconRegistry:
+    """노드 타입과 상태(예: "expanded")를 키로 QIcon을 공유하는 레지스트리"""
+
+    def __init__(self) -> None:
+        self._paths: Dict[IconKey, str] = {
+            (MTNodeType.GROUP, None): f"{ICON_DIR}/group.png",
+            (MTNodeType.INSTRUCTION, None): f"{ICON_DIR}/inst.png",
+        }
+        self._icons: Dict[IconKey, QIcon] = {}
+        self._files: Dict[str, QIcon] = {}
+        self._fallback: QIcon | None = None
+
+    def register(self, node_type: MTNodeType | None, relative_path: str, state: str | None = None) -> None:
+        """노드 타입/상태에 아이콘 파일을 지정합니다. 이미 만든 아이콘은 다음 조회부터 바뀝니다."""
+        self._paths[(node_type, state)] = relative_path
+        self._icons.clear()  # 상태별 대체 아이콘도 함께 다시 계산
+
+    def icon(self, node_type: MTNodeType | None, state: str | None = None) -> QIcon:
+        """
+        노드 타입/상태에 해당하는 아이콘을 반환합니다.
+        상태별 아이콘이 없으면 노드 타입 기본 아이콘을, 그것도 없으면 빈 아이콘을 반환합니다.
+        """
+        key = (node_type, state)
+        icon = self._icons.get(key)
+        if icon is None:
+            relative_path = self._paths.get(key)
+            if relative_path is not None:
+                icon = self.file_icon(relative_path)
+            elif state is not None:
+                icon = self.icon(node_type)
+            else:
+                icon = self.fallback()
+            self._icons[key] = icon
+        return icon
+
+    def file_icon(self, relative_path: str) -> QIcon:
+        """리소스 경로의 아이콘을 반환합니다. (버튼 아이콘 등)"""
+        icon = self._files.get(relative_path)
+        if icon is None:
+            icon_path = resource_path(relative_path)
+            if os.path.exists(icon_path):
+                icon = QIcon(icon_path)
+            else:
+                logger.warning(f"Icon file not found at {icon_path}")
+                icon = self.fallback()
+            self._files[relative_path] = icon
+        return icon
+
+    def fallback(self) -> QIcon:
+        """아이콘이 없을 때 쓰는 빈 아이콘"""
+        if self._fallback is None:
+            self._fallback = QIcon()
+        return self._fallback
+
+    def clear(self) -> None:
+        """만들어 둔 아이콘을 모두 버립니다. (테마 변경 등)"""
+        self._icons.clear()
+        self._files.clear()
+
+
+_registry: MTIconRegistry | None = None
+
+
+def get_icon_registry() -> MTIconRegistry:
+    """프로세스 전체에서 공유하는 아이콘 레지스트리를 반환합니다."""
+    global _registry
+    if _registry is None:
+        _registry = MTIconRegistry()
+    return _registry
+
+
+def node_icon(node_type: MTNodeType | None, state: str | None = None) -> QIcon:
+    """노드 타입/상태 아이콘을 공유 레지스트리에서 가져옵니다."""
+    return get_icon_registry().icon(node_type, state)
@@ -0,0 +1,328 @@
+import logging
+from typing import Any, Dict, List, overload
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
+
+from core.interfaces.base_item_keys import DomainKeys as DK
+from core.interfaces.base_item_data import MTNodeType
+from core.interfaces.base_tree import IMTTree
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager, MTTreeEvent, MTEventPriority
+from view.impl.icon_registry import node_icon
+
+logger = logging.getLogger(__name__)
+
+"""
+MTTree를 QTreeView에 직접 보여주는 QAbstractItemModel 어댑터입니다.
+QTreeWidgetItem을 만들지 않고 트리의 children_ids를 그대로 읽으며,
+자식은 펼칠 때 fetch_batch개씩 불러오고 트리 이벤트마다 바뀐 행만 알립니다.
+지연 로딩 트리(MTLazyTree)는 펼칠 때 저장소에서 자식을 가져오고, 캐시에서 내려놓은 그룹은 다시 펼칠 때 가져옵니다.
+"""
+
+
+class _MTModelNode:
+    """모델에 불러온 행 하나. QModelIndex.internalPointer()로 참조됩니다."""
+    __slots__ = ("item_id", "parent", "children", "row")
+
+    def __init__(self, item_id: str | None, parent: "_MTModelNode | None", row: int = 0):
+        self.item_id = item_id
+        self.parent = parent
+        self.children: List["_MTModelNode"] = []  # 트리 children_ids의 앞부분(불러온 만큼)
+        self.row = row  # 부모 children 안의 위치 캐시 (검증 후 사용)
+
+
+class MTTreeItemModel(QAbstractItemModel):
+    """MTTree용 지연 로딩 아이템 모델"""
+
+    FETCH_BATCH = 512
+
+    def __init__(self, tree: IMTTree, event_manager: IMTTreeEventManager | None = None,
+                 parent=None, fetch_batch: int = FETCH_BATCH):
+        """
+        Args:
+            tree (IMTTree): 보여줄 트리
+            event_manager (IMTTreeEventManager | None): 트리 변경 이벤트를 받을 이벤트 매니저
+            parent: Qt 부모 객체
+            fetch_batch (int): fetchMore 한 번에 불러올 자식 수
+        """
+        super().__init__(parent)
+        self._tree = tree
+        self._fetch_batch = max(1, fetch_batch)
+        self._nodes: Dict[str, _MTModelNode] = {}
+        self._root = self._new_root()
+        if event_manager is not None:
+            self.watch_event_manager(event_manager)
+
+    # --- 구독 ---
+    def watch_event_manager(self, event_manager: IMTTreeEventManager) -> None:
+        """트리 이벤트를 구독합니다. 다른 구독자가 트리를 읽은 뒤 갱신하도록 LOW 우선순위로 등록합니다."""
+        handlers = {
+            MTTreeEvent.ITEM_ADDED: self._on_item_added,
+            MTTreeEvent.ITEM_REMOVED: self._on_item_removed,
+            MTTreeEvent.ITEM_MOVED: self._on_item_moved,
+            MTTreeEvent.ITEM_MODIFIED: self._on_item_modified,
+            MTTreeEvent.TREE_RESET: self._on_tree_reset,
+            MTTreeEvent.SUBTREE_UNLOADED: self._on_subtree_unloaded,
+        }
+        for event_type, handler in handlers.items():
+            self._subscribe(event_manager, event_type, handler)
+
+    def watch_state_manager(self, state_manager: IMTTreeEventManager) -> None:
+        """undo/redo로 트리 전체가 바뀌면 모델을 다시 구성하도록 상태 관리자를 구독합니다."""
+        self._subscribe(state_manager, MTTreeEvent.TREE_UNDO, self._on_tree_reset)
+        self._subscribe(state_manager, MTTreeEvent.TREE_REDO, self._on_tree_reset)
+
+    @staticmethod
+    def _subscribe(event_manager, event_type: MTTreeEvent, handler) -> None:
+        try:
+            event_manager.subscribe(event_type, handler, priority=MTEventPriority.LOW)
+        except TypeError:
+            event_manager.subscribe(event_type, handler)  # 우선순위를 지원하지 않는 이벤트 매니저
+
+    def set_tree(self, tree: IMTTree) -> None:
+        """다른 트리로 교체하고 모델을 다시 구성합니다. (불러오기 등)"""
+        self._tree = tree
+        self.reset_model()
+
+    def reset_model(self) -> None:
+        """불러온 행을 모두 버리고 루트부터 다시 구성합니다."""
+        self.beginResetModel()
+        self._nodes.clear()
+        self._root = self._new_root()
+        self.endResetModel()
+
+    # --- 조회 ---
+    def item_id(self, index: QModelIndex) -> str | None:
+        """인덱스가 가리키는 아이템 ID를 반환합니다."""
+        return index.internalPointer().item_id if index.isValid() else None
+
+    def index_for_id(self, item_id: str, column: int = 0) -> QModelIndex:
+        """아이템 ID의 인덱스를 반환합니다. 아직 불러오지 않은 아이템이면 무효 인덱스입니다."""
+        node = self._nodes.get(item_id)
+        if node is None or node is self._root:
+            return QModelIndex()
+        return self.createIndex(self._row(node), column, node)
+
+    # --- QAbstractItemModel ---
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        if column != 0 or row < 0 or row >= len(node.children):
+            return QModelIndex()
+        child = node.children[row]
+        child.row = row
+        return self.createIndex(row, column, child)
+
+    @overload
+    def parent(self, child: QModelIndex) -> QModelIndex: ...
+
+    @overload
+    def parent(self) -> QObject | None: ...
+
+    def parent(self, child: QModelIndex | None = None) -> QModelIndex | QObject | None:
+        if child is None:
+            return super().parent()  # RF : 인자 없이 부르면 QObject.parent() (Qt 부모 객체)
+        if not child.isValid():
+            return QModelIndex()
+        parent_node = child.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(self._row(parent_node), 0, parent_node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        if node.children:
+            return True
+        is_loaded = getattr(self._tree, "is_loaded", None)
+        if is_loaded is not None and not is_loaded(node.item_id):
+            return True  # 아직 가져오지 않은 그룹: 펼칠 때 가져옴
+        return bool(self._child_ids(node.item_id))
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._node(parent)
+        return len(node.children) < len(self._child_ids(node.item_id))
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self._node(parent)
+        child_ids = self._child_ids(node.item_id)
+        start = len(node.children)
+        end = min(len(child_ids), start + self._fetch_batch)
+        if start >= end:
+            return
+        self.beginInsertRows(parent, start, end - 1)
+        for row in range(start, end):
+            node.children.append(self._new_node(child_ids[row], node, row))
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        item_id = index.internalPointer().item_id
+        if role == Qt.ItemDataRole.UserRole:
+            return item_id
+        item = self._tree.get_item(item_id)
+        if item is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.get_property(DK.NAME)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return node_icon(item.get_property(DK.NODE_TYPE))
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+        item = self._tree.get_item(index.internalPointer().item_id)
+        if item is not None and item.get_property(DK.NODE_TYPE) == MTNodeType.GROUP:
+            flags |= Qt.ItemFlag.ItemIsDropEnabled
+        return flags
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole and section == 0:
+            return "Macro Tree"
+        return None
+
+    # --- 트리 이벤트 처리 ---
+    def _on_item_added(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        item_id = data.get("item_id")
+        parent_node = self._node_for(data.get("parent_id"))
+        if item_id is None or parent_node is None or item_id in self._nodes:
+            return
+        row = self._position_in_tree(item_id, parent_node.item_id)
+        if row is None or row > len(parent_node.children):
+            return  # 아직 불러오지 않은 구간: fetchMore에서 읽음
+        self._insert_node(parent_node, row, item_id)
+
+    def _on_item_removed(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        node = self._node_for(data.get("item_id"))
+        if node is not None and node is not self._root:
+            self._remove_node(node)
+
+    def _on_item_moved(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        item_id = data.get("item_id")
+        if item_id is None:
+            return
+        node = self._nodes.get(item_id)
+        dest_node = self._node_for(data.get("new_parent_id"))
+        new_row = self._position_in_tree(item_id, dest_node.item_id) if dest_node is not None else None
+        if dest_node is not None and new_row is not None:
+            loaded = len(dest_node.children) - (1 if node is not None and node.parent is dest_node else 0)
+            if new_row > loaded:
+                new_row = None  # 새 위치가 아직 불러오지 않은 구간
+        if node is None:
+            if dest_node is not None and new_row is not None:
+                self._insert_node(dest_node, new_row, item_id)
+            return
+        src_node = node.parent
+        if dest_node is None or new_row is None or src_node is None:
+            self._remove_node(node)
+            return
+        src_row = self._row(node)
+        if src_node is dest_node and src_row == new_row:
+            return
+        # RF : beginMoveRows의 목적지 행은 제거 전 기준이므로 같은 부모 안에서 아래로 옮길 때 +1
+        dest_row = new_row + 1 if src_node is dest_node and new_row > src_row else new_row
+        if not self.beginMoveRows(self._index_of(src_node), src_row, src_row, self._index_of(dest_node), dest_row):
+            self.reset_model()
+            return
+        del src_node.children[src_row]
+        dest_node.children.insert(new_row, node)
+        node.parent = dest_node
+        node.row = new_row
+        self.endMoveRows()
+
+    def _on_item_modified(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        item_id = data.get("item_id")
+        index = self.index_for_id(item_id) if item_id is not None else QModelIndex()
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def _on_tree_reset(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        self.reset_model()
+
+    def _on_subtree_unloaded(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        node = self._node_for(data.get("item_id"))
+        if node is None or not node.children:
+            return
+        self.beginRemoveRows(self._index_of(node), 0, len(node.children) - 1)
+        removed, node.children = node.children, []
+        self.endRemoveRows()
+        self._forget(removed)
+
+    # --- 내부 도우미 ---
+    def _new_root(self) -> _MTModelNode:
+        root = _MTModelNode(self._tree.root_id if self._tree is not None else None, None)
+        if root.item_id is not None:
+            self._nodes[root.item_id] = root
+        return root
+
+    def _new_node(self, item_id: str, parent: _MTModelNode, row: int) -> _MTModelNode:
+        node = _MTModelNode(item_id, parent, row)
+        self._nodes[item_id] = node
+        return node
+
+    def _node_for(self, item_id: str | None) -> _MTModelNode | None:
+        return self._nodes.get(item_id) if item_id is not None else None
+
+    def _node(self, index: QModelIndex) -> _MTModelNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _index_of(self, node: _MTModelNode) -> QModelIndex:
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(self._row(node), 0, node)
+
+    def _row(self, node: _MTModelNode) -> int:
+        """부모 안에서의 행 번호. 캐시가 어긋났을 때만 형제 행 번호를 다시 계산합니다."""
+        if node.parent is None:
+            return 0
+        siblings = node.parent.children
+        if node.row >= len(siblings) or siblings[node.row] is not node:
+            for row, sibling in enumerate(siblings):
+                sibling.row = row
+        return node.row
+
+    def _child_ids(self, item_id: str | None) -> List[str]:
+        if item_id is None or self._tree is None:
+            return []
+        ensure_children = getattr(self._tree, "ensure_children", None)
+        if ensure_children is not None:
+            ensure_children(item_id)  # 지연 로딩 트리
+        item = self._tree.get_item(item_id)
+        return item.get_property(DK.CHILDREN, []) if item is not None else []
+
+    def _position_in_tree(self, item_id: str, parent_id: str | None) -> int | None:
+        try:
+            return self._child_ids(parent_id).index(item_id)
+        except ValueError:
+            return None
+
+    def _insert_node(self, parent_node: _MTModelNode, row: int, item_id: str) -> None:
+        self.beginInsertRows(self._index_of(parent_node), row, row)
+        parent_node.children.insert(row, self._new_node(item_id, parent_node, row))
+        self.endInsertRows()
+
+    def _remove_node(self, node: _MTModelNode) -> None:
+        parent_node = node.parent
+        if parent_node is None:
+            return
+        row = self._row(node)
+        self.beginRemoveRows(self._index_of(parent_node), row, row)
+        del parent_node.children[row]
+        self.endRemoveRows()
+        self._forget([node])  # 인덱스가 무효화된 뒤에 하위 노드 참조를 해제
+
+    def _forget(self, nodes: List[_MTModelNode]) -> None:
+        stack = list(nodes)
+        while stack:
+            current = stack.pop()
+            if current.item_id is not None and self._nodes.get(current.item_id) is current:
+                del self._nodes[current.item_id]
+            stack.extend(current.children)
@@ -1,9 +1,9 @@
 import sys
 import os
-from dotenv import load_dotenv
+import time
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QSplitter, QPushButton, QTreeWidget, QTreeWidgetItem
 from PyQt6.QtGui import QAction, QKeySequence, QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 from core.impl.tree import MTTree
 from core.impl.item import MTItem
@@ -13,23 +13,36 @@ from model.state.impl.tree_state_mgr import MTTreeStateManager
 from model.events.impl.tree_event_mgr import MTTreeEventManager
 from core.interfaces.base_item_data import MTNodeType, MTItemDomainDTO, MTItemUIStateDTO, MTItemDTO
 from model.events.interfaces.base_tree_event_mgr import MTTreeUIEvent   
-from model.store.file.impl.file_tree_repo import MTFileTreeRepository
+from model.store.registry import create_repository, DEFAULT_BACKEND
 from model.store.store_manager import StoreManager
 
-# MACRO_TREE_DEBUG 환경 변수 확인
-load_dotenv() # .env 파일 로드, os.environ 접근 전에 호출
-IS_DEBUG_MODE = os.environ.get('MACRO_TREE_DEBUG') == 'False'
-print(f"IS_DEBUG_MODE: {IS_DEBUG_MODE}")
-DEBUG_IMPORTS_SUCCESSFUL = False # 초기값
-DebugManager = None # 초기값
+# 첫 창 표시까지의 목표 시간(ms). 초과하면 시작 시 경고를 출력합니다.
+STARTUP_BUDGET_MS = 800
 
-if IS_DEBUG_MODE:
+DEBUG_IMPORTS_SUCCESSFUL = False # 디버그 뷰어 사용 스위치 (False면 디버그 매니저를 임포트하지 않음)
+
+def load_env() -> None:
+    """.env 파일을 로드합니다. python-dotenv가 없으면 건너뜁니다."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv() # .env 파일 로드, os.environ 접근 전에 호출
+
+def is_debug_mode() -> bool:
+    """MACRO_TREE_DEBUG 환경 변수를 확인합니다. (load_env 이후 호출)"""
+    return os.environ.get('MACRO_TREE_DEBUG') == 'False'
+
+def load_debug_manager():
+    """디버그 모드일 때만 디버그 매니저 클래스를 임포트합니다. 실패하면 None"""
+    if not is_debug_mode():
+        return None
     try:
         from debug.debug_manager import DebugManager # 새로운 매니저 클래스
-        DEBUG_IMPORTS_SUCCESSFUL = False
+        return DebugManager
     except ImportError:
         print("디버그 매니저 로드 실패. 디버그 기능이 비활성화됩니다.")
-        # DebugManager가 None으로 유지되므로, 이후 로직에서 이를 확인하여 처리합니다.
+        return None
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -37,8 +50,9 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Tree Application with Debug Viewers")
         self.event_manager = MTTreeEventManager()
         self.tree = MTTree(tree_id="root", name="Root Tree", event_manager=self.event_manager)
-        self.repository = MTFileTreeRepository()
-        self.store_manager = StoreManager(repository=self.repository) # MTFileTreeRepository 인스턴스(self.repository)를 직접 주입
+        # RF : 저장소 백엔드는 사용할 것만 임포트 (기본: 파일 저장소)
+        self.repository = create_repository(os.environ.get('MACRO_TREE_STORE', DEFAULT_BACKEND))
+        self.store_manager = StoreManager(repository=self.repository) # 저장소 인스턴스(self.repository)를 직접 주입
 
         # 샘플 데이터: 그룹 1개와 그 하위에 INSTRUCTION 1개만 추가
         # group = MTItem("group-1", {"name": "Group 1", "node_type": MTNodeType.GROUP})
@@ -93,9 +107,10 @@ class MainWindow(QMainWindow):
         # 메인 트리 뷰 생성
         self.tree_view = TreeView(self.viewmodel)
 
-        self.debug_manager_instance: 'DebugManager' | None = None # 타입 힌트
+        self.debug_manager_instance = None
+        DebugManager = load_debug_manager() if DEBUG_IMPORTS_SUCCESSFUL else None
 
-        if IS_DEBUG_MODE and DEBUG_IMPORTS_SUCCESSFUL and DebugManager is not None:
+        if DebugManager is not None:
             self.debug_manager_instance = DebugManager(
                 main_window=self,
                 event_manager=self.event_manager,
@@ -171,10 +186,31 @@ class MainWindow(QMainWindow):
                 pass # RF: 의도된 동작일 수 있으므로 유지
         super().closeEvent(event)
 
-def main():
+def report_first_window(started_at: float) -> float:
+    """첫 창 표시까지 걸린 시간(ms)을 출력하고 반환합니다. 목표 시간을 넘으면 경고합니다."""
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    status = "OK" if elapsed_ms <= STARTUP_BUDGET_MS else "OVER BUDGET"
+    print(f"time-to-first-window: {elapsed_ms:.1f} ms (budget {STARTUP_BUDGET_MS} ms, {status})")
+    return elapsed_ms
+
+def main(started_at: float | None = None):
+    """
+    애플리케이션을 실행합니다.
+    Args:
+        started_at (float | None): 시작 시각(time.perf_counter). 첫 창 표시 시간 측정용
+    """
+    if started_at is None:
+        started_at = time.perf_counter()
+    load_env()
+    print(f"IS_DEBUG_MODE: {is_debug_mode()}")
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    # 이벤트 루프가 첫 프레임을 처리한 직후 측정
+    QTimer.singleShot(0, lambda: report_first_window(started_at))
+    if os.environ.get('MACRO_TREE_STARTUP_PROBE'):
+        # 시작 시간 벤치마크용: 첫 창 표시 후 바로 종료
+        QTimer.singleShot(0, app.quit)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
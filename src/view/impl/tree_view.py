@@ -1,10 +1,11 @@
-import sys # resource_path를 위해 추가
-from PyQt6.QtWidgets import QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QSizePolicy, QMessageBox, QFileDialog
-from PyQt6.QtGui import QIcon, QFontMetrics
+from PyQt6.QtWidgets import QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QSizePolicy, QMessageBox, QFileDialog, QProgressDialog, QLineEdit, QComboBox
+from PyQt6.QtGui import QIcon, QFontMetrics, QKeySequence, QShortcut
 from PyQt6.QtCore import Qt, QSize
 from viewmodel.impl.tree_viewmodel import MTTreeViewModel
 from view.impl.tree_widget import MTTreeWidget
-from core.interfaces.base_item_data import MTNodeType, MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO
+from view.impl.icon_registry import ICON_DIR, get_icon_registry
+from view.impl.ui_dispatcher import MTUiDispatcher
+from core.interfaces.base_item_data import MTNodeType, MTDevice, MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO
 from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
 from typing import Any
 import os
@@ -14,19 +15,12 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
-# resource_path 함수 정의 시작
-def resource_path(relative_path: str) -> str:
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    base_path = getattr(sys, "_MEIPASS", None)
-    if base_path is None:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-# resource_path 함수 정의 끝
-
 class TreeView(QWidget):
     def __init__(self, viewmodel: MTTreeViewModel, parent=None):
         super().__init__(parent)
         self._viewmodel = viewmodel
+        self._dispatcher = MTUiDispatcher(self)  # 백그라운드 불러오기 콜백을 GUI 스레드로 전달
+        self._load_dialog: QProgressDialog | None = None
 
         self._layout = QVBoxLayout(self)
 
@@ -36,12 +30,10 @@ class TreeView(QWidget):
         # 버튼 사이 간격 설정 (예: 5px)
         button_layout.setSpacing(5)
 
-        # 아이콘 경로를 resource_path로 처리
-        add_icon_path = resource_path("src/images/icons/add.png")
-        del_icon_path = resource_path("src/images/icons/del.png")
-
-        add_icon = QIcon(add_icon_path)
-        del_icon = QIcon(del_icon_path)
+        # 아이콘은 공유 레지스트리에서 가져옴 (경로 확인/로드는 한 번만)
+        icons = get_icon_registry()
+        add_icon = icons.file_icon(f"{ICON_DIR}/add.png")
+        del_icon = icons.file_icon(f"{ICON_DIR}/del.png")
 
         # 버튼 생성 및 설정
         self.add_button = QPushButton("Add")
@@ -119,6 +111,29 @@ class TreeView(QWidget):
         # 버튼 레이아웃을 메인 레이아웃에 추가
         self._layout.addLayout(button_layout)
 
+        # 검색/필터 (입력할 때마다 직전 결과 안에서 다시 거름)
+        search_layout = QHBoxLayout()
+        search_layout.setContentsMargins(0, 0, 0, 0)
+        search_layout.setSpacing(5)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("이름 검색")
+        self.search_edit.setClearButtonEnabled(True)
+        self.type_filter = QComboBox()
+        self.type_filter.addItem("모든 타입", None)
+        for node_type in MTNodeType:
+            self.type_filter.addItem(node_type.value, node_type)
+        self.device_filter = QComboBox()
+        self.device_filter.addItem("모든 장치", None)
+        for device in MTDevice:
+            self.device_filter.addItem(device.value, device)
+        self.search_edit.textChanged.connect(self.on_search_changed)
+        self.type_filter.currentIndexChanged.connect(self.on_search_changed)
+        self.device_filter.currentIndexChanged.connect(self.on_search_changed)
+        search_layout.addWidget(self.search_edit, 1)
+        search_layout.addWidget(self.type_filter)
+        search_layout.addWidget(self.device_filter)
+        self._layout.addLayout(search_layout)
+
         self.tree_widget = MTTreeWidget(self._viewmodel)
         self._layout.addWidget(self.tree_widget)
         self.setLayout(self._layout)
@@ -131,6 +146,12 @@ class TreeView(QWidget):
         self._viewmodel.tree_reset.connect(self.on_item_crud_slot)
         self._viewmodel.tree_undo.connect(self.on_tree_undoredo_slot)
         self._viewmodel.tree_redo.connect(self.on_tree_undoredo_slot)
+        self._viewmodel.load_progress.connect(self.on_load_progress_slot)
+        self._viewmodel.search_changed.connect(self.tree_widget.apply_search_result)
+        # 선택 일괄 작업 단축키
+        QShortcut(QKeySequence(QKeySequence.StandardKey.Delete), self.tree_widget, self.on_del_item)
+        QShortcut(QKeySequence("Ctrl+D"), self.tree_widget, self.on_duplicate_items)
+        self._viewmodel.load_finished.connect(self.on_load_finished_slot)
 
     """MTTreeWidget에서 현재 선택된 아이템의 ID를 반환합니다."""
     def get_selected_item_id(self):
@@ -190,10 +211,18 @@ class TreeView(QWidget):
         )
 
     def on_del_item(self):
+        # RF : 선택된 아이템을 한 번에 삭제 (스냅샷/Undo 기록은 한 번)
+        selected_ids = self._viewmodel.get_selected_items()
+        if selected_ids:
+            self._viewmodel.remove_items(selected_ids)
+            return
         selected_item_id = self.get_selected_item_id()
         if selected_item_id:
             self._viewmodel.remove_item(selected_item_id)
 
+    def on_duplicate_items(self):
+        self._viewmodel.duplicate_items(self._viewmodel.get_selected_items())
+
     def on_save_clicked(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "트리 저장", "", "JSON 파일 (*.json);;모든 파일 (*.*)")
         if file_path:
@@ -229,19 +258,43 @@ class TreeView(QWidget):
                     QMessageBox.warning(self, "경고", "유효한 파일명이 아닙니다.")
                     return
 
-                if hasattr(self._viewmodel, 'load_tree'):
-                    # ViewModel의 load_tree는 tree_id를 인자로 받는다고 가정 (file_path 대신)
-                    # ViewModel의 load_tree 시그니처가 (self, tree_id: str)로 변경 필요
-                    success = self._viewmodel.load_tree(tree_id) # file_path 대신 tree_id 전달
-                    if not success:
-                        QMessageBox.critical(self, "불러오기 실패", "파일을 불러올 수 없습니다.")
-                    else:
-                        self.tree_widget.update_tree_items()
-                else:
-                    QMessageBox.critical(self, "오류", "ViewModel에 load_tree 메서드가 없습니다.")
+                # RF : 읽기/파싱은 작업 스레드에서, 트리 반영은 최상위 그룹 단위로 GUI 스레드에서 진행
+                self._close_load_dialog()
+                dialog = QProgressDialog("트리를 불러오는 중...", "취소", 0, 0, self)
+                dialog.setWindowTitle("불러오기")
+                dialog.setWindowModality(Qt.WindowModality.WindowModal)
+                dialog.setMinimumDuration(300)  # 금방 끝나는 불러오기는 창을 띄우지 않음
+                dialog.setAutoClose(False)
+                dialog.setAutoReset(False)
+                dialog.canceled.connect(self._viewmodel.cancel_load)
+                self._load_dialog = dialog
+                self._viewmodel.load_tree_async(tree_id, dispatch=self._dispatcher)
             except Exception as e:
+                self._close_load_dialog()
                 QMessageBox.critical(self, "불러오기 오류", f"불러오기 중 오류 발생: {e}")
 
+    def on_search_changed(self, *_):
+        self._viewmodel.search(self.search_edit.text(), self.type_filter.currentData(), self.device_filter.currentData())
+
+    def on_load_progress_slot(self, loaded: int, total: int):
+        if self._load_dialog is not None:
+            self._load_dialog.setMaximum(total)
+            self._load_dialog.setValue(loaded)
+
+    def on_load_finished_slot(self, result: dict):
+        self._close_load_dialog()
+        if result.get("error"):
+            QMessageBox.critical(self, "불러오기 오류", f"불러오기 중 오류 발생: {result['error']}")
+        elif not result.get("success") and not result.get("cancelled"):
+            QMessageBox.critical(self, "불러오기 실패", "파일을 불러올 수 없습니다.")
+
+    def _close_load_dialog(self):
+        dialog, self._load_dialog = self._load_dialog, None
+        if dialog is not None:
+            dialog.canceled.disconnect()
+            dialog.close()
+            dialog.deleteLater()
+
     # --- ViewModel 시그널 슬롯 ---
     def on_tree_undoredo_slot(self, event_type: MTTreeEvent, data: dict[str, Any]):
         logger.debug(f"Undo/Redo Slot triggered: {event_type}, data keys: {data.keys() if isinstance(data, dict) else 'Not a dict'}")
@@ -267,7 +320,11 @@ class TreeView(QWidget):
             else:
                 self.tree_widget.update_tree_items()
         elif event_type == MTTreeEvent.ITEM_MOVED:
-            self.tree_widget.update_tree_items()
+            item_id = data.get('item_id')
+            if item_id:
+                self.tree_widget.handle_item_moved(item_id, data.get('new_parent_id'), data.get('old_parent_id'), data.get('new_index'))
+            else:
+                self.tree_widget.update_tree_items()
         elif event_type == MTTreeEvent.ITEM_MODIFIED:
             item_id = data.get('item_id')
             item_dto_dict = data.get('changes')
@@ -1,21 +1,32 @@
-import sys
-from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QAbstractItemView
+from PyQt6.QtWidgets import QApplication, QTreeWidget, QTreeWidgetItem, QAbstractItemView
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QBrush, QColor
 from core.interfaces.base_item_keys import DomainKeys as DK, UIStateKeys as UK
 from core.interfaces.base_item_data import MTNodeType, MTItemDTO
-import os
+from view.impl.icon_registry import node_icon
 from viewmodel.impl.tree_viewmodel import MTTreeViewModel
 import logging                                                                                              
 
 logger = logging.getLogger(__name__)
 
-def resource_path(relative_path: str) -> str:
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    base_path = getattr(sys, "_MEIPASS", None)
-    if base_path is None:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+SEARCH_HIGHLIGHT = QColor(255, 236, 140)  # 검색 결과 배경색
+
+def _to_node_type(value) -> MTNodeType | None:
+    if value is None or isinstance(value, MTNodeType):
+        return value
+    try:
+        return MTNodeType(value)
+    except ValueError:
+        return None
+
+def _render_state(item_dto: MTItemDTO) -> tuple:
+    """위젯 아이템에 표시할 상태 (이름, 노드 타입, 확장, 선택)"""
+    return (
+        item_dto.domain_data.name,
+        _to_node_type(item_dto.domain_data.node_type),
+        bool(item_dto.ui_state_data.is_expanded),
+        bool(item_dto.ui_state_data.is_selected),
+    )
 
 class MTTreeWidget(QTreeWidget):
     def __init__(self, viewmodel: MTTreeViewModel, parent=None):
@@ -29,43 +40,128 @@ class MTTreeWidget(QTreeWidget):
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
         self.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
-        self._id_to_widget_map = {}
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self._id_to_widget_map: dict[str, QTreeWidgetItem] = {}
+        self._render_cache: dict[str, tuple] = {}  # 아이템 ID -> 마지막으로 반영한 표시 상태
 
         self.update_tree_items()
 
     def update_tree_items(self, tree_snapshot_data: dict | None = None):
-        self.clear()
-        self._id_to_widget_map.clear()
-        
-        root_items_dtos = self._viewmodel.get_item_children(None)
-        
-        for item_dto in root_items_dtos:
-            self._add_tree_item_recursive(item_dto, self.invisibleRootItem())
-
-    def _add_tree_item_recursive(self, item_dto: MTItemDTO, parent_q_widget: QTreeWidgetItem | QTreeWidget):
-        widget_item = QTreeWidgetItem(parent_q_widget, [item_dto.domain_data.name])
-        widget_item.setData(0, Qt.ItemDataRole.UserRole, item_dto.item_id)
-        self._id_to_widget_map[item_dto.item_id] = widget_item
-
-        node_type = item_dto.domain_data.node_type
-        icon_path = None
-        if node_type == MTNodeType.GROUP:
-            icon_path = resource_path("src/images/icons/group.png")
-        elif node_type == MTNodeType.INSTRUCTION:
-            icon_path = resource_path("src/images/icons/inst.png")
-        
-        if icon_path and os.path.exists(icon_path):
-            widget_item.setIcon(0, QIcon(icon_path))
-        elif icon_path:
-            logger.warning(f"Icon file not found at {icon_path} for item {item_dto.item_id}")
+        """
+        현재 위젯을 트리 상태와 비교해 바뀐 아이템만 추가/삭제/이동/갱신합니다.
+        Args:
+            tree_snapshot_data (dict | None): 트리 스냅샷(to_dict 형식). None이면 뷰모델에서 현재 트리를 읽음
+        """
+        children, render_states = self._collect_tree_state(tree_snapshot_data)
+        # RF : 배치 중에는 다시 그리기와 itemExpanded 등 시그널을 막아 뷰모델로 되돌아가는 호출을 방지
+        self.setUpdatesEnabled(False)
+        signals_were_blocked = self.blockSignals(True)
+        try:
+            self._reconcile(children, render_states)
+        finally:
+            self.blockSignals(signals_were_blocked)
+            self.setUpdatesEnabled(True)
+
+    def _collect_tree_state(self, tree_snapshot_data: dict | None) -> tuple[dict, dict]:
+        """
+        표시할 트리 구조와 아이템별 표시 상태를 모읍니다. (루트에서 도달 가능한 아이템만)
+        Returns:
+            tuple[dict, dict]: (부모 ID -> 자식 ID 목록, 아이템 ID -> 표시 상태). 최상위 부모 키는 None
+        """
+        children: dict[str | None, list[str]] = {}
+        render_states: dict[str, tuple] = {}
+        if tree_snapshot_data is not None and "tree_data" in tree_snapshot_data:
+            tree_snapshot_data = tree_snapshot_data["tree_data"]
+
+        if tree_snapshot_data is not None and "items" in tree_snapshot_data:
+            items = tree_snapshot_data.get("items", {})
+            root_item = items.get(tree_snapshot_data.get("root_id"), {})
+            queue = [(None, root_item.get("domain_data", {}).get(DK.CHILDREN) or [])]
+            for parent_id, child_ids in queue:
+                child_ids = [child_id for child_id in child_ids if child_id in items]
+                children[parent_id] = child_ids
+                for child_id in child_ids:
+                    domain_data = items[child_id].get("domain_data", {})
+                    ui_state_data = items[child_id].get("ui_state_data", {})
+                    render_states[child_id] = (
+                        domain_data.get(DK.NAME, ""),
+                        _to_node_type(domain_data.get(DK.NODE_TYPE)),
+                        bool(ui_state_data.get(UK.EXPANDED, False)),
+                        bool(ui_state_data.get(UK.SELECTED, False)),
+                    )
+                    queue.append((child_id, domain_data.get(DK.CHILDREN) or []))
+            return children, render_states
 
-        widget_item.setExpanded(item_dto.ui_state_data.is_expanded)
-        if item_dto.ui_state_data.is_selected:
-            widget_item.setSelected(True)
+        queue = [(None, self._viewmodel.get_item_children(None))]
+        for parent_id, child_dtos in queue:
+            children[parent_id] = [child_dto.item_id for child_dto in child_dtos]
+            for child_dto in child_dtos:
+                render_states[child_dto.item_id] = _render_state(child_dto)
+                queue.append((child_dto.item_id, self._viewmodel.get_item_children(child_dto.item_id)))
+        return children, render_states
 
-        children_dtos = self._viewmodel.get_item_children(item_dto.item_id)
-        for child_dto in children_dtos:
-            self._add_tree_item_recursive(child_dto, widget_item)
+    def _reconcile(self, children: dict, render_states: dict) -> None:
+        """수집한 트리 상태에 맞게 위젯 아이템을 최소한으로 변경합니다."""
+        for item_id in [item_id for item_id in self._id_to_widget_map if item_id not in render_states]:
+            self._detach_widget_item(self._id_to_widget_map.pop(item_id))
+            self._render_cache.pop(item_id, None)
+
+        # 부모부터 차례로 자식 순서를 맞춤 (하위 아이템이 다른 부모로 옮겨가도 나중에 제자리를 찾음)
+        root_q_widget = self.invisibleRootItem()
+        if root_q_widget is None:
+            return
+        placed_parents: list[tuple[QTreeWidgetItem, int]] = []
+        queue: list[tuple[str | None, QTreeWidgetItem]] = [(None, root_q_widget)]
+        for parent_id, parent_q_widget in queue:
+            child_ids = children.get(parent_id, [])
+            for row, child_id in enumerate(child_ids):
+                widget_item = self._id_to_widget_map.get(child_id)
+                if widget_item is None:
+                    widget_item = QTreeWidgetItem()
+                    widget_item.setData(0, Qt.ItemDataRole.UserRole, child_id)
+                    self._id_to_widget_map[child_id] = widget_item
+                if parent_q_widget.child(row) is not widget_item:
+                    self._detach_widget_item(widget_item)
+                    parent_q_widget.insertChild(row, widget_item)
+                self._apply_render_state(child_id, widget_item, render_states[child_id])
+                queue.append((child_id, widget_item))
+            placed_parents.append((parent_q_widget, len(child_ids)))
+
+        for parent_q_widget, child_count in placed_parents:
+            while parent_q_widget.childCount() > child_count:
+                extra = parent_q_widget.takeChild(child_count)
+                if extra is None:
+                    break
+                extra_id = extra.data(0, Qt.ItemDataRole.UserRole)
+                if self._id_to_widget_map.get(extra_id) is extra:
+                    del self._id_to_widget_map[extra_id]
+                    self._render_cache.pop(extra_id, None)
+
+    def _detach_widget_item(self, widget_item: QTreeWidgetItem) -> None:
+        """위젯 아이템을 현재 부모에서 떼어냅니다. (하위 아이템은 함께 이동)"""
+        parent_widget = widget_item.parent()
+        if parent_widget is not None:
+            parent_widget.takeChild(parent_widget.indexOfChild(widget_item))
+        elif widget_item.treeWidget() is self:
+            self.takeTopLevelItem(self.indexOfTopLevelItem(widget_item))
+
+    def _apply_render_state(self, item_id: str, widget_item: QTreeWidgetItem, state: tuple) -> None:
+        """표시 상태(이름, 노드 타입, 확장, 선택)를 바뀐 부분만 위젯 아이템에 반영합니다."""
+        name, node_type, is_expanded, is_selected = state
+        cached = self._render_cache.get(item_id)
+        if cached is None or cached[0] != name:
+            widget_item.setText(0, name)
+        if cached is None or cached[1] != node_type:
+            self._set_item_icon(widget_item, node_type)
+        self._render_cache[item_id] = state
+        if widget_item.isExpanded() != is_expanded:
+            widget_item.setExpanded(is_expanded)
+        if widget_item.isSelected() != is_selected:
+            widget_item.setSelected(is_selected)
+
+    def _set_item_icon(self, widget_item: QTreeWidgetItem, node_type: MTNodeType | None) -> None:
+        # RF : 아이콘은 레지스트리에서 공유. 파일 확인/디코딩은 노드 타입별로 한 번만
+        widget_item.setIcon(0, node_icon(node_type))
 
     def handle_item_added(self, item_dto: MTItemDTO, parent_id: str | None):
         parent_q_widget: QTreeWidgetItem | QTreeWidget | None = None
@@ -83,28 +179,22 @@ class MTTreeWidget(QTreeWidget):
             logger.warning(f"Item DTO {item_dto.item_id} already in widget map. Skipping add.")
             return
         
-        widget_item = QTreeWidgetItem(parent_q_widget, [item_dto.domain_data.name])
-        widget_item.setData(0, Qt.ItemDataRole.UserRole, item_dto.item_id)
-        self._id_to_widget_map[item_dto.item_id] = widget_item
-
-        node_type = item_dto.domain_data.node_type
-        icon_path = None
-        if node_type == MTNodeType.GROUP:
-            icon_path = resource_path("src/images/icons/group.png")
-        elif node_type == MTNodeType.INSTRUCTION:
-            icon_path = resource_path("src/images/icons/inst.png")
-        
-        if icon_path and os.path.exists(icon_path):
-            widget_item.setIcon(0, QIcon(icon_path))
-        elif icon_path:
-            logger.warning(f"Icon file not found at {icon_path} for item {item_dto.item_id}")
-
-        widget_item.setExpanded(item_dto.ui_state_data.is_expanded)
-        if item_dto.ui_state_data.is_selected:
-            widget_item.setSelected(True)
+        # RF : 하위 트리가 한 번에 추가된 경우(add_subtree, 백그라운드 불러오기) 자손 위젯도 함께 만듦
+        pending = [(parent_q_widget, item_dto)]
+        while pending:
+            parent_widget, dto = pending.pop()
+            if dto.item_id in self._id_to_widget_map:
+                continue
+            widget_item = QTreeWidgetItem(parent_widget)
+            widget_item.setData(0, Qt.ItemDataRole.UserRole, dto.item_id)
+            self._id_to_widget_map[dto.item_id] = widget_item
+            self._apply_render_state(dto.item_id, widget_item, _render_state(dto))
+            if dto.domain_data.children_ids:
+                pending.extend((widget_item, child_dto) for child_dto in reversed(self._viewmodel.get_item_children(dto.item_id)))
 
     def handle_item_removed(self, item_id: str):
         widget_item = self._id_to_widget_map.pop(item_id, None)
+        self._render_cache.pop(item_id, None)
         if widget_item:
             parent_widget = widget_item.parent()
             if parent_widget:
@@ -117,25 +207,18 @@ class MTTreeWidget(QTreeWidget):
     def handle_item_modified(self, item_id: str, item_dto: MTItemDTO):
         widget_item = self._id_to_widget_map.get(item_id)
         if widget_item:
-            widget_item.setText(0, item_dto.domain_data.name)
-            node_type = item_dto.domain_data.node_type
-            icon_path = None
-            if node_type == MTNodeType.GROUP:
-                icon_path = resource_path("src/images/icons/group.png")
-            elif node_type == MTNodeType.INSTRUCTION:
-                icon_path = resource_path("src/images/icons/inst.png")
-            if icon_path and os.path.exists(icon_path):
-                widget_item.setIcon(0, QIcon(icon_path))
-            elif icon_path: logger.warning(f"Icon file not found {icon_path}")
-            else: widget_item.setIcon(0, QIcon())
-
-            widget_item.setExpanded(item_dto.ui_state_data.is_expanded)
-            widget_item.setSelected(item_dto.ui_state_data.is_selected)
+            self._apply_render_state(item_id, widget_item, _render_state(item_dto))
 
     def on_qtree_item_clicked(self, item: QTreeWidgetItem, column: int):
         item_id = item.data(0, Qt.ItemDataRole.UserRole)
-        if item_id:
-            self._viewmodel.select_item(item_id)
+        if not item_id:
+            return
+        modifiers = QApplication.keyboardModifiers()
+        ctrl = bool(modifiers & Qt.KeyboardModifier.ControlModifier)
+        if modifiers & Qt.KeyboardModifier.ShiftModifier:
+            self._viewmodel.select_range(item_id, extend=ctrl)
+        else:
+            self._viewmodel.select_item(item_id, multi_select=ctrl)
 
     def on_qtree_item_expanded(self, item: QTreeWidgetItem):
         item_id = item.data(0, Qt.ItemDataRole.UserRole)
@@ -151,99 +234,114 @@ class MTTreeWidget(QTreeWidget):
         drop_indicator = self.dropIndicatorPosition()
         target_item = self.itemAt(event.position().toPoint())
         dragged_item = self.currentItem()
-        if not dragged_item or not target_item:
+        if not dragged_item:
             event.ignore()
             return
         dragged_id = dragged_item.data(0, Qt.ItemDataRole.UserRole)
-        target_id = target_item.data(0, Qt.ItemDataRole.UserRole)
-        if dragged_id == target_id:
+        # RF : 끌어온 아이템이 선택에 포함되어 있으면 선택 전체를 한 번에 이동
+        selected_ids = self._viewmodel.get_selected_items()
+        dragged_ids = selected_ids if dragged_id in selected_ids else [dragged_id]
+        drop_target = self._drop_target(target_item, drop_indicator)
+        if drop_target is None or (target_item is not None and target_item.data(0, Qt.ItemDataRole.UserRole) in dragged_ids):
             event.ignore()
             return
-        if drop_indicator == QTreeWidget.DropIndicatorPosition.OnItem:
-            target_item_dto = self._viewmodel.get_item_dto(target_id)
-            if target_item_dto is None:
-                event.ignore()
-                print("target_item_dto is None")
-                return
-            target_node_type = target_item_dto.domain_data.node_type
-            if target_node_type == MTNodeType.GROUP:
-                print(f"DropEvent: Requesting move {dragged_id} onto {target_id}")
-                self._viewmodel.move_item(dragged_id, target_id)
-            else:
-                event.ignore()
-                print("target의 node_type이 group이 아님: 이동 불가")
-                return
-        elif drop_indicator == QTreeWidget.DropIndicatorPosition.AboveItem or drop_indicator == QTreeWidget.DropIndicatorPosition.BelowItem:
-            target_item_dto = self._viewmodel.get_item_dto(target_id)
-            if target_item_dto is None:
-                event.ignore()
-                return
-            target_parent_id = target_item_dto.domain_data.parent_id
-            print(f"DropEvent: Requesting move {dragged_id} near {target_id} (parent: {target_parent_id})")
-            self._viewmodel.move_item(dragged_id, target_parent_id)
-        else:
-            print(f"DropEvent: Requesting move {dragged_id} to root (None)")
-            self._viewmodel.move_item(dragged_id, None)
+        target_parent_id, target_index = drop_target
+        logger.debug(f"DropEvent: Requesting move {dragged_ids} to {target_parent_id} at {target_index}")
+        self._viewmodel.move_items(dragged_ids, target_parent_id, target_index)
+        # 위젯은 ITEM_MOVED 이벤트로 갱신하므로 Qt 기본 이동은 하지 않음
         event.ignore()
 
-    def handle_item_moved(self, item_id, new_parent_id, old_parent_id):
-        widget_item_popped = self._id_to_widget_map.pop(item_id, None) 
-
-        if not widget_item_popped:
-            self.update_tree_items()
-            return
-
-        old_q_parent_widget = widget_item_popped.parent()
-        taken_item_from_ui = None
-        if old_q_parent_widget:
-            index_in_old_parent = old_q_parent_widget.indexOfChild(widget_item_popped)
-            if index_in_old_parent != -1:
-                taken_item_from_ui = old_q_parent_widget.takeChild(index_in_old_parent)
-        else:
-            index_in_toplevel = self.indexOfTopLevelItem(widget_item_popped)
-            if index_in_toplevel != -1:
-                taken_item_from_ui = self.takeTopLevelItem(index_in_toplevel)
-
-        if taken_item_from_ui is None:
-             self.update_tree_items()
-             return
-        
-        new_q_parent_widget_target = None
-        is_new_parent_invisible_root = False
-        if new_parent_id == self._viewmodel.get_dummy_root_id() or new_parent_id is None:
-            new_q_parent_widget_target = self.invisibleRootItem()
-            is_new_parent_invisible_root = True
-        elif new_parent_id:
-            new_q_parent_widget_target = self._id_to_widget_map.get(new_parent_id)
-        
-        if new_q_parent_widget_target is None and not is_new_parent_invisible_root:
-            self.update_tree_items() 
-            return
+    def _drop_target(self, target_item: QTreeWidgetItem | None, drop_indicator) -> tuple[str | None, int] | None:
+        """
+        드롭 위치를 (새 부모 ID, 이동 전 기준 자식 목록 위치)로 바꿉니다. 이동할 수 없으면 None
+        """
+        if target_item is None or drop_indicator == QAbstractItemView.DropIndicatorPosition.OnViewport:
+            return None, -1
+        target_id = target_item.data(0, Qt.ItemDataRole.UserRole)
+        if drop_indicator == QAbstractItemView.DropIndicatorPosition.OnItem:
+            target_item_dto = self._viewmodel.get_item_dto(target_id)
+            if target_item_dto is None or _to_node_type(target_item_dto.domain_data.node_type) != MTNodeType.GROUP:
+                return None  # 그룹이 아닌 아이템 위에는 놓을 수 없음
+            return target_id, -1
+        # 위젯 순서는 트리의 자식 순서와 같으므로 위젯 행 번호를 그대로 사용
+        parent_widget = target_item.parent()
+        row = parent_widget.indexOfChild(target_item) if parent_widget is not None else self.indexOfTopLevelItem(target_item)
+        parent_id = parent_widget.data(0, Qt.ItemDataRole.UserRole) if parent_widget is not None else None
+        if drop_indicator == QAbstractItemView.DropIndicatorPosition.BelowItem:
+            row += 1
+        return parent_id, row
 
-        if is_new_parent_invisible_root:
-            self.addTopLevelItem(taken_item_from_ui)
-        elif new_q_parent_widget_target:
-            new_q_parent_widget_target.addChild(taken_item_from_ui)
+    def handle_item_moved(self, item_id, new_parent_id, old_parent_id, new_index: int | None = None):
+        """
+        이동한 아이템의 위젯(하위 위젯 포함)을 떼어 새 부모의 new_index 위치에 다시 넣습니다.
+        Args:
+            new_index (int | None): 새 부모의 자식 목록 위치. None이면 맨 뒤
+        """
+        widget_item = self._id_to_widget_map.get(item_id)
+        if new_parent_id is None or new_parent_id == self._viewmodel.get_dummy_root_id():
+            new_q_parent_widget = self.invisibleRootItem()
         else:
+            new_q_parent_widget = self._id_to_widget_map.get(new_parent_id)
+        if widget_item is None or new_q_parent_widget is None:
             self.update_tree_items()
             return
-        
-        current_ui_parent = taken_item_from_ui.parent()
 
-        self._id_to_widget_map[item_id] = taken_item_from_ui 
+        # RF : take/insert 한 번으로 하위 위젯까지 함께 옮기고, 그동안 itemExpanded 등 시그널이 뷰모델로 돌아가지 않도록 막음
+        signals_were_blocked = self.blockSignals(True)
+        try:
+            self._detach_widget_item(widget_item)
+            if new_index is None or new_index < 0 or new_index > new_q_parent_widget.childCount():
+                new_index = new_q_parent_widget.childCount()
+            new_q_parent_widget.insertChild(new_index, widget_item)
+            # 다시 넣은 위젯은 확장/선택 상태가 초기화되므로 하위 위젯까지 다시 적용
+            stack: list[QTreeWidgetItem] = [widget_item]
+            while stack:
+                current = stack.pop()
+                current_id = current.data(0, Qt.ItemDataRole.UserRole)
+                state = self._render_cache.get(current_id)
+                if state is not None:
+                    current.setExpanded(state[2])
+                    current.setSelected(state[3])
+                for row in range(current.childCount()):
+                    child = current.child(row)
+                    if child is not None:
+                        stack.append(child)
+        finally:
+            self.blockSignals(signals_were_blocked)
 
-        if item_dto_from_model := self._viewmodel.get_item_dto(item_id):
-            if item_dto_from_model.ui_state_data.is_expanded:
-                self.expandItem(taken_item_from_ui)
-            else:
-                self.collapseItem(taken_item_from_ui)
-            
-            if item_id in self._viewmodel.get_selected_items():
-                taken_item_from_ui.setSelected(True)
-            else:
-                taken_item_from_ui.setSelected(False)
+    def apply_search_result(self, result: dict) -> None:
+        """
+        검색 결과의 차이만 반영합니다. (새로 찾은 아이템 강조, 빠진 아이템 강조 해제, 조상 펼치기)
+        """
+        signals_were_blocked = self.blockSignals(True)
+        try:
+            for item_id in result.get("removed", ()):
+                widget_item = self._id_to_widget_map.get(item_id)
+                if widget_item is not None:
+                    widget_item.setBackground(0, QBrush())
+            highlight = QBrush(SEARCH_HIGHLIGHT)
+            for item_id in result.get("added", ()):
+                widget_item = self._id_to_widget_map.get(item_id)
+                if widget_item is not None:
+                    widget_item.setBackground(0, highlight)
+            for item_id in result.get("expanded", ()):
+                widget_item = self._id_to_widget_map.get(item_id)
+                if widget_item is not None:
+                    widget_item.setExpanded(True)
+                    state = self._render_cache.get(item_id)
+                    if state is not None:
+                        self._render_cache[item_id] = state[:2] + (True,) + state[3:]
+        finally:
+            self.blockSignals(signals_were_blocked)
+        if result.get("first") is not None:
+            first = self._id_to_widget_map.get(result["first"])  # 새로 찾은 아이템 중 화면에서 가장 위
+            if first is not None:
+                self.scrollToItem(first)
 
     def set_viewmodel(self, viewmodel):
         self._viewmodel = viewmodel
+        self.clear()
+        self._id_to_widget_map.clear()
+        self._render_cache.clear()
         self.update_tree_items()
     
\ No newline at end of file
@@ -0,0 +1,26 @@
+from functools import partial
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+"""
+작업 스레드에서 호출된 콜백을 GUI 스레드에서 실행하도록 넘기는 Qt 디스패처입니다.
+model.store.tree_loader의 dispatch 인자로 사용합니다. 다른 스레드에서 넘긴 호출은 큐를 거치므로 넘긴 순서대로 실행됩니다.
+"""
+
+
+class MTUiDispatcher(QObject):
+    """dispatch(fn, *args) -> GUI 스레드에서 fn(*args) 실행"""
+
+    _invoke = pyqtSignal(object)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        # RF : 기본(자동) 연결이라 객체가 있는 GUI 스레드가 아닌 곳에서 emit하면 큐에 넣어 GUI 이벤트 루프에서 실행됨
+        self._invoke.connect(self._run)
+
+    def __call__(self, fn: Callable[..., Any], *args: Any) -> None:
+        self._invoke.emit(partial(fn, *args))
+
+    def _run(self, call: Callable[[], Any]) -> None:
+        call()
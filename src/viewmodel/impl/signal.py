@@ -0,0 +1,47 @@
+from typing import Any, Callable, List, Protocol
+
+"""
+이 모듈은 Qt 없이 사용할 수 있는 시그널 구현을 제공합니다.
+pyqtSignal의 바운드 시그널과 같은 connect/disconnect/emit 형태를 따릅니다.
+"""
+
+
+class IMTSignal(Protocol):
+    """ViewModel 시그널 인터페이스 (pyqtSignal 바운드 시그널과 호환)"""
+
+    def connect(self, slot: Callable[..., Any]) -> None: ...
+
+    def disconnect(self, slot: Callable[..., Any] | None = None) -> None: ...
+
+    def emit(self, *args: Any) -> None: ...
+
+
+# 시그널 하나를 생성하는 함수 (예: MTSignal)
+SignalFactory = Callable[[], IMTSignal]
+
+
+class MTSignal:
+    """순수 파이썬 동기 시그널. emit 시 연결된 슬롯을 연결 순서대로 호출합니다."""
+    __slots__ = ("_slots",)
+
+    def __init__(self) -> None:
+        self._slots: List[Callable[..., Any]] = []
+
+    def connect(self, slot: Callable[..., Any]) -> None:
+        """슬롯을 연결합니다."""
+        self._slots.append(slot)
+
+    def disconnect(self, slot: Callable[..., Any] | None = None) -> None:
+        """슬롯 연결을 해제합니다. slot이 None이면 모든 연결을 해제합니다."""
+        if slot is None:
+            self._slots.clear()
+            return
+        try:
+            self._slots.remove(slot)
+        except ValueError:
+            raise TypeError(f"연결되지 않은 슬롯입니다: {slot!r}") from None
+
+    def emit(self, *args: Any) -> None:
+        """연결된 모든 슬롯을 호출합니다."""
+        for slot in list(self._slots):
+            slot(*args)
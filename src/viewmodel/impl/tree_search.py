@@ -0,0 +1,217 @@
+from itertools import compress, repeat
+from operator import contains
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from core.interfaces.base_item_keys import DomainKeys as DK
+from core.interfaces.base_tree import IMTTree
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+
+"""
+아이템 이름 검색 인덱스입니다.
+소문자로 바꾼 이름의 3-gram -> 아이템 ID 집합을 유지하고, 트리 이벤트마다 바뀐 아이템만 다시 색인합니다.
+이전 검색어를 포함하는 검색어(한 글자씩 입력)는 이전 결과 안에서만 다시 거릅니다.
+트리가 통째로 바뀌면(undo/redo, 불러오기) 그때 바뀐 아이템만 다시 색인하므로 키 입력 중에는 전체 색인을 만들지 않습니다.
+"""
+
+GRAM_SIZE = 3
+# RF : 1~2 글자 검색어는 큰 트리에서 거의 모든 아이템과 맞으므로 필터 없이는 검색하지 않음
+MIN_QUERY_LENGTH = GRAM_SIZE
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+class MTTreeSearchIndex:
+    """이름 3-gram 색인과 노드 타입/장치 필터"""
+
+    def __init__(self, tree: IMTTree | None):
+        self._tree = tree
+        self._names: Dict[str, str] = {}  # ID -> 소문자 이름
+        self._kinds: Dict[str, tuple] = {}  # ID -> (노드 타입 값, 장치 값)
+        self._postings: Dict[str, Set[str]] = {}  # 3-gram -> ID 집합
+        self._built = False
+        # 직전 검색 (검색어, 노드 타입, 장치) -> 결과. 색인이 바뀌면 버림
+        self._last_key: tuple | None = None
+        self._last_result: List[str] = []
+        self._last_names: List[str] = []  # _last_result와 같은 순서의 이름 (다시 거를 때 사전 조회를 피함)
+
+    def __len__(self) -> int:
+        self._ensure_built()
+        return len(self._names)
+
+    def search(self, text: str = "", node_type: Any = None, device: Any = None) -> Set[str]:
+        """
+        이름에 text가 들어 있고 노드 타입/장치가 일치하는 아이템 ID 집합을 반환합니다.
+        필터 없이 text가 MIN_QUERY_LENGTH보다 짧으면 빈 집합을 반환합니다. (검색하지 않음)
+        """
+        self._ensure_built()
+        query = text.casefold()
+        kind = (_enum_value(node_type), _enum_value(device))
+        if len(query) < MIN_QUERY_LENGTH and kind == (None, None):
+            return set()
+        key = (query,) + kind
+        last_key = self._last_key
+        if last_key == key:
+            return set(self._last_result)
+        if last_key is not None and last_key[1:] == kind and last_key[0] in query:
+            # RF : 검색어가 길어지기만 했으면 결과는 직전 결과의 부분집합
+            found = list(map(contains, self._last_names, repeat(query)))
+            result = list(compress(self._last_result, found))
+            names = list(compress(self._last_names, found))
+        else:
+            if len(query) == GRAM_SIZE:
+                result = list(self._postings.get(query, ()))  # 3-gram 목록이 곧 결과
+            elif len(query) > GRAM_SIZE:
+                result = self._containing(self._gram_candidates(query), query)
+            elif query:
+                result = self._containing(self._names, query)
+            else:
+                result = list(self._names)
+            if kind != (None, None):
+                kinds, matches = self._kinds, self._kind_matches
+                result = [item_id for item_id in result if matches(kinds[item_id], kind)]
+            names = list(map(self._names.__getitem__, result))
+        self._last_key, self._last_result, self._last_names = key, result, names
+        return set(result)
+
+    def invalidate(self) -> None:
+        """다음 검색에서 트리 전체를 다시 색인하도록 표시합니다. (트리가 바뀐 직후라면 refresh()가 더 빠름)"""
+        self._built = False
+        self._last_key = None
+
+    def refresh(self) -> None:
+        """
+        트리가 통째로 바뀌었을 때(undo/redo, 불러오기) 이름/타입이 바뀌거나 추가/삭제된 아이템만 다시 색인합니다.
+        아직 색인하지 않았으면 아무것도 하지 않습니다. 절반 넘게 사라졌으면 처음부터 다시 색인합니다.
+        """
+        if not self._built:
+            return
+        self._last_key = None
+        tree = self._tree
+        if tree is None:
+            self.rebuild()
+            return
+        items, root_id = tree.items, tree.root_id
+        stale = [item_id for item_id in self._names if item_id not in items or item_id == root_id]
+        if len(stale) * 2 > len(self._names):
+            self.rebuild()
+            return
+        for item_id in stale:
+            self._unindex_item(item_id)
+        names, kinds = self._names, self._kinds
+        for item_id, item in items.items():
+            if item_id == root_id:
+                continue
+            name, kind = self._describe(item)
+            if names.get(item_id) != name or kinds.get(item_id) != kind:
+                self._unindex_item(item_id)
+                self._add(item_id, name, kind)
+
+    def rebuild(self) -> None:
+        """트리 전체를 다시 색인합니다."""
+        self._names.clear()
+        self._kinds.clear()
+        self._postings.clear()
+        self._last_key = None
+        self._built = True
+        if self._tree is None:
+            return
+        root_id = self._tree.root_id
+        for item_id in self._tree.items:
+            if item_id != root_id:
+                self._index_item(item_id)
+
+    def handle_event(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        """트리 이벤트에 맞춰 바뀐 아이템만 다시 색인합니다. 아직 색인하지 않았으면 아무것도 하지 않습니다."""
+        if not self._built:
+            return
+        item_id = data.get("item_id")
+        if event_type == MTTreeEvent.ITEM_ADDED:
+            self._index_subtree(item_id)
+        elif event_type == MTTreeEvent.ITEM_REMOVED and item_id is not None:
+            self._unindex_item(item_id)
+        elif event_type == MTTreeEvent.ITEM_MODIFIED and item_id is not None:
+            self._unindex_item(item_id)
+            self._index_item(item_id)
+        elif event_type == MTTreeEvent.TREE_RESET:
+            self.refresh()
+            return
+        else:
+            return  # 이동은 이름/타입을 바꾸지 않음
+        self._last_key = None
+
+    # --- 내부 도우미 ---
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.rebuild()
+
+    @staticmethod
+    def _kind_matches(item_kind: tuple, kind: tuple) -> bool:
+        return (kind[0] is None or item_kind[0] == kind[0]) and (kind[1] is None or item_kind[1] == kind[1])
+
+    def _containing(self, item_ids: Iterable[str], query: str) -> List[str]:
+        """이름에 query가 들어 있는 아이템 ID. (비교를 C 수준 map/compress로 돌려 키 입력당 시간을 줄임)"""
+        item_ids = list(item_ids)
+        return list(compress(item_ids, map(contains, map(self._names.__getitem__, item_ids), repeat(query))))
+
+    def _gram_candidates(self, query: str) -> Set[str]:
+        postings = []
+        for gram in _grams(query):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        # 가장 작은 목록에서 시작해 교집합을 좁힘
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    def _index_subtree(self, item_id: str | None) -> None:
+        # RF : add_subtree는 하위 트리 루트에 대해서만 ITEM_ADDED를 알리므로 자손까지 색인
+        tree = self._tree
+        stack = [item_id] if item_id is not None and tree is not None else []
+        while stack:
+            current_id = stack.pop()
+            item = tree.get_item(current_id) if tree is not None else None
+            if item is not None and self._index_item(current_id):
+                stack.extend(item.get_property(DK.CHILDREN, []))
+
+    def _index_item(self, item_id: str) -> bool:
+        item = self._tree.get_item(item_id) if self._tree is not None else None
+        if item is None or item_id in self._names:
+            return item is not None
+        self._add(item_id, *self._describe(item))
+        return True
+
+    @staticmethod
+    def _describe(item: Any) -> Tuple[str, tuple]:
+        """(소문자 이름, (노드 타입 값, 장치 값))"""
+        name = str(item.get_property(DK.NAME, "") or "").casefold()
+        return name, (_enum_value(item.get_property(DK.NODE_TYPE)), _enum_value(item.get_property(DK.DEVICE)))
+
+    def _add(self, item_id: str, name: str, kind: tuple) -> None:
+        self._names[item_id] = name
+        self._kinds[item_id] = kind
+        for gram in _grams(name):
+            self._postings.setdefault(gram, set()).add(item_id)
+
+    def _unindex_item(self, item_id: str) -> None:
+        name = self._names.pop(item_id, None)
+        self._kinds.pop(item_id, None)
+        if name is None:
+            return
+        for gram in _grams(name):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(item_id)
+                if not posting:
+                    del self._postings[gram]
@@ -0,0 +1,122 @@
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from core.interfaces.base_item_keys import UIStateKeys as UK
+from core.interfaces.base_tree import IMTTree
+
+"""
+트리 선택 상태 인덱스입니다.
+선택된 아이템 ID를 삽입 순서가 유지되는 집합으로 관리하고, 바뀐 아이템의 is_selected만 트리에 반영합니다.
+모든 연산은 바뀐 아이템 수에 비례합니다. (전체 아이템을 훑거나 복사하지 않음)
+"""
+
+# (새로 선택된 ID 목록, 선택 해제된 ID 목록)
+SelectionChange = Tuple[List[str], List[str]]
+
+
+class MTTreeSelection:
+    """선택된 아이템 집합과 범위 선택 기준점(anchor)"""
+
+    def __init__(self, tree: IMTTree | None = None):
+        self._tree = tree
+        self._selected: Dict[str, None] = {}  # 삽입 순서가 유지되는 집합
+        self.anchor: str | None = None  # shift 범위 선택의 기준 아이템
+        self.current: str | None = None  # 마지막으로 선택/토글한 아이템
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._selected
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._selected))
+
+    def __len__(self) -> int:
+        return len(self._selected)
+
+    def ids(self) -> list[str]:
+        """선택된 아이템 ID 목록 (선택한 순서)"""
+        return list(self._selected)
+
+    def select(self, item_id: str) -> SelectionChange:
+        """아이템 하나만 선택합니다. 기준점도 이 아이템으로 옮깁니다."""
+        self.anchor = self.current = item_id
+        return self._replace([item_id])
+
+    def toggle(self, item_id: str) -> SelectionChange:
+        """다른 선택은 유지한 채 아이템의 선택 여부를 뒤집습니다. (ctrl-클릭)"""
+        self.anchor = self.current = item_id
+        if item_id in self._selected:
+            return self._update([], [item_id])
+        return self._update([item_id], [])
+
+    def select_range(self, item_ids: Iterable[str], extend: bool = False) -> SelectionChange:
+        """
+        범위의 아이템을 선택합니다. (shift-클릭) 기준점은 바꾸지 않습니다.
+        Args:
+            item_ids (Iterable[str]): 기준점부터 대상까지의 아이템 ID
+            extend (bool): True면 기존 선택에 추가 (ctrl+shift)
+        """
+        item_ids = list(item_ids)
+        if item_ids:
+            self.current = item_ids[-1]
+        if extend:
+            return self._update(item_ids, [])
+        return self._replace(item_ids)
+
+    def select_all(self, item_ids: Iterable[str]) -> SelectionChange:
+        """주어진 아이템을 모두 선택합니다."""
+        return self._update(item_ids, [])
+
+    def clear(self) -> SelectionChange:
+        """선택을 모두 해제합니다."""
+        self.anchor = self.current = None
+        return self._update([], list(self._selected))
+
+    def discard(self, item_ids: Iterable[str]) -> List[str]:
+        """삭제된 아이템을 선택에서 뺍니다. (트리에는 반영하지 않음)"""
+        removed = [item_id for item_id in item_ids if self._selected.pop(item_id, 0) is None]
+        if self.anchor in removed:
+            self.anchor = None
+        if self.current in removed:
+            self.current = None
+        return removed
+
+    def reset(self, item_ids: Iterable[str]) -> None:
+        """트리가 통째로 바뀐 뒤(undo/redo, 불러오기) 선택 집합을 다시 구성합니다."""
+        self._selected = dict.fromkeys(item_ids)
+        if self.anchor not in self._selected:
+            self.anchor = None
+        if self.current not in self._selected:
+            self.current = None
+
+    def reset_from_tree(self) -> None:
+        """트리 아이템의 is_selected 값으로 선택 집합을 다시 구성합니다."""
+        if self._tree is None:
+            self.reset([])
+            return
+        self.reset(item_id for item_id, item in self._tree.items.items() if item.get_property(UK.SELECTED, False))
+
+    def _replace(self, item_ids: List[str]) -> SelectionChange:
+        keep = dict.fromkeys(item_ids)
+        return self._update(item_ids, [item_id for item_id in self._selected if item_id not in keep])
+
+    def _update(self, to_select: Iterable[str], to_deselect: Iterable[str]) -> SelectionChange:
+        deselected = [item_id for item_id in to_deselect if self._selected.pop(item_id, 0) is None]
+        selected = []
+        for item_id in to_select:
+            if item_id not in self._selected and self._has_item(item_id):
+                self._selected[item_id] = None
+                selected.append(item_id)
+        self._write_through(selected, True)
+        self._write_through(deselected, False)
+        return selected, deselected
+
+    def _has_item(self, item_id: str) -> bool:
+        return self._tree is None or self._tree.get_item(item_id) is not None
+
+    def _write_through(self, item_ids: List[str], selected: bool) -> None:
+        # RF : ui_state 접근자는 deepcopy를 하므로 set_property로 해당 필드만 변경
+        if self._tree is None:
+            return
+        for item_id in item_ids:
+            item = self._tree.get_item(item_id)
+            if item is not None:
+                item.set_property(UK.SELECTED, selected)
@@ -0,0 +1,779 @@
+from viewmodel.impl.tree_viewmodel_core import MTTreeViewModelCore
+from viewmodel.impl.tree_viewmodel_model import MTTreeViewModelModel
+from viewmodel.impl.tree_viewmodel_view import MTTreeViewModelView
+from viewmodel.impl.tree_selection import MTTreeSelection, SelectionChange
+from viewmodel.impl.visible_rows import MTVisibleRowIndex
+from viewmodel.impl.tree_search import MTTreeSearchIndex
+from viewmodel.impl.signal import IMTSignal, MTSignal, SignalFactory
+from core.interfaces.base_tree import IMTTree
+from core.interfaces.base_tree import IMTItem
+from core.interfaces.base_item_data import MTItemDomainDTO, MTNodeType, MTItemDTO
+from core.interfaces.base_item_keys import DomainKeys as DK, UIStateKeys as UK
+from model.state.interfaces.base_tree_state_mgr import IMTTreeStateManager
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent, MTTreeUIEvent
+from model.events.interfaces.base_tree_event_mgr import IMTTreeEventManager
+from model.store.repo.interfaces.base_tree_repo import IMTStore
+from model.store.store_manager import StoreManager
+from model.store.tree_loader import Dispatch, MTTreeLoadTask
+from typing import Any
+import dataclasses
+
+"""
+UI 프레임워크에 의존하지 않는 트리 ViewModel 로직입니다.
+시그널 구현은 signal_factory로 주입하므로 Qt 없이(CLI, 서버, 벤치마크) 같은 로직을 실행할 수 있습니다.
+Qt 바인딩은 viewmodel.impl.tree_viewmodel.MTTreeViewModel을 사용합니다.
+"""
+class MTTreeViewModelBase:
+    # RF : 하위 클래스가 클래스 속성(예: pyqtSignal)으로 이미 선언한 시그널은 팩토리로 만들지 않음
+    SIGNAL_NAMES: tuple[str, ...] = (
+        "item_added",
+        "item_moved",
+        "item_removed",
+        "tree_reset",
+        "item_modified",
+        "tree_state_changed",
+        "tree_undo",
+        "tree_redo",
+        "selection_changed",
+        "load_progress",
+        "load_finished",
+        "search_changed",
+    )
+    # _init_signals가 인스턴스마다 만들거나 하위 클래스가 클래스 속성으로 선언
+    item_added: IMTSignal
+    item_moved: IMTSignal
+    item_removed: IMTSignal
+    tree_reset: IMTSignal
+    item_modified: IMTSignal
+    tree_state_changed: IMTSignal
+    tree_undo: IMTSignal
+    tree_redo: IMTSignal
+    selection_changed: IMTSignal
+    load_progress: IMTSignal
+    load_finished: IMTSignal
+    search_changed: IMTSignal
+
+    def __init__(self, tree: IMTTree, state_manager: IMTTreeStateManager, event_manager: IMTTreeEventManager, store_manager: IMTStore, repository: IMTStore, signal_factory: SignalFactory | None = None):
+        """
+        ViewModel을 초기화합니다.
+        Args:
+            tree (IMTTree): 트리 인스턴스
+            state_manager (IMTTreeStateManager): 상태 관리자
+            event_manager (IMTTreeEventManager): 이벤트 관리자
+            store_manager (IMTStore): 저장소 관리자
+            repository: 저장소(선택)
+            signal_factory (SignalFactory | None): 시그널 생성 함수. None이면 MTSignal 사용
+        """
+        self._init_signals(signal_factory if signal_factory is not None else MTSignal)
+        self._tree = tree
+        self._repository = repository
+        self._state_manager = state_manager
+        self._event_manager = event_manager
+        self._store_manager = store_manager
+        self._core: MTTreeViewModelCore = MTTreeViewModelCore(self._tree)
+        self._model: MTTreeViewModelModel = MTTreeViewModelModel(self._tree, self._state_manager, self._store_manager)
+        self._selection: MTTreeSelection = MTTreeSelection(self._tree)
+        self._visible_rows: MTVisibleRowIndex = MTVisibleRowIndex(self._tree)
+        self._view: MTTreeViewModelView = MTTreeViewModelView(self._tree, self._selection, visible_rows=self._visible_rows)
+        self._load_task: MTTreeLoadTask | None = None
+        self._load_generation = 0  # 가장 최근 불러오기 번호 (이전 불러오기의 늦은 콜백은 무시)
+        self._load_restore: dict[str, Any] | None = None  # 불러오기 전 트리 (배치가 열려 있는 동안만)
+        self._search_index: MTTreeSearchIndex = MTTreeSearchIndex(self._tree)
+        self._search_matches: set[str] = set()
+        self._search_revealed: set[str] = set()  # 조상을 이미 펼쳐 둔 검색 결과
+        self._search_opened: set[str] = set()  # 검색 결과 때문에 펼쳤거나 펼쳐져 있음을 확인한 조상
+
+        events_to_subscribe = [
+            MTTreeEvent.ITEM_ADDED,
+            MTTreeEvent.ITEM_REMOVED,
+            MTTreeEvent.ITEM_MOVED,
+            MTTreeEvent.ITEM_MODIFIED,
+            MTTreeEvent.TREE_RESET
+        ]
+
+        for event_type in events_to_subscribe:
+            self.subscribe(event_type, self.on_tree_mod, source='event')
+        self.subscribe(MTTreeEvent.TREE_CRUD, self.on_tree_crud, source='event')
+
+        if self._state_manager:
+            self.subscribe(MTTreeEvent.TREE_UNDO, self.on_tree_undoredo, source='state')
+            self.subscribe(MTTreeEvent.TREE_REDO, self.on_tree_undoredo, source='state')
+
+    def _init_signals(self, signal_factory: SignalFactory) -> None:
+        """클래스에 선언되지 않은 시그널을 팩토리로 생성합니다."""
+        for name in self.SIGNAL_NAMES:
+            if getattr(type(self), name, None) is None:
+                setattr(self, name, signal_factory())
+
+    def on_tree_undoredo(self, event_type: MTTreeEvent, data: dict[str, Any]):
+        """
+        Undo/Redo 이벤트를 처리합니다.
+        Args:
+            event_type (MTTreeEvent): 이벤트 타입
+            data (dict): 이벤트 데이터
+        """
+        if event_type == MTTreeEvent.TREE_UNDO:
+            self.tree_undo.emit(event_type,data)
+        elif event_type == MTTreeEvent.TREE_REDO:
+            self.tree_redo.emit(event_type,data)
+        if data:
+            if hasattr(self, '_core') and self._core:
+                self._core.restore_tree_from_snapshot(data)
+                self._selection.reset_from_tree()
+                self._visible_rows.invalidate()
+                self._search_index.refresh()
+                self._forget_search_expansion()
+
+    def on_tree_crud(self, event_type: MTTreeEvent, data: dict[str, Any]):
+        """
+        트리 CRUD 이벤트를 처리합니다. (주로 StateManager의 new_undo 호출 후 발생)
+        이 이벤트는 트리에 변경이 있었고, 해당 변경이 undo 스택에 기록되었음을 의미합니다.
+        ViewModel은 이 변경을 View에 알려 UI를 갱신해야 합니다.
+        Args:
+            event_type (MTTreeEvent): 이벤트 타입
+            data (dict): 이벤트 데이터 (변경된 트리 상태 딕셔너리)
+        """
+        if event_type == MTTreeEvent.TREE_CRUD:
+            self.tree_state_changed.emit(MTTreeEvent.TREE_CRUD, data)
+
+    def on_tree_mod(self, event_type: MTTreeEvent, data: dict[str, Any]):
+        """
+        트리 구조 변경(추가/삭제/이동/수정/리셋) 이벤트를 처리합니다.
+        Args:
+            event_type (MTTreeEvent): 이벤트 타입
+            data (dict): 이벤트 데이터
+        """
+        self._visible_rows.handle_event(event_type, data)
+        self._search_index.handle_event(event_type, data)
+        if event_type != MTTreeEvent.ITEM_ADDED:
+            self._forget_search_expansion()  # 조상이 바뀌거나 접혔을 수 있음
+        if event_type == MTTreeEvent.ITEM_ADDED:
+            self.item_added.emit(event_type,data)
+        elif event_type == MTTreeEvent.ITEM_REMOVED:
+            self._selection.discard([data.get("item_id")])
+            self.item_removed.emit(event_type,data)
+        elif event_type == MTTreeEvent.ITEM_MOVED:
+            self.item_moved.emit(event_type,data)
+        elif event_type == MTTreeEvent.TREE_RESET:
+            self._selection.reset([])
+            self.tree_reset.emit(event_type,data)
+        elif event_type == MTTreeEvent.ITEM_MODIFIED:
+            self.item_modified.emit(event_type,data)
+
+    # --- Core 위임 (비즈니스 로직/데이터 접근) ---
+    def get_node_type(self, item_id: str) -> MTNodeType | None:
+        """
+        지정된 아이템의 노드 타입을 반환합니다.
+        Args:
+            item_id (str): 아이템 ID
+        Returns:
+            MTNodeType | None: 노드 타입 또는 None
+        """
+        if self._core and hasattr(self._core, 'get_item_node_type'):
+            return self._core.get_item_node_type(item_id)
+        return None
+
+    def add_item(self, item_dto: MTItemDTO, selected_potential_parent_id: str | None = None) -> str | None:
+        """
+        새 트리 아이템을 추가합니다.
+        Args:
+            item_dto (MTItemDTO): 추가할 아이템 DTO
+            selected_potential_parent_id (str | None): 부모 후보 아이디(선택)
+        Returns:
+            str | None: 추가된 아이템의 ID 또는 None
+        """
+        def get_parent_id_and_index(selected_id: str | None) -> tuple[str | None, int]:
+            if not selected_id:
+                return self.get_dummy_root_id(), -1
+            
+            core_item = self._core.get_item(selected_id)
+            if not core_item:
+                return self.get_dummy_root_id(), -1
+
+            node_type = core_item.get_property("node_type")
+
+            if node_type == MTNodeType.GROUP:
+                return selected_id, -1
+            
+            if node_type == MTNodeType.INSTRUCTION:
+                parent_id_of_selected = core_item.get_property("parent_id") 
+                
+                if parent_id_of_selected: 
+                    parent_of_selected_item = self._core.get_item(parent_id_of_selected)
+                    if parent_of_selected_item:
+                        siblings_ids = parent_of_selected_item.get_property("children_ids", [])
+                        try:
+                            idx = siblings_ids.index(selected_id) + 1
+                        except ValueError:
+                            idx = -1
+                        return parent_id_of_selected, idx
+                return parent_id_of_selected, -1
+            
+            return self.get_dummy_root_id(), -1
+
+        actual_parent_id, insert_index = get_parent_id_and_index(selected_potential_parent_id)
+        
+        if item_dto.domain_data.parent_id != actual_parent_id:
+            new_domain_data = dataclasses.replace(item_dto.domain_data, parent_id=actual_parent_id)
+            item_dto_with_parent = dataclasses.replace(item_dto, domain_data=new_domain_data)
+        else:
+            item_dto_with_parent = item_dto
+            
+        return self._core.add_item(item_dto=item_dto_with_parent, index=insert_index)
+
+    def update_item(self, item_id: str, item_dto: MTItemDTO) -> bool:
+        """
+        아이템의 데이터를 수정합니다.
+        Args:
+            item_id (str): 아이템 ID
+            item_dto (MTItemDTO): 새로운 데이터
+        Returns:
+            bool: 성공 여부
+        """
+        return self._core.update_item(item_id, item_dto)
+
+    def remove_item(self, item_id: str) -> bool:
+        """
+        아이템을 트리에서 제거합니다.
+        Args:
+            item_id (str): 제거할 아이템 ID
+        Returns:
+            bool: 성공 여부
+        """
+        result = self._core.remove_item(item_id)
+        return result
+
+    def move_item(self, item_id: str, new_parent_id: str | None = None) -> bool:
+        """
+        아이템을 새 부모로 이동합니다.
+        Args:
+            item_id (str): 이동할 아이템 ID
+            new_parent_id (str | None): 새 부모 ID(선택)
+        Returns:
+            bool: 성공 여부
+        """
+        result = self._core.move_item(item_id, new_parent_id)
+        return result
+
+    def remove_items(self, item_ids: list[str] | None = None) -> list[str]:
+        """
+        여러 아이템을 한 번에 삭제하고 Undo 스택에 한 번만 기록합니다.
+        Args:
+            item_ids (list[str] | None): 삭제할 아이템 ID 목록. None이면 현재 선택
+        Returns:
+            list[str]: 삭제한 최상위 아이템 ID 목록
+        """
+        removed: list[str] = self._core.remove_items(self._bulk_targets(item_ids))
+        self._record_bulk_undo(removed)
+        return removed
+
+    def move_items(self, item_ids: list[str] | None, new_parent_id: str | None = None, new_index: int = -1) -> list[str]:
+        """
+        여러 아이템을 상대 순서를 유지한 채 새 부모의 new_index 위치로 옮기고 Undo 스택에 한 번만 기록합니다.
+        Args:
+            item_ids (list[str] | None): 이동할 아이템 ID 목록. None이면 현재 선택
+            new_parent_id (str | None): 새 부모 ID(선택)
+            new_index (int): 새 부모의 자식 목록 위치, -1이면 맨 뒤
+        Returns:
+            list[str]: 이동한 아이템 ID 목록
+        """
+        moved: list[str] = self._core.move_items(self._bulk_targets(item_ids), new_parent_id, new_index)
+        self._record_bulk_undo(moved)
+        return moved
+
+    def duplicate_items(self, item_ids: list[str] | None = None) -> list[str]:
+        """
+        여러 아이템을 하위 아이템과 함께 복제하고 Undo 스택에 한 번만 기록합니다.
+        Args:
+            item_ids (list[str] | None): 복제할 아이템 ID 목록. None이면 현재 선택
+        Returns:
+            list[str]: 복제본 ID 목록
+        """
+        copies: list[str] = self._core.duplicate_items(self._bulk_targets(item_ids))
+        self._record_bulk_undo(copies)
+        return copies
+
+    def _bulk_targets(self, item_ids: list[str] | None) -> list[str]:
+        return self._selection.ids() if item_ids is None else list(item_ids)
+
+    def _record_bulk_undo(self, changed_ids: list[str]) -> None:
+        # RF : 일괄 작업 전체를 Undo 한 단계로 기록
+        if changed_ids and self._state_manager:
+            self._state_manager.new_undo(self._core.to_dict())
+
+    def reset_tree(self):
+        """
+        트리를 초기 상태로 리셋합니다.
+        """
+        tree = self._core._get_tree()
+        if tree:
+            tree.reset_tree()
+            self.tree_reset.emit(MTTreeEvent.TREE_RESET, {})
+
+    def get_tree_items(self) -> dict[str, IMTItem]:
+        """
+        트리의 모든 아이템을 딕셔너리로 반환합니다.
+        Returns:
+            dict[str, IMTItem]: 아이템 딕셔너리
+        """
+        return self._core.get_tree_items()
+
+    # --- StateManager 위임 (상태/이벤트/저장/복원) ---
+    def subscribe(self, event_type, callback, source='state'):
+        """
+        이벤트 또는 상태 변경을 구독합니다.
+        Args:
+            event_type: 이벤트 타입
+            callback: 콜백 함수
+            source (str): 'state' 또는 'event'
+        Returns:
+            구독 결과
+        """
+        if source == 'state':
+            return self._state_manager.subscribe(event_type, callback)
+        elif source == 'event':
+            return self._event_manager.subscribe(event_type, callback)
+        else:
+            raise ValueError(f"Unknown event source: {source}")
+
+    def unsubscribe(self, event_type, callback, source='state'):
+        """
+        이벤트 또는 상태 변경 구독을 해제합니다.
+        Args:
+            event_type: 이벤트 타입
+            callback: 콜백 함수
+            source (str): 'state' 또는 'event'
+        Returns:
+            구독 해제 결과
+        """
+        if source == 'state':
+            return self._state_manager.unsubscribe(event_type, callback)
+        elif source == 'event':
+            return self._event_manager.unsubscribe(event_type, callback)
+        else:
+            raise ValueError(f"Unknown event source: {source}")
+
+    def new_undo(self, tree: IMTTree) -> dict[str, Any]:
+        """
+        새 undo 스테이지를 추가합니다.
+        Args:
+            tree (IMTTree): 트리 인스턴스
+        Returns:
+            dict[str, Any]: 새 undo 스테이지 데이터
+        """
+        return self._state_manager.new_undo(tree)
+    def undo(self, tree: IMTTree) -> dict[str, Any] | None:
+        """
+        undo(실행 취소)를 수행합니다.
+        Args:
+            tree (IMTTree): 트리 인스턴스
+        Returns:
+            dict[str, Any] | None: 이전 상태 데이터 또는 None
+        """
+        return self._state_manager.undo()
+    def redo(self, tree: IMTTree) -> dict[str, Any] | None:
+        """
+        redo(다시 실행)을 수행합니다.
+        Args:
+            tree (IMTTree): 트리 인스턴스
+        Returns:
+            dict[str, Any] | None: 다음 상태 데이터 또는 None
+        """
+        return self._state_manager.redo()
+    def can_undo(self) -> bool:
+        """
+        undo(실행 취소) 가능 여부를 반환합니다.
+        Returns:
+            bool: 가능 여부
+        """
+        return self._state_manager.can_undo()
+    def can_redo(self) -> bool:
+        """
+        redo(다시 실행) 가능 여부를 반환합니다.
+        Returns:
+            bool: 가능 여부
+        """
+        return self._state_manager.can_redo()
+
+    # --- View 위임 (UI/조회/상태) ---
+    def get_items(self, start: int = 0, stop: int | None = None) -> list[MTItemDTO]:
+        """화면에 보이는 행의 아이템 DTO 목록을 가져옵니다. (start/stop: 행 범위)"""
+        return self._view.get_items(start, stop)
+
+    def select_item(self, item_id: str, multi_select: bool = False) -> bool:
+        """
+        아이템을 선택합니다. 선택은 Undo/Redo 스택에 기록하지 않습니다.
+        Args:
+            item_id (str): 선택할 아이템의 ID
+            multi_select (bool): True면 기존 선택을 유지하고 이 아이템만 토글 (ctrl-클릭)
+        Returns:
+            bool: 성공 여부
+        """
+        change = self._view.select_item(item_id, multi_select)
+        if change is None:
+            return False
+        self._emit_selection_changed(change)
+        return True
+
+    def select_range(self, item_id: str, extend: bool = False) -> bool:
+        """
+        기준점(마지막으로 클릭한 아이템)부터 item_id까지 화면에 보이는 순서대로 선택합니다. (shift-클릭)
+        Args:
+            item_id (str): 범위의 끝 아이템 ID
+            extend (bool): True면 기존 선택에 추가 (ctrl+shift-클릭)
+        Returns:
+            bool: 성공 여부
+        """
+        if self._core.get_item(item_id) is None:
+            return False
+        anchor = self._selection.anchor
+        if anchor is None or self._core.get_item(anchor) is None:
+            return self.select_item(item_id)
+        item_ids = self._visible_rows.between(anchor, item_id) or [item_id]
+        self._emit_selection_changed(self._selection.select_range(item_ids, extend))
+        return True
+
+    def select_all(self) -> None:
+        """모든 아이템을 선택합니다."""
+        root_id = self._tree.root_id if self._tree else None
+        self._emit_selection_changed(self._selection.select_all(item_id for item_id in self._tree.items if item_id != root_id))
+
+    def search(self, text: str = "", node_type: MTNodeType | None = None, device: Any = None, expand: bool = True) -> set[str]:
+        """
+        이름/노드 타입/장치로 아이템을 찾고 search_changed로 이전 결과와의 차이를 알립니다.
+        expand가 True면 찾은 아이템이 보이도록 조상 아이템을 펼칩니다. (Undo에는 기록하지 않음)
+        first는 새로 찾은 아이템 중 화면 순서로 가장 위에 있는 아이템입니다.
+        """
+        matches = self._search_index.search(text, node_type, device)
+        previous, self._search_matches = self._search_matches, matches
+        added = matches - previous
+        if expand:
+            # RF : 조상을 이미 펼쳤거나 이미 보이는 결과는 건너뛰어 키 입력마다 모든 결과의 조상을 다시 훑지 않음
+            expanded = self._expand_ancestors(self._visible_rows.hidden(matches - self._search_revealed))
+            self._search_revealed = matches
+        else:
+            expanded = []
+            self._search_revealed = self._search_revealed & matches
+        self.search_changed.emit({
+            "query": text,
+            "matches": matches,
+            "added": added,
+            "removed": previous - matches,
+            "expanded": expanded,
+            "first": self._first_visible(added),
+        })
+        return matches
+
+    def clear_search(self) -> None:
+        """검색 결과 강조를 모두 해제합니다."""
+        self.search("", expand=False)
+
+    @property
+    def search_matches(self) -> set[str]:
+        return self._search_matches
+
+    def _expand_ancestors(self, item_ids: set[str]) -> list[str]:
+        """
+        아이템들의 접혀 있는 조상을 펼치고, 펼친 아이템 ID 목록(위에서부터)을 반환합니다.
+        앞선 검색에서 이미 펼친 조상에 닿으면 그 위로는 올라가지 않습니다.
+        """
+        seen = self._search_opened
+        expanded: list[str] = []
+        root_id = self._tree.root_id
+        for item_id in item_ids:
+            item = self._tree.get_item(item_id)
+            parent_id = item.get_property(DK.PARENT_ID) if item is not None else None
+            path: list[str] = []
+            while parent_id is not None and parent_id != root_id and parent_id not in seen:
+                seen.add(parent_id)
+                parent = self._tree.get_item(parent_id)
+                if parent is None:
+                    break
+                if not parent.get_property(UK.EXPANDED, False):
+                    path.append(parent_id)
+                parent_id = parent.get_property(DK.PARENT_ID)
+            expanded.extend(reversed(path))
+        # RF : 펼침 상태를 모두 쓴 다음 보이는 행을 맞춰야 중간 조상이 접힌 채로 남지 않음
+        for item_id in expanded:
+            self._tree.get_item(item_id).set_property(UK.EXPANDED, True)
+        for item_id in expanded:
+            self._visible_rows.sync_expanded(item_id)
+        return expanded
+
+    def _forget_search_expansion(self) -> None:
+        """트리가 바뀌거나 아이템이 접히면 다음 검색에서 조상을 처음부터 다시 펼칩니다."""
+        self._search_revealed = set()
+        self._search_opened = set()
+
+    def _first_visible(self, item_ids: set[str]) -> str | None:
+        """아이템들 중 보이는 행 순서로 가장 앞의 아이템 ID"""
+        if not item_ids:
+            return None
+        if len(item_ids) == 1:
+            item_id = next(iter(item_ids))
+            return item_id if item_id in self._visible_rows else None
+        return next((item_id for item_id in self._visible_rows.ids() if item_id in item_ids), None)
+
+    @property
+    def visible_rows(self) -> MTVisibleRowIndex:
+        """화면에 보이는 행 목록 (행 번호 <-> 아이템 ID, 깊이)"""
+        return self._visible_rows
+
+    def _emit_selection_changed(self, change: SelectionChange) -> None:
+        """선택 변경을 한 번의 시그널로 알립니다. 바뀐 것이 없으면 알리지 않습니다."""
+        selected, deselected = change
+        if selected or deselected:
+            self.selection_changed.emit(MTTreeUIEvent.ITEM_SELECTED, {
+                "selected": selected,
+                "deselected": deselected,
+                "current": self._selection.current,
+            })
+
+    def get_current_tree(self) -> IMTTree | None:
+        """
+        현재 트리 인스턴스를 반환합니다.
+        Returns:
+            IMTTree | None: 트리 인스턴스 또는 None
+        """
+        return self._view.get_current_tree()
+
+    def get_item(self, item_id: str) -> MTItemDTO | None:
+        """
+        지정된 ID의 아이템 DTO를 반환합니다. (View 인터페이스 따름)
+        Args:
+            item_id (str): 아이템 ID
+        Returns:
+            MTItemDTO | None: 아이템 DTO 또는 None
+        """
+        return self._view.get_item_dto(item_id)
+
+    def get_selected_items(self) -> list[str]:
+        """
+        현재 선택된 아이템들의 ID 리스트를 반환합니다.
+        Returns:
+            list[str]: 선택된 아이템 ID 리스트
+        """
+        return self._view.get_selected_items()
+
+    def get_item_children(self, parent_id: str | None = None) -> list[MTItemDTO]:
+        """
+        지정된 부모 ID의 자식 아이템 데이터 MTItemDTO 리스트를 반환합니다.
+        Args:
+            parent_id (str | None): 부모 아이디(선택)
+        Returns:
+            list[MTItemDTO]: 자식 아이템 DTO 리스트
+        """
+        return self._view.get_item_children(parent_id)
+
+    def get_item_dto(self, item_id: str) -> MTItemDTO | None:
+        """지정된 ID의 아이템을 MTItemDTO로 반환합니다."""
+        item: IMTItem | None = self._core.get_item(item_id)
+        if item:
+            return item.to_dto()
+        return None
+
+    def toggle_expanded(self, item_id: str, expanded: bool | None = None) -> bool:
+        """
+        아이템의 확장 상태를 토글하거나 지정된 상태로 설정하고, 변경 사항을 Undo/Redo 스택에 기록합니다.
+        View에서 이 메서드를 호출하여 Core 상태를 변경합니다.
+        Args:
+            item_id (str): 상태를 변경할 아이템의 ID
+            expanded (bool | None): 새로운 확장 상태. None이면 현재 상태를 반전.
+        Returns:
+            bool: 작업 성공 여부 (실제 상태 변경이 있었는지 여부와 다를 수 있음, 여기서는 Core 작업 성공 여부)
+        """
+        core_item = self._core.get_item(item_id) 
+        if not core_item:
+            return False
+
+        current_ui_state = core_item.ui_state 
+        
+        new_expanded_state: bool
+        if expanded is None: # 토글 동작
+            new_expanded_state = not current_ui_state.is_expanded
+        else: # 지정된 상태로 설정
+            new_expanded_state = expanded
+            
+        if current_ui_state.is_expanded != new_expanded_state:
+            current_ui_state.is_expanded = new_expanded_state
+            core_item.ui_state = current_ui_state 
+            self._visible_rows.sync_expanded(item_id)
+            if not new_expanded_state:
+                self._forget_search_expansion()
+            
+            tree_state_dict = self._core.to_dict()
+            if tree_state_dict:
+                self._state_manager.new_undo(tree_state_dict)
+            else:
+                print(f"Warning: Could not get tree state dict for undo in toggle_expanded for item {item_id}")
+                return False # Undo 기록 실패 시 작업 실패로 간주 가능
+            return True # 상태 변경 및 Undo 기록 성공
+        return True # 상태 변경이 없었지만, 요청은 성공적으로 처리됨으로 간주
+
+    def clear_selection_state(self) -> None:
+        """
+        선택 상태를 초기화합니다.
+        """
+        self._emit_selection_changed(self._view.clear_selection_state())
+
+    def get_dummy_root_id(self) -> str | None:
+        """
+        더미 루트 아이템의 ID를 반환합니다.
+        Returns:
+            str | None: 더미 루트 ID 또는 None
+        """
+        if self._core and hasattr(self._core, '_tree') and hasattr(self._core._tree, 'DUMMY_ROOT_ID'):
+             return self._core._tree.DUMMY_ROOT_ID
+        return None
+
+    def save_tree(self, tree_id: str | None = None) -> str:
+        """
+        현재 트리 상태를 저장합니다.
+        Args:
+            tree_id (str | None): 저장할 트리의 ID(선택)
+        Returns:
+            str: 저장된 트리의 ID
+        """
+        current_tree_object = self._core._get_tree()
+        if not current_tree_object:
+            raise ValueError("현재 트리 객체를 가져올 수 없습니다.")
+        saved_id = self._repository.save(current_tree_object, tree_id)
+        self._attach_journal(saved_id)
+        return saved_id
+
+    def _attach_journal(self, tree_id: str) -> None:
+        """저장소가 변경 저널을 지원하면 이후 저장이 변경분만 기록하도록 현재 트리를 연결합니다."""
+        attach = getattr(self._repository, "attach_journal", None)
+        if attach is not None and self._event_manager is not None:
+            attach(self._tree, self._event_manager, self._state_manager, tree_id)
+
+    def load_tree(self, tree_id: str) -> bool:
+        """
+        저장소에서 트리 데이터를 불러와 현재 트리 상태를 복원합니다.
+        Args:
+            tree_id (str): 불러올 트리의 ID (파일명)
+        Returns:
+            bool: 성공 여부
+        """
+        loaded_tree = self._repository.load(tree_id)
+        if loaded_tree:
+            if self._state_manager:
+                self._state_manager.set_initial_state(loaded_tree)
+            
+            if self._event_manager:
+                self._event_manager.notify(MTTreeEvent.TREE_RESET, {"tree_data": loaded_tree.to_dict()})
+            return True
+        return False
+
+    def load_tree_async(self, tree_id: str, dispatch: Dispatch | None = None) -> MTTreeLoadTask:
+        """
+        작업 스레드에서 트리를 불러와 최상위 그룹 단위로 현재 트리에 채웁니다.
+        진행률은 load_progress(불러온 아이템 수, 전체 수), 끝나면 load_finished(dict)로 알립니다.
+        취소되거나 실패하면 불러오기 전 상태로 되돌립니다. 진행 중인 불러오기가 있으면 취소하며,
+        취소된 불러오기의 콜백이 늦게 도착해도 무시하고 처음 불러오기 전 상태와 배치를 새 불러오기가 이어받습니다.
+        Args:
+            tree_id (str): 불러올 트리의 ID
+            dispatch (Dispatch | None): 콜백을 UI 스레드로 넘기는 함수 (Qt는 view.impl.ui_dispatcher.MTUiDispatcher)
+        Returns:
+            MTTreeLoadTask: 진행률 확인/취소용 작업 핸들
+        """
+        if self._load_task is not None and not self._load_task.done():
+            self._load_task.cancel()
+        store = self._store_manager if hasattr(self._store_manager, "load_tree_async") else StoreManager(self._repository)
+        task = MTTreeLoadTask(tree_id)
+        self._load_generation += 1
+        generation = self._load_generation
+
+        def is_current() -> bool:
+            return generation == self._load_generation and not task.cancelled
+
+        def on_start(header: dict[str, Any], total: int) -> None:
+            if not is_current():
+                return
+            if self._load_restore is None:
+                self._load_restore = self._tree.to_dict()
+                # RF : 그룹마다 전체 스냅샷(TREE_CRUD)을 만들지 않도록 끝날 때까지 한 번으로 묶음
+                self._tree.begin_batch()
+            self._reset_tree_state(header)
+            self.load_progress.emit(0, total)
+
+        def on_chunk(item_dtos: list[MTItemDTO]) -> None:
+            if self._load_restore is not None and is_current():
+                self._tree.add_subtree(item_dtos)
+
+        def on_progress(loaded: int, total: int) -> None:
+            if is_current():
+                self.load_progress.emit(loaded, total)
+
+        def on_done(done_task: MTTreeLoadTask) -> None:
+            error = done_task.error()
+            superseded = generation != self._load_generation  # 새 불러오기가 트리와 배치를 이어받음
+            success = error is None and not done_task.cancelled and not superseded and done_task.result() is not None
+            if not superseded and self._load_restore is not None:
+                if not success:
+                    self._reset_tree_state(self._load_restore)
+                self._load_restore = None
+                self._tree.end_batch()
+            if success and self._state_manager:
+                self._state_manager.set_initial_state(self._tree)
+            if success:
+                self._attach_journal(tree_id)
+            if self._load_task is done_task:
+                self._load_task = None
+            self.load_finished.emit({
+                "tree_id": tree_id,
+                "success": success,
+                "cancelled": done_task.cancelled or superseded,
+                "error": str(error) if error is not None else None,
+            })
+
+        self._load_task = task
+        return store.load_tree_async(tree_id, on_start, on_chunk, on_progress, on_done, dispatch=dispatch, task=task)
+
+    def cancel_load(self) -> None:
+        """진행 중인 백그라운드 불러오기를 취소합니다."""
+        if self._load_task is not None:
+            self._load_task.cancel()
+
+    def _reset_tree_state(self, tree_data: dict[str, Any]) -> None:
+        """트리를 tree_data로 통째로 바꾸고 TREE_RESET을 알립니다."""
+        self._tree.dict_to_state(tree_data)
+        if self._event_manager:
+            self._event_manager.notify(MTTreeEvent.TREE_RESET, {"tree_data": tree_data})
+
+    def toggle_expanded_state(self, item_id: str, is_expanded: bool) -> None:
+        """
+        Core 아이템의 확장 상태를 변경하고, 변경 사항을 Undo/Redo 스택에 기록합니다.
+        Args:
+            item_id (str): 상태를 변경할 아이템의 ID
+            is_expanded (bool): 새로운 확장 상태
+        """
+        core_item = self._core.get_item(item_id) 
+        if core_item:
+            current_ui_state = core_item.ui_state # MTItemUIStateDTO (deepcopy)
+            if current_ui_state.is_expanded != is_expanded:
+                current_ui_state.is_expanded = is_expanded
+                core_item.ui_state = current_ui_state # setter (deepcopy)
+                self._visible_rows.sync_expanded(item_id)
+                if not is_expanded:
+                    self._forget_search_expansion()
+                
+                # 변경된 전체 트리 상태를 Undo 스택에 저장
+                current_tree_snapshot = self._core.to_dict() # MTTreeViewModelCore의 to_dict() 사용
+                if current_tree_snapshot:
+                    self._state_manager.new_undo(current_tree_snapshot)
+                else:
+                    print(f"Warning: Could not get tree snapshot for undo in toggle_expanded_state for item {item_id}")
+
+    def get_all_item_dtos(self) -> dict[str, MTItemDTO]:
+        """
+        트리의 모든 아이템 DTO를 딕셔너리로 반환합니다.
+        Returns:
+            dict[str, MTItemDTO]: 아이템 DTO 딕셔너리
+        """
+        return self._core.get_all_item_dtos()
+
+
+class MTTreeViewModelHeadless(MTTreeViewModelBase):
+    """Qt 없이 동작하는 ViewModel (MTSignal 기반). CLI/서버/벤치마크용"""
+    pass
@@ -84,6 +84,30 @@ class MTTreeViewModelCore(IMTTreeViewModelCore):
         except exc.MTTreeError:
             return False
 
+    def remove_items(self, item_ids: list[str]) -> list[str]:
+        tree = self._get_tree()
+        removed: list[str] = tree.remove_items(item_ids)
+        return removed
+
+    def move_items(self, item_ids: list[str], new_parent_id: str | None = None, new_index: int = -1) -> list[str]:
+        tree = self._get_tree()
+        try:
+            moved: list[str] = tree.move_items(item_ids, new_parent_id, new_index)
+        except exc.MTItemNotFoundError:
+            return []
+        except exc.MTTreeError:
+            return []
+        return moved
+
+    def duplicate_items(self, item_ids: list[str]) -> list[str]:
+        tree = self._get_tree()
+        try:
+            copies: list[str] = tree.duplicate_items(item_ids)
+        except exc.MTTreeError as e:
+            print(f"Error in duplicate_items: {e}")
+            return []
+        return copies
+
     def get_item_node_type(self, item_id: str) -> MTNodeType | None:
         """지정된 ID를 가진 아이템의 노드 타입을 반환합니다."""
         tree = self._get_tree()
@@ -121,7 +145,12 @@ class MTTreeViewModelCore(IMTTreeViewModelCore):
             print("Error: Tree object does not have a dict_to_state method.")
 
     def to_dict(self) -> dict:
-        return self._tree.to_dict() if self._tree else {}
+        """Undo에 기록할 트리 상태 (지연 로딩 트리는 불러온 부분만)"""
+        if not self._tree:
+            return {}
+        snapshot = getattr(self._tree, "snapshot", None)
+        data: dict = snapshot() if snapshot is not None else self._tree.to_dict()
+        return data
 
     def dict_to_state(self, data):
         return self._tree.dict_to_state(data)
\ No newline at end of file
@@ -1,8 +1,6 @@
 from typing import Callable, Set, Any
 
-from model.state.impl.tree_state_mgr import MTTreeStateManager
 from model.state.interfaces.base_tree_state_mgr import IMTTreeStateManager
-from model.store.db.impl.postgres_repo import PostgreSQLTreeRepository
 from model.store.repo.interfaces.base_tree_repo import IMTStore
 from viewmodel.interfaces.base_tree_viewmodel_model import IMTTreeViewModelModel
 from core.interfaces.base_tree import IMTTree
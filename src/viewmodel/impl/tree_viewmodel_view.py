@@ -3,65 +3,59 @@ from core.interfaces.base_item_data import MTItemDomainDTO, MTItemUIStateDTO, MT
 from core.interfaces.base_tree import IMTTree, IMTItem
 from core.impl.utils import to_tree_item_data
 from viewmodel.interfaces.base_tree_viewmodel_view import IMTTreeViewModelView
+from viewmodel.impl.tree_selection import MTTreeSelection, SelectionChange
+from viewmodel.impl.visible_rows import MTVisibleRowIndex
 
 class MTTreeViewModelView(IMTTreeViewModelView):
-    def __init__(self, tree=None, selected_items=None, notify_change: Callable[[], None] | None = None):
+    def __init__(self, tree=None, selected_items: MTTreeSelection | None = None, notify_change: Callable[[], None] | None = None,
+                 visible_rows: MTVisibleRowIndex | None = None):
         self._tree:IMTTree | None = tree
-        self._selected_items = selected_items if selected_items is not None else set()
+        self._selected_items = selected_items if selected_items is not None else MTTreeSelection(tree)
         self._notify_change = notify_change if notify_change is not None else lambda: None
+        self._visible_rows = visible_rows if visible_rows is not None else MTVisibleRowIndex(tree)
 
-    def get_items(self) -> list[MTItemDTO]:
-        """UI에 표시할 아이템 목록을 반환합니다. (DFS 순회)"""
+    def get_items(self, start: int = 0, stop: int | None = None) -> list[MTItemDTO]:
+        """
+        UI에 표시할 아이템(펼쳐진 부모 아래 보이는 행)을 화면 순서대로 반환합니다.
+        Args:
+            start (int): 첫 행 번호
+            stop (int | None): 마지막 행 다음 번호. None이면 끝까지 (스크롤 영역만 변환할 때 지정)
+        """
         tree = self.get_current_tree()
         if not tree:
             return []
+        # RF : 트리 전체를 DFS로 훑지 않고 보이는 행 목록에서 요청한 구간만 DTO로 변환
         result = []
-        # DFS(깊이 우선 탐색) 순회로 트리 아이템을 방문
-        # RF : nested func. 여기서만 공유. Result 확인 용이. 깔끔한 코드
-        def dfs(item: IMTItem):
+        for item_id in self._visible_rows.ids(start, stop):
+            item = tree.get_item(item_id)
+            if item is None:
+                continue
             parent_id = item.get_property("parent_id")
             if not (isinstance(parent_id, str) or parent_id is None):
                 parent_id = None
-            result.append(
-                to_tree_item_data(
-                    item,
-                    parent_id,
-                    selected=(item.id in self._selected_items)
-                )
-            )
-            # 자식 아이템들을 재귀적으로 방문
-            for child in tree.get_children(item.id):
-                dfs(child)
-        # 루트 아이템부터 DFS 시작
-        root_id = tree.root_id
-        if root_id:
-            root_item = tree.get_item(root_id)
-            if root_item:
-                dfs(root_item)
+            result.append(to_tree_item_data(item, parent_id, selected=(item_id in self._selected_items)))
         return result
 
-    def select_item(self, item_id: str, multi_select: bool = False) -> bool:
+    def select_item(self, item_id: str, multi_select: bool = False) -> SelectionChange | None:
         """아이템을 선택합니다.
         
         Args:
             item_id: 선택할 아이템 ID
-            multi_select: 다중 선택 모드
+            multi_select: 다중 선택 모드 (기존 선택을 유지하고 토글)
             
         Returns:
-            성공 여부
+            (선택된 ID 목록, 해제된 ID 목록) 또는 아이템이 없으면 None
         """
         tree = self.get_current_tree()
         if not tree or not tree.get_item(item_id):
-            return False
-        # 다중 선택이 아니면 기존 선택 초기화
-        if not multi_select:
-            self._selected_items.clear()
-        # 선택 토글
-        if item_id in self._selected_items:
-            self._selected_items.remove(item_id)
-        else:
-            self._selected_items.add(item_id)
-        return True
+            return None
+        if multi_select:
+            return self._selected_items.toggle(item_id)
+        return self._selected_items.select(item_id)
+
+    @property
+    def selection(self) -> MTTreeSelection:
+        return self._selected_items
 
     def get_current_tree(self) -> IMTTree | None:
         return self._tree
@@ -102,10 +96,6 @@ class MTTreeViewModelView(IMTTreeViewModelView):
         item.set_property("expanded", new_state)
         return True
 
-    def clear_selection_state(self):
+    def clear_selection_state(self) -> SelectionChange:
         """선택 상태를 초기화합니다."""
-        if not self._selected_items:
-            return # 변경 없으면 아무것도 안 함
-
-        self._selected_items.clear()
-        print("ViewModelView: Selection cleared.")
\ No newline at end of file
+        return self._selected_items.clear()
@@ -0,0 +1,230 @@
+from typing import Any, Dict, List, Set
+
+from core.interfaces.base_item_keys import DomainKeys as DK, UIStateKeys as UK
+from core.interfaces.base_tree import IMTTree
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+
+"""
+화면에 보이는 행(펼쳐진 부모 아래 아이템)을 전위 순회 순서로 펼친 목록입니다.
+처음 사용할 때 한 번 구성하고, 이후에는 펼치기/접기와 트리 이벤트마다 바뀐 구간만 고칩니다.
+행 -> ID는 O(1), ID -> 행은 위치 캐시로 대부분 O(1)입니다.
+"""
+
+
+class MTVisibleRowIndex:
+    """보이는 행 목록 (행 번호, 깊이, ID)"""
+
+    def __init__(self, tree: IMTTree | None):
+        self._tree = tree
+        self._rows: List[str] = []
+        self._depths: Dict[str, int] = {}  # 보이는 아이템 -> 깊이 (최상위 0)
+        self._open: Set[str] = set()  # 자식이 목록에 포함된(펼쳐진) 아이템
+        self._positions: Dict[str, int] = {}  # ID -> 행 캐시. _valid_upto 이전 행만, rows와 일치할 때만 신뢰
+        self._valid_upto = 0
+        self._built = False
+
+    # --- 조회 ---
+    def __len__(self) -> int:
+        self._ensure_built()
+        return len(self._rows)
+
+    def __contains__(self, item_id: object) -> bool:
+        self._ensure_built()
+        return item_id in self._depths
+
+    def hidden(self, item_ids: Set[str]) -> Set[str]:
+        """아이템들 중 보이지 않는(조상이 접혀 있는) 아이템"""
+        self._ensure_built()
+        return item_ids.difference(self._depths)
+
+    def item_at(self, row: int) -> str | None:
+        """행 번호의 아이템 ID"""
+        self._ensure_built()
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def row_of(self, item_id: str) -> int | None:
+        """아이템의 행 번호. 보이지 않으면 None"""
+        self._ensure_built()
+        if item_id not in self._depths:
+            return None
+        rows = self._rows
+        row = self._positions.get(item_id)
+        if row is not None and row < self._valid_upto and rows[row] == item_id:
+            return row
+        # RF : 캐시가 무효화된 지점부터 찾는 아이템까지만 위치를 다시 기록 (분할 상환)
+        for row in range(self._valid_upto, len(rows)):
+            self._positions[rows[row]] = row
+            if rows[row] == item_id:
+                self._valid_upto = row + 1
+                return row
+        self._valid_upto = len(rows)
+        return self._positions.get(item_id)
+
+    def depth_of(self, item_id: str) -> int | None:
+        """아이템의 깊이 (최상위 0). 보이지 않으면 None"""
+        self._ensure_built()
+        return self._depths.get(item_id)
+
+    def ids(self, start: int = 0, stop: int | None = None) -> List[str]:
+        """행 범위의 아이템 ID 목록 (스크롤 영역 등)"""
+        self._ensure_built()
+        return self._rows[start:stop]
+
+    def neighbor(self, item_id: str, step: int = 1) -> str | None:
+        """step만큼 떨어진 행의 아이템 ID (키보드 위/아래 이동)"""
+        row = self.row_of(item_id)
+        return self.item_at(row + step) if row is not None else None
+
+    def between(self, first_id: str, last_id: str) -> List[str]:
+        """두 아이템 사이(양 끝 포함)의 아이템 ID를 first_id부터 last_id 방향으로 반환합니다."""
+        first_row, last_row = self.row_of(first_id), self.row_of(last_id)
+        if first_row is None or last_row is None:
+            return []
+        if first_row <= last_row:
+            return self._rows[first_row:last_row + 1]
+        return self._rows[last_row:first_row + 1][::-1]
+
+    # --- 갱신 ---
+    def invalidate(self) -> None:
+        """트리가 통째로 바뀌었을 때(undo/redo, 불러오기) 다음 조회에서 다시 구성하도록 표시합니다."""
+        self._built = False
+
+    def rebuild(self) -> None:
+        """루트부터 보이는 행 목록을 다시 구성합니다."""
+        self._rows = []
+        self._depths = {}
+        self._open = set()
+        self._positions = {}
+        self._valid_upto = 0
+        self._built = True
+        root_id = self._tree.root_id if self._tree is not None else None
+        for child_id in self._children(root_id):
+            self._rows.extend(self._collect(child_id, 0))
+
+    def handle_event(self, event_type: MTTreeEvent, data: Dict[str, Any]) -> None:
+        """트리 이벤트에 맞춰 바뀐 구간만 고칩니다. 아직 구성하지 않았으면 아무것도 하지 않습니다."""
+        if not self._built:
+            return
+        item_id = data.get("item_id")
+        if event_type == MTTreeEvent.ITEM_ADDED:
+            self._insert_item(item_id, data.get("parent_id"))
+        elif event_type == MTTreeEvent.ITEM_REMOVED:
+            self._remove_item(item_id)
+        elif event_type == MTTreeEvent.ITEM_MOVED:
+            self._remove_item(item_id)
+            self._insert_item(item_id, data.get("new_parent_id"))
+        elif event_type == MTTreeEvent.ITEM_MODIFIED and item_id is not None:
+            self.sync_expanded(item_id)
+        elif event_type == MTTreeEvent.TREE_RESET:
+            self.invalidate()
+
+    def sync_expanded(self, item_id: str) -> None:
+        """아이템의 is_expanded 값에 맞춰 자식 행을 펼치거나 접습니다."""
+        tree = self._tree
+        if not self._built or tree is None:
+            return
+        row = self.row_of(item_id)
+        if row is None:
+            return
+        item = tree.get_item(item_id)
+        if item is None:
+            return
+        expanded = bool(item.get_property(UK.EXPANDED, False))
+        if expanded and item_id not in self._open:
+            depth = self._depths[item_id]
+            self._open.add(item_id)
+            new_rows: List[str] = []
+            for child_id in self._children(item_id):
+                new_rows.extend(self._collect(child_id, depth + 1))
+            self._insert_rows(row + 1, new_rows)
+        elif not expanded and item_id in self._open:
+            self._open.discard(item_id)
+            self._delete_rows(row + 1, self._span_end(row))
+
+    # --- 내부 도우미 ---
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.rebuild()
+
+    def _children(self, item_id: str | None) -> List[str]:
+        if item_id is None or self._tree is None:
+            return []
+        item = self._tree.get_item(item_id)
+        return item.get_property(DK.CHILDREN, []) if item is not None else []
+
+    def _collect(self, item_id: str, depth: int) -> List[str]:
+        """아이템과 보이는 하위 아이템을 전위 순서로 모으고 깊이/펼침 상태를 기록합니다."""
+        rows: List[str] = []
+        if self._tree is None:
+            return rows
+        stack = [(item_id, depth)]
+        while stack:
+            current_id, current_depth = stack.pop()
+            item = self._tree.get_item(current_id)
+            if item is None:
+                continue
+            rows.append(current_id)
+            self._depths[current_id] = current_depth
+            if item.get_property(UK.EXPANDED, False):
+                self._open.add(current_id)
+                stack.extend((child_id, current_depth + 1) for child_id in reversed(item.get_property(DK.CHILDREN, [])))
+        return rows
+
+    def _span_end(self, row: int) -> int:
+        """row 아이템의 하위 행이 끝나는 위치(다음 형제 행)"""
+        depth = self._depths[self._rows[row]]
+        end = row + 1
+        while end < len(self._rows) and self._depths[self._rows[end]] > depth:
+            end += 1
+        return end
+
+    def _insert_item(self, item_id: str | None, parent_id: str | None) -> None:
+        if self._tree is None or item_id is None or item_id in self._depths:
+            return
+        root_id = self._tree.root_id
+        if parent_id is None or parent_id == root_id:
+            parent_row: int | None = -1
+            depth = 0
+            siblings = self._children(root_id)
+        elif parent_id in self._open:
+            parent_row, depth = self.row_of(parent_id), self._depths[parent_id] + 1
+            siblings = self._children(parent_id)
+        else:
+            return  # 부모가 접혀 있거나 보이지 않음
+        if parent_row is None:
+            self.invalidate()
+            return
+        try:
+            index = siblings.index(item_id)
+        except ValueError:
+            return
+        if index == 0:
+            row = parent_row + 1
+        else:
+            previous_row = self.row_of(siblings[index - 1])
+            if previous_row is None:
+                self.invalidate()
+                return
+            row = self._span_end(previous_row)
+        self._insert_rows(row, self._collect(item_id, depth))
+
+    def _remove_item(self, item_id: str | None) -> None:
+        row = self.row_of(item_id) if item_id is not None else None
+        if row is None:
+            return
+        self._delete_rows(row, self._span_end(row))
+
+    def _insert_rows(self, row: int, item_ids: List[str]) -> None:
+        if item_ids:
+            self._rows[row:row] = item_ids
+            self._valid_upto = min(self._valid_upto, row)
+
+    def _delete_rows(self, start: int, end: int) -> None:
+        if start >= end:
+            return
+        for item_id in self._rows[start:end]:
+            self._depths.pop(item_id, None)
+            self._open.discard(item_id)
+            self._positions.pop(item_id, None)
+        del self._rows[start:end]
+        self._valid_upto = min(self._valid_upto, start)
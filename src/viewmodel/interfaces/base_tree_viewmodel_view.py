@@ -4,7 +4,7 @@ from core.interfaces.base_tree import IMTTree, IMTItem
 from core.interfaces.base_item_data import MTItemDomainDTO, MTItemDTO
 
 class IMTTreeViewModelView(Protocol):
-    def get_items(self) -> List[MTItemDTO]: ...
+    def get_items(self, start: int = 0, stop: int | None = None) -> List[MTItemDTO]: ...
     def select_item(self, item_id: str, multi_select: bool = False) -> bool: ...
     def get_current_tree(self) -> IMTTree | None: ...
     def get_item_dto(self, item_id: str) -> MTItemDTO | None: ...
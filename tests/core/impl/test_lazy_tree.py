@@ -0,0 +1,152 @@
+import pytest
+
+from core.impl.lazy_tree import UNLOADED_KEY, MTLazyTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+
+
+class FakeSource:
+    """그룹 groups개 아래에 명령 per_group개씩 있는 저장소. 행은 조회할 때 만듦"""
+
+    def __init__(self, groups=5, per_group=4, expanded=()):
+        self.groups = groups
+        self.per_group = per_group
+        self.expanded = set(expanded)
+        self.calls = []
+
+    def fetch_children(self, parent_ids):
+        self.calls.append(list(parent_ids))
+        result = {}
+        for parent_id in parent_ids:
+            if parent_id is None:
+                result[parent_id] = [self._dto(f"g{n}", MTNodeType.GROUP) for n in range(self.groups)]
+            elif parent_id.startswith("g"):
+                result[parent_id] = [self._dto(f"{parent_id}-{n}", MTNodeType.INSTRUCTION) for n in range(self.per_group)]
+        return result
+
+    def _dto(self, item_id, node_type):
+        return MTItemDTO(item_id, MTItemDomainDTO(name=item_id, node_type=node_type),
+                         MTItemUIStateDTO(is_expanded=item_id in self.expanded))
+
+
+def child_ids(tree, parent_id=None):
+    return [item.id for item in tree.get_children(parent_id)]
+
+
+class TestLazyTree:
+
+    def test_opening_reads_only_the_top_level(self):
+        source = FakeSource(groups=50, per_group=20_000)  # 100만 행
+        tree = MTLazyTree("t", "Library", source)
+        assert source.calls == [[None]]
+        assert len(tree.items) == 51  # 더미 루트 + 그룹
+        assert not tree.is_loaded("g0") and tree.is_loaded(None)
+
+    def test_children_are_fetched_once_when_reached(self):
+        source = FakeSource()
+        tree = MTLazyTree("t", "Library", source)
+        assert child_ids(tree, "g1") == ["g1-0", "g1-1", "g1-2", "g1-3"]
+        assert child_ids(tree, "g1") == ["g1-0", "g1-1", "g1-2", "g1-3"]
+        assert tree.get_item("g1-2").get_property("parent_id") == "g1"
+        assert source.calls == [[None], ["g1"]]
+
+        visited = []
+        tree.traverse(lambda item: visited.append(item.id))
+        assert len(visited) == 1 + 5 + 5 * 4
+
+    def test_least_recently_used_groups_are_unloaded(self):
+        source = FakeSource()
+        event_manager = MTTreeEventManager()
+        unloaded = []
+        def on_unloaded(event_type, data):
+            unloaded.append(data["item_id"])
+        event_manager.subscribe(MTTreeEvent.SUBTREE_UNLOADED, on_unloaded)
+        tree = MTLazyTree("t", "Library", source, event_manager, cache_size=3)
+
+        child_ids(tree, "g0")
+        child_ids(tree, "g1")
+        child_ids(tree, "g0")  # g0을 최근에 씀
+        child_ids(tree, "g2")
+        assert unloaded == ["g1"]
+        assert not tree.is_loaded("g1") and tree.get_item("g1-0") is None
+        assert tree.get_item("g0-0") is not None and tree.loaded_group_count == 3
+
+        assert child_ids(tree, "g1") == ["g1-0", "g1-1", "g1-2", "g1-3"]
+        assert source.calls[-1] == ["g1"]
+
+    def test_hints_and_expanded_groups_are_prefetched_together(self):
+        source = FakeSource(expanded={"g4"})
+        tree = MTLazyTree("t", "Library", source)
+        tree.hint(["g2", "g3"])
+        child_ids(tree, "g0")
+        assert source.calls[-1] == ["g0", "g4", "g2", "g3"]
+        child_ids(tree, "g2")
+        child_ids(tree, "g4")
+        assert len(source.calls) == 2
+
+    def test_edited_groups_stay_loaded(self):
+        source = FakeSource()
+        tree = MTLazyTree("t", "Library", source, MTTreeEventManager(), cache_size=2)
+        child_ids(tree, "g0")
+        tree.move_item("g0-0", "g1", 0)  # 옮길 곳(g1)을 먼저 불러온 뒤 이동
+        assert child_ids(tree, "g1") == ["g0-0", "g1-0", "g1-1", "g1-2", "g1-3"]
+        for group_id in ("g2", "g3", "g4"):
+            child_ids(tree, group_id)
+        assert tree.is_loaded("g0") and tree.is_loaded("g1")
+
+        items = tree.to_dict()["items"]  # 저장은 전체를 불러옴
+        assert len(items) == 1 + 5 + 5 * 4
+        assert items["g0"]["domain_data"]["children_ids"] == ["g0-1", "g0-2", "g0-3"]
+
+    def test_edits_snapshot_only_loaded_groups(self):
+        source = FakeSource(groups=50, per_group=100)
+        event_manager = MTTreeEventManager()
+        snapshots = []
+        event_manager.subscribe(MTTreeEvent.TREE_CRUD, lambda event_type, data: snapshots.append(data["tree_data"]))
+        tree = MTLazyTree("t", "Library", source, event_manager)
+
+        tree.add_item(MTItemDTO("new", MTItemDomainDTO(name="new", parent_id="g0", node_type=MTNodeType.INSTRUCTION),
+                                MTItemUIStateDTO()))
+        child_ids(tree, "g1")
+        dto = tree.get_item("g1-0").to_dto()
+        dto.domain_data.name = "renamed"
+        tree.modify_item("g1-0", dto)
+
+        assert source.calls == [[None], ["g0"], ["g1"]]
+        assert len(snapshots) == 2
+        assert len(snapshots[-1]["items"]) == 1 + 50 + 101 + 100
+        assert set(snapshots[-1][UNLOADED_KEY]) == {f"g{n}" for n in range(2, 50)}
+
+    def test_restoring_a_partial_snapshot_fetches_unloaded_groups_again(self):
+        source = FakeSource()
+        event_manager = MTTreeEventManager()
+        snapshots = []
+        event_manager.subscribe(MTTreeEvent.TREE_CRUD, lambda event_type, data: snapshots.append(data["tree_data"]))
+        tree = MTLazyTree("t", "Library", source, event_manager)
+        child_ids(tree, "g0")
+        tree.remove_item("g0-0")
+        tree.remove_item("g0-1")
+
+        tree.dict_to_state(snapshots[0])  # undo
+
+        assert child_ids(tree, "g0") == ["g0-1", "g0-2", "g0-3"]
+        assert not tree.is_loaded("g3")
+        assert child_ids(tree, "g3") == ["g3-0", "g3-1", "g3-2", "g3-3"]
+        assert source.calls[-1] == ["g3"]
+
+    def test_duplicate_copies_unloaded_descendants(self):
+        source = FakeSource()
+        tree = MTLazyTree("t", "Library", source)
+        copy_id, = tree.duplicate_items(["g3"])
+        assert len(child_ids(tree, copy_id)) == 4
+        assert child_ids(tree)[4] == copy_id
+
+
+@pytest.mark.parametrize("cache_size", [1, 2])
+def test_traversal_is_complete_with_a_tiny_cache(cache_size):
+    tree = MTLazyTree("t", "Library", FakeSource(), cache_size=cache_size)
+    visited = []
+    tree.traverse(lambda item: visited.append(item.id))
+    assert len(visited) == 1 + 5 + 5 * 4
+    assert tree.loaded_group_count <= max(cache_size, 1) + 1
@@ -0,0 +1,98 @@
+import io
+import json
+
+import pytest
+
+from core.impl.tree import MTTree
+from core.impl.tree_stream import MTTreeStreamBuilder, iter_tree_json, read_tree_json, write_tree_json
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType
+
+
+@pytest.fixture
+def tree():
+    tree = MTTree("t", "스트리밍 트리")
+    tree.add_item(MTItemDTO("g", MTItemDomainDTO(name="그룹", node_type=MTNodeType.GROUP), MTItemUIStateDTO()))
+    for n in range(50):
+        tree.add_item(MTItemDTO(f"n{n}", MTItemDomainDTO(name=f"명령 {n} \"quoted\"", parent_id="g",
+                                                         action_data={"x": n, "y": n / 3}), MTItemUIStateDTO()))
+    return tree
+
+
+def streamed(tree):
+    out = io.StringIO()
+    write_tree_json(tree, out, buffer_size=100)
+    return out.getvalue()
+
+
+class TestTreeStream:
+
+    def test_written_json_matches_to_dict(self, tree):
+        assert json.loads(streamed(tree)) == json.loads(json.dumps(tree.to_dict()))
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_read_in_small_chunks_matches_from_dict(self, tree, chunk_size):
+        data = streamed(tree).encode("utf-8")
+        loaded = read_tree_json(io.BytesIO(data), chunk_size=chunk_size)
+        assert loaded.to_dict() == MTTree.from_dict(json.loads(data)).to_dict()
+
+    def test_reads_indented_json_with_keys_in_any_order(self, tree):
+        data = tree.to_dict()
+        reordered = {"items": data["items"], "root_id": data["root_id"], "name": data["name"], "id": data["id"], "extra": [1]}
+        loaded = read_tree_json(io.StringIO(json.dumps(reordered, indent=2)), chunk_size=16)
+        assert (loaded.id, loaded.name, loaded.root_id) == ("t", "스트리밍 트리", tree.root_id)
+        assert set(loaded.items) == set(tree.items)
+
+    def test_items_are_yielded_one_by_one(self, tree):
+        keys = [key for key, _ in iter_tree_json(io.StringIO(streamed(tree)), chunk_size=64)]
+        assert keys[:3] == ["id", "name", "root_id"]
+        assert keys.count("items") == len(tree.items)
+
+    @pytest.mark.parametrize("text", ['{"id": "t", "items": {"a": ', '{"id": "t"} trailing', '[]'])
+    def test_malformed_json_raises(self, text):
+        with pytest.raises(json.JSONDecodeError):
+            read_tree_json(io.StringIO(text), chunk_size=4)
+
+
+def make_group_tree():
+    tree = MTTree("t", "그룹 트리")
+    for item_id, parent_id in [("a", None), ("a1", "a"), ("b", None), ("b1", "b"), ("c", None), ("a2", "a1")]:
+        tree.add_item(MTItemDTO(item_id, MTItemDomainDTO(name=item_id, node_type=MTNodeType.GROUP, parent_id=parent_id),
+                                MTItemUIStateDTO()))
+    return tree
+
+
+def feed_all(builder, data):
+    """(토큰마다 완성된 최상위 그룹, 그때 읽은 아이템 수) 목록"""
+    ready = []
+    for key, value in iter_tree_json(io.StringIO(data)):
+        groups = builder.feed(key, value)
+        if groups:
+            ready.append((groups, builder.item_count))
+    return ready
+
+
+class TestTreeStreamBuilder:
+
+    def test_groups_are_reported_when_complete_and_in_order(self):
+        tree = make_group_tree()
+        builder = MTTreeStreamBuilder()
+        # a2(a의 손자)가 마지막에 오므로 a가 완성될 때까지 b, c도 기다림
+        assert feed_all(builder, streamed(tree)) == [(["a", "b", "c"], 6)]
+        assert builder.finish() == []
+        assert builder.tree.to_dict() == tree.to_dict()
+
+    def test_root_id_after_items(self):
+        tree = make_group_tree()
+        data = tree.to_dict()
+        reordered = {"items": data["items"], "id": data["id"], "name": data["name"], "root_id": data["root_id"]}
+        builder = MTTreeStreamBuilder()
+        assert feed_all(builder, json.dumps(reordered)) == [(["a", "b", "c"], 6)]
+        assert builder.item_count == 6 and builder.finish() == []
+
+    def test_finish_returns_incomplete_groups(self):
+        data = make_group_tree().to_dict()
+        del data["items"]["a2"]
+        data["items"]["b"]["domain_data"]["children_ids"].append("missing")
+        builder = MTTreeStreamBuilder()
+        assert feed_all(builder, json.dumps(data)) == []
+        assert builder.finish() == ["a", "b", "c"]
@@ -0,0 +1,97 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from model.events.impl.event_metrics import MTEventMetrics, MTLatencyHistogram
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+from model.state.impl.tree_state_mgr import MTTreeStateManager
+
+
+class TestMTLatencyHistogram:
+
+    def test_buckets_and_summary(self):
+        histogram = MTLatencyHistogram()
+        for elapsed_ns in (500, 1_500, 3_000, 1_000_000):
+            histogram.add(elapsed_ns)
+
+        summary = histogram.to_dict()
+        assert summary["count"] == 4
+        assert summary["max_us"] == 1000.0
+        assert sum(summary["buckets_us"].values()) == 4
+        assert histogram.percentile_us(0.5) <= histogram.percentile_us(0.99)
+
+
+class TestEventMetrics:
+
+    @pytest.fixture
+    def event_manager(self):
+        return MTTreeEventManager()
+
+    def test_metrics_disabled_by_default(self, event_manager):
+        callback = Mock()
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, callback)
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {"item_id": "a"})
+
+        assert event_manager.metrics is None
+        callback.assert_called_once()
+
+    def test_records_counts_and_callback_latency(self, event_manager):
+        def slow_view(event_type, data):
+            pass
+
+        metrics = event_manager.enable_metrics()
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, slow_view)
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {"item_id": "a"})
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {"item_id": "b"})
+        event_manager.notify(MTTreeEvent.ITEM_REMOVED, {"item_id": "a"})
+
+        snapshot = metrics.snapshot()
+        assert snapshot["event_counts"] == {"item_added": 2, "item_removed": 1}
+        callbacks = snapshot["callbacks"]["item_added"]
+        assert len(callbacks) == 1
+        (name, histogram), = callbacks.items()
+        assert name.endswith("slow_view")
+        assert histogram["count"] == 2
+        assert metrics.slowest_callbacks(1)[0][1] == name
+
+    def test_callback_exception_is_still_recorded(self, event_manager):
+        metrics = event_manager.enable_metrics()
+        event_manager.subscribe(MTTreeEvent.ITEM_MODIFIED, Mock(side_effect=ValueError("boom")))
+
+        with pytest.raises(ValueError):
+            event_manager.notify(MTTreeEvent.ITEM_MODIFIED, {})
+        assert metrics.snapshot()["event_counts"] == {"item_modified": 1}
+
+    def test_disable_metrics(self, event_manager):
+        metrics = event_manager.enable_metrics()
+        event_manager.disable_metrics()
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {})
+
+        assert event_manager.metrics is None
+        assert metrics.snapshot()["event_counts"] == {}
+
+    def test_dump_json(self, event_manager, tmp_path):
+        metrics = event_manager.enable_metrics()
+        metrics.record_payload(MTTreeEvent.TREE_CRUD, 2_000)
+        event_manager.notify(MTTreeEvent.TREE_CRUD, {"tree_data": {}})
+
+        out = tmp_path / "metrics.json"
+        text = metrics.dump_json(str(out))
+        assert json.loads(text) == json.loads(out.read_text(encoding="utf-8"))
+        assert json.loads(text)["payload"]["tree_crud"]["count"] == 1
+
+    def test_state_manager_records_history_operations(self):
+        tree = Mock()
+        tree.to_dict.return_value = {"items": {}}
+        state_manager = MTTreeStateManager(tree)
+        metrics = state_manager.enable_metrics()
+
+        state_manager.new_undo({"items": {"a": {}}})
+        state_manager.undo()
+        state_manager.redo()
+
+        operations = metrics.snapshot()["operations"]
+        assert set(operations) == {"history.new_undo", "history.undo", "history.redo"}
+        assert metrics.snapshot()["event_counts"] == {"tree_crud": 1, "tree_undo": 1, "tree_redo": 1}
@@ -0,0 +1,102 @@
+from multiprocessing import Pipe
+
+import pytest
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType
+from model.events.impl.tree_delta import MTDeltaOp, encode_event
+from model.events.impl.tree_event_bus import (
+    MTTreeEventForwarder, MTTreeReplica, MTTreeSyncError, decode_frame, encode_frame,
+)
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+
+
+def make_dto(item_id, name, parent_id=None, node_type=MTNodeType.INSTRUCTION):
+    return MTItemDTO(
+        item_id=item_id,
+        domain_data=MTItemDomainDTO(name=name, parent_id=parent_id, node_type=node_type),
+        ui_state_data=MTItemUIStateDTO(),
+    )
+
+
+class TestMTTreeEventBus:
+
+    @pytest.fixture
+    def bus(self):
+        editor_end, executor_end = Pipe()
+        forwarder = MTTreeEventForwarder(editor_end)
+        tree = MTTree("tree", "Tree", forwarder)
+        forwarder.bind_tree(tree)
+        replica = MTTreeReplica(executor_end)
+        forwarder.send_snapshot()
+        replica.poll()
+        yield tree, forwarder, replica
+        editor_end.close()
+        executor_end.close()
+
+    def test_replica_follows_edits(self, bus):
+        tree, forwarder, replica = bus
+        tree.add_item(make_dto("g1", "Group", node_type=MTNodeType.GROUP))
+        tree.add_item(make_dto("a", "A", parent_id="g1"))
+        tree.add_item(make_dto("b", "B", parent_id="g1"))
+        tree.add_item(make_dto("c", "C", parent_id="g1"), index=0)
+        tree.move_item("b", None)
+        tree.modify_item("a", make_dto("a", "A renamed", parent_id="g1"))
+        tree.remove_item("c")
+
+        assert replica.poll() > 0
+        assert replica.tree.to_dict()["items"] == tree.to_dict()["items"]
+        assert replica.last_seq == forwarder.seq
+
+    def test_each_mutation_is_one_frame_of_deltas(self, bus):
+        tree, forwarder, replica = bus
+        seq_before = forwarder.seq
+        tree.add_item(make_dto("x", "X"))
+        assert forwarder.seq == seq_before + 1
+        assert replica.poll() == 1
+
+    def test_remove_subtree(self, bus):
+        tree, forwarder, replica = bus
+        tree.add_item(make_dto("g1", "Group", node_type=MTNodeType.GROUP))
+        tree.add_item(make_dto("a", "A", parent_id="g1"))
+        tree.remove_item("g1")
+        replica.poll()
+
+        assert replica.tree.get_item("g1") is None
+        assert replica.tree.get_item("a") is None
+        assert replica.tree.to_dict()["items"] == tree.to_dict()["items"]
+
+    def test_sequence_gap_triggers_resync(self, bus):
+        tree, forwarder, replica = bus
+        tree.add_item(make_dto("a", "A"))
+        replica.poll()
+
+        forwarder._seq += 1  # 프레임 하나가 유실된 상황
+        tree.add_item(make_dto("b", "B"))
+        replica.poll()
+        assert replica.needs_resync
+        assert replica.tree.get_item("b") is None
+
+        tree.add_item(make_dto("c", "C"))  # 다음 flush에서 재동기화 요청을 처리
+        replica.poll()
+        assert not replica.needs_resync
+        assert replica.tree.to_dict()["items"] == tree.to_dict()["items"]
+
+    def test_local_subscribers_still_notified(self, bus):
+        tree, forwarder, replica = bus
+        received = []
+        handler = lambda event_type, data: received.append(event_type)
+        forwarder.subscribe(MTTreeEvent.ITEM_ADDED, handler)
+        forwarder.subscribe(MTTreeEvent.TREE_CRUD, handler)
+        tree.add_item(make_dto("a", "A"))
+        assert received == [MTTreeEvent.ITEM_ADDED, MTTreeEvent.TREE_CRUD]
+
+    def test_tree_crud_is_not_forwarded(self):
+        tree = MTTree("tree", "Tree")
+        assert encode_event(tree, MTTreeEvent.TREE_CRUD, {"tree_data": {}}) is None
+
+    def test_frame_round_trip_and_validation(self):
+        deltas = [(MTDeltaOp.REMOVE, ("a",)), (MTDeltaOp.RESET, ())]
+        assert decode_frame(encode_frame(0, 7, deltas)) == (0, 7, deltas)
+        with pytest.raises(MTTreeSyncError):
+            decode_frame(b"XXXX" + encode_frame(0, 1, deltas)[4:])
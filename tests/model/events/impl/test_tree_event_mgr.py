@@ -1,8 +1,13 @@
+import gc
+import weakref
+
 import pytest
 from unittest.mock import Mock, call
 
-from src.model.events.impl.tree_event_mgr import MTTreeEventManager
-from src.model.events.interfaces.base_tree_event_mgr import MTTreeEvent, TreeEventCallback
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent, TreeEventCallback, MTEventPriority, MTEventResult
 
 class TestMTTreeEventManager:
 
@@ -121,7 +126,7 @@ class TestMTTreeEventManager:
         event_manager.unsubscribe(MTTreeEvent.ITEM_MOVED, mock_callback_two) # 존재하지 않는 콜백 구독 해제
         
         # 구독자 목록은 변경되지 않아야 함
-        assert event_manager._subscribers[MTTreeEvent.ITEM_MOVED] == initial_subscribers
+        assert list(event_manager._subscribers[MTTreeEvent.ITEM_MOVED]) == initial_subscribers
         assert len(event_manager._subscribers[MTTreeEvent.ITEM_MOVED]) == 1
 
 
@@ -135,14 +140,140 @@ class TestMTTreeEventManager:
         """Test that subscribing multiple times and unsubscribing works as expected."""
         event_manager.subscribe(MTTreeEvent.TREE_RESET, mock_callback_one)
         event_manager.subscribe(MTTreeEvent.TREE_RESET, mock_callback_one) # 동일 콜백 다시 구독
-        assert len(event_manager._subscribers[MTTreeEvent.TREE_RESET]) == 2 # 중복 허용 (현재 구현)
+        assert len(event_manager._subscribers[MTTreeEvent.TREE_RESET]) == 1 # 중복 구독은 한 번만 등록
 
         event_manager.unsubscribe(MTTreeEvent.TREE_RESET, mock_callback_one)
-        # 현재 unsubscribe는 일치하는 모든 콜백을 제거
         assert len(event_manager._subscribers[MTTreeEvent.TREE_RESET]) == 0
         
         # 다시 구독 및 알림 테스트
         event_manager.subscribe(MTTreeEvent.TREE_RESET, mock_callback_one)
         event_data = {"tree_id": "new_tree"}
         event_manager.notify(MTTreeEvent.TREE_RESET, event_data)
-        mock_callback_one.assert_called_once_with(MTTreeEvent.TREE_RESET, event_data) 
\ No newline at end of file
+        mock_callback_one.assert_called_once_with(MTTreeEvent.TREE_RESET, event_data) 
+
+    def test_notify_preserves_subscription_order(self, event_manager):
+        """Test that subscribers are notified in subscription order."""
+        calls = []
+        callbacks = [lambda e, d, i=i: calls.append(i) for i in range(5)]
+        for callback in callbacks:
+            event_manager.subscribe(MTTreeEvent.ITEM_ADDED, callback)
+        event_manager.unsubscribe(MTTreeEvent.ITEM_ADDED, callbacks[2])
+
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {})
+        assert calls == [0, 1, 3, 4]
+
+    def test_unsubscribe_during_notify(self, event_manager, mock_callback_two):
+        """Test that a callback may unsubscribe itself while being notified."""
+        def once(event_type, data):
+            event_manager.unsubscribe(event_type, once)
+
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, once)
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, mock_callback_two)
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {})
+
+        mock_callback_two.assert_called_once()
+        assert once not in event_manager._subscribers[MTTreeEvent.ITEM_ADDED]
+
+    def test_bound_method_subscriber_does_not_leak(self, event_manager):
+        """Test that a bound-method subscriber is released once its owner is dropped."""
+        class View:
+            def __init__(self):
+                self.received = []
+
+            def on_event(self, event_type, data):
+                self.received.append(data)
+
+        view = View()
+        event_manager.subscribe(MTTreeEvent.TREE_CRUD, view.on_event)
+        event_manager.notify(MTTreeEvent.TREE_CRUD, {"n": 1})
+        assert view.received == [{"n": 1}]
+
+        view_ref = weakref.ref(view)
+        del view
+        gc.collect()
+
+        assert view_ref() is None
+        assert len(event_manager._subscribers[MTTreeEvent.TREE_CRUD]) == 0
+        assert not event_manager._subscribers[MTTreeEvent.TREE_CRUD]
+        event_manager.notify(MTTreeEvent.TREE_CRUD, {"n": 2})
+
+    def test_weak_function_subscriber(self, event_manager):
+        """Test that plain callables can opt in to weak references."""
+        def handler(event_type, data):
+            pass
+
+        event_manager.subscribe(MTTreeEvent.ITEM_REMOVED, handler, weak=True)
+        assert handler in event_manager._subscribers[MTTreeEvent.ITEM_REMOVED]
+
+        del handler
+        gc.collect()
+        assert len(event_manager._subscribers[MTTreeEvent.ITEM_REMOVED]) == 0
+
+
+class TestEventPriorityAndValidation:
+
+    @pytest.fixture
+    def event_manager(self):
+        return MTTreeEventManager()
+
+    def test_higher_priority_runs_first(self, event_manager):
+        calls = []
+        ui = lambda e, d: calls.append("ui")
+        index = lambda e, d: calls.append("index")
+        cache = lambda e, d: calls.append("cache")
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, ui, priority=MTEventPriority.LOW)
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, cache, priority=MTEventPriority.HIGH)
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, index, priority=MTEventPriority.HIGHEST)
+
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {})
+        assert calls == ["index", "cache", "ui"]
+
+    def test_consumed_stops_propagation(self, event_manager):
+        later = Mock()
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, lambda e, d: MTEventResult.CONSUMED, priority=MTEventPriority.HIGH)
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, later)
+
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {})
+        later.assert_not_called()
+
+    def test_consumed_with_metrics_enabled(self, event_manager):
+        later = Mock()
+        event_manager.enable_metrics()
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, lambda e, d: MTEventResult.CONSUMED)
+        event_manager.subscribe(MTTreeEvent.ITEM_ADDED, later)
+
+        event_manager.notify(MTTreeEvent.ITEM_ADDED, {})
+        later.assert_not_called()
+
+    def test_validator_vetoes_mutation_before_snapshot(self, event_manager):
+        crud = Mock()
+        event_manager.subscribe(MTTreeEvent.TREE_CRUD, crud)
+        event_manager.add_validator(
+            MTTreeEvent.ITEM_ADDED, lambda e, d: not d["item_dto"].domain_data.name.startswith("locked"))
+        tree = MTTree("tree", "Tree", event_manager)
+
+        def dto(item_id, name):
+            return MTItemDTO(item_id=item_id, domain_data=MTItemDomainDTO(name=name), ui_state_data=MTItemUIStateDTO())
+
+        assert tree.add_item(dto("a", "locked item")) is None
+        assert tree.get_item("a") is None
+        crud.assert_not_called()
+
+        assert tree.add_item(dto("b", "free item")) == "b"
+        crud.assert_called_once()
+
+    def test_validator_vetoes_subtree_removal_atomically(self, event_manager):
+        tree = MTTree("tree", "Tree", event_manager)
+        group = MTItemDTO(item_id="g", domain_data=MTItemDomainDTO(name="g"), ui_state_data=MTItemUIStateDTO())
+        child = MTItemDTO(item_id="c", domain_data=MTItemDomainDTO(name="c", parent_id="g"), ui_state_data=MTItemUIStateDTO())
+        tree.add_item(group)
+        tree.add_item(child)
+        validator = Mock(return_value=False)
+        event_manager.add_validator(MTTreeEvent.ITEM_REMOVED, validator)
+
+        assert tree.remove_item("g") is False
+        assert tree.get_item("g") is not None and tree.get_item("c") is not None
+
+        event_manager.remove_validator(MTTreeEvent.ITEM_REMOVED, validator)
+        assert tree.remove_item("g") is True
+        assert tree.get_item("c") is None
@@ -0,0 +1,49 @@
+import pytest
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.store.db.impl.sqlite_tree_repo import SQLiteTreeRepository
+from model.store.file.impl.file_tree_repo import MTFileTreeRepository
+
+
+def _make_dto(item_id, parent_id=None, node_type=MTNodeType.INSTRUCTION, name=None, ui_state=None, **domain):
+    return MTItemDTO(
+        item_id=item_id,
+        domain_data=MTItemDomainDTO(name=name if name is not None else item_id, node_type=node_type,
+                                    parent_id=parent_id, **domain),
+        ui_state_data=ui_state if ui_state is not None else MTItemUIStateDTO(),
+    )
+
+
+def _make_tree(tree_id="t", name="Tree", count=0, dtos=()):
+    tree = MTTree(tree_id, name, MTTreeEventManager())
+    for dto in dtos:
+        tree.add_item(dto)
+    for n in range(count):
+        tree.add_item(_make_dto(f"i{n}", name=f"아이템 {n}"))
+    return tree
+
+
+@pytest.fixture
+def make_dto():
+    """make_dto(item_id, parent_id=None, node_type=INSTRUCTION, name=item_id, ui_state=None, **domain)"""
+    return _make_dto
+
+
+@pytest.fixture
+def make_tree():
+    """make_tree(tree_id="t", name="Tree", count=0, dtos=()): dtos를 차례로 추가한 뒤 최상위 아이템 i0..을 count개 덧붙입니다."""
+    return _make_tree
+
+
+@pytest.fixture
+def file_repo(tmp_path):
+    return MTFileTreeRepository(str(tmp_path))
+
+
+@pytest.fixture
+def sqlite_repo(tmp_path):
+    repo = SQLiteTreeRepository(str(tmp_path / "trees.db"))
+    yield repo
+    repo.close()
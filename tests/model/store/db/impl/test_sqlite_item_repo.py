@@ -0,0 +1,90 @@
+import pytest
+
+from core.interfaces.base_item_data import MTNodeType
+from model.state.impl.tree_state_mgr import MTTreeStateManager
+from model.store.db.impl.sqlite_item_repo import SQLiteItemTreeRepository
+
+
+def child_names(tree, parent_id=None):
+    return [item.get_property("name") for item in tree.get_children(parent_id)]
+
+
+@pytest.fixture
+def tree(make_tree, make_dto):
+    dtos = []
+    for group_id in ("g1", "g2"):
+        dtos.append(make_dto(group_id, node_type=MTNodeType.GROUP, action_data={"x": 1}))
+        dtos += [make_dto(f"{group_id}-{n}", parent_id=group_id, action_data={"x": 1}) for n in range(3)]
+    return make_tree(dtos=[*dtos, make_dto("b", action_data={"x": 1})])
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return SQLiteItemTreeRepository(str(tmp_path / "items.db"))
+
+
+class TestSQLiteItemTreeRepository:
+
+    def test_round_trip_and_list(self, repo, tree):
+        assert repo.save(tree) == "t"
+        assert repo.load("t").to_dict() == tree.to_dict()
+        assert repo.list_trees() == {"t": "Tree"}
+        assert repo.conn.execute("SELECT count(*) FROM tree_items").fetchone()[0] == 9
+        assert repo.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert repo.load("missing") is None
+        assert repo.delete("t") is True and repo.list_trees() == {}
+
+    def test_tracked_save_writes_only_changed_rows(self, repo, tree, make_dto):
+        repo.attach_tracker(tree, tree._event_manager)
+        changes = repo.conn.total_changes
+        tree.modify_item("g1-1", make_dto("g1-1", parent_id="g1", name="renamed"))
+        tree.add_item(make_dto("new", parent_id="g2", action_data={"x": 1}), 0)
+        repo.save(tree)
+        # 트리 이름 1 + 수정 1 + 추가 1 + 같은 부모(g2)의 형제 순서 3
+        assert repo.conn.total_changes - changes == 6
+        assert repo.load("t").to_dict() == tree.to_dict()
+
+    def test_moves_and_removals(self, repo, tree):
+        repo.save(tree)
+        repo.attach_tracker(tree, tree._event_manager)
+        tree.move_item("g1-2", "g2", 1)
+        tree.remove_item("g1")
+        tree.move_item("b", "g2", 0)
+        repo.save(tree)
+        loaded = repo.load("t")
+        assert child_names(loaded) == ["g2"]
+        assert child_names(loaded, "g2") == ["b", "g2-0", "g1-2", "g2-1", "g2-2"]
+        assert repo.conn.execute("SELECT count(*) FROM tree_items").fetchone()[0] == 6
+
+    def test_removed_then_re_added_id_is_kept(self, repo, tree):
+        repo.attach_tracker(tree, tree._event_manager)
+        subtree = [item.to_dto() for item in (tree.get_item(i) for i in ("g1", "g1-0", "g1-1", "g1-2"))]
+        tree.remove_item("g1")
+        tree.add_subtree(subtree)
+        repo.save(tree)
+        assert child_names(repo.load("t")) == ["g2", "b", "g1"]
+        assert child_names(repo.load("t"), "g1") == ["g1-0", "g1-1", "g1-2"]
+
+    def test_undo_falls_back_to_full_save(self, repo, tree):
+        state_manager = MTTreeStateManager(tree)
+        state_manager.set_initial_state(tree)
+        tracker = repo.attach_tracker(tree, tree._event_manager, state_manager)
+        tree.remove_item("b")
+        state_manager.new_undo(tree.to_dict())
+        tree.dict_to_state(state_manager.undo())
+        assert tracker.needs_full_save
+        repo.save(tree)
+        assert not tracker.needs_full_save and tracker.pending_count == 0
+        assert repo.load("t").to_dict() == tree.to_dict()
+
+    def test_load_subtree(self, repo, tree, make_tree):
+        repo.save(tree)
+        dtos = repo.load_subtree("t", "g2")
+        assert [dto.item_id for dto in dtos] == ["g2", "g2-0", "g2-1", "g2-2"]
+        assert dtos[0].domain_data.children_ids == ["g2-0", "g2-1", "g2-2"]
+        assert dtos[1].domain_data.action_data == {"x": 1}
+        assert repo.load_subtree("t", "missing") == []
+
+        copy = make_tree("c", "Copy")
+        copy.add_subtree(dtos)
+        assert child_names(copy, "g2") == ["g2-0", "g2-1", "g2-2"]
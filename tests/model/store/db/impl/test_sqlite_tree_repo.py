@@ -0,0 +1,39 @@
+import json
+
+from model.store.db.impl.sqlite_tree_repo import SQLiteTreeRepository
+
+
+class TestSQLiteTreeRepository:
+
+    def test_round_trip(self, sqlite_repo, make_tree):
+        tree = make_tree(count=30)
+        assert sqlite_repo.save(tree) == "t"
+        assert sqlite_repo.load("t").to_dict() == tree.to_dict()
+        assert sqlite_repo.load("missing") is None
+
+    def test_replace_and_list(self, sqlite_repo, make_tree):
+        sqlite_repo.save(make_tree(name="First", count=30))
+        sqlite_repo.save(make_tree(name="Second", count=3))
+        sqlite_repo.save(make_tree("u", "Other", count=30))
+        assert sqlite_repo.list_trees() == {"t": "Second", "u": "Other"}
+        assert len(sqlite_repo.load("t").items) == 4
+        assert sqlite_repo.delete("u") is True and sqlite_repo.list_trees() == {"t": "Second"}
+
+    def test_reads_rows_written_as_text(self, sqlite_repo, make_tree):
+        tree = make_tree(count=30)
+        with sqlite_repo.conn:
+            sqlite_repo.conn.execute("INSERT INTO tree_data (id, data) VALUES (?, ?)",
+                              ("old", json.dumps(tree.to_dict(), ensure_ascii=False, indent=2)))
+        assert sqlite_repo.load("old").to_dict() == tree.to_dict()
+        assert sqlite_repo.list_trees()["old"] == "Tree"
+
+    def test_rows_are_compressed_by_default(self, sqlite_repo, tmp_path, make_tree):
+        tree = make_tree(count=300)
+        sqlite_repo.save(tree)
+        data = sqlite_repo.conn.execute("SELECT data FROM tree_data WHERE id = 't'").fetchone()[0]
+        assert data[:1] == b"\x01" and len(data) * 5 < len(json.dumps(tree.to_dict(), ensure_ascii=False).encode())
+        assert sqlite_repo.load("t").to_dict() == tree.to_dict()
+        assert sqlite_repo.list_trees() == {"t": "Tree"}
+        # 압축 설정을 바꿔도 이미 저장된 행을 읽음
+        plain = SQLiteTreeRepository(str(tmp_path / "trees.db"), compression="none")
+        assert plain.load("t").to_dict() == tree.to_dict()
@@ -0,0 +1,186 @@
+import threading
+
+import pytest
+
+from model.store.db.connection_pool import MTConnectionPool, MTPoolClosedError, MTPoolTimeoutError
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, params=None):
+        if self.conn.broken:
+            raise ConnectionError("server closed the connection")
+        self.conn.executed.append(sql)
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """가짜 DB-API 연결"""
+
+    def __init__(self, n):
+        self.n = n
+        self.closed = False
+        self.broken = False
+        self.executed = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        if self.broken:
+            raise ConnectionError("server closed the connection")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def opened():
+    return []
+
+
+@pytest.fixture
+def make_pool(clock, opened):
+    def connect():
+        opened.append(FakeConnection(len(opened)))
+        return opened[-1]
+
+    def make(**kwargs):
+        kwargs.setdefault("health_check_after", None)
+        return MTConnectionPool(connect, clock=clock, **kwargs)
+
+    return make
+
+
+class TestConnectionPool:
+
+    def test_reuses_connection(self, make_pool, opened):
+        pool = make_pool()
+        for _ in range(3):
+            with pool.connection() as conn:
+                assert conn is opened[0]
+        assert len(opened) == 1 and opened[0].rollbacks == 3  # 반납할 때마다 정리
+        stats = pool.stats()
+        assert (stats["size"], stats["idle"], stats["in_use"], stats["created"]) == (1, 1, 0, 1)
+        assert stats["wait"]["count"] == 3 and stats["use"]["count"] == 3
+
+    def test_blocks_until_connection_is_returned(self, make_pool, opened):
+        pool = make_pool(max_size=1, acquire_timeout=5)
+        returned = threading.Event()
+        with pool.connection() as first:
+            def borrow():
+                with pool.connection() as conn:
+                    assert conn is first
+                    returned.set()
+
+            thread = threading.Thread(target=borrow)
+            thread.start()
+            assert not returned.wait(0.05)
+        thread.join(5)
+        assert returned.is_set() and len(opened) == 1
+
+    def test_timeout_when_exhausted(self, make_pool):
+        pool = make_pool(max_size=2)
+        with pool.connection(), pool.connection():
+            with pytest.raises(MTPoolTimeoutError):
+                with pool.connection(timeout=0):
+                    pass
+        assert pool.stats()["timeouts"] == 1
+        with pool.connection(timeout=0):  # 반납 후에는 바로 빌림
+            pass
+
+    def test_expired_connection_is_replaced(self, make_pool, opened, clock):
+        pool = make_pool(max_lifetime=60)
+        with pool.connection():
+            pass
+        clock.now = 61
+        with pool.connection() as conn:
+            assert conn is opened[1]
+        assert opened[0].closed and pool.size == 1
+        clock.now = 200  # 빌려준 동안 수명이 다하면 반납할 때 닫음
+        with pool.connection() as conn:
+            clock.now = 300
+        assert conn.closed and pool.size == 0 and pool.stats()["expired"] == 3
+
+    def test_health_check_after_idle(self, make_pool, opened, clock):
+        pool = make_pool(health_check_after=30)
+        with pool.connection():
+            pass
+        clock.now = 10
+        with pool.connection():
+            pass
+        assert opened[0].executed == []  # 잠깐 쉰 연결은 확인하지 않음
+        clock.now = 50
+        with pool.connection():
+            pass
+        assert opened[0].executed == ["SELECT 1"]
+        opened[0].broken = True
+        clock.now = 100
+        with pool.connection() as conn:
+            assert conn is opened[1]
+        assert opened[0].closed and pool.size == 1 and pool.stats()["health_check_failed"] == 1
+
+    def test_broken_connection_is_discarded_on_release(self, make_pool, opened):
+        pool = make_pool()
+        with pool.connection() as conn:
+            conn.broken = True
+        with pool.connection() as conn:
+            conn.close()
+        assert pool.size == 0 and pool.stats()["discarded"] == 2
+        with pool.connection() as conn:
+            assert conn is opened[2]
+
+    def test_failed_connect_frees_slot(self, clock):
+        calls = []
+
+        def connect():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ConnectionError("refused")
+            return FakeConnection(len(calls))
+
+        pool = MTConnectionPool(connect, max_size=1, clock=clock)
+        with pytest.raises(ConnectionError):
+            with pool.connection():
+                pass
+        with pool.connection(timeout=0):
+            pass
+        assert pool.size == 1
+
+    def test_close(self, make_pool, opened):
+        pool = make_pool()
+        with pool.connection():
+            with pool.connection() as idle:
+                pass
+            pool.close()
+            assert opened[0].closed is False and idle.closed  # 빌려준 연결은 반납할 때 닫음
+        assert opened[0].closed and pool.size == 0
+        with pytest.raises(MTPoolClosedError):
+            with pool.connection():
+                pass
+
+    def test_invalid_size(self, make_pool):
+        with pytest.raises(ValueError):
+            make_pool(max_size=0)
@@ -0,0 +1,84 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model.store.db.sqlite_connection import MTSQLiteConnectionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = MTSQLiteConnectionManager(str(tmp_path / "db.sqlite"), max_readers=2, busy_timeout=2.0)
+    with manager.write() as conn:
+        conn.execute("CREATE TABLE t (v INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+    yield manager
+    manager.close()
+
+
+class TestSQLiteConnectionManager:
+
+    def test_pragmas(self, manager):
+        with manager.read() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 2000
+
+    def test_readers_do_not_wait_for_open_write(self, manager):
+        in_write, release = threading.Event(), threading.Event()
+
+        def writer():
+            with manager.write() as conn:
+                conn.execute("INSERT INTO t VALUES (2)")
+                in_write.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            assert in_write.wait(5)
+            with ThreadPoolExecutor(4) as executor:
+                counts = list(executor.map(lambda _: self._count(manager), range(8)))
+            assert counts == [1] * 8  # 커밋 전 내용은 보이지 않음
+            assert manager.reader_count <= 2
+        finally:
+            release.set()
+            thread.join()
+        assert self._count(manager) == 2
+
+    def test_read_inside_write_sees_own_changes(self, manager):
+        with manager.write() as conn:
+            conn.execute("INSERT INTO t VALUES (2)")
+            assert self._count(manager) == 2
+            with manager.write():  # 중첩 쓰기는 바깥에서 한 번만 커밋
+                conn.execute("INSERT INTO t VALUES (3)")
+        assert self._count(manager) == 3
+
+    def test_failed_write_is_rolled_back(self, manager):
+        with pytest.raises(ZeroDivisionError):
+            with manager.write() as conn:
+                conn.execute("INSERT INTO t VALUES (2)")
+                1 / 0
+        assert self._count(manager) == 1
+
+    def test_memory_database_uses_one_connection(self):
+        manager = MTSQLiteConnectionManager(":memory:")
+        with manager.write() as conn:
+            conn.execute("CREATE TABLE t (v INTEGER)")
+        with manager.read() as conn:
+            assert conn is manager.writer and conn.execute("SELECT count(*) FROM t").fetchone()[0] == 0
+        manager.close()
+
+    @staticmethod
+    def _count(manager):
+        with manager.read() as conn:
+            return conn.execute("SELECT count(*) FROM t").fetchone()[0]
+
+
+def test_repository_is_shared_across_threads(sqlite_repo, make_tree):
+    trees = [make_tree(f"t{n}", f"Tree t{n}", count=20) for n in range(8)]
+    with ThreadPoolExecutor(4) as executor:
+        assert sorted(executor.map(sqlite_repo.save, trees)) == [tree.id for tree in trees]
+        loaded = list(executor.map(sqlite_repo.load, [tree.id for tree in trees]))
+    assert [tree.to_dict() for tree in loaded] == [tree.to_dict() for tree in trees]
+    assert len(sqlite_repo.list_trees()) == 8
@@ -0,0 +1,71 @@
+import pytest
+
+import core.exceptions as exc
+from core.interfaces.base_item_data import MTNodeType
+from model.store.db.impl.sqlite_tree_repo import SQLiteTreeRepository
+from model.store.db.sqlite_search import to_match_query
+from model.store.file.impl.file_tree_repo import MTFileTreeRepository
+from model.store.repo.interfaces.base_search import MTSearchHit
+from model.store.store_manager import StoreManager
+
+
+@pytest.fixture
+def make_search_tree(make_tree, make_dto):
+    """make_search_tree(tree_id, *(item_id, name, action, action_data)): "로그인 단계" 그룹 아래에 키보드 명령을 둔 트리"""
+    def make(tree_id, *instructions):
+        dtos = [make_dto("g", node_type=MTNodeType.GROUP, name="로그인 단계")]
+        dtos += [make_dto(item_id, "g", name=name, device="keyboard", action=action, action_data=action_data)
+                 for item_id, name, action, action_data in instructions]
+        return make_tree(tree_id, f"Tree {tree_id}", dtos=dtos)
+
+    return make
+
+
+@pytest.fixture
+def repo(sqlite_repo, make_search_tree):
+    sqlite_repo.save(make_search_tree("a", ("a1", "아이디 입력", "type", {"text": "admin"}),
+                                      ("a2", "Click login button", "click", {"x": 10, "y": 20})))
+    sqlite_repo.save(make_search_tree("b", ("b1", "Open settings", "hotkey", {"keys": ["ctrl", "comma"]})))
+    return sqlite_repo
+
+
+class TestSQLiteSearch:
+
+    def test_finds_items_by_name_type_and_action(self, repo, monkeypatch):
+        monkeypatch.setattr(repo, "load", lambda tree_id: pytest.fail("검색은 트리를 불러오지 않아야 함"))
+        assert [(hit.tree_id, hit.item_id) for hit in repo.search("login")] == [("a", "a2")]
+        assert repo.search("아이디")[0] == MTSearchHit("a", "a1", "[아이디] 입력")
+        assert repo.search("admin")[0].item_id == "a1"  # action_data의 문자열
+        assert repo.search("ctrl")[0].item_id == "b1"
+        assert {hit.item_id for hit in repo.search("group")} == {"g"}
+        assert len(repo.search("instruction", limit=2)) == 2
+        assert repo.search("sett")[0].item_id == "b1"  # 앞부분 일치
+        assert repo.search("missing") == [] and repo.search("  ") == []
+
+    def test_index_follows_save_and_delete(self, repo, make_search_tree):
+        repo.save(make_search_tree("a", ("a3", "Close window", "hotkey", {})))
+        assert repo.search("login") == []
+        assert repo.search("close")[0] == MTSearchHit("a", "a3", "[Close] window")
+        assert repo.delete("b") is True
+        assert repo.search("settings") == []
+
+    def test_existing_trees_are_indexed_once(self, repo, tmp_path):
+        repo.conn.execute("DROP TABLE tree_search")
+        repo.conn.execute("DROP TABLE tree_search_items")
+        repo.close()
+        reopened = SQLiteTreeRepository(str(tmp_path / "trees.db"))
+        assert reopened.search("settings")[0].tree_id == "b"
+        reopened.close()
+
+    def test_query_syntax_is_escaped(self, repo):
+        assert to_match_query('say "hi" OR') == '"say"* """hi"""* "OR"*'
+        assert repo.search('login" AND (') == []
+
+
+def test_store_manager_search(repo, tmp_path):
+    assert StoreManager(repo).search("login", limit=5) == [MTSearchHit("a", "a2", "Click [login] button")]
+    with pytest.raises(exc.MTSearchUnavailableError):
+        StoreManager(MTFileTreeRepository(str(tmp_path / "files"))).search("login")
+    repo.search_enabled = False  # FTS5 없이 빌드된 SQLite
+    with pytest.raises(exc.MTSearchUnavailableError):
+        StoreManager(repo).search("login")
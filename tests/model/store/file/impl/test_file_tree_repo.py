@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+from model.store.file.impl import file_tree_repo
+from model.store.file.impl.file_tree_repo import MANIFEST_FILE, MTFileTreeRepository
+
+
+@pytest.fixture
+def no_tree_loading(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("목록 조회 중 트리를 만들면 안 됨")
+    monkeypatch.setattr(file_tree_repo.MTTree, "from_dict", fail)
+
+
+class TestMTFileTreeRepository:
+
+    def test_save_writes_json_file_and_round_trips(self, file_repo, tmp_path, make_tree):
+        file_repo.save(make_tree("t1", "First", count=2))
+        assert (tmp_path / "t1.json").is_file()
+        assert file_repo.list_trees() == {"t1": "First"}
+        assert file_repo.load("t1").name == "First"
+
+    def test_manifest_records_summary(self, file_repo, tmp_path, make_tree):
+        file_repo.save(make_tree("t1", "First", count=3))
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text(encoding="utf-8"))
+        entry = manifest["trees"]["t1"]
+        assert entry["item_count"] == 3
+        assert entry["size"] == (tmp_path / "t1.json").stat().st_size
+        assert file_repo.list_tree_info()["t1"]["sha256"] == entry["sha256"]
+
+    def test_listing_uses_manifest_without_building_trees(self, file_repo, tmp_path, no_tree_loading, make_tree):
+        MTFileTreeRepository(str(tmp_path)).save(make_tree("t1", "First", count=2))
+        assert MTFileTreeRepository(str(tmp_path)).list_trees() == {"t1": "First"}
+
+    def test_only_changed_files_are_rescanned(self, file_repo, tmp_path, monkeypatch, make_tree):
+        file_repo.save(make_tree("t1", "First", count=2))
+        file_repo.save(make_tree("t2", "Second", count=2))
+        other = make_tree("t2", "Renamed elsewhere", count=5).to_dict()
+        path = tmp_path / "t2.json"
+        path.write_text(json.dumps(other), encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+
+        scanned = []
+        original = MTFileTreeRepository._scan_file
+        monkeypatch.setattr(MTFileTreeRepository, "_scan_file",
+                            lambda self, tree_id, file_path: scanned.append(tree_id) or original(self, tree_id, file_path))
+        info = file_repo.list_tree_info()
+        assert scanned == ["t2"]
+        assert info["t2"]["name"] == "Renamed elsewhere" and info["t2"]["item_count"] == 5
+
+    def test_malformed_file_is_listed_as_failed(self, file_repo, tmp_path, make_tree):
+        file_repo.save(make_tree("t1", "First", count=2))
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+        info = file_repo.list_tree_info()
+        assert info["t1"]["name"] == "First"
+        assert info["bad"]["name"] == "Failed to load bad" and info["bad"]["item_count"] == 0
+
+    def test_unreadable_file_is_skipped(self, file_repo, tmp_path, monkeypatch, make_tree):
+        file_repo.save(make_tree("t1", "First", count=2))
+        file_repo.save(make_tree("t2", "Second", count=2))
+        os.utime(tmp_path / "t2.json", ns=(1, 1))  # t2만 다시 읽음
+
+        def unreadable(file):
+            raise PermissionError("t2.json")
+        monkeypatch.setattr(file_tree_repo, "open_decompressed", unreadable)
+        assert file_repo.list_trees() == {"t1": "First"}
+
+    def test_delete_and_external_removal_update_manifest(self, file_repo, tmp_path, make_tree):
+        file_repo.save(make_tree("t1", "First", count=2))
+        file_repo.save(make_tree("t2", "Second", count=2))
+        assert file_repo.delete("t1") is True
+        (tmp_path / "t2.json").unlink()
+        assert file_repo.list_trees() == {}
+        assert json.loads((tmp_path / MANIFEST_FILE).read_text(encoding="utf-8"))["trees"] == {}
+
+    def test_legacy_files_without_extension_are_listed_and_replaced(self, file_repo, tmp_path, make_tree):
+        (tmp_path / "old").write_text(json.dumps(make_tree("old", "Old", count=2).to_dict()), encoding="utf-8")
+        assert file_repo.list_trees() == {"old": "Old"}
+        assert file_repo.load("old").name == "Old"
+
+        file_repo.save(make_tree("old", "Old v2", count=2))
+        assert not (tmp_path / "old").exists()
+        assert file_repo.list_trees() == {"old": "Old v2"}
+
+    def test_compressed_files_are_detected_by_header(self, tmp_path, make_tree):
+        tree = make_tree("t1", "Packed", count=200)
+        MTFileTreeRepository(str(tmp_path), compression="lzma").save(tree)
+        data = (tmp_path / "t1.json").read_bytes()
+        assert data[:1] == b"\x02" and len(data) * 5 < len(json.dumps(tree.to_dict()))
+
+        repo = MTFileTreeRepository(str(tmp_path))  # 압축 설정과 관계없이 읽음
+        assert repo.list_tree_info()["t1"]["item_count"] == 200
+        assert repo.load("t1").to_dict() == tree.to_dict()
+
+    def test_binary_format_cannot_be_compressed(self, tmp_path):
+        with pytest.raises(ValueError):
+            MTFileTreeRepository(str(tmp_path), file_format="binary", compression="zlib")
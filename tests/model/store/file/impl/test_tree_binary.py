@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from core.interfaces.base_item_data import MTDevice, MTItemUIStateDTO, MTNodeType
+from model.store.file.impl.file_tree_repo import MTFileTreeRepository
+from model.store.file.impl.tree_binary import MTBinaryFormatError, MTBinaryTreeReader, decode_tree, encode_tree
+
+
+@pytest.fixture
+def tree(make_tree, make_dto):
+    def dto(item_id, parent_id=None, node_type=MTNodeType.INSTRUCTION, **domain):
+        return make_dto(item_id, parent_id, node_type, name=f"이름 {item_id}", ui_state=MTItemUIStateDTO(icon="icon.png"),
+                        **domain)
+
+    return make_tree("t", "Binary Tree", dtos=[
+        dto("g", node_type=MTNodeType.GROUP),
+        dto("click", parent_id="g", device="mouse",
+            action_data={"x": 10, "y": -2.5, "buttons": ["left"], "big": 1 << 70, "hold": None}),
+        dto("type", parent_id="g", device="keyboard", action="type"),
+        *(dto(f"n{n}") for n in range(20)),
+    ])
+
+
+def json_round_trip(tree_data):
+    return json.loads(json.dumps(tree_data))
+
+
+class TestBinaryFormat:
+
+    def test_round_trip_matches_json(self, tree):
+        tree_data = tree.to_dict()
+        assert decode_tree(encode_tree(tree_data)) == json_round_trip(tree_data)
+
+    def test_values_outside_the_code_tables_are_kept(self, tree):
+        tree_data = json_round_trip(tree.to_dict())
+        item = tree_data["items"]["n0"]
+        item["domain_data"].update(node_type="macro", device="pen", parent_id="elsewhere", children_ids=["ghost"], note="x")
+        item["ui_state_data"]["badge"] = 3
+        assert decode_tree(encode_tree(tree_data)) == tree_data
+
+    def test_enum_values_are_stored_like_json_export(self, tree):
+        tree_data = tree.to_dict()
+        tree_data["items"]["click"]["domain_data"]["device"] = MTDevice.MOUSE
+        assert decode_tree(encode_tree(tree_data))["items"]["click"]["domain_data"]["device"] == "mouse"
+
+    def test_reader_materializes_only_touched_nodes(self, tree, tmp_path):
+        path = tmp_path / "t.mtb"
+        path.write_bytes(encode_tree(tree.to_dict()))
+        with MTBinaryTreeReader(str(path)) as reader:
+            assert (reader.id, reader.name, len(reader)) == ("t", "Binary Tree", len(tree.items))
+            assert reader.children_ids("g") == ["click", "type"]
+            assert reader.items["type"]["domain_data"]["action"] == "type"
+            assert "missing" not in reader.items
+            assert reader.items.materialized == 1
+            assert list(reader.items)[:2] == list(tree.items)[:2]
+
+    def test_not_a_binary_file(self, tmp_path):
+        path = tmp_path / "t.mtb"
+        path.write_bytes(b"{}")
+        with pytest.raises(MTBinaryFormatError):
+            MTBinaryTreeReader(str(path))
+
+
+class TestBinaryRepository:
+
+    def test_selectable_format_round_trips(self, tree, tmp_path):
+        repo = MTFileTreeRepository(str(tmp_path), file_format="binary")
+        repo.save(tree)
+        assert (tmp_path / "t.mtb").is_file() and not (tmp_path / "t.json").exists()
+        assert repo.list_tree_info()["t"]["item_count"] == len(tree.items) - 1
+        assert repo.load("t").to_dict() == json_round_trip(tree.to_dict())
+
+    def test_switching_format_replaces_the_other_file(self, tree, tmp_path):
+        MTFileTreeRepository(str(tmp_path)).save(tree)
+        repo = MTFileTreeRepository(str(tmp_path), file_format="binary")
+        assert repo.load("t").name == "Binary Tree"
+        repo.save(tree)
+        assert sorted(path.name for path in tmp_path.iterdir() if path.suffix in (".json", ".mtb")) == ["_manifest.json", "t.mtb"]
+
+    def test_open_tree_defers_to_load_while_journal_has_records(self, tree, tmp_path):
+        repo = MTFileTreeRepository(str(tmp_path), file_format="binary")
+        repo.save(tree)
+        with repo.open_tree("t") as reader:
+            assert reader.items["g"]["domain_data"]["children_ids"] == ["click", "type"]
+
+        repo.attach_journal(tree, tree._event_manager)
+        tree.remove_item("n0")
+        repo.save(tree)
+        assert repo.open_tree("t") is None
+        assert "n0" not in repo.load("t").items
+
+    def test_unknown_format_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            MTFileTreeRepository(str(tmp_path), file_format="xml")
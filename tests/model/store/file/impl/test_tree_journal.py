@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from core.interfaces.base_item_data import MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.state.impl.tree_state_mgr import MTTreeStateManager
+from model.store.file.impl.file_tree_repo import MANIFEST_FILE, MTFileTreeRepository
+from model.store.file.impl.tree_journal import write_atomic
+
+
+def child_names(tree, parent_id=None):
+    return [item.get_property("name") for item in tree.get_children(parent_id)]
+
+
+@pytest.fixture
+def tree(make_tree, make_dto):
+    return make_tree(dtos=[make_dto("g", node_type=MTNodeType.GROUP), make_dto("a", parent_id="g"), make_dto("b")])
+
+
+@pytest.fixture
+def journal(file_repo, tree):
+    file_repo.save(tree)
+    return file_repo.attach_journal(tree, tree._event_manager)
+
+
+class TestTreeJournal:
+
+    def test_small_edit_appends_to_journal_only(self, file_repo, tree, journal, tmp_path, make_dto):
+        base = (tmp_path / "t.json").read_bytes()
+        tree.add_item(make_dto("c", parent_id="g"))
+        tree.move_item("b", "g", 0)
+        file_repo.save(tree)
+
+        assert (tmp_path / "t.json").read_bytes() == base
+        assert journal.record_count == 2
+        loaded = file_repo.load("t")
+        assert child_names(loaded, "g") == ["b", "a", "c"]
+
+    def test_unsaved_changes_are_not_persisted(self, file_repo, tree, journal):
+        tree.remove_item("b")
+        assert child_names(file_repo.load("t")) == ["g", "b"]
+
+    def test_duplicated_subtree_replays_with_descendants(self, file_repo, tree, journal):
+        copy_id, = tree.duplicate_items(["g"])
+        file_repo.save(tree)
+        loaded = file_repo.load("t")
+        assert child_names(loaded, copy_id) == ["a"]
+
+    def test_torn_last_record_is_ignored(self, file_repo, tree, journal, tmp_path, make_dto):
+        tree.add_item(make_dto("c"))
+        file_repo.save(tree)
+        with open(tmp_path / "t.journal", "ab") as file:
+            file.write(b'[1,["d",-1,{"item_')
+        assert child_names(file_repo.load("t")) == ["g", "b", "c"]
+
+        # 다시 연결하면 잘린 줄을 지우고 이어서 기록
+        reloaded = file_repo.load("t")
+        events = MTTreeEventManager()
+        reloaded._event_manager = events
+        file_repo.attach_journal(reloaded, events)
+        reloaded.remove_item("b")
+        file_repo.save(reloaded)
+        assert child_names(file_repo.load("t")) == ["g", "c"]
+
+    def test_large_journal_is_compacted(self, file_repo, tree, journal, tmp_path, make_dto):
+        file_repo.compact_min_bytes = 0
+        for n in range(20):
+            tree.add_item(make_dto(f"n{n}"))
+        file_repo.save(tree)
+
+        assert journal.record_count == 0
+        assert len(json.loads((tmp_path / "t.json").read_bytes())["items"]) == len(tree.items)
+        assert len(file_repo.load("t").items) == len(tree.items)
+
+    def test_undo_forces_full_rewrite(self, file_repo, tree, tmp_path, make_dto):
+        state_manager = MTTreeStateManager(tree)
+        state_manager.set_initial_state(tree)
+        file_repo.save(tree)
+        journal = file_repo.attach_journal(tree, tree._event_manager, state_manager)
+        tree.add_item(make_dto("c"))
+        state_manager.new_undo(tree.to_dict())
+        tree.dict_to_state(state_manager.undo())
+
+        assert journal.needs_compaction
+        file_repo.save(tree)
+        assert not journal.needs_compaction
+        assert child_names(file_repo.load("t")) == ["g", "b"]
+
+    def test_stale_journal_after_external_rewrite_is_ignored(self, file_repo, tree, journal, tmp_path, make_dto, make_tree):
+        tree.add_item(make_dto("c"))
+        file_repo.save(tree)
+        other = make_tree(dtos=[make_dto("x")])
+        write_atomic(str(tmp_path / "t.json"), json.dumps(other.to_dict()).encode("utf-8"))
+        assert child_names(file_repo.load("t")) == ["x"]
+
+    def test_listing_counts_items_recorded_only_in_journal(self, file_repo, tree, journal, tmp_path, make_dto):
+        tree.remove_item("g")
+        tree.add_item(make_dto("c"))
+        file_repo.save(tree)
+        assert file_repo.list_tree_info()["t"]["item_count"] == 2
+
+        (tmp_path / MANIFEST_FILE).unlink()  # 매니페스트를 다시 만들 때도 저널을 반영
+        assert MTFileTreeRepository(str(tmp_path)).list_tree_info()["t"]["item_count"] == 2
+
+    def test_listing_rescans_when_journal_grows_elsewhere(self, file_repo, tree, journal, tmp_path, make_dto):
+        other = MTFileTreeRepository(str(tmp_path))
+        assert other.list_tree_info()["t"]["item_count"] == 3
+        tree.add_item(make_dto("c"))
+        file_repo.save(tree)
+        assert other.list_tree_info()["t"]["item_count"] == 4
+
+    def test_delete_removes_journal(self, file_repo, tree, journal, tmp_path, make_dto):
+        tree.add_item(make_dto("c"))
+        file_repo.save(tree)
+        assert file_repo.delete("t") is True
+        assert not (tmp_path / "t.journal").exists()
+        assert file_repo.list_trees() == {}
+
+    def test_journal_replays_over_compressed_base(self, tree, tmp_path, make_dto):
+        repo = MTFileTreeRepository(str(tmp_path), compression="zlib")
+        repo.save(tree)
+        repo.attach_journal(tree, tree._event_manager)
+        tree.add_item(make_dto("c", parent_id="g"))
+        repo.save(tree)
+        assert (tmp_path / "t.json").read_bytes()[:1] == b"\x01"
+        assert child_names(repo.load("t"), "g") == ["a", "c"]
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from model.store import registry
+from model.store.file.impl.file_tree_repo import MTFileTreeRepository
+
+SRC_DIR = Path(__file__).resolve().parents[3] / "src"
+
+
+def _loaded_heavy_modules(statement: str) -> str:
+    code = f"import sys; {statement}; print(','.join(m for m in ('psycopg2', 'sqlalchemy') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class TestStoreRegistry:
+
+    def test_available_backends(self):
+        assert {"file", "sqlite", "postgres", "sqlalchemy"} <= set(registry.available_backends())
+
+    def test_create_file_repository(self, tmp_path):
+        repo = registry.create_repository("file", storage_dir=str(tmp_path))
+        assert isinstance(repo, MTFileTreeRepository)
+
+    def test_unknown_backend(self):
+        with pytest.raises(KeyError):
+            registry.get_backend_class("nope")
+
+    def test_register_backend_validates_target(self, monkeypatch):
+        monkeypatch.setattr(registry, "_BACKENDS", dict(registry._BACKENDS))
+        with pytest.raises(ValueError):
+            registry.register_backend("bad", "no_colon_here")
+        registry.register_backend("file2", "model.store.file.impl.file_tree_repo:MTFileTreeRepository")
+        assert registry.get_backend_class("file2") is MTFileTreeRepository
+
+    def test_registry_import_is_lazy(self):
+        assert _loaded_heavy_modules("import model.store.registry") == ""
+
+    def test_database_setup_import_is_lazy(self):
+        assert _loaded_heavy_modules("import model.store.db.database_setup") == ""
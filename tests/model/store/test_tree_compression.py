@@ -0,0 +1,68 @@
+import io
+import os
+
+import pytest
+
+from model.store.tree_compression import (CODECS, MTCompressingWriter, MTCompressionError, compress_bytes,
+                                          decompress_bytes, get_codec, open_decompressed, resolve_level)
+
+DATA = b'{"items":{' + b",".join(b'"a%d":{"x":%d,"button":"left"}' % (n, n % 7) for n in range(5000)) + b"}}"
+
+
+class _ChunkCountingReader:
+    """read(size)만 있는 (seek 불가) 파일 객체"""
+
+    def __init__(self, data):
+        self._file = io.BytesIO(data)
+        self.largest_read = 0
+
+    def read(self, size=-1):
+        chunk = self._file.read(size)
+        self.largest_read = max(self.largest_read, len(chunk))
+        return chunk
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+class TestCodecs:
+
+    def test_streaming_round_trip(self, name):
+        buffer = io.BytesIO()
+        with MTCompressingWriter(buffer, CODECS[name]) as writer:
+            for start in range(0, len(DATA), 1000):
+                writer.write(DATA[start:start + 1000])
+        compressed = buffer.getvalue()
+        assert compressed[:1] == CODECS[name].header
+        assert len(compressed) * 10 < len(DATA)
+        assert compressed == compress_bytes(DATA, CODECS[name])
+        assert decompress_bytes(compressed) == DATA
+
+    def test_reader_never_returns_more_than_requested(self, name):
+        reader = open_decompressed(_ChunkCountingReader(compress_bytes(DATA, CODECS[name])))
+        pieces = []
+        while piece := reader.read(100):
+            assert len(piece) <= 100
+            pieces.append(piece)
+        assert b"".join(pieces) == DATA
+
+    def test_truncated_or_corrupt_data_raises(self, name):
+        compressed = compress_bytes(DATA, CODECS[name])
+        with pytest.raises(MTCompressionError):
+            open_decompressed(io.BytesIO(compressed[:len(compressed) // 2])).read()
+        with pytest.raises(MTCompressionError):
+            decompress_bytes(compressed[:1] + os.urandom(64))
+
+
+class TestUncompressed:
+
+    def test_data_without_header_is_read_as_is(self):
+        reader = open_decompressed(_ChunkCountingReader(DATA))
+        assert reader.read(1) + reader.read(5) + reader.read() == DATA
+        assert decompress_bytes(DATA) == DATA
+        assert compress_bytes(DATA, get_codec("none")) == DATA
+
+    def test_unknown_codec_and_level_are_rejected(self):
+        with pytest.raises(ValueError):
+            get_codec("brotli")
+        with pytest.raises(ValueError):
+            resolve_level(CODECS["zlib"], 10)
+        assert resolve_level(CODECS["lzma"], None) == CODECS["lzma"].default_level
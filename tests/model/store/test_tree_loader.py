@@ -0,0 +1,256 @@
+import threading
+import time
+from concurrent.futures import Executor, Future
+from unittest.mock import Mock
+
+import pytest
+
+from core.impl.tree import MTTree
+from core.impl.tree_stream import MTTreeStream
+from core.interfaces.base_item_data import MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+from model.state.impl.tree_state_mgr import MTTreeStateManager
+from model.store.file.impl.file_tree_repo import MTFileTreeRepository
+from model.store.store_manager import StoreManager
+from model.store.tree_loader import MTTreeLoadTask, iter_top_level_groups
+from viewmodel.impl.tree_viewmodel_base import MTTreeViewModelHeadless
+
+
+class InlineExecutor(Executor):
+    """제출한 작업을 호출한 스레드에서 바로 실행합니다."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class CancellingRepository(MTFileTreeRepository):
+    """스트림에서 아이템을 cancel_after개 읽으면 작업을 취소합니다."""
+
+    def __init__(self, storage_dir, task, cancel_after):
+        super().__init__(storage_dir=storage_dir)
+        self.task, self.cancel_after, self.read = task, cancel_after, 0
+
+    def open_tree_stream(self, tree_id):
+        stream = super().open_tree_stream(tree_id)
+
+        def tokens():
+            for key, value in stream.tokens:
+                if key == "items":
+                    self.read += 1
+                    if self.read == self.cancel_after:
+                        self.task.cancel()
+                yield key, value
+
+        return MTTreeStream(tokens(), stream.item_count)
+
+
+@pytest.fixture
+def saved_tree(make_tree, make_dto):
+    dtos = []
+    for group in ("g1", "g2", "g3"):
+        dtos += [make_dto(group, node_type=MTNodeType.GROUP), make_dto(f"{group}a", parent_id=group, node_type=MTNodeType.GROUP)]
+        if group == "g1":
+            dtos.append(make_dto("g1aa", parent_id="g1a"))
+        dtos.append(make_dto(f"{group}b", parent_id=group))
+    return make_tree("saved", "Saved", dtos=dtos)
+
+
+@pytest.fixture
+def repo(file_repo, saved_tree):
+    file_repo.save(saved_tree, "saved")
+    return file_repo
+
+
+@pytest.fixture
+def vm(repo, make_tree, make_dto):
+    tree = make_tree("current", "Current", dtos=[make_dto("old", node_type=MTNodeType.GROUP)])
+    return MTTreeViewModelHeadless(tree, MTTreeStateManager(tree), tree._event_manager,
+                                   StoreManager(repo, executor=InlineExecutor()), repo)
+
+
+class TestTreeLoader:
+
+    def test_groups_are_preorder_subtrees(self, saved_tree):
+        groups = list(iter_top_level_groups(saved_tree))
+        assert [[dto.item_id for dto in group] for group in groups] == [
+            ["g1", "g1a", "g1aa", "g1b"], ["g2", "g2a", "g2b"], ["g3", "g3a", "g3b"]]
+
+    def test_streams_groups_and_progress(self, repo):
+        chunks, progress = [], []
+        task = StoreManager(repo).load_tree_async(
+            "saved", on_chunk=lambda dtos: chunks.append(dtos[0].item_id), on_progress=lambda *p: progress.append(p))
+        loaded = task.result(timeout=5)
+
+        assert loaded.get_item("g1aa") is not None
+        assert chunks == ["g1", "g2", "g3"]
+        assert progress == [(4, 10), (7, 10), (10, 10)]
+        assert task.error() is None
+
+    def test_cancel_stops_before_next_group(self, repo):
+        chunks = []
+        task = MTTreeLoadTask("saved")
+
+        def on_chunk(dtos):
+            chunks.append(dtos[0].item_id)
+            task.cancel()
+
+        StoreManager(repo).load_tree_async("saved", on_chunk=on_chunk, task=task)
+        assert task.result(timeout=5) is None
+        assert task.cancelled and chunks == ["g1"]
+        assert task.error() is None
+
+    def test_cancel_while_parsing(self, repo, tmp_path):
+        task = MTTreeLoadTask("saved")
+        cancelling = CancellingRepository(str(tmp_path), task, cancel_after=2)
+        started, chunks = [], []
+
+        StoreManager(cancelling).load_tree_async("saved", on_start=lambda *args: started.append(args),
+                                                 on_chunk=chunks.append, task=task)
+        assert task.result(timeout=5) is None
+        assert started == [] and chunks == []  # 첫 그룹이 완성되기 전에 멈춤
+        assert cancelling.read == 2 and task.error() is None
+
+    def test_journal_falls_back_to_full_load(self, repo, make_dto):
+        tree = repo.load("saved")
+        tree._event_manager = MTTreeEventManager()
+        repo.attach_journal(tree, tree._event_manager)
+        tree.add_item(make_dto("g4", node_type=MTNodeType.GROUP))
+        repo.save(tree, "saved")
+        assert repo.open_tree_stream("saved") is None
+
+        chunks = []
+        task = StoreManager(repo).load_tree_async("saved", on_chunk=lambda dtos: chunks.append(dtos[0].item_id))
+        assert task.result(timeout=5).get_item("g4") is not None
+        assert chunks == ["g1", "g2", "g3", "g4"]
+
+    def test_next_chunk_waits_for_previous_one(self, repo):
+        pending, posted_while_busy = [], []
+        lock = threading.Lock()
+
+        def dispatch(fn, *args):
+            with lock:
+                if pending:
+                    posted_while_busy.append(fn)
+                pending.append((fn, args))
+
+        chunks = []
+        task = StoreManager(repo).load_tree_async("saved", on_chunk=lambda dtos: chunks.append(dtos[0].item_id),
+                                                  dispatch=dispatch)
+        deadline = time.monotonic() + 5
+        while not (task.done() and not pending) and time.monotonic() < deadline:
+            time.sleep(0.02)  # 작업 스레드가 더 넘기려 하는지 지켜봄
+            with lock:
+                call = pending.pop(0) if pending else None
+            if call is not None:
+                call[0](*call[1])
+        assert chunks == ["g1", "g2", "g3"] and task.result(timeout=5) is not None
+        assert posted_while_busy == []
+
+    def test_callbacks_go_through_dispatch(self, repo):
+        threads = set()
+        done = threading.Event()
+
+        def dispatch(fn, *args):
+            threads.add(threading.current_thread().name)
+            fn(*args)
+
+        StoreManager(repo).load_tree_async("saved", on_done=lambda task: done.set(), dispatch=dispatch)
+        assert done.wait(5)
+        assert all(name.startswith("mt-store") for name in threads)
+
+
+class TestViewModelAsyncLoad:
+
+    def test_load_replaces_tree_group_by_group(self, vm):
+        added, crud, finished = Mock(), Mock(), Mock()
+        vm.item_added.connect(added)
+        vm.tree_state_changed.connect(crud)
+        vm.load_finished.connect(finished)
+
+        vm.load_tree_async("saved")
+
+        assert vm.get_item_dto("old") is None
+        assert [dto.item_id for dto in vm.get_item_children(None)] == ["g1", "g2", "g3"]
+        assert vm.get_item_dto("g1aa").domain_data.parent_id == "g1a"
+        assert added.call_count == 3  # 최상위 그룹마다 한 번
+        assert crud.call_count == 1  # 스냅샷은 끝에 한 번
+        assert finished.call_args.args[0] == {"tree_id": "saved", "success": True, "cancelled": False, "error": None}
+        assert vm.can_undo() is False
+
+    def test_cancel_restores_previous_tree(self, vm):
+        finished = Mock()
+        vm.load_finished.connect(finished)
+        vm.item_added.connect(lambda event_type, data: vm.cancel_load())
+
+        vm.load_tree_async("saved")
+
+        assert [dto.item_id for dto in vm.get_item_children(None)] == ["old"]
+        assert vm.get_item_dto("g1") is None
+        assert finished.call_args.args[0]["cancelled"] is True
+        assert finished.call_args.args[0]["success"] is False
+
+    def test_late_callbacks_of_a_superseded_load_are_ignored(self, repo, make_tree, make_dto):
+        tree = make_tree("current", "Current", dtos=[make_dto("old", node_type=MTNodeType.GROUP)])
+        vm = MTTreeViewModelHeadless(tree, MTTreeStateManager(tree), tree._event_manager, StoreManager(repo), repo)
+        finished = Mock()
+        vm.load_finished.connect(finished)
+        first_calls, second_calls = [], []
+
+        def pump(calls, until):
+            """작업 스레드가 넘긴 콜백을 until()이 참이 될 때까지 차례로 실행합니다."""
+            deadline = time.monotonic() + 5
+            while not until() and time.monotonic() < deadline:
+                if calls:
+                    calls.pop(0)()
+                else:
+                    time.sleep(0.01)
+            assert until()
+
+        vm.load_tree_async("saved", dispatch=lambda fn, *args: first_calls.append(lambda: fn(*args)))
+        pump(first_calls, lambda: vm.get_item_dto("g1") is not None)  # on_start와 첫 그룹까지
+        vm.load_tree_async("saved", dispatch=lambda fn, *args: second_calls.append(lambda: fn(*args)))
+        pump(second_calls, lambda: finished.call_count == 1)  # 첫 불러오기의 on_done보다 먼저 끝남
+        pump(first_calls, lambda: finished.call_count == 2)  # 늦게 도착한 첫 불러오기의 나머지 콜백
+
+        assert [dto.item_id for dto in vm.get_item_children(None)] == ["g1", "g2", "g3"]
+        assert vm.get_item_dto("old") is None
+        assert tree._batch_depth == 0
+        second, first = (call.args[0] for call in finished.call_args_list)
+        assert second["success"] is True
+        assert first["success"] is False and first["cancelled"] is True
+
+    def test_missing_tree_reports_failure(self, vm):
+        finished = Mock()
+        vm.load_finished.connect(finished)
+        vm.load_tree_async("missing")
+
+        assert finished.call_args.args[0]["success"] is False
+        assert vm.get_item_dto("old") is not None
+
+
+class TestAddSubtree:
+
+    def test_adds_descendants_with_single_event(self, make_dto, make_tree, saved_tree):
+        group = next(iter_top_level_groups(saved_tree))
+        tree = make_tree(name="T", dtos=[make_dto("x", node_type=MTNodeType.GROUP)])
+        events = []
+        tree._event_manager.subscribe(MTTreeEvent.ITEM_ADDED, lambda event_type, data: events.append(data))
+
+        assert tree.add_subtree(group, index=0) == "g1"
+        assert [item.id for item in tree.get_children(None)] == ["g1", "x"]
+        assert [item.id for item in tree.get_children("g1a")] == ["g1aa"]
+        assert events == [{"item_id": "g1", "parent_id": MTTree.DUMMY_ROOT_ID}]
+
+    def test_batch_defers_tree_crud(self, make_dto, make_tree):
+        tree = make_tree(name="T")
+        snapshots = []
+        tree._event_manager.subscribe(MTTreeEvent.TREE_CRUD, lambda event_type, data: snapshots.append(data))
+        with tree.batch():
+            tree.add_item(make_dto("a", node_type=MTNodeType.GROUP))
+            tree.add_item(make_dto("b", node_type=MTNodeType.GROUP))
+            assert snapshots == []
+        assert len(snapshots) == 1
+        assert set(snapshots[0]["tree_data"]["items"]) >= {"a", "b"}
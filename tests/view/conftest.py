@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qt_app():
+    """
+    테스트 세션 동안 QApplication 하나를 유지합니다.
+    인스턴스를 버리면 가비지 컬렉션된 뒤 QIcon/QPixmap/위젯 생성이 프로세스를 중단시킵니다.
+    """
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from core.interfaces.base_item_data import MTNodeType
+from view.impl import icon_registry
+from view.impl.icon_registry import MTIconRegistry, get_icon_registry
+
+
+@pytest.fixture
+def registry():
+    return MTIconRegistry()
+
+
+class TestMTIconRegistry:
+
+    def test_icons_are_shared(self, registry):
+        assert registry.icon(MTNodeType.GROUP) is registry.icon(MTNodeType.GROUP)
+        assert get_icon_registry() is get_icon_registry()
+
+    def test_state_falls_back_to_node_type_icon(self, registry):
+        assert registry.icon(MTNodeType.GROUP, "expanded") is registry.icon(MTNodeType.GROUP)
+
+    def test_missing_icon_is_resolved_once(self, registry, monkeypatch):
+        calls = []
+        monkeypatch.setattr(icon_registry.os.path, "exists", lambda path: calls.append(path) or False)
+        registry.register(MTNodeType.INSTRUCTION, "missing/inst.png")
+
+        first = registry.icon(MTNodeType.INSTRUCTION)
+        second = registry.icon(MTNodeType.INSTRUCTION)
+
+        assert first is second is registry.fallback()
+        assert first.isNull()
+        assert len(calls) == 1
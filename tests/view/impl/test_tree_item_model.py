@@ -0,0 +1,120 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import QModelIndex, Qt
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from view.impl.tree_item_model import MTTreeItemModel
+
+
+def make_dto(item_id, parent_id=None, node_type=MTNodeType.INSTRUCTION):
+    return MTItemDTO(
+        item_id=item_id,
+        domain_data=MTItemDomainDTO(name=item_id.upper(), node_type=node_type, parent_id=parent_id),
+        ui_state_data=MTItemUIStateDTO(),
+    )
+
+
+@pytest.fixture
+def tree():
+    tree = MTTree("tree", "Tree", MTTreeEventManager())
+    tree.add_item(make_dto("g", node_type=MTNodeType.GROUP))
+    for name in ("a", "b", "c"):
+        tree.add_item(make_dto(name, parent_id="g"))
+    tree.add_item(make_dto("d"))
+    return tree
+
+
+@pytest.fixture
+def model(tree):
+    model = MTTreeItemModel(tree, tree._event_manager, fetch_batch=2)
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+    return model
+
+
+def ids(model, parent=QModelIndex()):
+    return [model.item_id(model.index(row, 0, parent)) for row in range(model.rowCount(parent))]
+
+
+class TestMTTreeItemModel:
+
+    def test_children_are_fetched_lazily(self, model):
+        group = model.index_for_id("g")
+        assert ids(model) == ["g", "d"]
+        assert model.hasChildren(group)
+        assert model.rowCount(group) == 0
+
+        model.fetchMore(group)
+        assert ids(model, group) == ["a", "b"]
+        assert model.canFetchMore(group)
+        model.fetchMore(group)
+        assert ids(model, group) == ["a", "b", "c"]
+        assert not model.canFetchMore(group)
+        assert model.parent(model.index_for_id("b")) == group
+
+    def test_data_roles(self, model):
+        index = model.index_for_id("d")
+        assert model.data(index) == "D"
+        assert model.data(index, Qt.ItemDataRole.UserRole) == "d"
+        assert model.flags(model.index_for_id("g")) & Qt.ItemFlag.ItemIsDropEnabled
+
+    def test_add_and_remove_emit_single_rows(self, tree, model):
+        inserted, removed = [], []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+        tree.add_item(make_dto("e"), index=1)
+        assert ids(model) == ["g", "e", "d"]
+        assert inserted == [(1, 1)]
+
+        tree.remove_item("e")
+        assert ids(model) == ["g", "d"]
+        assert removed == [(1, 1)]
+        assert model.index_for_id("e").isValid() is False
+
+    def test_add_to_unfetched_parent_is_deferred(self, tree, model):
+        tree.add_item(make_dto("x", parent_id="g"))
+        group = model.index_for_id("g")
+        assert model.rowCount(group) == 0
+        while model.canFetchMore(group):
+            model.fetchMore(group)
+        assert ids(model, group) == ["a", "b", "c", "x"]
+
+    def test_move_between_loaded_parents(self, tree, model):
+        group = model.index_for_id("g")
+        model.fetchMore(group)
+        model.fetchMore(group)
+        moved = []
+        model.rowsMoved.connect(lambda *args: moved.append(args[1:3]))
+
+        tree.move_item("d", "g", 1)
+
+        assert moved == [(1, 1)]
+        assert ids(model) == ["g"]
+        assert ids(model, group) == ["a", "d", "b", "c"]
+        assert model.parent(model.index_for_id("d")) == group
+
+    def test_modify_emits_data_changed(self, tree, model):
+        changed = []
+        model.dataChanged.connect(lambda top_left, bottom_right, roles=None: changed.append(top_left.row()))
+        dto = tree.get_item("d").to_dto()
+        dto.domain_data.name = "Renamed"
+        tree.modify_item("d", dto)
+        assert changed == [1]
+        assert model.data(model.index_for_id("d")) == "Renamed"
+
+    def test_reset_rebuilds_model(self, tree, model):
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+        tree.reset_tree()
+        assert resets == [True]
+        assert model.rowCount() == 0
+
+    def test_parent_without_index_is_qt_parent(self, tree):
+        from PyQt6.QtCore import QObject
+        owner = QObject()
+        assert MTTreeItemModel(tree, parent=owner).parent() is owner
@@ -0,0 +1,113 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.state.impl.tree_state_mgr import MTTreeStateManager
+from view.impl.tree_widget import MTTreeWidget
+from viewmodel.impl.tree_viewmodel_base import MTTreeViewModelHeadless
+
+
+def make_dto(item_id, parent_id=None, node_type=MTNodeType.INSTRUCTION):
+    return MTItemDTO(
+        item_id=item_id,
+        domain_data=MTItemDomainDTO(name=item_id.upper(), node_type=node_type, parent_id=parent_id),
+        ui_state_data=MTItemUIStateDTO(),
+    )
+
+
+@pytest.fixture
+def tree():
+    event_manager = MTTreeEventManager()
+    tree = MTTree("tree", "Tree", event_manager)
+    tree.add_item(make_dto("g", node_type=MTNodeType.GROUP))
+    tree.add_item(make_dto("a", parent_id="g"))
+    tree.add_item(make_dto("b"))
+    tree.add_item(make_dto("c"))
+    return tree
+
+
+@pytest.fixture
+def widget(tree):
+    viewmodel = MTTreeViewModelHeadless(tree, MTTreeStateManager(tree), tree._event_manager, None, None)
+    return MTTreeWidget(viewmodel)
+
+
+def top_level_ids(widget):
+    return [widget.topLevelItem(i).text(0) for i in range(widget.topLevelItemCount())]
+
+
+class TestMTTreeWidgetReconcile:
+
+    def test_reconcile_keeps_unchanged_widget_items(self, tree, widget):
+        before = dict(widget._id_to_widget_map)
+        tree.move_item("c", None, 0)
+        tree.remove_item("b")
+
+        widget.update_tree_items()
+
+        assert top_level_ids(widget) == ["C", "G"]
+        assert "b" not in widget._id_to_widget_map
+        for item_id in ("g", "a", "c"):
+            assert widget._id_to_widget_map[item_id] is before[item_id]
+
+    def test_reconcile_moves_between_parents_and_relabels(self, tree, widget):
+        tree.move_item("a", None)
+        dto = tree.get_item("c").to_dto()
+        dto.domain_data.name = "Renamed"
+        tree.modify_item("c", dto)
+
+        widget.update_tree_items(tree.to_dict())
+
+        assert top_level_ids(widget) == ["G", "B", "Renamed", "A"]
+        assert widget._id_to_widget_map["g"].childCount() == 0
+
+    def test_reconcile_does_not_call_back_into_viewmodel(self, tree, widget):
+        snapshot = tree.to_dict()
+        snapshot["items"]["g"]["ui_state_data"]["is_expanded"] = True
+        expanded = []
+        widget.itemExpanded.connect(lambda item: expanded.append(item))
+
+        widget.update_tree_items(snapshot)
+
+        assert widget._id_to_widget_map["g"].isExpanded()
+        assert expanded == []
+
+
+class TestMTTreeWidgetSearch:
+
+    def test_scrolls_to_first_match_in_row_order(self, widget, monkeypatch):
+        scrolled = []
+        monkeypatch.setattr(widget, "scrollToItem", scrolled.append)
+        widget._viewmodel.search_changed.connect(widget.apply_search_result)  # MTTreeView가 연결하는 것과 같음
+
+        widget._viewmodel.search(node_type=MTNodeType.INSTRUCTION)
+
+        assert scrolled == [widget._id_to_widget_map["a"]]
+        assert widget._id_to_widget_map["g"].isExpanded()
+
+
+class TestMTTreeWidgetMove:
+
+    def test_handle_item_moved_inserts_subtree_at_index(self, tree, widget):
+        group_widget = widget._id_to_widget_map["g"]
+        tree.move_item("g", None, 2)
+
+        widget.handle_item_moved("g", None, None, 2)
+
+        assert top_level_ids(widget) == ["B", "C", "G"]
+        assert widget._id_to_widget_map["g"] is group_widget
+        assert group_widget.child(0).text(0) == "A"
+
+    def test_drop_target_rows(self, widget):
+        from PyQt6.QtWidgets import QAbstractItemView
+        position = QAbstractItemView.DropIndicatorPosition
+        b_widget = widget._id_to_widget_map["b"]
+
+        assert widget._drop_target(b_widget, position.AboveItem) == (None, 1)
+        assert widget._drop_target(b_widget, position.BelowItem) == (None, 2)
+        assert widget._drop_target(widget._id_to_widget_map["g"], position.OnItem) == ("g", -1)
+        assert widget._drop_target(b_widget, position.OnItem) is None
+        assert widget._drop_target(widget._id_to_widget_map["a"], position.BelowItem) == ("g", 1)
@@ -0,0 +1,40 @@
+import pytest
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTItemDTO, MTItemDomainDTO, MTItemUIStateDTO, MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.state.impl.tree_state_mgr import MTTreeStateManager
+from viewmodel.impl.tree_viewmodel_base import MTTreeViewModelHeadless
+
+
+def _make_dto(item_id, parent_id=None, node_type=MTNodeType.INSTRUCTION, expanded=False, name=None, device=None):
+    return MTItemDTO(
+        item_id=item_id,
+        domain_data=MTItemDomainDTO(name=name if name is not None else item_id, node_type=node_type,
+                                    parent_id=parent_id, device=device),
+        ui_state_data=MTItemUIStateDTO(is_expanded=expanded),
+    )
+
+
+@pytest.fixture
+def make_dto():
+    """make_dto(item_id, parent_id=None, node_type=INSTRUCTION, expanded=False, name=item_id, device=None)"""
+    return _make_dto
+
+
+@pytest.fixture
+def make_tree():
+    """make_tree(*dtos): 이벤트 관리자가 있는 트리에 DTO를 차례로 추가합니다."""
+    def make(*dtos):
+        tree = MTTree("tree", "Tree", MTTreeEventManager())
+        for dto in dtos:
+            tree.add_item(dto)
+        return tree
+
+    return make
+
+
+@pytest.fixture
+def vm(tree):
+    """파일에서 정의한 tree fixture를 감싼 헤드리스 뷰모델"""
+    return MTTreeViewModelHeadless(tree, MTTreeStateManager(tree), tree._event_manager, None, None)
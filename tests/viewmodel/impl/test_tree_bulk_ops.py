@@ -0,0 +1,96 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core.exceptions import MTTreeError
+from core.interfaces.base_item_data import MTNodeType
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+
+
+def child_ids(tree, parent_id=None):
+    return [item.id for item in tree.get_children(parent_id)]
+
+
+@pytest.fixture
+def tree(make_tree, make_dto):
+    return make_tree(*(make_dto(item_id) for item_id in ("a", "b", "c", "d")),
+                     make_dto("g", node_type=MTNodeType.GROUP),
+                     make_dto("g1", parent_id="g"),
+                     make_dto("g2", parent_id="g"))
+
+
+@pytest.fixture
+def vm(vm, tree):
+    vm._state_manager.set_initial_state(tree)
+    return vm
+
+
+@pytest.fixture
+def crud(tree):
+    snapshots = []
+    tree._event_manager.subscribe(MTTreeEvent.TREE_CRUD, lambda event_type, data: snapshots.append(data))
+    return snapshots
+
+
+class TestTreeBulkOps:
+
+    def test_remove_items_prunes_descendants(self, tree, crud):
+        assert tree.remove_items(["g1", "c", "g", "missing"]) == ["c", "g"]
+        assert child_ids(tree) == ["a", "b", "d"]
+        assert "g1" not in tree.items
+        assert len(crud) == 1
+
+    def test_move_items_keeps_tree_order(self, tree, crud):
+        assert tree.move_items(["d", "b"], "g", 1) == ["b", "d"]
+        assert child_ids(tree, "g") == ["g1", "b", "d", "g2"]
+        assert child_ids(tree) == ["a", "c", "g"]
+        assert len(crud) == 1
+
+    def test_move_items_within_parent_uses_position_before_move(self, tree):
+        tree.move_items(["a", "b"], None, 3)
+        assert child_ids(tree) == ["c", "a", "b", "d", "g"]
+
+    def test_move_items_into_own_subtree_is_rejected(self, tree):
+        with pytest.raises(MTTreeError):
+            tree.move_items(["a", "g"], "g1")
+        assert child_ids(tree) == ["a", "b", "c", "d", "g"]
+
+    def test_duplicate_items_copies_subtrees_after_originals(self, tree, crud):
+        copies = tree.duplicate_items(["g", "a", "g2"])
+        assert len(copies) == 2
+        top = child_ids(tree)
+        assert top[:2] == ["a", copies[0]] and top[-2:] == ["g", copies[1]]
+        copied_children = tree.get_children(copies[1])
+        assert [item.get_property("name") for item in copied_children] == ["g1", "g2"]
+        assert all(item.get_property("parent_id") == copies[1] for item in copied_children)
+        assert len(crud) == 1
+
+
+class TestViewModelBulkOps:
+
+    def test_single_undo_entry_per_bulk_operation(self, vm, tree):
+        vm.remove_items(["a", "b", "c"])
+        assert child_ids(tree) == ["d", "g"]
+        vm.undo(tree)
+        assert child_ids(tree) == ["a", "b", "c", "d", "g"]
+        assert vm.can_undo() is False
+
+    def test_selection_is_the_default_target(self, vm, tree):
+        vm.select_item("b")
+        vm.select_item("d", multi_select=True)
+        vm.move_items(None, "g")
+        assert child_ids(tree, "g") == ["g1", "g2", "b", "d"]
+
+        vm.remove_items()
+        assert child_ids(tree, "g") == ["g1", "g2"]
+        assert vm.get_selected_items() == []
+
+    def test_one_state_signal_per_bulk_operation(self, vm):
+        changed = Mock()
+        vm.tree_state_changed.connect(changed)
+        vm.duplicate_items(["a", "b", "c"])
+        assert changed.call_count == 1
+
+    def test_nothing_changed_records_no_undo(self, vm):
+        assert vm.remove_items(["missing"]) == []
+        assert vm.can_undo() is False
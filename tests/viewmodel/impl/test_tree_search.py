@@ -0,0 +1,159 @@
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from core.interfaces.base_item_data import MTDevice, MTNodeType
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+from viewmodel.impl.tree_search import MTTreeSearchIndex
+
+
+@pytest.fixture
+def tree(make_tree, make_dto):
+    return make_tree(
+        make_dto("login", name="Login Flow", node_type=MTNodeType.GROUP),
+        make_dto("steps", name="Steps", parent_id="login", node_type=MTNodeType.GROUP),
+        make_dto("click", name="Click Login Button", parent_id="steps", device=MTDevice.MOUSE),
+        make_dto("type", name="Type Password", parent_id="steps", device=MTDevice.KEYBOARD),
+        make_dto("logout", name="Logout", device=MTDevice.MOUSE),
+    )
+
+
+def watched_index(tree):
+    index = MTTreeSearchIndex(tree)
+    for event_type in (MTTreeEvent.ITEM_ADDED, MTTreeEvent.ITEM_REMOVED, MTTreeEvent.ITEM_MODIFIED, MTTreeEvent.TREE_RESET):
+        tree._event_manager.subscribe(event_type, index.handle_event)
+    return index
+
+
+class TestMTTreeSearchIndex:
+
+    def test_substring_and_filters(self, tree):
+        index = MTTreeSearchIndex(tree)
+        assert index.search("log") == {"login", "click", "logout"}
+        assert index.search("LOGIN") == {"login", "click"}
+        assert index.search("lo", node_type=MTNodeType.INSTRUCTION, device=MTDevice.MOUSE) == {"click", "logout"}
+        assert index.search(device=MTDevice.KEYBOARD) == {"type"}
+        assert index.search("") == set()
+        assert index.search("lo") == set()
+
+    def test_index_follows_tree_events(self, tree, make_dto):
+        index = watched_index(tree)
+        index.search("log")
+        tree.add_item(make_dto("backlog", name="Backlog"))
+        tree.remove_item("steps")
+        dto = tree.get_item("logout").to_dto()
+        dto.domain_data.name = "Sign out"
+        tree.modify_item("logout", dto)
+
+        assert index.search("log") == {"login", "backlog"}
+        assert index.search("sign") == {"logout"}
+
+    def test_subtree_added_at_once_is_indexed(self, tree):
+        index = watched_index(tree)
+        len(index)
+        tree.duplicate_items(["login"])
+        assert len(index.search("password")) == 2
+
+    def test_refined_results_match_fresh_search(self, tree, make_dto):
+        rng = random.Random(3)
+        words = ["alpha", "beta", "gamma", "delta", "login", "logout"]
+        with tree.batch():
+            for n in range(300):
+                tree.add_item(make_dto(f"n{n}", name=" ".join(rng.sample(words, 2)) + f" {n}"))
+        index = MTTreeSearchIndex(tree)
+        for query in ["log", "logi", "login", "login ", "login a", "log", "eta", "eta 1", "ta 1"]:
+            assert index.search(query) == MTTreeSearchIndex(tree).search(query), query
+
+    def test_reset_refreshes_only_changed_items(self, tree, make_dto, monkeypatch):
+        index = watched_index(tree)
+        index.search("log")
+        snapshot = tree.to_dict()
+        tree.add_item(make_dto("backlog", name="Backlog"))
+        dto = tree.get_item("logout").to_dto()
+        dto.domain_data.name = "Sign out"
+        tree.modify_item("logout", dto)
+        reindexed = []
+        add = index._add
+        monkeypatch.setattr(index, "_add", lambda item_id, *args: (reindexed.append(item_id), add(item_id, *args)))
+        monkeypatch.setattr(index, "rebuild", lambda: pytest.fail("키 입력 전에 전체 색인을 다시 만들지 않아야 함"))
+
+        tree.dict_to_state(snapshot)
+        index.refresh()
+
+        assert reindexed == ["logout"]
+        assert index.search("log") == {"login", "click", "logout"}
+        assert index.search("sign") == set()
+
+
+class TestViewModelSearch:
+
+    def test_ancestors_of_matches_are_expanded(self, vm, tree):
+        changed = Mock()
+        vm.search_changed.connect(changed)
+
+        assert vm.search("password") == {"type"}
+
+        result = changed.call_args.args[0]
+        assert result["added"] == {"type"} and result["removed"] == set()
+        assert result["expanded"] == ["login", "steps"]
+        assert vm.visible_rows.row_of("type") is not None
+        assert vm.can_undo() is False
+
+    def test_undo_keeps_index_current(self, vm, tree, make_dto):
+        vm.search("log")
+        vm._state_manager.set_initial_state(tree)
+        vm.add_item(make_dto("backlog", name="Backlog"))
+        assert vm.search("log") == {"login", "click", "logout", "backlog"}
+
+        vm.undo(tree)
+        assert vm._search_index._built
+        assert vm.search("logo") == {"logout"}
+        assert vm.search("backl") == set()
+
+    def test_each_keystroke_reports_only_the_difference(self, vm):
+        changed = Mock()
+        vm.search_changed.connect(changed)
+        vm.search("log")
+        vm.search("logo")
+
+        result = changed.call_args.args[0]
+        assert result["matches"] == {"logout"}
+        assert result["added"] == set()
+        assert result["removed"] == {"login", "click"}
+
+        vm.clear_search()
+        assert changed.call_args.args[0]["removed"] == {"logout"}
+        assert vm.search_matches == set()
+
+    def test_expansion_walks_only_new_matches(self, vm, monkeypatch):
+        walked = []
+        expand = vm._expand_ancestors
+        monkeypatch.setattr(vm, "_expand_ancestors", lambda item_ids: (walked.append(set(item_ids)), expand(item_ids))[1])
+
+        vm.search("log")
+        vm.search("logo")
+        vm.search("log")
+
+        assert walked == [{"click"}, set(), set()]  # 보이는 결과와 이미 펼친 결과는 건너뜀
+        assert vm._search_opened == {"login", "steps"}
+
+    def test_collapsed_ancestor_is_expanded_again(self, vm):
+        changed = Mock()
+        vm.search_changed.connect(changed)
+        vm.search("password")
+        vm.toggle_expanded("steps", False)
+
+        vm.search("passwor")
+
+        assert changed.call_args.args[0]["expanded"] == ["steps"]
+        assert vm.visible_rows.row_of("type") is not None
+
+    def test_first_match_follows_row_order(self, vm):
+        changed = Mock()
+        vm.search_changed.connect(changed)
+        for _ in range(5):
+            vm.search(device=MTDevice.MOUSE)
+            assert changed.call_args.args[0]["first"] == "click"
+            vm.clear_search()
+            assert changed.call_args.args[0]["first"] is None
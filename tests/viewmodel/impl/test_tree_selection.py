@@ -0,0 +1,102 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core.interfaces.base_item_data import MTNodeType
+from model.events.interfaces.base_tree_event_mgr import MTTreeUIEvent
+from viewmodel.impl.tree_selection import MTTreeSelection
+
+
+@pytest.fixture
+def tree(make_tree, make_dto):
+    return make_tree(
+        make_dto("a"),
+        make_dto("g", node_type=MTNodeType.GROUP, expanded=True),
+        make_dto("g1", parent_id="g"),
+        make_dto("g2", parent_id="g"),
+        make_dto("h", node_type=MTNodeType.GROUP),
+        make_dto("h1", parent_id="h"),
+        make_dto("b"),
+    )
+
+
+def is_selected(tree, item_id):
+    return tree.get_item(item_id).ui_state.is_selected
+
+
+class TestMTTreeSelection:
+
+    def test_select_replaces_and_writes_through(self, tree):
+        selection = MTTreeSelection(tree)
+        selection.select("a")
+        assert selection.select("b") == (["b"], ["a"])
+        assert selection.ids() == ["b"]
+        assert is_selected(tree, "b") and not is_selected(tree, "a")
+
+    def test_toggle_keeps_other_selection(self, tree):
+        selection = MTTreeSelection(tree)
+        selection.select("a")
+        assert selection.toggle("b") == (["b"], [])
+        assert selection.toggle("a") == ([], ["a"])
+        assert selection.ids() == ["b"]
+
+    def test_unchanged_items_are_not_touched(self, tree):
+        selection = MTTreeSelection(tree)
+        selection.select_all(["a", "b"])
+        assert selection.select_range(["a", "b", "g"]) == (["g"], [])
+
+    def test_discard_and_reset_from_tree(self, tree):
+        selection = MTTreeSelection(tree)
+        selection.select_all(["a", "b"])
+        assert selection.discard(["a", "missing"]) == ["a"]
+        assert selection.ids() == ["b"]
+
+        tree.get_item("g").set_property("is_selected", True)
+        selection.reset_from_tree()
+        assert sorted(selection.ids()) == ["a", "b", "g"]
+
+
+class TestViewModelSelection:
+
+    def test_single_signal_per_change_and_no_undo_entry(self, vm):
+        changed = Mock()
+        vm.selection_changed.connect(changed)
+        vm.select_item("a")
+        vm.select_item("b")
+
+        assert changed.call_count == 2
+        event_type, data = changed.call_args.args
+        assert event_type == MTTreeUIEvent.ITEM_SELECTED
+        assert data == {"selected": ["b"], "deselected": ["a"], "current": "b"}
+        assert vm.can_undo() is False
+
+    def test_range_select_follows_visible_order(self, vm):
+        vm.select_item("a")
+        vm.select_range("b")
+        # h는 접혀 있으므로 h1은 범위에 들어가지 않음
+        assert vm.get_selected_items() == ["a", "g", "g1", "g2", "h", "b"]
+
+        vm.select_range("g1")
+        assert vm.get_selected_items() == ["a", "g", "g1"]
+
+    def test_range_select_upwards_and_extend(self, vm):
+        vm.select_item("g2")
+        vm.select_range("a")
+        assert vm.get_selected_items() == ["g2", "g1", "g", "a"]
+
+        vm.select_item("b", multi_select=True)
+        vm.select_range("h", extend=True)
+        assert set(vm.get_selected_items()) == {"a", "g", "g1", "g2", "h", "b"}
+
+    def test_select_all_and_clear(self, vm, tree):
+        vm.select_all()
+        assert len(vm.get_selected_items()) == len(tree.items) - 1
+        vm.clear_selection_state()
+        assert vm.get_selected_items() == []
+        assert not any(item.ui_state.is_selected for item in tree.items.values())
+
+    def test_removed_items_leave_selection(self, vm, tree):
+        vm.select_item("g")
+        vm.select_item("g1", multi_select=True)
+        tree.remove_item("g")
+        assert vm.get_selected_items() == []
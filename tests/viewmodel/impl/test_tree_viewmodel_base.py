@@ -0,0 +1,96 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTNodeType
+from model.events.impl.tree_event_mgr import MTTreeEventManager
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+from model.state.impl.tree_state_mgr import MTTreeStateManager
+from viewmodel.impl.signal import MTSignal
+from viewmodel.impl.tree_viewmodel_base import MTTreeViewModelBase, MTTreeViewModelHeadless
+
+SRC_DIR = Path(__file__).resolve().parents[3] / "src"
+
+
+@pytest.fixture
+def headless_vm():
+    event_manager = MTTreeEventManager()
+    tree = MTTree("tree", "Tree", event_manager)
+    state_manager = MTTreeStateManager(tree)
+    return MTTreeViewModelHeadless(tree, state_manager, event_manager, store_manager=None, repository=None)
+
+
+class TestMTSignal:
+
+    def test_connect_emit_disconnect(self):
+        signal = MTSignal()
+        slot = Mock()
+        signal.connect(slot)
+        signal.emit(MTTreeEvent.ITEM_ADDED, {"item_id": "a"})
+        slot.assert_called_once_with(MTTreeEvent.ITEM_ADDED, {"item_id": "a"})
+
+        signal.disconnect(slot)
+        signal.emit(MTTreeEvent.ITEM_ADDED, {})
+        assert slot.call_count == 1
+
+    def test_disconnect_unknown_slot_raises(self):
+        with pytest.raises(TypeError):
+            MTSignal().disconnect(Mock())
+
+
+class TestMTTreeViewModelHeadless:
+
+    def test_signals_created_per_instance(self, headless_vm):
+        other = MTTreeViewModelHeadless(MTTree("t2", "T2"), Mock(), Mock(), None, None)
+        for name in MTTreeViewModelBase.SIGNAL_NAMES:
+            assert isinstance(getattr(headless_vm, name), MTSignal)
+            assert getattr(headless_vm, name) is not getattr(other, name)
+
+    def test_add_item_emits_signals(self, headless_vm, make_dto):
+        added, changed = Mock(), Mock()
+        headless_vm.item_added.connect(added)
+        headless_vm.tree_state_changed.connect(changed)
+
+        item_id = headless_vm.add_item(make_dto("a", name="A"))
+
+        assert item_id == "a"
+        added.assert_called_once()
+        assert added.call_args.args[0] == MTTreeEvent.ITEM_ADDED
+        changed.assert_called_once()
+
+    def test_undo_restores_tree(self, headless_vm, make_dto):
+        headless_vm.add_item(make_dto("g", name="G", node_type=MTNodeType.GROUP))
+        headless_vm.toggle_expanded("g", True)
+        headless_vm.toggle_expanded("g", False)
+        undone = Mock()
+        headless_vm.tree_undo.connect(undone)
+
+        headless_vm.undo(None)
+
+        undone.assert_called_once()
+        assert headless_vm.get_item_dto("g").ui_state_data.is_expanded is True
+
+    def test_custom_signal_factory(self):
+        created = []
+
+        def factory():
+            signal = MTSignal()
+            created.append(signal)
+            return signal
+
+        MTTreeViewModelBase(MTTree("t", "T"), Mock(), Mock(), None, None, signal_factory=factory)
+        assert len(created) == len(MTTreeViewModelBase.SIGNAL_NAMES)
+
+    def test_import_does_not_load_qt_or_database_drivers(self):
+        code = (
+            "import sys; import viewmodel.impl.tree_viewmodel_base; "
+            "print(','.join(m for m in ('PyQt6', 'psycopg2', 'sqlalchemy') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == ""
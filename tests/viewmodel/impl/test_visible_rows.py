@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from core.impl.tree import MTTree
+from core.interfaces.base_item_data import MTNodeType
+from model.events.interfaces.base_tree_event_mgr import MTTreeEvent
+from viewmodel.impl.visible_rows import MTVisibleRowIndex
+
+
+def rebuilt_rows(tree):
+    fresh = MTVisibleRowIndex(tree)
+    return [(item_id, fresh.depth_of(item_id)) for item_id in fresh.ids()]
+
+
+def current_rows(index):
+    return [(item_id, index.depth_of(item_id)) for item_id in index.ids()]
+
+
+@pytest.fixture
+def tree(make_tree, make_dto):
+    return make_tree(
+        make_dto("a", node_type=MTNodeType.GROUP, expanded=True),
+        make_dto("a1", parent_id="a", node_type=MTNodeType.GROUP),
+        make_dto("a2", parent_id="a", node_type=MTNodeType.GROUP, expanded=True),
+        make_dto("a21", parent_id="a2", node_type=MTNodeType.GROUP),
+        make_dto("b", node_type=MTNodeType.GROUP),
+        make_dto("b1", parent_id="b", node_type=MTNodeType.GROUP),
+    )
+
+
+class TestMTVisibleRowIndex:
+
+    def test_rows_depths_and_positions(self, tree):
+        index = MTVisibleRowIndex(tree)
+        assert index.ids() == ["a", "a1", "a2", "a21", "b"]
+        assert [index.depth_of(i) for i in index.ids()] == [0, 1, 1, 2, 0]
+        assert index.row_of("a21") == 3
+        assert index.row_of("b1") is None
+        assert index.item_at(4) == "b"
+        assert index.neighbor("a2", -1) == "a1"
+        assert index.between("a21", "a1") == ["a21", "a2", "a1"]
+
+    def test_expand_and_collapse_through_viewmodel(self, vm):
+        rows = vm.visible_rows
+        assert len(rows) == 5
+
+        vm.toggle_expanded("b", True)
+        assert rows.ids()[-2:] == ["b", "b1"]
+        vm.toggle_expanded("a", False)
+        assert rows.ids() == ["a", "b", "b1"]
+        assert rows.row_of("b1") == 2
+
+    def test_mutations_are_applied_incrementally(self, tree, vm, make_dto):
+        rows = vm.visible_rows
+        len(rows)
+
+        tree.add_item(make_dto("a0", parent_id="a"), index=0)
+        tree.add_item(make_dto("c"))
+        tree.move_item("a2", "b")
+        tree.remove_item("a1")
+
+        assert current_rows(rows) == rebuilt_rows(tree)
+        assert rows.ids() == ["a", "a0", "b", "c"]
+
+    def test_undo_rebuilds_lazily(self, tree, vm):
+        vm.toggle_expanded("b", True)
+        vm.toggle_expanded("a", False)
+        vm.undo(tree)
+        assert current_rows(vm.visible_rows) == rebuilt_rows(tree)
+        assert vm.visible_rows.ids() == ["a", "a1", "a2", "a21", "b", "b1"]
+
+    def test_random_edits_match_full_rebuild(self, tree, vm, make_dto):
+        rng = random.Random(7)
+        rows = vm.visible_rows
+        len(rows)
+        for step in range(300):
+            ids = [item_id for item_id in tree.items if item_id != MTTree.DUMMY_ROOT_ID]
+            action = rng.random()
+            if action < 0.35 or len(ids) < 3:
+                parent_id = rng.choice(ids + [None])
+                siblings = tree.get_children(parent_id)
+                tree.add_item(make_dto(f"n{step}", parent_id=parent_id, node_type=MTNodeType.GROUP,
+                                       expanded=rng.random() < 0.5),
+                              index=rng.randint(-1, len(siblings)))
+            elif action < 0.5:
+                tree.remove_item(rng.choice(ids))
+            elif action < 0.7:
+                item_id, parent_id = rng.choice(ids), rng.choice(ids + [None])
+                if parent_id != item_id and not (parent_id and tree._is_descendant(item_id, parent_id)):
+                    tree.move_item(item_id, parent_id)
+            else:
+                vm.toggle_expanded(rng.choice(ids))
+            assert current_rows(rows) == rebuilt_rows(tree), f"step {step}"
+            for row, item_id in enumerate(rows.ids()):
+                assert rows.row_of(item_id) == row
+
+    def test_handle_event_before_build_is_ignored(self, tree):
+        index = MTVisibleRowIndex(tree)
+        index.handle_event(MTTreeEvent.ITEM_REMOVED, {"item_id": "a"})
+        assert index.ids()[0] == "a"
+
+    def test_reorder_within_parent_is_tracked(self, tree, vm):
+        rows = vm.visible_rows
+        len(rows)
+        moved = []
+        tree._event_manager.subscribe(MTTreeEvent.ITEM_MOVED, lambda event_type, data: moved.append(data))
+
+        tree.move_item("a2", "a", 0)
+        tree.move_item("b", None, 0)
+
+        assert rows.ids() == ["b", "a", "a2", "a21", "a1"]
+        assert current_rows(rows) == rebuilt_rows(tree)
+        assert [data["new_index"] for data in moved] == [0, 0]
+
+    def test_get_items_reads_visible_rows(self, tree, vm, monkeypatch):
+        monkeypatch.setattr(tree, "get_children", lambda parent_id: pytest.fail("트리를 순회하지 않아야 함"))
+        assert [dto.item_id for dto in vm.get_items()] == ["a", "a1", "a2", "a21", "b"]
+        vm.toggle_expanded("a", False)
+        assert [dto.item_id for dto in vm.get_items()] == ["a", "b"]
+        assert [(dto.item_id, dto.domain_data.parent_id) for dto in vm.get_items(1, 2)] == [("b", None)]